@@ -364,7 +364,11 @@ def cmd_graph_build(args: argparse.Namespace) -> dict:
     # Build the graph
     start = time.perf_counter()
     try:
-        universe = build_universe_graph(cache_path, output_path)
+        universe = build_universe_graph(
+            cache_path,
+            output_path,
+            include_jump_matrix=getattr(args, "jump_matrix", False),
+        )
         elapsed = time.perf_counter() - start
 
         result = {
@@ -380,6 +384,8 @@ def cmd_graph_build(args: argparse.Namespace) -> dict:
                 "nullsec_systems": len(universe.nullsec_systems),
                 "regions": len(universe.region_names),
                 "constellations": len(universe.constellation_names),
+                "jump_matrix": universe.jump_matrix is not None,
+                "border_index": universe.border_index is not None,
             },
             "output": {
                 "path": str(output_path),
@@ -1883,6 +1889,11 @@ def register_parsers(subparsers: argparse._SubParsersAction) -> None:
         action="store_true",
         help="Update checksum in data-sources.json after build (recommended)",
     )
+    graph_build_parser.add_argument(
+        "--jump-matrix",
+        action="store_true",
+        help="Embed precomputed all-pairs jump distances (~70 MB, memory-mapped on load)",
+    )
     graph_build_parser.set_defaults(func=cmd_graph_build)
 
     # Graph verify command (STP-011)
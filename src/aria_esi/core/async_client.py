@@ -19,16 +19,26 @@ import httpx
 
 from .constants import ESI_BASE_URL, ESI_DATASOURCE
 from .logging import get_logger
+from .rate_limit import TokenBucket, get_esi_rate_limiter
+from .response_cache import (
+    CachedResponse,
+    ESIResponseCache,
+    get_esi_response_cache,
+    response_cache_key,
+)
 from .retry import (
     RETRYABLE_STATUS_CODES,
     RetryableESIError,
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import AsyncIterator, Mapping
 
 logger = get_logger(__name__)
 
+# Concurrent page requests issued by get_all_pages() after page 1
+DEFAULT_PAGE_CONCURRENCY = 8
+
 
 # =============================================================================
 # Response Types
@@ -77,6 +87,11 @@ class AsyncESIResponse:
         except (ValueError, TypeError):
             return None
 
+    @property
+    def etag(self) -> str | None:
+        """ETag header, for If-None-Match revalidation."""
+        return self.headers.get("ETag") or self.headers.get("etag")
+
     @property
     def x_pages(self) -> int | None:
         """Parse X-Pages header for pagination."""
@@ -181,6 +196,10 @@ class AsyncESIClient:
     Uses httpx.AsyncClient for true async I/O. Must be used as an
     async context manager to ensure proper connection pooling.
 
+    get(), get_safe() and get_all_pages() go through the shared ETag /
+    Expires response cache (see core.response_cache); get_with_headers()
+    leaves conditional requests to the caller.
+
     Usage:
         async with AsyncESIClient() as client:
             systems = await client.get("/universe/systems/30005325/")
@@ -195,6 +214,9 @@ class AsyncESIClient:
         token: Optional[str] = None,
         timeout: float = 30.0,
         enable_retry: bool = True,
+        rate_limiter: Optional[TokenBucket] = None,
+        cache_responses: bool = True,
+        response_cache: Optional[ESIResponseCache] = None,
     ) -> None:
         """
         Initialize async ESI client.
@@ -203,6 +225,12 @@ class AsyncESIClient:
             token: OAuth access token for authenticated requests
             timeout: Request timeout in seconds (default: 30)
             enable_retry: Whether to enable retry logic (default: True)
+            rate_limiter: Token bucket every request draws from
+                (default: the process-wide get_esi_rate_limiter())
+            cache_responses: Serve GETs through the ETag/Expires response
+                cache (default: True)
+            response_cache: Cache to use when caching is enabled
+                (default: the process-wide get_esi_response_cache())
         """
         self.token: Optional[str] = token
         self.timeout: float = timeout
@@ -216,6 +244,16 @@ class AsyncESIClient:
         self._error_limit_reset: float = 0
         self._rate_limit_backoff_threshold: int = 20
         self._lock = asyncio.Lock()
+        self._rate_limiter: TokenBucket = (
+            rate_limiter if rate_limiter is not None else get_esi_rate_limiter()
+        )
+
+        # Conditional request cache (ETag / Expires)
+        self._response_cache: Optional[ESIResponseCache] = None
+        if cache_responses:
+            self._response_cache = (
+                response_cache if response_cache is not None else get_esi_response_cache()
+            )
 
     async def __aenter__(self) -> AsyncESIClient:
         """Enter async context and create httpx client."""
@@ -288,6 +326,8 @@ class AsyncESIClient:
         """Check rate limit status and back off if approaching limit."""
         import time
 
+        await self._rate_limiter.acquire()
+
         async with self._lock:
             if time.time() > self._error_limit_reset:
                 self._error_limit_remain = 100
@@ -330,26 +370,74 @@ class AsyncESIClient:
         auth: bool = False,
     ) -> Union[dict, list, int, float, None]:
         """Execute GET request without retry."""
+        response = await self._get_response_once(endpoint, params, auth)
+        return response.data
+
+    async def _get_response_once(
+        self,
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+        auth: bool = False,
+        use_cache: bool = True,
+    ) -> AsyncESIResponse:
+        """
+        Execute GET request without retry, through the response cache.
+
+        A fresh cached response is returned without a request. A stale
+        one is revalidated with If-None-Match, and a 304 returns the
+        cached body with status 200. A 304 with nothing cached returns
+        data=None and status 304. use_cache=False bypasses the cache.
+        """
         if not self._client:
             raise AsyncESIError("Client not initialized. Use 'async with' context manager.")
 
-        await self._check_rate_limit()
-
         url = self._build_url(endpoint, params)
         headers: dict[str, str] = {}
 
         if auth and self.token:
             headers["Authorization"] = f"Bearer {self.token}"
 
+        cache_key = response_cache_key(f"{self.base_url}{url}", headers.get("Authorization"))
+        cache = self._response_cache if use_cache else None
+        cached = await self._cache_lookup(cache, cache_key)
+        if cache is not None and cached is not None and cached.is_fresh():
+            cache.record_hit()
+            return AsyncESIResponse(
+                data=cached.json(), headers=dict(cached.headers), status_code=200
+            )
+
+        await self._check_rate_limit()
+
+        if cached is not None and cached.etag:
+            headers["If-None-Match"] = cached.etag
+
         try:
             response = await self._client.get(url, headers=headers if headers else None)
             self._update_rate_limits(response.headers)
 
             if response.status_code == 304:
-                return None
+                if cache is not None and cached is not None:
+                    cached = cache.revalidate(cache_key, cached, response.headers, persist=False)
+                    await self._cache_persist(cache, cache_key, cached, auth)
+                    return AsyncESIResponse(
+                        data=cached.json(), headers=dict(cached.headers), status_code=200
+                    )
+                return AsyncESIResponse(data=None, headers=dict(response.headers), status_code=304)
 
             response.raise_for_status()
-            return response.json()
+            data = response.json()
+
+            if cache is not None:
+                cache.record_miss()
+                stored = cache.store(cache_key, response.headers, response.content, persist=False)
+                if stored is not None:
+                    await self._cache_persist(cache, cache_key, stored, auth)
+
+            return AsyncESIResponse(
+                data=data,
+                headers=dict(response.headers),
+                status_code=response.status_code,
+            )
 
         except httpx.HTTPStatusError as e:
             self._update_rate_limits(e.response.headers)
@@ -373,6 +461,36 @@ class AsyncESIClient:
         except httpx.RequestError as e:
             raise AsyncESIError(f"Network error: {e}")
 
+    async def _cache_lookup(
+        self, cache: Optional[ESIResponseCache], cache_key: str
+    ) -> Optional[CachedResponse]:
+        """Find a cached response, reading SQLite off the event loop."""
+        if cache is None:
+            return None
+        cached = cache.peek(cache_key)
+        if cached is None and cache.persistent:
+            cached = await asyncio.to_thread(cache.get, cache_key)
+        return cached
+
+    async def _cache_persist(
+        self, cache: ESIResponseCache, cache_key: str, entry: CachedResponse, auth: bool
+    ) -> None:
+        """Write a public response through to SQLite off the event loop."""
+        if auth or not cache.persistent:
+            return
+        await asyncio.to_thread(cache.write_through, cache_key, entry)
+
+    @esi_retry_async()
+    async def _get_response_with_retry(
+        self,
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+        auth: bool = False,
+        use_cache: bool = True,
+    ) -> AsyncESIResponse:
+        """Execute GET request with retry logic, returning headers."""
+        return await self._get_response_once(endpoint, params, auth, use_cache)
+
     @esi_retry_async()
     async def _get_with_retry(
         self,
@@ -420,18 +538,20 @@ class AsyncESIClient:
         params: Optional[dict[str, Any]] = None,
         auth: bool = False,
         if_modified_since: Optional[str] = None,
+        if_none_match: Optional[str] = None,
     ) -> AsyncESIResponse:
         """
         Make GET request and return response with headers.
 
-        Useful for conditional requests (If-Modified-Since) and
-        pagination (X-Pages header).
+        Useful for conditional requests (If-Modified-Since or
+        If-None-Match) and pagination (X-Pages header).
 
         Args:
             endpoint: API endpoint path
             params: Optional query parameters
             auth: Whether to include authentication header
             if_modified_since: Value for If-Modified-Since header
+            if_none_match: ETag for If-None-Match header
 
         Returns:
             AsyncESIResponse with data and headers
@@ -450,6 +570,9 @@ class AsyncESIClient:
         if if_modified_since:
             headers["If-Modified-Since"] = if_modified_since
 
+        if if_none_match:
+            headers["If-None-Match"] = if_none_match
+
         try:
             response = await self._client.get(url, headers=headers if headers else None)
             self._update_rate_limits(response.headers)
@@ -482,6 +605,134 @@ class AsyncESIClient:
         except httpx.RequestError as e:
             raise AsyncESIError(f"Network error: {e}")
 
+    async def get_all_pages(
+        self,
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+        auth: bool = False,
+        max_pages: Optional[int] = None,
+        concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+        use_cache: bool = True,
+    ) -> AsyncIterator[list]:
+        """
+        Fetch every page of a paginated endpoint, yielding pages as they arrive.
+
+        Page 1 is fetched first to read X-Pages. The remaining pages are
+        fetched concurrently by at most ``concurrency`` workers and yielded
+        in completion order, not page order. Workers stop fetching while
+        ``concurrency`` pages are waiting to be consumed, so a caller that
+        aggregates each page as it arrives never holds the whole result.
+
+        Usage:
+            async for page in client.get_all_pages("/markets/10000002/orders/"):
+                for order in page:
+                    ...
+
+        Args:
+            endpoint: API endpoint path
+            params: Optional query parameters (``page`` is set per request)
+            auth: Whether to include authentication header
+            max_pages: Stop after this many pages (default: all)
+            concurrency: Maximum concurrent page requests (default: 8)
+            use_cache: Go through the response cache. Pass False for large
+                one-off dumps that would only evict everything else.
+
+        Yields:
+            The JSON list of each page
+
+        Raises:
+            AsyncESIError: If any page fails; outstanding pages are cancelled
+        """
+        async for response in self.get_all_page_responses(
+            endpoint,
+            params,
+            auth,
+            max_pages=max_pages,
+            concurrency=concurrency,
+            use_cache=use_cache,
+        ):
+            yield _page_items(response.data)
+
+    async def get_all_page_responses(
+        self,
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+        auth: bool = False,
+        max_pages: Optional[int] = None,
+        concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+        use_cache: bool = True,
+    ) -> AsyncIterator[AsyncESIResponse]:
+        """
+        Like get_all_pages(), but yield each page's full AsyncESIResponse.
+
+        The first response yielded is always page 1, so its headers
+        (Last-Modified, Expires, X-Pages) describe the whole result.
+        """
+        first = await self._get_page(endpoint, params, auth, page=1, use_cache=use_cache)
+        yield first
+
+        total_pages = first.x_pages or 1
+        if max_pages is not None:
+            total_pages = min(total_pages, max_pages)
+        if total_pages <= 1:
+            return
+
+        pending: asyncio.Queue[int] = asyncio.Queue()
+        for page in range(2, total_pages + 1):
+            pending.put_nowait(page)
+        done: asyncio.Queue[Union[AsyncESIResponse, BaseException]] = asyncio.Queue(
+            maxsize=max(1, concurrency)
+        )
+
+        async def worker() -> None:
+            while True:
+                try:
+                    page = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    result: Union[AsyncESIResponse, BaseException] = await self._get_page(
+                        endpoint, params, auth, page=page, use_cache=use_cache
+                    )
+                except Exception as e:
+                    result = e
+                await done.put(result)
+
+        workers = [
+            asyncio.ensure_future(worker())
+            for _ in range(min(max(1, concurrency), total_pages - 1))
+        ]
+        try:
+            for _ in range(total_pages - 1):
+                result = await done.get()
+                if isinstance(result, BaseException):
+                    raise result
+                yield result
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _get_page(
+        self,
+        endpoint: str,
+        params: Optional[dict[str, Any]],
+        auth: bool,
+        page: int,
+        use_cache: bool = True,
+    ) -> AsyncESIResponse:
+        """Fetch one page of a paginated endpoint, with retry if enabled."""
+        # Page 1 is requested without an explicit page parameter so its URL
+        # matches a plain get() of the same endpoint.
+        page_params = dict(params) if params else {}
+        if page > 1:
+            page_params["page"] = page
+        if self.enable_retry:
+            return await self._get_response_with_retry(
+                endpoint, page_params or None, auth, use_cache
+            )
+        return await self._get_response_once(endpoint, page_params or None, auth, use_cache)
+
     async def post(
         self,
         endpoint: str,
@@ -532,6 +783,11 @@ class AsyncESIClient:
             raise AsyncESIError(f"Network error: {e}")
 
 
+def _page_items(data: Any) -> list:
+    """Return a page body as a list (ESI paginated endpoints return arrays)."""
+    return data if isinstance(data, list) else []
+
+
 # =============================================================================
 # Convenience Functions
 # =============================================================================
@@ -17,6 +17,12 @@ from typing import Any, Optional, Union
 import httpx
 
 from .constants import ESI_BASE_URL, ESI_DATASOURCE
+from .response_cache import (
+    CachedResponse,
+    ESIResponseCache,
+    get_esi_response_cache,
+    response_cache_key,
+)
 from .retry import (
     RetryableESIError,
     classify_httpx_error,
@@ -72,6 +78,11 @@ class ESIResponse:
         except (ValueError, TypeError):
             return None
 
+    @property
+    def etag(self) -> str | None:
+        """ETag header, for If-None-Match revalidation."""
+        return self.headers.get("ETag") or self.headers.get("etag")
+
     @property
     def x_pages(self) -> int | None:
         """Parse X-Pages header for pagination."""
@@ -130,7 +141,12 @@ class ESIClient:
     """
 
     def __init__(
-        self, token: Optional[str] = None, timeout: int = 30, enable_retry: bool = True
+        self,
+        token: Optional[str] = None,
+        timeout: int = 30,
+        enable_retry: bool = True,
+        cache_responses: bool = True,
+        response_cache: Optional[ESIResponseCache] = None,
     ) -> None:
         """
         Initialize ESI client.
@@ -140,6 +156,10 @@ class ESIClient:
             timeout: Request timeout in seconds (default: 30)
             enable_retry: Whether to enable retry logic (default: True)
                          Requires tenacity: pip install aria[resilient]
+            cache_responses: Serve GETs through the ETag/Expires response
+                         cache shared with AsyncESIClient (default: True)
+            response_cache: Cache to use when caching is enabled
+                         (default: the process-wide get_esi_response_cache())
         """
         self.token: Optional[str] = token
         self.timeout: int = timeout
@@ -156,6 +176,13 @@ class ESIClient:
         self._error_limit_reset: float = 0  # Unix timestamp when limit resets
         self._rate_limit_backoff_threshold: int = 20  # Back off when fewer errors remain
 
+        # Conditional request cache (ETag / Expires)
+        self._response_cache: Optional[ESIResponseCache] = None
+        if cache_responses:
+            self._response_cache = (
+                response_cache if response_cache is not None else get_esi_response_cache()
+            )
+
     def _get_client(self) -> httpx.Client:
         """Get or create the httpx client (lazy initialization)."""
         if self._http_client is None:
@@ -275,6 +302,7 @@ class ESIClient:
         url: str,
         headers: dict[str, str],
         data: Optional[bytes] = None,
+        cached: Optional[CachedResponse] = None,
     ) -> Union[dict, list, int, float, None]:
         """
         Execute an HTTP request with optional retry logic.
@@ -288,6 +316,7 @@ class ESIClient:
             url: Full URL with query string
             headers: Request headers
             data: Request body bytes for POST requests
+            cached: Stale cache entry whose ETag was sent as If-None-Match
 
         Returns:
             Parsed JSON response
@@ -296,9 +325,9 @@ class ESIClient:
             ESIError: On HTTP errors or request failures
         """
         if self.enable_retry:
-            return self._execute_with_retry(method, url, headers, data)
+            return self._execute_with_retry(method, url, headers, data, cached)
         else:
-            return self._execute_once(method, url, headers, data)
+            return self._execute_once(method, url, headers, data, cached)
 
     def _execute_once(
         self,
@@ -306,6 +335,7 @@ class ESIClient:
         url: str,
         headers: dict[str, str],
         data: Optional[bytes] = None,
+        cached: Optional[CachedResponse] = None,
     ) -> Union[dict, list, int, float, None]:
         """Execute request without retry logic."""
         # Check rate limit before request
@@ -320,8 +350,7 @@ class ESIClient:
                 response = client.post(url, headers=headers, content=data)
 
             self._update_rate_limits(response.headers)
-            response.raise_for_status()
-            return response.json()
+            return self._read_response(method, url, headers, response, cached)
 
         except httpx.HTTPStatusError as e:
             self._update_rate_limits(e.response.headers)
@@ -345,6 +374,7 @@ class ESIClient:
         url: str,
         headers: dict[str, str],
         data: Optional[bytes] = None,
+        cached: Optional[CachedResponse] = None,
     ) -> Union[dict, list, int, float, None]:
         """
         Execute request with retry logic.
@@ -368,8 +398,7 @@ class ESIClient:
                 response = client.post(url, headers=headers, content=data)
 
             self._update_rate_limits(response.headers)
-            response.raise_for_status()
-            return response.json()
+            return self._read_response(method, url, headers, response, cached)
 
         except httpx.HTTPStatusError as e:
             self._update_rate_limits(e.response.headers)
@@ -389,6 +418,38 @@ class ESIClient:
         except json.JSONDecodeError as e:
             raise ESIError(f"Invalid JSON response: {e}")
 
+    def _read_response(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        response: httpx.Response,
+        cached: Optional[CachedResponse],
+    ) -> Union[dict, list, int, float, None]:
+        """
+        Parse a response, consulting and updating the response cache for GETs.
+
+        A 304 answering our If-None-Match returns the cached body. A 200
+        GET is stored when it carries an ETag or Expires header;
+        authenticated responses are kept in memory only.
+        """
+        cache = self._response_cache
+        if method != "GET" or cache is None:
+            response.raise_for_status()
+            return response.json()
+
+        authorization = headers.get("Authorization")
+        key = response_cache_key(url, authorization)
+        persist = authorization is None
+        if response.status_code == 304 and cached is not None:
+            return cache.revalidate(key, cached, response.headers, persist=persist).json()
+
+        response.raise_for_status()
+        data = response.json()
+        cache.record_miss()
+        cache.store(key, response.headers, response.content, persist=persist)
+        return data
+
     def get(
         self, endpoint: str, auth: bool = False, params: Optional[dict[str, Any]] = None
     ) -> Union[dict[str, Any], list[Any], int, float, None]:
@@ -398,6 +459,9 @@ class ESIClient:
         When retry is enabled, transient failures (429, 503, network errors)
         are automatically retried with exponential backoff.
 
+        Responses are served from the response cache while inside their
+        Expires window, and revalidated with If-None-Match after it.
+
         Args:
             endpoint: API endpoint path
             auth: Whether to include authorization header
@@ -417,8 +481,20 @@ class ESIClient:
                 raise ESIError("Authentication required but no token provided")
             headers["Authorization"] = f"Bearer {self.token}"
 
+        cache = self._response_cache
+        key = response_cache_key(url, headers.get("Authorization"))
+        cached = cache.get(key) if cache is not None else None
+        if cache is not None and cached is not None:
+            if cached.is_fresh():
+                cache.record_hit()
+                return cached.json()
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            else:
+                cached = None
+
         try:
-            return self._execute_request("GET", url, headers)
+            return self._execute_request("GET", url, headers, cached=cached)
         except RetryableESIError as e:
             # Convert retry error to ESIError if all retries failed
             raise ESIError(e.message, status_code=e.status_code)
@@ -431,18 +507,21 @@ class ESIClient:
         auth: bool = False,
         params: Optional[dict[str, Any]] = None,
         if_modified_since: Optional[str] = None,
+        if_none_match: Optional[str] = None,
     ) -> ESIResponse:
         """
         Make GET request to ESI with header capture.
 
-        Used for conditional requests (If-Modified-Since) and capturing
-        response headers like Last-Modified, Expires, and X-Pages.
+        Used for conditional requests (If-Modified-Since or If-None-Match)
+        and capturing response headers like Last-Modified, Expires, ETag,
+        and X-Pages.
 
         Args:
             endpoint: API endpoint path
             auth: Whether to include authorization header
             params: Additional query parameters
             if_modified_since: RFC 2822 timestamp for conditional request
+            if_none_match: ETag from a previous response for conditional request
 
         Returns:
             ESIResponse with data, headers, and status code
@@ -461,6 +540,9 @@ class ESIClient:
         if if_modified_since:
             headers["If-Modified-Since"] = if_modified_since
 
+        if if_none_match:
+            headers["If-None-Match"] = if_none_match
+
         # Check rate limit before request
         self._check_rate_limit()
 
@@ -16,6 +16,8 @@ Data Paths:
     - cache/aria.db: Market database
     - cache/eos-data/: EOS fitting data
     - cache/killmails.db: Killmail store
+    - cache/routes.db: Persisted route cache
+    - cache/esi.db: Persisted ESI response cache
 
 Environment Variables:
     ARIA_LOG_LEVEL: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -30,6 +32,8 @@ Environment Variables:
     ARIA_MCP_BYPASS_POLICY: Bypass MCP policy checks
     ARIA_UNIVERSE_GRAPH: Custom universe graph path
     ARIA_UNIVERSE_LOG_LEVEL: MCP server log level
+    ARIA_ROUTE_CACHE_PERSIST: Persist computed routes across restarts
+    ARIA_ESI_CACHE_PERSIST: Persist cacheable public ESI responses across restarts
     ARIA_DEBUG_TIMING: Enable timing debug logs
 
 External API Keys (no ARIA_ prefix):
@@ -214,6 +218,16 @@ class AriaSettings(BaseSettings):
         description="MCP universe server log level",
     )
 
+    route_cache_persist: bool = Field(
+        default=True,
+        description="Persist computed routes to cache/routes.db across restarts",
+    )
+
+    esi_cache_persist: bool = Field(
+        default=True,
+        description="Persist cacheable public ESI responses to cache/esi.db",
+    )
+
     # =========================================================================
     # External API Keys (loaded without ARIA_ prefix)
     # =========================================================================
@@ -257,6 +271,11 @@ class AriaSettings(BaseSettings):
         description="Hours to retain realtime kill data before cleanup",
     )
 
+    killmail_partition_by_day: bool = Field(
+        default=False,
+        description="Store killmails in one table per UTC day (retention drops whole days)",
+    )
+
     # =========================================================================
     # Validators
     # =========================================================================
@@ -308,6 +327,16 @@ class AriaSettings(BaseSettings):
         """Path to killmail database."""
         return self.instance_root / "cache" / "killmails.db"
 
+    @property
+    def route_cache_path(self) -> Path:
+        """Path to persisted route cache."""
+        return self.instance_root / "cache" / "routes.db"
+
+    @property
+    def esi_cache_path(self) -> Path:
+        """Path to persisted ESI response cache."""
+        return self.instance_root / "cache" / "esi.db"
+
     @property
     def cache_dir(self) -> Path:
         """Path to cache directory."""
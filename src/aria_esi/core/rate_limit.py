@@ -0,0 +1,132 @@
+"""
+ARIA ESI Request Rate Limiting
+
+Token-bucket limiter for outgoing ESI requests. A single process-wide
+bucket is shared by the killmail fetch queue and every AsyncESIClient,
+so all ESI traffic draws from one budget.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+# ESI requests per second allowed across the process
+ESI_REQUESTS_PER_SECOND = 20.0
+
+
+class TokenBucket:
+    """
+    Async token-bucket rate limiter.
+
+    Tokens refill continuously at `rate` per second up to `capacity`.
+    Waiters are served in arrival order, so a burst of callers is
+    spread evenly instead of stampeding when tokens refill.
+
+    Usage:
+        bucket = TokenBucket(rate=20)
+        await bucket.acquire()  # Waits until a token is available
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        """
+        Initialize the bucket, full.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size (default: one second of tokens)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        # Created lazily: the shared bucket outlives any one event loop
+        self._lock: asyncio.Lock | None = None
+        self._lock_loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def available(self) -> float:
+        """Tokens currently available."""
+        self._refill()
+        return self._tokens
+
+    def _refill(self) -> None:
+        """Add tokens accrued since the last update."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """
+        Take tokens without waiting.
+
+        Args:
+            tokens: Tokens to take
+
+        Returns:
+            True if taken, False if not enough were available
+        """
+        self._refill()
+        if self._tokens >= tokens:
+            self._tokens -= tokens
+            return True
+        return False
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Return the waiter lock, recreated for each running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens, waiting until they are available.
+
+        Args:
+            tokens: Tokens to take (at most capacity)
+
+        Returns:
+            Seconds spent waiting
+        """
+        if tokens > self.capacity:
+            raise ValueError("Cannot acquire more tokens than bucket capacity")
+
+        waited = 0.0
+        async with self._get_lock():
+            self._refill()
+            while self._tokens < tokens:
+                delay = (tokens - self._tokens) / self.rate
+                await asyncio.sleep(delay)
+                waited += delay
+                self._refill()
+            self._tokens -= tokens
+        return waited
+
+
+# =============================================================================
+# Shared ESI limiter
+# =============================================================================
+
+_esi_rate_limiter: TokenBucket | None = None
+
+
+def get_esi_rate_limiter() -> TokenBucket:
+    """Get or create the process-wide ESI rate limiter."""
+    global _esi_rate_limiter
+    if _esi_rate_limiter is None:
+        _esi_rate_limiter = TokenBucket(rate=ESI_REQUESTS_PER_SECOND)
+    return _esi_rate_limiter
+
+
+def reset_esi_rate_limiter() -> None:
+    """Reset the shared ESI rate limiter (for testing)."""
+    global _esi_rate_limiter
+    _esi_rate_limiter = None
@@ -0,0 +1,531 @@
+"""
+ESI Response Cache.
+
+Conditional-request cache shared by ESIClient and AsyncESIClient. GET
+responses carrying an ETag or Expires header are kept in a bounded
+in-memory LRU, keyed by the full request URL (plus a hash of the
+Authorization header for authenticated requests, see response_cache_key):
+
+- Inside the Expires window the cached body is served without a request.
+- After it, the request is sent with If-None-Match. A 304 refreshes the
+  entry's expiry and the cached body is served again.
+
+Public (unauthenticated) responses are also written through to a small
+SQLite file (cache/esi.db) so the CLI and the MCP server share them
+across processes and restarts. Authenticated responses stay in memory;
+character data is never written to the shared file.
+
+Bodies are cached as raw JSON bytes and parsed on every hit, so callers
+can mutate what they get back without corrupting the cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+ESI_CACHE_SIZE = 1024
+"""Maximum responses held in memory."""
+
+ESI_CACHE_MAX_BYTES = 64 * 1024 * 1024
+"""Maximum total body bytes held in memory."""
+
+ESI_CACHE_MAX_PERSISTED_BODY = 1024 * 1024
+"""Bodies larger than this are cached in memory only."""
+
+ESI_CACHE_MAX_ROWS = 4096
+"""Maximum responses kept in the SQLite file."""
+
+ESI_CACHE_PRUNE_INTERVAL = 256
+"""Persisted writes between trims of the SQLite table back to max rows."""
+
+RETAINED_HEADERS = ("etag", "expires", "last-modified", "x-pages")
+"""Response headers stored with a cached body and replayed on hits."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    etag TEXT,
+    expires REAL NOT NULL,
+    headers TEXT NOT NULL,
+    stored_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_stored ON responses(stored_at);
+"""
+
+
+# =============================================================================
+# Cached Response
+# =============================================================================
+
+
+@dataclass
+class CachedResponse:
+    """A cached ESI response body and its validators."""
+
+    body: bytes
+    """Raw JSON response body."""
+
+    etag: str | None = None
+    """ETag validator for If-None-Match revalidation."""
+
+    expires: float = 0.0
+    """Unix timestamp the body is fresh until (0 when unknown)."""
+
+    headers: dict[str, str] = field(default_factory=dict)
+    """Retained response headers (lowercase keys)."""
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        """Check whether the body can be served without revalidation."""
+        return self.expires > (time.time() if now is None else now)
+
+    def json(self) -> Any:
+        """Parse the cached body."""
+        return json.loads(self.body)
+
+
+def parse_expires(headers: Mapping[str, str]) -> float:
+    """
+    Parse an Expires header to a Unix timestamp.
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        Expiry timestamp, or 0.0 if missing or unparseable
+    """
+    value = headers.get("expires") or headers.get("Expires")
+    if not value:
+        return 0.0
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def response_cache_key(url: str, authorization: str | None = None) -> str:
+    """
+    Build the cache key for a GET request.
+
+    Authenticated responses are scoped to the credential that fetched
+    them, so an unauthenticated call or another pilot's token for the
+    same URL never receives them.
+
+    Args:
+        url: Full request URL
+        authorization: Authorization header value, if any
+
+    Returns:
+        The URL, suffixed with a credential hash when authenticated
+    """
+    if not authorization:
+        return url
+    digest = hashlib.blake2b(authorization.encode(), digest_size=16).hexdigest()
+    return f"{url}#auth={digest}"
+
+
+def _retained_headers(headers: Mapping[str, str]) -> dict[str, str]:
+    lowered = {name.lower(): value for name, value in headers.items()}
+    return {name: lowered[name] for name in RETAINED_HEADERS if lowered.get(name)}
+
+
+# =============================================================================
+# Response Cache
+# =============================================================================
+
+
+class ESIResponseCache:
+    """
+    LRU cache of ESI GET responses with optional SQLite write-through.
+
+    Thread-safe; one lock guards the in-memory LRU and the SQLite
+    connection. Persistence failures are logged and disable persistence
+    rather than failing the request.
+
+    Example:
+        entry = cache.get(url)
+        if entry is not None and entry.is_fresh():
+            return entry.json()
+        # ... send request with If-None-Match: entry.etag ...
+        if response.status_code == 304:
+            return cache.revalidate(url, entry, response.headers).json()
+        cache.store(url, response.headers, response.content)
+    """
+
+    def __init__(
+        self,
+        maxsize: int = ESI_CACHE_SIZE,
+        max_bytes: int = ESI_CACHE_MAX_BYTES,
+        db_path: Path | None = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum responses held in memory
+            max_bytes: Maximum total body bytes held in memory
+            db_path: Optional SQLite file for persistence
+        """
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.db_path = db_path
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._writes_since_prune = 0
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.disk_hits = 0
+
+        if db_path is not None:
+            self._open(db_path)
+
+    @property
+    def persistent(self) -> bool:
+        """Whether public responses are written through to SQLite."""
+        return self._conn is not None
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    def peek(self, url: str) -> CachedResponse | None:
+        """
+        Look up a response in memory only (never touches SQLite).
+
+        Args:
+            url: Full request URL
+
+        Returns:
+            Cached entry (fresh or stale), or None
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+
+    def get(self, url: str) -> CachedResponse | None:
+        """
+        Look up a response in memory, then in SQLite.
+
+        Args:
+            url: Full request URL
+
+        Returns:
+            Cached entry (fresh or stale), or None
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+                return entry
+            if self._conn is None:
+                return None
+            entry = self._load(url)
+            if entry is not None:
+                self.disk_hits += 1
+                self._insert(url, entry)
+            return entry
+
+    def record_hit(self) -> None:
+        """Count a request served from a fresh entry."""
+        with self._lock:
+            self.hits += 1
+
+    def record_miss(self) -> None:
+        """Count a request that went to ESI without a usable validator."""
+        with self._lock:
+            self.misses += 1
+
+    def store(
+        self,
+        url: str,
+        headers: Mapping[str, str],
+        body: bytes,
+        persist: bool = True,
+    ) -> CachedResponse | None:
+        """
+        Cache a 200 response if it carries an ETag or Expires header.
+
+        Args:
+            url: Full request URL
+            headers: Response headers
+            body: Raw JSON response body
+            persist: Write through to SQLite (False for authenticated
+                responses)
+
+        Returns:
+            The cached entry, or None if the response is not cacheable
+        """
+        retained = _retained_headers(headers)
+        if "etag" not in retained and "expires" not in retained:
+            return None
+        entry = CachedResponse(
+            body=bytes(body),
+            etag=retained.get("etag"),
+            expires=parse_expires(retained),
+            headers=retained,
+        )
+        with self._lock:
+            self.stores += 1
+            self._insert(url, entry)
+            if persist and self._conn is not None:
+                self._persist(url, entry)
+        return entry
+
+    def revalidate(
+        self,
+        url: str,
+        entry: CachedResponse,
+        headers: Mapping[str, str],
+        persist: bool = True,
+    ) -> CachedResponse:
+        """
+        Refresh an entry after a 304 Not Modified.
+
+        Args:
+            url: Full request URL
+            entry: Entry whose ETag was sent as If-None-Match
+            headers: 304 response headers (new Expires, possibly new ETag)
+            persist: Write the new expiry through to SQLite
+
+        Returns:
+            The refreshed entry (same body)
+        """
+        retained = {**entry.headers, **_retained_headers(headers)}
+        refreshed = CachedResponse(
+            body=entry.body,
+            etag=retained.get("etag"),
+            expires=parse_expires(retained),
+            headers=retained,
+        )
+        with self._lock:
+            self.revalidated += 1
+            self._insert(url, refreshed)
+            if persist and self._conn is not None:
+                self._persist(url, refreshed)
+        return refreshed
+
+    def write_through(self, url: str, entry: CachedResponse) -> None:
+        """
+        Write an entry to SQLite without touching the in-memory LRU.
+
+        For callers that store/revalidate with persist=False and then
+        persist off their event loop.
+
+        Args:
+            url: Full request URL
+            entry: Entry returned by store() or revalidate()
+        """
+        with self._lock:
+            if self._conn is not None:
+                self._persist(url, entry)
+
+    def clear(self) -> None:
+        """Drop all cached responses, including persisted ones, and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.revalidated = self.misses = 0
+            self.stores = self.evictions = self.disk_hits = 0
+            if self._conn is not None:
+                try:
+                    with self._conn:
+                        self._conn.execute("DELETE FROM responses")
+                except sqlite3.Error as e:
+                    self._disable_persistence(e)
+
+    def close(self) -> None:
+        """Close the SQLite connection, if any. In-memory entries are kept."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache counters for status reporting.
+
+        Returns:
+            Dict with hit/revalidation/miss counters, memory usage and
+            persistence details
+        """
+        with self._lock:
+            requests = self.hits + self.revalidated + self.misses
+            return {
+                "entries": len(self._entries),
+                "maxsize": self.maxsize,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "revalidated": self.revalidated,
+                "misses": self.misses,
+                "hit_rate": (
+                    round((self.hits + self.revalidated) / requests, 4) if requests else None
+                ),
+                "stores": self.stores,
+                "evictions": self.evictions,
+                "persistent": self._conn is not None,
+                "loaded_from_disk": self.disk_hits,
+                "db_path": str(self.db_path) if self.db_path else None,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # -------------------------------------------------------------------------
+    # Internals (call with lock held)
+    # -------------------------------------------------------------------------
+
+    def _insert(self, url: str, entry: CachedResponse) -> None:
+        old = self._entries.pop(url, None)
+        if old is not None:
+            self._bytes -= len(old.body)
+        if len(entry.body) > self.max_bytes:
+            return
+        self._entries[url] = entry
+        self._bytes += len(entry.body)
+        while len(self._entries) > self.maxsize or self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted.body)
+            self.evictions += 1
+
+    def _open(self, db_path: Path) -> None:
+        """Open the SQLite file, dropping unusable rows."""
+        try:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(db_path), check_same_thread=False, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            with conn:
+                # Entries without an ETag can't be revalidated once expired
+                dropped = conn.execute(
+                    "DELETE FROM responses WHERE etag IS NULL AND expires < ?",
+                    (time.time(),),
+                ).rowcount
+        except sqlite3.Error as e:
+            logger.warning("ESI response cache persistence unavailable (%s): %s", db_path, e)
+            return
+
+        if dropped:
+            logger.debug("ESI response cache: dropped %d expired responses", dropped)
+        self._conn = conn
+
+    def _load(self, url: str) -> CachedResponse | None:
+        assert self._conn is not None
+        try:
+            row = self._conn.execute(
+                "SELECT body, etag, expires, headers FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+        except sqlite3.Error as e:
+            self._disable_persistence(e)
+            return None
+        if row is None:
+            return None
+        body, etag, expires, headers = row
+        try:
+            retained = json.loads(headers)
+        except json.JSONDecodeError:
+            return None
+        return CachedResponse(body=bytes(body), etag=etag, expires=expires, headers=retained)
+
+    def _persist(self, url: str, entry: CachedResponse) -> None:
+        assert self._conn is not None
+        if len(entry.body) > ESI_CACHE_MAX_PERSISTED_BODY:
+            return
+        try:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        url,
+                        entry.body,
+                        entry.etag,
+                        entry.expires,
+                        json.dumps(entry.headers),
+                        time.time(),
+                    ),
+                )
+                self._writes_since_prune += 1
+                if self._writes_since_prune >= ESI_CACHE_PRUNE_INTERVAL:
+                    self._writes_since_prune = 0
+                    self._conn.execute(
+                        """
+                        DELETE FROM responses WHERE rowid IN (
+                            SELECT rowid FROM responses ORDER BY stored_at DESC
+                            LIMIT -1 OFFSET ?
+                        )
+                        """,
+                        (ESI_CACHE_MAX_ROWS,),
+                    )
+        except sqlite3.Error as e:
+            self._disable_persistence(e)
+
+    def _disable_persistence(self, error: sqlite3.Error) -> None:
+        logger.warning("ESI response cache persistence disabled: %s", error)
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+# =============================================================================
+# Process-wide Accessor
+# =============================================================================
+
+_response_cache: ESIResponseCache | None = None
+_response_cache_lock = threading.Lock()
+
+
+def get_esi_response_cache() -> ESIResponseCache:
+    """
+    Get or create the process-wide ESI response cache.
+
+    Persists to cache/esi.db unless ARIA_ESI_CACHE_PERSIST is disabled.
+
+    Returns:
+        Shared ESIResponseCache
+    """
+    global _response_cache
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                from .config import get_settings
+
+                settings = get_settings()
+                _response_cache = ESIResponseCache(
+                    db_path=settings.esi_cache_path if settings.esi_cache_persist else None
+                )
+    return _response_cache
+
+
+def reset_esi_response_cache() -> None:
+    """Reset the shared ESI response cache (for testing)."""
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is not None:
+            _response_cache.close()
+        _response_cache = None
@@ -30,6 +30,9 @@ class UniverseLimits:
     Output limits control truncation for context management.
     """
 
+    # Route tool limits
+    ROUTE_MAX_DESTINATIONS: int = 50  # Max destinations per multi-route request
+
     # Search tool limits
     SEARCH_MAX_LIMIT: int = 100  # Max systems user can request
     SEARCH_MAX_JUMPS: int = 50  # Max search radius
@@ -45,6 +48,7 @@ class UniverseLimits:
     # Waypoints tool limits
     WAYPOINTS_MIN_COUNT: int = 2  # Minimum waypoints for optimization
     WAYPOINTS_MAX_COUNT: int = 50  # Maximum waypoints for optimization
+    TSP_TIME_BUDGET_MS: int = 50  # Visit-order improvement budget (waypoints, loop)
 
     # Loop tool limits
     LOOP_MIN_TARGET_JUMPS: int = 10  # Minimum loop size
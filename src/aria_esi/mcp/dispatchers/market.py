@@ -699,13 +699,14 @@ async def _valuation(
     quantities: dict[int, int] = {}
     unresolved_items: list[dict] = []
 
-    for item in items:
-        if not isinstance(item, dict):
-            continue
+    entries = [item for item in items if isinstance(item, dict)]
+    resolved = db.batch_resolve_names([item.get("name", "") for item in entries])
+
+    for item in entries:
         name = item.get("name", "")
         qty = item.get("quantity", 1)
 
-        type_info = db.resolve_type_name(name)
+        type_info = resolved.get(name)
         if type_info:
             type_id = type_info.type_id
             type_ids.append(type_id)
@@ -6,6 +6,8 @@ Aggregates status from all domains:
 - Market cache (Fuzzwork, ESI orders, ESI history)
 - SDE database
 - EOS fitting engine
+- Route cache
+- ESI response cache
 """
 
 from __future__ import annotations
@@ -39,6 +41,8 @@ def register_status_tool(server: FastMCP) -> None:
         - Market cache: Fuzzwork, ESI orders, and history cache status
         - SDE database: Type count and database health
         - Fitting engine: EOS data availability and version
+        - Navigation: Route cache hit/miss counters
+        - ESI: Response cache hit/revalidation/miss counters
 
         Returns:
             Dictionary with status for each domain:
@@ -46,6 +50,8 @@ def register_status_tool(server: FastMCP) -> None:
             - market: Fuzzwork, ESI orders, ESI history cache status
             - sde: Database stats, type count, availability
             - fitting: EOS data validity, version, available files
+            - navigation: Route cache size, hits, misses, persistence
+            - esi: Response cache size, hits, revalidations, persistence
             - summary: Overall health indicator
 
         Example response:
@@ -70,6 +76,12 @@ def register_status_tool(server: FastMCP) -> None:
                     "version": "2548611",
                     "total_records": 45678
                 },
+                "navigation": {
+                    "route_cache": {"entries": 120, "hits": 950, "misses": 120, ...}
+                },
+                "esi": {
+                    "response_cache": {"entries": 40, "hits": 310, "revalidated": 25, ...}
+                },
                 "summary": {
                     "all_healthy": true,
                     "issues": []
@@ -203,6 +215,26 @@ def register_status_tool(server: FastMCP) -> None:
             result["fitting"] = {"is_valid": False, "error": str(e)}
             issues.append("Fitting engine unavailable")
 
+        # Route cache status
+        try:
+            from aria_esi.services.navigation import get_route_cache
+
+            from ..tools import get_universe
+
+            result["navigation"] = {"route_cache": get_route_cache(get_universe()).get_stats()}
+        except Exception as e:
+            logger.debug("Route cache status unavailable: %s", e)
+            result["navigation"] = {"route_cache": None, "error": str(e)}
+
+        # ESI response cache status
+        try:
+            from aria_esi.core.response_cache import get_esi_response_cache
+
+            result["esi"] = {"response_cache": get_esi_response_cache().get_stats()}
+        except Exception as e:
+            logger.debug("ESI response cache status unavailable: %s", e)
+            result["esi"] = {"response_cache": None, "error": str(e)}
+
         # Discord webhook status
         try:
             from aria_esi.services.redisq.notifications import get_notification_manager
@@ -92,7 +92,7 @@ def register_universe_dispatcher(server: FastMCP, graph: UniverseGraph) -> None:
         action: str,
         # route params
         origin: str | None = None,
-        destination: str | None = None,
+        destination: str | list[str] | None = None,
         mode: str = "shortest",
         avoid_systems: list[str] | None = None,
         # systems params
@@ -113,6 +113,8 @@ def register_universe_dispatcher(server: FastMCP, graph: UniverseGraph) -> None:
         max_borders: int | None = None,
         optimize: str = "density",
         security_filter: str = "highsec",
+        # loop/waypoints params
+        solver: str = "optimize",
         # waypoints params
         waypoints: list[str] | None = None,
         return_to_origin: bool = True,
@@ -156,7 +158,8 @@ def register_universe_dispatcher(server: FastMCP, graph: UniverseGraph) -> None:
 
             Route params (action="route"):
                 origin: Starting system
-                destination: Target system
+                destination: Target system, or a list of systems to route to
+                    each of them at once (max 50, results sorted by jumps)
                 mode: "shortest", "safe", or "unsafe"
                 avoid_systems: Systems to avoid
 
@@ -184,6 +187,7 @@ def register_universe_dispatcher(server: FastMCP, graph: UniverseGraph) -> None:
                 optimize: "density" or "coverage"
                 security_filter: "highsec", "lowsec", or "any"
                 avoid_systems: Systems to avoid
+                solver: "optimize" (default) or "greedy" border visit ordering
 
             Analyze params (action="analyze"):
                 systems: Ordered route to analyze
@@ -203,6 +207,8 @@ def register_universe_dispatcher(server: FastMCP, graph: UniverseGraph) -> None:
                 return_to_origin: Return to start (default True)
                 security_filter: "any", "highsec", "lowsec"
                 avoid_systems: Systems to avoid
+                solver: "optimize" (default, exact up to 12 stops, else
+                    2-opt/Or-opt within a time budget) or "greedy"
 
             Activity params (action="activity"):
                 systems: Systems to query
@@ -240,6 +246,7 @@ def register_universe_dispatcher(server: FastMCP, graph: UniverseGraph) -> None:
 
         Examples:
             universe(action="route", origin="Jita", destination="Amarr", mode="safe")
+            universe(action="route", origin="Jita", destination=["Amarr", "Dodixie", "Rens"])
             universe(action="systems", systems=["Jita", "Perimeter"])
             universe(action="borders", origin="Dodixie", limit=5)
             universe(action="loop", origin="Masalle", target_jumps=25)
@@ -291,6 +298,7 @@ def register_universe_dispatcher(server: FastMCP, graph: UniverseGraph) -> None:
                 "max_borders": max_borders,
                 "optimize": optimize,
                 "security_filter": security_filter,
+                "solver": solver,
                 "waypoints": waypoints,
                 "return_to_origin": return_to_origin,
                 "activity_type": activity_type,
@@ -305,10 +313,22 @@ def register_universe_dispatcher(server: FastMCP, graph: UniverseGraph) -> None:
             },
         )
 
+        # A list of destinations is only meaningful for route
+        destinations: list[str] = []
+        if isinstance(destination, list):
+            if action != "route":
+                raise InvalidParameterError(
+                    "destination",
+                    destination,
+                    "A list of systems is only supported for action='route'",
+                )
+            destinations = destination
+            destination = None
+
         # Execute action and add any validation warnings to result
         match action:
             case "route":
-                result = await _route(origin, destination, mode, avoid_systems)
+                result = await _route(origin, destination, destinations, mode, avoid_systems)
 
             case "systems":
                 result = await _systems(systems)
@@ -330,6 +350,7 @@ def register_universe_dispatcher(server: FastMCP, graph: UniverseGraph) -> None:
                     optimize,
                     security_filter,
                     avoid_systems,
+                    solver,
                 )
 
             case "analyze":
@@ -349,7 +370,7 @@ def register_universe_dispatcher(server: FastMCP, graph: UniverseGraph) -> None:
 
             case "optimize_waypoints":
                 result = await _optimize_waypoints(
-                    waypoints, origin, return_to_origin, security_filter, avoid_systems
+                    waypoints, origin, return_to_origin, security_filter, avoid_systems, solver
                 )
 
             case "activity":
@@ -398,12 +419,15 @@ def register_universe_dispatcher(server: FastMCP, graph: UniverseGraph) -> None:
 async def _route(
     origin: str | None,
     destination: str | None,
+    destinations: list[str],
     mode: str,
     avoid_systems: list[str] | None,
 ) -> dict:
     """Route action - delegate to tools_route."""
     if not origin:
         raise InvalidParameterError("origin", origin, "Required for action='route'")
+    if destinations:
+        return await _route_many(origin, destinations, mode, avoid_systems)
     if not destination:
         raise InvalidParameterError("destination", destination, "Required for action='route'")
 
@@ -467,6 +491,98 @@ async def _route(
     )
 
 
+async def _route_many(
+    origin: str,
+    destinations: list[str],
+    mode: str,
+    avoid_systems: list[str] | None,
+) -> dict:
+    """Route action with several destinations - one batched route table."""
+    if len(destinations) > UNIVERSE.ROUTE_MAX_DESTINATIONS:
+        raise InvalidParameterError(
+            "destination",
+            f"{len(destinations)} systems",
+            f"Max {UNIVERSE.ROUTE_MAX_DESTINATIONS} destinations per request",
+        )
+
+    from ...services.navigation import (
+        NavigationService,
+        compute_security_summary,
+        generate_warnings,
+    )
+    from ..models import MultiRouteResult, RouteSummary, SecuritySummary
+    from ..tools import collect_corrections, get_universe, resolve_system_name
+    from ..tools_route import VALID_MODES
+
+    universe = get_universe()
+
+    if mode not in VALID_MODES:
+        raise InvalidParameterError(
+            "mode", mode, f"Must be one of: {', '.join(sorted(VALID_MODES))}"
+        )
+
+    origin_resolved = resolve_system_name(origin)
+    dest_resolved = [resolve_system_name(name) for name in destinations]
+    corrections = collect_corrections(origin_resolved, *dest_resolved)
+
+    service = NavigationService(universe)
+    avoid_indices, unresolved_avoids = service.resolve_avoid_systems(avoid_systems or [])
+
+    table = service.calculate_routes(
+        [origin_resolved.idx],
+        [r.idx for r in dest_resolved],
+        mode,  # type: ignore[arg-type]
+        avoid_indices or None,
+    )
+
+    routes: list[RouteSummary] = []
+    unreachable: list[str] = []
+    seen: set[int] = set()
+    for resolved in dest_resolved:
+        if resolved.idx in seen:
+            continue
+        seen.add(resolved.idx)
+
+        path = table.path(origin_resolved.idx, resolved.idx)
+        if not path:
+            unreachable.append(resolved.canonical_name)
+            continue
+
+        summary = compute_security_summary(universe, path)
+        routes.append(
+            RouteSummary(
+                destination=resolved.canonical_name,
+                jumps=len(path) - 1,
+                systems=[universe.idx_to_name[idx] for idx in path],
+                security_summary=SecuritySummary(
+                    total_jumps=summary.total_jumps,
+                    highsec_jumps=summary.highsec_jumps,
+                    lowsec_jumps=summary.lowsec_jumps,
+                    nullsec_jumps=summary.nullsec_jumps,
+                    lowest_security=summary.lowest_security,
+                    lowest_security_system=summary.lowest_security_system,
+                ),
+                warnings=generate_warnings(universe, path, mode),
+            )
+        )
+
+    routes.sort(key=lambda r: r.jumps)
+
+    warnings: list[str] = []
+    if unresolved_avoids:
+        warnings.append(f"Unknown systems in avoid_systems: {', '.join(unresolved_avoids)}")
+
+    result = MultiRouteResult(
+        origin=origin_resolved.canonical_name,
+        mode=mode,  # type: ignore[arg-type]
+        routes=routes,
+        unreachable=unreachable,
+        warnings=warnings,
+        corrections=corrections,
+    )
+    return wrap_output(result.model_dump(), "routes", max_items=UNIVERSE.ROUTE_MAX_DESTINATIONS)
+
+
 async def _systems(systems: list[str] | None) -> dict:
     """Systems action - delegate to tools_systems."""
     if not systems:
@@ -639,11 +755,13 @@ async def _loop(
     optimize: str,
     security_filter: str,
     avoid_systems: list[str] | None,
+    solver: str = "optimize",
 ) -> dict:
     """Loop action - delegate to tools_loop."""
     if not origin:
         raise InvalidParameterError("origin", origin, "Required for action='loop'")
 
+    from ...services.loop_planning.tsp import VALID_TSP_SOLVERS, is_tsp_solver
     from ..models import VALID_OPTIMIZE_MODES, VALID_SECURITY_FILTERS
     from ..tools import collect_corrections, get_universe, resolve_system_name
     from ..tools_loop import (
@@ -687,6 +805,12 @@ async def _loop(
             security_filter,
             f"Must be one of: {', '.join(sorted(VALID_SECURITY_FILTERS))}",
         )
+    if not is_tsp_solver(solver):
+        raise InvalidParameterError(
+            "solver",
+            solver,
+            f"Must be one of: {', '.join(sorted(VALID_TSP_SOLVERS))}",
+        )
 
     origin_resolved = resolve_system_name(origin)
     corrections = collect_corrections(origin_resolved)
@@ -712,6 +836,7 @@ async def _loop(
         avoid_systems=avoid_indices,
         unresolved_avoids=unresolved_avoids,
         corrections=corrections,
+        solver=solver,
     )
 
     return wrap_output(result, "systems", max_items=UNIVERSE.OUTPUT_MAX_SYSTEMS)
@@ -841,8 +966,10 @@ async def _optimize_waypoints(
     return_to_origin: bool,
     security_filter: str,
     avoid_systems: list[str] | None,
+    solver: str = "optimize",
 ) -> dict:
     """Optimize waypoints action - delegate to tools_waypoints."""
+    from ...services.loop_planning.tsp import VALID_TSP_SOLVERS, is_tsp_solver
     from ..models import VALID_SECURITY_FILTERS
     from ..tools import collect_corrections, get_universe, resolve_system_name
     from ..tools_waypoints import (
@@ -878,6 +1005,12 @@ async def _optimize_waypoints(
             security_filter,
             f"Must be one of: {', '.join(sorted(VALID_SECURITY_FILTERS))}",
         )
+    if not is_tsp_solver(solver):
+        raise InvalidParameterError(
+            "solver",
+            solver,
+            f"Must be one of: {', '.join(sorted(VALID_TSP_SOLVERS))}",
+        )
 
     origin_idx: int | None = None
     origin_name: str | None = None
@@ -926,6 +1059,7 @@ async def _optimize_waypoints(
         unresolved_waypoints=unresolved,
         unresolved_avoids=unresolved_avoids,
         corrections=corrections,
+        solver=solver,
     )
 
     return wrap_output(result, "route", max_items=UNIVERSE.OUTPUT_MAX_ROUTE)
@@ -7,13 +7,16 @@ Provides in-memory caching of market data with multi-layer fallback:
 3. Database cache (stale fallback)
 
 Follows the ActivityCache pattern: on-demand refresh with async locks
-to prevent duplicate API calls.
+to prevent duplicate API calls. Raw regional orders are fetched
+single-flight per (region, type, side), so concurrent callers for the
+same key share one ESI request while different keys run in parallel.
 """
 
 from __future__ import annotations
 
 import asyncio
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -45,6 +48,9 @@ FUZZWORK_TTL_SECONDS = 900  # 15 minutes
 ESI_ORDERS_TTL_SECONDS = 300  # 5 minutes
 ESI_HISTORY_TTL_SECONDS = 3600  # 1 hour
 
+# Maximum cached (region, type, order_type) order lists
+RAW_ORDERS_CACHE_SIZE = 512
+
 # Freshness thresholds (seconds)
 FRESH_THRESHOLD = 300  # 5 minutes
 RECENT_THRESHOLD = 1800  # 30 minutes
@@ -102,6 +108,100 @@ class CachedOrders:
     order_type: str  # "sell", "buy", or "all"
 
 
+RawOrdersKey = tuple[int, int, str]
+
+
+class RawOrdersCache:
+    """
+    Size-bounded LRU of raw regional orders with TTL expiry.
+
+    Entries older than ttl_seconds are treated as misses and dropped.
+    When full, expired entries are purged first, then the least recently
+    used entries are evicted.
+
+    Not thread-safe; MarketCache uses it from a single event loop.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = RAW_ORDERS_CACHE_SIZE,
+        ttl_seconds: int = ESI_ORDERS_TTL_SECONDS,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum cached order lists
+            ttl_seconds: Age after which an entry is refetched
+        """
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[RawOrdersKey, CachedOrders] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _is_expired(self, entry: CachedOrders, now: float) -> bool:
+        return now - entry.timestamp >= self.ttl_seconds
+
+    def get(self, key: RawOrdersKey) -> CachedOrders | None:
+        """
+        Look up fresh orders, counting a hit or miss.
+
+        Args:
+            key: (region_id, type_id, order_type)
+
+        Returns:
+            Cached entry, or None if absent or expired
+        """
+        entry = self._entries.get(key)
+        if entry is not None and self._is_expired(entry, time.time()):
+            del self._entries[key]
+            self.expirations += 1
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: RawOrdersKey, entry: CachedOrders) -> None:
+        """Store orders, evicting expired and then least recently used entries."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        if len(self._entries) <= self.maxsize:
+            return
+
+        now = time.time()
+        for stale in [k for k, e in self._entries.items() if self._is_expired(e, now)]:
+            del self._entries[stale]
+            self.expirations += 1
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache counters for status reporting."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
 # =============================================================================
 # Market Cache
 # =============================================================================
@@ -168,9 +268,9 @@ class MarketCache:
         self._fuzzwork = CacheLayer(name="fuzzwork", ttl_seconds=FUZZWORK_TTL_SECONDS)
         self._esi_orders = CacheLayer(name="esi_orders", ttl_seconds=ESI_ORDERS_TTL_SECONDS)
 
-        # Raw orders cache: key = (region_id, type_id, order_type)
-        self._raw_orders_cache: dict[tuple[int, int, str], CachedOrders] = {}
-        self._raw_orders_lock = asyncio.Lock()
+        # Raw orders cache and in-flight fetches: key = (region_id, type_id, order_type)
+        self._raw_orders_cache = RawOrdersCache()
+        self._raw_orders_inflight: dict[RawOrdersKey, asyncio.Task[list[dict]]] = {}
 
         # Clients (lazy-loaded)
         self._fuzzwork_client: FuzzworkClient | None = None
@@ -287,6 +387,10 @@ class MarketCache:
                 "stale": self._esi_orders.is_stale(),
                 "last_error": self._esi_orders.last_error,
             },
+            "raw_orders": {
+                **self._raw_orders_cache.get_stats(),
+                "in_flight": len(self._raw_orders_inflight),
+            },
             "region_id": self._region_id,
             "station_id": self._station_id,
         }
@@ -322,9 +426,8 @@ class MarketCache:
         """
         cache_key = (region_id, type_id, order_type)
 
-        # Check cache first (outside lock for read)
         cached = self._raw_orders_cache.get(cache_key)
-        if cached and (time.time() - cached.timestamp) < ESI_ORDERS_TTL_SECONDS:
+        if cached is not None:
             logger.debug(
                 "Cache hit for orders: region=%d type=%d order_type=%s",
                 region_id,
@@ -333,33 +436,43 @@ class MarketCache:
             )
             return cached.orders
 
-        # Fetch with lock to prevent duplicate requests
-        async with self._raw_orders_lock:
-            # Double-check cache after acquiring lock
-            cached = self._raw_orders_cache.get(cache_key)
-            if cached and (time.time() - cached.timestamp) < ESI_ORDERS_TTL_SECONDS:
-                return cached.orders
+        # Join an in-flight fetch for the same key, or start one. The fetch
+        # runs as its own task so a cancelled caller doesn't abort it for
+        # the others.
+        task = self._raw_orders_inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(self._load_raw_orders(cache_key))
+            self._raw_orders_inflight[cache_key] = task
+        else:
+            self._raw_orders_cache.coalesced += 1
+        return await asyncio.shield(task)
 
-            # Fetch from ESI
+    async def _load_raw_orders(self, cache_key: RawOrdersKey) -> list[dict]:
+        """Fetch orders for a key from ESI and cache them."""
+        region_id, type_id, order_type = cache_key
+        try:
             orders = await self._fetch_raw_orders(region_id, type_id, order_type)
-
-            # Cache the result
-            self._raw_orders_cache[cache_key] = CachedOrders(
-                orders=orders,
-                timestamp=time.time(),
-                region_id=region_id,
-                type_id=type_id,
-                order_type=order_type,
+            self._raw_orders_cache.put(
+                cache_key,
+                CachedOrders(
+                    orders=orders,
+                    timestamp=time.time(),
+                    region_id=region_id,
+                    type_id=type_id,
+                    order_type=order_type,
+                ),
             )
-
-            logger.debug(
-                "Fetched %d orders from ESI: region=%d type=%d order_type=%s",
-                len(orders),
-                region_id,
-                type_id,
-                order_type,
-            )
-            return orders
+        finally:
+            del self._raw_orders_inflight[cache_key]
+
+        logger.debug(
+            "Fetched %d orders from ESI: region=%d type=%d order_type=%s",
+            len(orders),
+            region_id,
+            type_id,
+            order_type,
+        )
+        return orders
 
     async def _fetch_raw_orders(
         self,
@@ -368,7 +481,10 @@ class MarketCache:
         order_type: str,
     ) -> list[dict]:
         """
-        Fetch raw orders from ESI.
+        Fetch raw orders from ESI, following X-Pages across every page.
+
+        A side that fails part-way contributes no orders rather than a
+        truncated subset.
 
         Internal method - use get_regional_orders() for cached access.
         """
@@ -384,23 +500,25 @@ class MarketCache:
 
         if order_type in ("sell", "all"):
             try:
-                data = await client.get(
+                sell_orders: list[dict] = []
+                async for page in client.get_all_pages(
                     f"/markets/{region_id}/orders/",
                     params={"type_id": str(type_id), "order_type": "sell"},
-                )
-                if isinstance(data, list):
-                    all_orders.extend(data)
+                ):
+                    sell_orders.extend(page)
+                all_orders.extend(sell_orders)
             except Exception as e:
                 logger.debug("Failed to fetch sell orders: %s", e)
 
         if order_type in ("buy", "all"):
             try:
-                data = await client.get(
+                buy_orders: list[dict] = []
+                async for page in client.get_all_pages(
                     f"/markets/{region_id}/orders/",
                     params={"type_id": str(type_id), "order_type": "buy"},
-                )
-                if isinstance(data, list):
-                    all_orders.extend(data)
+                ):
+                    buy_orders.extend(page)
+                all_orders.extend(buy_orders)
             except Exception as e:
                 logger.debug("Failed to fetch buy orders: %s", e)
 
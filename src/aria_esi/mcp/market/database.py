@@ -17,6 +17,20 @@ from typing import TYPE_CHECKING
 
 from ...core.config import get_settings
 from ...core.logging import get_logger
+from .name_index import (
+    FUZZY_CANDIDATE_LIMIT,
+    MIN_TRIGRAM_QUERY_LENGTH,
+    NAME_BATCH_SIZE,
+    TYPE_NAMES_VERSION_KEY,
+    TYPES_FTS_REBUILD_SQL,
+    TYPES_FTS_SQL,
+    TypeNameIndex,
+    contains_clause,
+    first_containing_sql,
+    fts_trigrams,
+    has_types_fts,
+    rank_by_edit_distance,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -547,6 +561,7 @@ class MarketDatabase:
 
         self._conn: sqlite3.Connection | None = None
         self._initialized = False
+        self._name_index: TypeNameIndex | None = None
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get or create database connection."""
@@ -818,7 +833,7 @@ class MarketDatabase:
         """
         Resolve item name to type info.
 
-        Tries exact match first, then case-insensitive, then fuzzy.
+        Tries exact match first (case-insensitive), then prefix, then contains.
 
         Args:
             name: Item name to resolve
@@ -826,37 +841,8 @@ class MarketDatabase:
         Returns:
             TypeInfo if found, None otherwise
         """
-        conn = self._get_connection()
         name_lower = name.lower().strip()
-
-        # Try exact match (case-insensitive)
-        row = conn.execute(
-            "SELECT * FROM types WHERE type_name_lower = ?",
-            (name_lower,),
-        ).fetchone()
-
-        if row:
-            return self._row_to_type_info(row)
-
-        # Try prefix match
-        row = conn.execute(
-            "SELECT * FROM types WHERE type_name_lower LIKE ? LIMIT 1",
-            (f"{name_lower}%",),
-        ).fetchone()
-
-        if row:
-            return self._row_to_type_info(row)
-
-        # Try contains match
-        row = conn.execute(
-            "SELECT * FROM types WHERE type_name_lower LIKE ? LIMIT 1",
-            (f"%{name_lower}%",),
-        ).fetchone()
-
-        if row:
-            return self._row_to_type_info(row)
-
-        return None
+        return self._resolve_type_names({name_lower}).get(name_lower)
 
     def resolve_type_id(self, type_id: int) -> TypeInfo | None:
         """
@@ -880,6 +866,10 @@ class MarketDatabase:
         """
         Find type name suggestions for fuzzy matching.
 
+        Prefix matches come first, then names containing the input, then
+        (with the trigram index) misspellings within
+        MAX_LEVENSHTEIN_DISTANCE edits, closest first.
+
         Args:
             name: Partial or misspelled name
             limit: Maximum suggestions to return
@@ -891,49 +881,184 @@ class MarketDatabase:
         name_lower = name.lower().strip()
 
         # Start with prefix matches
-        rows = conn.execute(
-            """
-            SELECT type_name FROM types
-            WHERE type_name_lower LIKE ?
-            ORDER BY length(type_name)
-            LIMIT ?
-            """,
-            (f"{name_lower}%", limit),
-        ).fetchall()
-
-        suggestions = [row["type_name"] for row in rows]
+        suggestions = self._type_name_index().names_with_prefix(name_lower, limit)
 
         if len(suggestions) < limit:
             # Add contains matches
-            remaining = limit - len(suggestions)
+            clause, params = contains_clause(name_lower, self.has_type_name_fts())
             rows = conn.execute(
-                """
-                SELECT type_name FROM types
-                WHERE type_name_lower LIKE ?
-                AND type_name_lower NOT LIKE ?
-                ORDER BY length(type_name)
+                f"""
+                SELECT t.type_name FROM types t
+                WHERE {clause}
+                AND substr(t.type_name_lower, 1, ?) != ?
+                ORDER BY length(t.type_name)
                 LIMIT ?
                 """,
-                (f"%{name_lower}%", f"{name_lower}%", remaining),
+                (*params, len(name_lower), name_lower, limit - len(suggestions)),
             ).fetchall()
             suggestions.extend(row["type_name"] for row in rows)
 
+        query = fts_trigrams(name_lower)
+        if len(suggestions) < limit and query and self.has_type_name_fts():
+            # Add misspellings among names sharing trigrams with the input
+            rows = conn.execute(
+                """
+                SELECT t.type_name, t.type_name_lower FROM types t
+                WHERE t.type_id IN (
+                    SELECT rowid FROM types_fts WHERE types_fts MATCH ? ORDER BY rank LIMIT ?
+                )
+                """,
+                (query, FUZZY_CANDIDATE_LIMIT),
+            ).fetchall()
+            seen = set(suggestions)
+            suggestions.extend(
+                rank_by_edit_distance(
+                    name_lower,
+                    ((row[0], row[1]) for row in rows if row[0] not in seen),
+                    MAX_LEVENSHTEIN_DISTANCE,
+                    limit - len(suggestions),
+                )
+            )
+
         return suggestions
 
     def batch_resolve_names(self, names: Sequence[str]) -> dict[str, TypeInfo | None]:
         """
         Resolve multiple item names.
 
+        Resolves the whole batch together (one exact-match query, one
+        substring query for the leftovers) rather than name by name, so
+        clipboard and fitting imports stay cheap.
+
         Args:
             names: Item names to resolve
 
         Returns:
             Dict mapping input names to TypeInfo (or None if not found)
         """
-        results: dict[str, TypeInfo | None] = {}
-        for name in names:
-            results[name] = self.resolve_type_name(name)
-        return results
+        keys = {name: name.lower().strip() for name in names}
+        resolved = self._resolve_type_names(set(keys.values()))
+        return {name: resolved.get(key) for name, key in keys.items()}
+
+    def _resolve_type_names(self, names: set[str]) -> dict[str, TypeInfo]:
+        """
+        Resolve lowercase names: exact match, then prefix, then contains.
+
+        Args:
+            names: Lowercase, stripped names
+
+        Returns:
+            Dict mapping each resolved name to its TypeInfo
+        """
+        conn = self._get_connection()
+        resolved: dict[str, TypeInfo] = {}
+
+        # Exact matches (lowest type_id wins on duplicate names)
+        ordered = sorted(names)
+        for i in range(0, len(ordered), NAME_BATCH_SIZE):
+            chunk = ordered[i : i + NAME_BATCH_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"""
+                SELECT * FROM types WHERE type_name_lower IN ({placeholders})
+                ORDER BY type_id DESC
+                """,
+                chunk,
+            ).fetchall()
+            for row in rows:
+                resolved[row["type_name_lower"]] = self._row_to_type_info(row)
+
+        missing = names - resolved.keys()
+        if not missing:
+            return resolved
+
+        # Prefix matches from the in-memory index
+        index = self._type_name_index()
+        matched_ids: dict[str, int] = {}
+        for name in missing:
+            type_id = index.first_with_prefix(name)
+            if type_id is not None:
+                matched_ids[name] = type_id
+
+        # Contains matches, all leftovers in one query where the index allows
+        leftover = missing - matched_ids.keys()
+        if leftover and self.has_type_name_fts():
+            indexed = sorted(name for name in leftover if len(name) >= MIN_TRIGRAM_QUERY_LENGTH)
+            for i in range(0, len(indexed), NAME_BATCH_SIZE):
+                chunk = indexed[i : i + NAME_BATCH_SIZE]
+                rows = conn.execute(first_containing_sql(len(chunk)), chunk).fetchall()
+                matched_ids.update({row[0]: row[1] for row in rows if row[1] is not None})
+            leftover.difference_update(indexed)
+        for name in leftover:
+            row = conn.execute(
+                "SELECT type_id FROM types WHERE type_name_lower LIKE ? LIMIT 1",
+                (f"%{name}%",),
+            ).fetchone()
+            if row:
+                matched_ids[name] = row["type_id"]
+
+        if matched_ids:
+            ids = sorted(set(matched_ids.values()))
+            placeholders = ",".join("?" * len(ids))
+            rows = conn.execute(
+                f"SELECT * FROM types WHERE type_id IN ({placeholders})",
+                ids,
+            ).fetchall()
+            infos = {row["type_id"]: self._row_to_type_info(row) for row in rows}
+            for name, type_id in matched_ids.items():
+                info = infos.get(type_id)
+                # Skip matches from a types_fts that lags behind types
+                if info is not None and name in info.type_name.lower():
+                    resolved[name] = info
+
+        return resolved
+
+    def has_type_name_fts(self) -> bool:
+        """Whether the trigram type name index (types_fts) exists."""
+        return has_types_fts(self._get_connection())
+
+    def _type_name_index(self) -> TypeNameIndex:
+        """Get the in-memory prefix index, reloading it if type names changed."""
+        conn = self._get_connection()
+        row = conn.execute(
+            "SELECT value FROM metadata WHERE key = ?", (TYPE_NAMES_VERSION_KEY,)
+        ).fetchone()
+        version = row["value"] if row else None
+
+        index = self._name_index
+        if index is None or index.version != version:
+            rows = conn.execute("SELECT type_name_lower, type_id, type_name FROM types")
+            index = TypeNameIndex(rows, version)
+            self._name_index = index
+        return index
+
+    def rebuild_type_name_index(self) -> bool:
+        """
+        Rebuild the type name indexes after types were written.
+
+        Creates and repopulates types_fts, and invalidates in-memory prefix
+        indexes in this and other processes.
+
+        Returns:
+            True if the trigram index is available, False if this SQLite
+            build lacks FTS5 trigram support (lookups fall back to LIKE)
+        """
+        conn = self._get_connection()
+        try:
+            conn.execute(TYPES_FTS_SQL)
+            conn.execute(TYPES_FTS_REBUILD_SQL)
+            available = True
+        except sqlite3.OperationalError as e:
+            logger.warning("Type name trigram index unavailable: %s", e)
+            available = False
+
+        conn.execute(
+            "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+            (TYPE_NAMES_VERSION_KEY, str(time.time_ns())),
+        )
+        conn.commit()
+        self._name_index = None
+        return available
 
     def _row_to_type_info(self, row: sqlite3.Row) -> TypeInfo:
         """Convert database row to TypeInfo."""
@@ -1246,6 +1371,7 @@ class MarketDatabase:
             ],
         )
         conn.commit()
+        self.rebuild_type_name_index()
         return cursor.rowcount
 
     def import_fuzzwork_csv(self, csv_data: bytes) -> tuple[int, int]:
@@ -1375,6 +1501,8 @@ class MarketDatabase:
             aggregates_count = self.save_aggregates_batch(aggregates_batch)
 
         conn.commit()
+        if types_count:
+            self.rebuild_type_name_index()
         logger.info(
             "Imported %d types and %d aggregates from Fuzzwork CSV",
             types_count,
@@ -1410,6 +1538,7 @@ class MarketDatabase:
             batch,
         )
         conn.commit()
+        self.rebuild_type_name_index()
         return len(batch)
 
     # =========================================================================
@@ -16,6 +16,7 @@ import aiosqlite
 from ...core.config import get_settings
 from ...core.logging import get_logger
 from .database import (
+    MAX_LEVENSHTEIN_DISTANCE,
     SCHEMA_SQL,
     CachedAggregate,
     CachedHistory,
@@ -25,6 +26,18 @@ from .database import (
     Watchlist,
     WatchlistItem,
 )
+from .name_index import (
+    FUZZY_CANDIDATE_LIMIT,
+    MIN_TRIGRAM_QUERY_LENGTH,
+    NAME_BATCH_SIZE,
+    TYPE_NAMES_VERSION_KEY,
+    TYPES_FTS_EXISTS_SQL,
+    TypeNameIndex,
+    contains_clause,
+    first_containing_sql,
+    fts_trigrams,
+    rank_by_edit_distance,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -56,6 +69,7 @@ class AsyncMarketDatabase:
 
         self._conn: aiosqlite.Connection | None = None
         self._initialized = False
+        self._name_index: TypeNameIndex | None = None
 
     async def _get_connection(self) -> aiosqlite.Connection:
         """Get or create database connection."""
@@ -161,7 +175,7 @@ class AsyncMarketDatabase:
         """
         Resolve item name to type info.
 
-        Tries exact match first, then case-insensitive, then fuzzy.
+        Tries exact match first (case-insensitive), then prefix, then contains.
 
         Args:
             name: Item name to resolve
@@ -169,40 +183,9 @@ class AsyncMarketDatabase:
         Returns:
             TypeInfo if found, None otherwise
         """
-        conn = await self._get_connection()
         name_lower = name.lower().strip()
-
-        # Try exact match (case-insensitive)
-        async with conn.execute(
-            "SELECT * FROM types WHERE type_name_lower = ?",
-            (name_lower,),
-        ) as cursor:
-            row = await cursor.fetchone()
-
-        if row:
-            return self._row_to_type_info(row)
-
-        # Try prefix match
-        async with conn.execute(
-            "SELECT * FROM types WHERE type_name_lower LIKE ? LIMIT 1",
-            (f"{name_lower}%",),
-        ) as cursor:
-            row = await cursor.fetchone()
-
-        if row:
-            return self._row_to_type_info(row)
-
-        # Try contains match
-        async with conn.execute(
-            "SELECT * FROM types WHERE type_name_lower LIKE ? LIMIT 1",
-            (f"%{name_lower}%",),
-        ) as cursor:
-            row = await cursor.fetchone()
-
-        if row:
-            return self._row_to_type_info(row)
-
-        return None
+        resolved = await self._resolve_type_names({name_lower})
+        return resolved.get(name_lower)
 
     async def resolve_type_id(self, type_id: int) -> TypeInfo | None:
         """
@@ -250,6 +233,9 @@ class AsyncMarketDatabase:
         """
         Find type name suggestions for fuzzy matching.
 
+        Prefix matches come first, then names containing the input, then
+        (with the trigram index) misspellings ranked by edit distance.
+
         Args:
             name: Partial or misspelled name
             limit: Maximum suggestions to return
@@ -259,53 +245,171 @@ class AsyncMarketDatabase:
         """
         conn = await self._get_connection()
         name_lower = name.lower().strip()
+        has_fts = await self.has_type_name_fts()
 
         # Start with prefix matches
-        async with conn.execute(
-            """
-            SELECT type_name FROM types
-            WHERE type_name_lower LIKE ?
-            ORDER BY length(type_name)
-            LIMIT ?
-            """,
-            (f"{name_lower}%", limit),
-        ) as cursor:
-            rows = await cursor.fetchall()
-
-        suggestions = [row["type_name"] for row in rows]
+        index = await self._type_name_index()
+        suggestions = index.names_with_prefix(name_lower, limit)
 
         if len(suggestions) < limit:
             # Add contains matches
-            remaining = limit - len(suggestions)
+            clause, params = contains_clause(name_lower, has_fts)
             async with conn.execute(
-                """
-                SELECT type_name FROM types
-                WHERE type_name_lower LIKE ?
-                AND type_name_lower NOT LIKE ?
-                ORDER BY length(type_name)
+                f"""
+                SELECT t.type_name FROM types t
+                WHERE {clause}
+                AND substr(t.type_name_lower, 1, ?) != ?
+                ORDER BY length(t.type_name)
                 LIMIT ?
                 """,
-                (f"%{name_lower}%", f"{name_lower}%", remaining),
+                (*params, len(name_lower), name_lower, limit - len(suggestions)),
             ) as cursor:
                 rows = await cursor.fetchall()
             suggestions.extend(row["type_name"] for row in rows)
 
+        query = fts_trigrams(name_lower)
+        if len(suggestions) < limit and query and has_fts:
+            # Add misspellings among names sharing trigrams with the input
+            async with conn.execute(
+                """
+                SELECT t.type_name, t.type_name_lower FROM types t
+                WHERE t.type_id IN (
+                    SELECT rowid FROM types_fts WHERE types_fts MATCH ? ORDER BY rank LIMIT ?
+                )
+                """,
+                (query, FUZZY_CANDIDATE_LIMIT),
+            ) as cursor:
+                rows = await cursor.fetchall()
+            seen = set(suggestions)
+            suggestions.extend(
+                rank_by_edit_distance(
+                    name_lower,
+                    ((row[0], row[1]) for row in rows if row[0] not in seen),
+                    MAX_LEVENSHTEIN_DISTANCE,
+                    limit - len(suggestions),
+                )
+            )
+
         return suggestions
 
     async def batch_resolve_names(self, names: Sequence[str]) -> dict[str, TypeInfo | None]:
         """
         Resolve multiple item names.
 
+        Resolves the whole batch together rather than name by name.
+
         Args:
             names: Item names to resolve
 
         Returns:
             Dict mapping input names to TypeInfo (or None if not found)
         """
-        results: dict[str, TypeInfo | None] = {}
-        for name in names:
-            results[name] = await self.resolve_type_name(name)
-        return results
+        keys = {name: name.lower().strip() for name in names}
+        resolved = await self._resolve_type_names(set(keys.values()))
+        return {name: resolved.get(key) for name, key in keys.items()}
+
+    async def _resolve_type_names(self, names: set[str]) -> dict[str, TypeInfo]:
+        """
+        Resolve lowercase names: exact match, then prefix, then contains.
+
+        Args:
+            names: Lowercase, stripped names
+
+        Returns:
+            Dict mapping each resolved name to its TypeInfo
+        """
+        conn = await self._get_connection()
+        resolved: dict[str, TypeInfo] = {}
+
+        # Exact matches (lowest type_id wins on duplicate names)
+        ordered = sorted(names)
+        for i in range(0, len(ordered), NAME_BATCH_SIZE):
+            chunk = ordered[i : i + NAME_BATCH_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            async with conn.execute(
+                f"""
+                SELECT * FROM types WHERE type_name_lower IN ({placeholders})
+                ORDER BY type_id DESC
+                """,
+                chunk,
+            ) as cursor:
+                rows = await cursor.fetchall()
+            for row in rows:
+                resolved[row["type_name_lower"]] = self._row_to_type_info(row)
+
+        missing = names - resolved.keys()
+        if not missing:
+            return resolved
+
+        # Prefix matches from the in-memory index
+        index = await self._type_name_index()
+        matched_ids: dict[str, int] = {}
+        for name in missing:
+            type_id = index.first_with_prefix(name)
+            if type_id is not None:
+                matched_ids[name] = type_id
+
+        # Contains matches, all leftovers in one query where the index allows
+        leftover = missing - matched_ids.keys()
+        if leftover and await self.has_type_name_fts():
+            indexed = sorted(name for name in leftover if len(name) >= MIN_TRIGRAM_QUERY_LENGTH)
+            for i in range(0, len(indexed), NAME_BATCH_SIZE):
+                chunk = indexed[i : i + NAME_BATCH_SIZE]
+                async with conn.execute(first_containing_sql(len(chunk)), chunk) as cursor:
+                    rows = await cursor.fetchall()
+                matched_ids.update({row[0]: row[1] for row in rows if row[1] is not None})
+            leftover.difference_update(indexed)
+        for name in leftover:
+            async with conn.execute(
+                "SELECT type_id FROM types WHERE type_name_lower LIKE ? LIMIT 1",
+                (f"%{name}%",),
+            ) as cursor:
+                match = await cursor.fetchone()
+            if match is not None:
+                matched_ids[name] = match["type_id"]
+
+        if matched_ids:
+            ids = sorted(set(matched_ids.values()))
+            placeholders = ",".join("?" * len(ids))
+            async with conn.execute(
+                f"SELECT * FROM types WHERE type_id IN ({placeholders})",
+                ids,
+            ) as cursor:
+                rows = await cursor.fetchall()
+            infos = {row["type_id"]: self._row_to_type_info(row) for row in rows}
+            for name, type_id in matched_ids.items():
+                info = infos.get(type_id)
+                # Skip matches from a types_fts that lags behind types
+                if info is not None and name in info.type_name.lower():
+                    resolved[name] = info
+
+        return resolved
+
+    async def has_type_name_fts(self) -> bool:
+        """Whether the trigram type name index (types_fts) exists."""
+        conn = await self._get_connection()
+        async with conn.execute(TYPES_FTS_EXISTS_SQL) as cursor:
+            row = await cursor.fetchone()
+        return row is not None
+
+    async def _type_name_index(self) -> TypeNameIndex:
+        """Get the in-memory prefix index, reloading it if type names changed."""
+        conn = await self._get_connection()
+        async with conn.execute(
+            "SELECT value FROM metadata WHERE key = ?", (TYPE_NAMES_VERSION_KEY,)
+        ) as cursor:
+            row = await cursor.fetchone()
+        version = row["value"] if row else None
+
+        index = self._name_index
+        if index is None or index.version != version:
+            async with conn.execute(
+                "SELECT type_name_lower, type_id, type_name FROM types"
+            ) as cursor:
+                rows = await cursor.fetchall()
+            index = TypeNameIndex(((row[0], row[1], row[2]) for row in rows), version)
+            self._name_index = index
+        return index
 
     def _row_to_type_info(self, row: aiosqlite.Row) -> TypeInfo:
         """Convert database row to TypeInfo."""
@@ -0,0 +1,221 @@
+"""
+Type Name Index for ARIA.
+
+Lookup structures behind type name resolution, replacing LIKE scans over
+the ~50k row types table:
+
+- types_fts: FTS5 table with the trigram tokenizer over
+  types.type_name_lower (external content, rowid = type_id), so
+  substring matches are index lookups. Built during SDE import and
+  rebuilt by MarketDatabase.rebuild_type_name_index whenever type names
+  are written.
+- TypeNameIndex: in-memory sorted array of lowercase names answering
+  prefix lookups by bisection.
+
+SQLite builds without FTS5 or the trigram tokenizer (before 3.34) fall
+back to LIKE scans.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import TYPE_CHECKING
+
+from ..tools import _levenshtein_distance
+
+if TYPE_CHECKING:
+    import sqlite3
+    from collections.abc import Iterable
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+TYPES_FTS_SQL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS types_fts USING fts5(
+    type_name_lower,
+    content='types',
+    content_rowid='type_id',
+    tokenize='trigram'
+)
+"""
+
+TYPES_FTS_REBUILD_SQL = "INSERT INTO types_fts(types_fts) VALUES ('rebuild')"
+
+TYPES_FTS_EXISTS_SQL = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'types_fts'"
+
+# Metadata key bumped whenever type names change; in-memory indexes
+# built against an older value are reloaded
+TYPE_NAMES_VERSION_KEY = "type_names_version"
+
+# Shortest query the trigram index can answer
+MIN_TRIGRAM_QUERY_LENGTH = 3
+
+# Rows scored by edit distance when looking for fuzzy suggestions
+FUZZY_CANDIDATE_LIMIT = 200
+
+# Names bound per IN (...) query
+NAME_BATCH_SIZE = 500
+
+
+# =============================================================================
+# Query Helpers
+# =============================================================================
+
+
+def has_types_fts(conn: sqlite3.Connection) -> bool:
+    """Whether the database has the trigram type name index."""
+    return conn.execute(TYPES_FTS_EXISTS_SQL).fetchone() is not None
+
+
+def fts_phrase(text: str) -> str:
+    """Quote text as an FTS5 phrase (a substring under the trigram tokenizer)."""
+    return '"' + text.replace('"', '""') + '"'
+
+
+def fts_any(texts: Iterable[str]) -> str:
+    """FTS5 query matching any of the texts as substrings."""
+    return " OR ".join(fts_phrase(text) for text in texts)
+
+
+def fts_trigrams(text: str) -> str | None:
+    """
+    FTS5 query matching names sharing any trigram with text.
+
+    Used to gather fuzzy candidates; bm25 ranks names sharing the most
+    (and rarest) trigrams first.
+
+    Returns:
+        Query string, or None if text is too short to have a trigram
+    """
+    grams = {text[i : i + 3] for i in range(len(text) - 2)}
+    return fts_any(sorted(grams)) if grams else None
+
+
+def contains_clause(query: str, fts: bool) -> tuple[str, list[str]]:
+    """
+    SQL predicate matching types (aliased t) whose name contains query.
+
+    Args:
+        query: Lowercase substring
+        fts: Whether types_fts is available
+
+    Returns:
+        Tuple of (predicate, parameters)
+    """
+    if fts and len(query) >= MIN_TRIGRAM_QUERY_LENGTH:
+        # instr() guards against a types_fts that lags behind types
+        return (
+            "t.type_id IN (SELECT rowid FROM types_fts WHERE types_fts MATCH ?)"
+            " AND instr(t.type_name_lower, ?) > 0",
+            [fts_phrase(query), query],
+        )
+    return "t.type_name_lower LIKE ?", [f"%{query}%"]
+
+
+def first_containing_sql(count: int) -> str:
+    """
+    Query resolving many substrings against types_fts in one statement.
+
+    Binds one lowercase substring per parameter and returns a
+    (substring, type_id) row for each: the lowest type_id whose name
+    contains it, or NULL.
+
+    Args:
+        count: Number of substrings bound
+    """
+    values = ",".join("(?)" for _ in range(count))
+    return f"""
+        WITH q(name) AS (VALUES {values})
+        SELECT q.name, (
+            SELECT min(rowid) FROM types_fts
+            WHERE types_fts MATCH '"' || replace(q.name, '"', '""') || '"'
+        ) FROM q
+    """
+
+
+# =============================================================================
+# Edit Distance
+# =============================================================================
+
+
+def rank_by_edit_distance(
+    query: str,
+    candidates: Iterable[tuple[str, str]],
+    max_distance: int,
+    limit: int,
+) -> list[str]:
+    """
+    Rank candidate names by edit distance from query.
+
+    Args:
+        query: Lowercase query
+        candidates: (type_name, type_name_lower) pairs
+        max_distance: Largest distance kept
+        limit: Maximum names to return
+
+    Returns:
+        Type names, closest first (ties by length, then name)
+    """
+    scored = []
+    for type_name, name_lower in candidates:
+        distance = _levenshtein_distance(query, name_lower, max_distance)
+        if distance <= max_distance:
+            scored.append((distance, len(type_name), type_name))
+    scored.sort()
+    return [type_name for _, _, type_name in scored[:limit]]
+
+
+# =============================================================================
+# Prefix Index
+# =============================================================================
+
+
+class TypeNameIndex:
+    """
+    Sorted in-memory array of type names for prefix lookups.
+
+    A prefix selects a contiguous range of the sorted lowercase names,
+    found by bisection instead of a LIKE 'x%' scan (the types index is
+    not usable for LIKE under SQLite's default case-insensitive LIKE).
+
+    Usage:
+        index = TypeNameIndex(conn.execute(
+            "SELECT type_name_lower, type_id, type_name FROM types"
+        ), version)
+        index.first_with_prefix("trit")
+    """
+
+    def __init__(self, rows: Iterable[tuple[str, int, str]], version: str | None = None):
+        """
+        Build the index.
+
+        Args:
+            rows: (type_name_lower, type_id, type_name) rows
+            version: type_names_version the rows were read at
+        """
+        entries = sorted((row[0], row[1], row[2]) for row in rows)
+        self.version = version
+        self._keys = [entry[0] for entry in entries]
+        self._ids = [entry[1] for entry in entries]
+        self._names = [entry[2] for entry in entries]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _range(self, prefix: str) -> tuple[int, int]:
+        """Index range of names starting with prefix."""
+        start = bisect_left(self._keys, prefix)
+        end = bisect_left(self._keys, prefix + "\U0010ffff", lo=start)
+        return start, end
+
+    def first_with_prefix(self, prefix: str) -> int | None:
+        """Type ID of the alphabetically first name starting with prefix."""
+        start, end = self._range(prefix)
+        return self._ids[start] if end > start else None
+
+    def names_with_prefix(self, prefix: str, limit: int) -> list[str]:
+        """Type names starting with prefix, shortest first."""
+        start, end = self._range(prefix)
+        names = sorted(self._names[start:end], key=lambda name: (len(name), name))
+        return names[:limit]
@@ -9,14 +9,21 @@ from __future__ import annotations
 
 import asyncio
 import time
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+import numpy as np
+
+from aria_esi.core.async_client import AsyncESIError
 from aria_esi.core.client import ESIClient, ESIError
 from aria_esi.core.logging import get_logger
+from aria_esi.core.retry import RetryableESIError
 from aria_esi.models.market import ScopePriceRefreshInfo, ScopeRefreshResult
 
 if TYPE_CHECKING:
+    from aria_esi.core.async_client import AsyncESIClient
+
     from .database import MarketScope, MarketScopePrice, WatchlistItem
     from .database_async import AsyncMarketDatabase
 
@@ -56,6 +63,7 @@ class FetchContext:
     was_conditional: bool = False
     pages_fetched: int = 0
     pages_truncated: bool = False
+    bulk: bool = False
     scan_status: str = "complete"
     warnings: list[str] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
@@ -67,6 +75,138 @@ class FetchContext:
         return int((time.time() - self.start_time) * 1000)
 
 
+class RegionOrderAggregator:
+    """
+    Streaming aggregation of full region order pages for a set of types.
+
+    Each page is reduced to NumPy arrays of the orders for watched types
+    (optionally only those at one location or system) and the rest are
+    dropped, so memory grows with the watched orders rather than the
+    region's whole order book. results() groups the kept orders by
+    type_id and side in one sort.
+
+    Example:
+        aggregator = RegionOrderAggregator(type_ids)
+        async for page in client.get_all_pages(f"/markets/{region_id}/orders/"):
+            aggregator.add_page(page)
+        prices = aggregator.results()
+    """
+
+    def __init__(
+        self,
+        type_ids: Iterable[int],
+        filter_key: str | None = None,
+        filter_value: int | None = None,
+    ):
+        """
+        Initialize the aggregator.
+
+        Args:
+            type_ids: Watched type IDs (every one gets a result)
+            filter_key: Optional order field to match (location_id or system_id)
+            filter_value: Value filter_key must equal
+        """
+        self.type_ids = np.unique(np.fromiter(type_ids, dtype=np.int64))
+        self.filter_key = filter_key
+        self.filter_value = filter_value
+        self.orders_seen = 0
+        self.orders_kept = 0
+        self._chunks: list[tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = []
+
+    def add_page(self, orders: list[dict]) -> None:
+        """
+        Keep the orders of one page that match the watchlist and filter.
+
+        Args:
+            orders: Raw ESI order dicts
+        """
+        count = len(orders)
+        if count == 0:
+            return
+        self.orders_seen += count
+
+        page_type_ids = np.fromiter(
+            (order.get("type_id", 0) for order in orders), dtype=np.int64, count=count
+        )
+        keep = np.flatnonzero(np.isin(page_type_ids, self.type_ids))
+        if self.filter_key and self.filter_value is not None and keep.size:
+            key, value = self.filter_key, self.filter_value
+            matches = np.fromiter(
+                (orders[i].get(key) == value for i in keep), dtype=bool, count=keep.size
+            )
+            keep = keep[matches]
+        if not keep.size:
+            return
+
+        kept = [orders[i] for i in keep]
+        self._chunks.append(
+            (
+                page_type_ids[keep],
+                np.fromiter((o.get("price", 0) for o in kept), dtype=np.float64, count=keep.size),
+                np.fromiter(
+                    (o.get("volume_remain", 0) for o in kept), dtype=np.int64, count=keep.size
+                ),
+                np.fromiter(
+                    (bool(o.get("is_buy_order", False)) for o in kept),
+                    dtype=bool,
+                    count=keep.size,
+                ),
+            )
+        )
+        self.orders_kept += keep.size
+
+    def results(self) -> dict[int, AggregatedPrice]:
+        """
+        Aggregate the kept orders per watched type.
+
+        Returns:
+            Dict of type_id to AggregatedPrice, with an empty entry for
+            watched types that had no matching orders
+        """
+        prices = {int(type_id): AggregatedPrice(type_id=int(type_id)) for type_id in self.type_ids}
+
+        if self._chunks:
+            type_ids, order_prices, volumes, is_buy = (
+                np.concatenate(column) for column in zip(*self._chunks)
+            )
+            for buy_side in (True, False):
+                side = is_buy == buy_side
+                if not side.any():
+                    continue
+                order = np.argsort(type_ids[side], kind="stable")
+                side_types = type_ids[side][order]
+                side_prices = order_prices[side][order]
+                side_volumes = volumes[side][order]
+
+                starts = np.flatnonzero(np.r_[True, side_types[1:] != side_types[:-1]])
+                counts = np.diff(np.r_[starts, side_types.size])
+                volume_sums = np.add.reduceat(side_volumes, starts)
+                if buy_side:
+                    best = np.maximum.reduceat(side_prices, starts)
+                else:
+                    best = np.minimum.reduceat(side_prices, starts)
+
+                for type_id, best_price, volume, order_count in zip(
+                    side_types[starts].tolist(),
+                    best.tolist(),
+                    volume_sums.tolist(),
+                    counts.tolist(),
+                ):
+                    price = prices[type_id]
+                    if buy_side:
+                        price.buy_max = best_price
+                        price.buy_volume = volume
+                        price.buy_order_count = order_count
+                    else:
+                        price.sell_min = best_price
+                        price.sell_volume = volume
+                        price.sell_order_count = order_count
+
+        for price in prices.values():
+            price.calculate_spread()
+        return prices
+
+
 class MarketScopeFetcher:
     """
     ESI-backed market data fetcher for ad-hoc scopes.
@@ -80,6 +220,12 @@ class MarketScopeFetcher:
     - system: Fetch region orders, filter by system_id
     - structure: Fetch all structure orders (paginated), filter by watchlist
 
+    Bulk mode:
+        Once a region, station or system scope's watchlist reaches
+        BULK_REGION_THRESHOLD items, the whole region order book is pulled
+        once (all pages, concurrently) and streamed through a
+        RegionOrderAggregator instead of one request per type.
+
     Caching:
         Uses TTL-based caching (DEFAULT_TTL_SECONDS). If data was fetched
         within the TTL window, cached results are returned without ESI calls.
@@ -95,11 +241,13 @@ class MarketScopeFetcher:
     DEFAULT_TTL_SECONDS = 900  # 15 minutes
     MAX_STRUCTURE_PAGES = 5
     MAX_CONCURRENT_FETCHES = 10
+    BULK_REGION_THRESHOLD = 100  # Watchlist size that switches to full region pulls
 
     def __init__(
         self,
         db: AsyncMarketDatabase,
         client: ESIClient | None = None,
+        async_client: AsyncESIClient | None = None,
     ):
         """
         Initialize the scope fetcher.
@@ -107,9 +255,12 @@ class MarketScopeFetcher:
         Args:
             db: Async market database for storage
             client: Optional ESI client (creates one if not provided)
+            async_client: Optional async ESI client for bulk region pulls
+                (uses the shared MCP client if not provided)
         """
         self.db = db
         self.client = client or ESIClient()
+        self.async_client = async_client
 
     async def refresh_scope(
         self,
@@ -205,6 +356,8 @@ class MarketScopeFetcher:
 
         # Fetch orders for each type in watchlist
         type_ids = [item.type_id for item in ctx.watchlist_items]
+        if self._use_bulk(ctx) and await self._fetch_region_orders_bulk(ctx, region_id, type_ids):
+            return
         await self._fetch_type_orders_batch(ctx, region_id, type_ids)
 
     async def _refresh_filtered_scope(self, ctx: FetchContext) -> None:
@@ -237,6 +390,15 @@ class MarketScopeFetcher:
             ctx.scan_status = "error"
             return
 
+        if self._use_bulk(ctx) and await self._fetch_region_orders_bulk(
+            ctx,
+            region_id,
+            type_ids,
+            filter_key=filter_key,
+            filter_value=filter_value,
+        ):
+            return
+
         await self._fetch_type_orders_batch(
             ctx,
             region_id,
@@ -341,6 +503,79 @@ class MarketScopeFetcher:
         for price in ctx.prices.values():
             price.calculate_spread()
 
+    def _use_bulk(self, ctx: FetchContext) -> bool:
+        """Check whether a scope's watchlist is large enough for a full region pull."""
+        return len(ctx.watchlist_items) >= self.BULK_REGION_THRESHOLD
+
+    async def _fetch_region_orders_bulk(
+        self,
+        ctx: FetchContext,
+        region_id: int,
+        type_ids: list[int],
+        filter_key: str | None = None,
+        filter_value: int | None = None,
+    ) -> bool:
+        """
+        Fetch every page of a region's orders once and aggregate the watchlist.
+
+        Pages are streamed through a RegionOrderAggregator as they arrive,
+        bypassing the ESI response cache so one dump doesn't evict it.
+
+        Args:
+            ctx: Fetch context
+            region_id: Region ID to fetch from
+            type_ids: Watchlist type IDs
+            filter_key: Optional filter key (location_id or system_id)
+            filter_value: Optional filter value
+
+        Returns:
+            True if prices were aggregated, False if the pull failed and the
+            caller should fall back to per-type requests
+        """
+        aggregator = RegionOrderAggregator(type_ids, filter_key, filter_value)
+
+        try:
+            client = self.async_client
+            if client is None:
+                from aria_esi.mcp.esi_client import get_async_esi_client
+
+                client = await get_async_esi_client()
+
+            async for response in client.get_all_page_responses(
+                f"/markets/{region_id}/orders/",
+                params={"order_type": "all"},
+                use_cache=False,
+            ):
+                # Page 1 comes first; its headers describe the whole snapshot
+                if ctx.pages_fetched == 0:
+                    ctx.http_last_modified = response.last_modified_timestamp
+                    ctx.http_expires = response.expires_timestamp
+                ctx.pages_fetched += 1
+                if isinstance(response.data, list):
+                    aggregator.add_page(response.data)
+
+        except (AsyncESIError, RetryableESIError) as e:
+            ctx.warnings.append(
+                f"Bulk fetch of region {region_id} orders failed ({e.message}); "
+                "fell back to per-type requests"
+            )
+            ctx.pages_fetched = 0
+            ctx.http_last_modified = None
+            ctx.http_expires = None
+            return False
+
+        ctx.bulk = True
+        ctx.prices.update(aggregator.results())
+        logger.debug(
+            "Bulk region %d: %d pages, kept %d of %d orders for %d types",
+            region_id,
+            ctx.pages_fetched,
+            aggregator.orders_kept,
+            aggregator.orders_seen,
+            len(aggregator.type_ids),
+        )
+        return True
+
     async def _fetch_type_orders_batch(
         self,
         ctx: FetchContext,
@@ -640,7 +875,9 @@ class MarketScopeFetcher:
             http_expires=ctx.http_expires,
             scan_status=ctx.scan_status,
             was_conditional=ctx.was_conditional,
-            pages_fetched=ctx.pages_fetched if ctx.scope.scope_type == "structure" else None,
+            pages_fetched=(
+                ctx.pages_fetched if ctx.scope.scope_type == "structure" or ctx.bulk else None
+            ),
             pages_truncated=ctx.pages_truncated,
             prices=prices_info,
             warnings=ctx.warnings,
@@ -19,10 +19,15 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from aria_esi.core.async_client import AsyncESIError, AsyncESIResponse
 from aria_esi.core.client import ESIError, ESIResponse
 from aria_esi.mcp.market.database import MarketDatabase, MarketScope, WatchlistItem
 from aria_esi.mcp.market.database_async import AsyncMarketDatabase
-from aria_esi.mcp.market.scope_refresh import AggregatedPrice, MarketScopeFetcher
+from aria_esi.mcp.market.scope_refresh import (
+    AggregatedPrice,
+    MarketScopeFetcher,
+    RegionOrderAggregator,
+)
 
 # =============================================================================
 # Fixtures
@@ -157,6 +162,27 @@ def make_orders(
     return orders
 
 
+class FakeAsyncESIClient:
+    """Async client stub serving fixed region order pages."""
+
+    def __init__(self, pages: list[list[dict]], error: Exception | None = None):
+        self.pages = pages
+        self.error = error
+        self.calls: list[tuple[str, dict | None]] = []
+
+    async def get_all_page_responses(self, endpoint, params=None, auth=False, **kwargs):
+        self.calls.append((endpoint, params))
+        if self.error is not None:
+            raise self.error
+        headers = {
+            "Last-Modified": "Wed, 22 Jan 2025 10:00:00 GMT",
+            "Expires": "Wed, 22 Jan 2025 10:05:00 GMT",
+            "X-Pages": str(len(self.pages)),
+        }
+        for page in self.pages:
+            yield AsyncESIResponse(data=page, headers=headers)
+
+
 # =============================================================================
 # Unit Tests: AggregatedPrice
 # =============================================================================
@@ -467,6 +493,173 @@ class TestScopeFetcherFiltered:
             await async_db.close()
 
 
+class TestRegionOrderAggregator:
+    """Tests for vectorized region order aggregation."""
+
+    def test_aggregates_watched_types_only(self):
+        """Orders for unwatched types are dropped; each side is grouped by type."""
+        aggregator = RegionOrderAggregator([34, 35])
+        aggregator.add_page(
+            make_orders(34, [(100.0, 1000), (101.0, 10)], [(110.0, 500), (109.0, 5)])
+        )
+        aggregator.add_page(make_orders(36, [(999.0, 1)], [(1.0, 1)]))
+
+        prices = aggregator.results()
+
+        assert set(prices) == {34, 35}
+        assert prices[34].buy_max == 101.0
+        assert prices[34].buy_volume == 1010
+        assert prices[34].buy_order_count == 2
+        assert prices[34].sell_min == 109.0
+        assert prices[34].sell_volume == 505
+        assert prices[34].sell_order_count == 2
+        assert prices[34].spread_pct == pytest.approx((109.0 - 101.0) / 109.0 * 100)
+        assert prices[35].buy_order_count == 0
+        assert prices[35].sell_min is None
+        assert aggregator.orders_seen == 6
+        assert aggregator.orders_kept == 4
+
+    def test_matches_per_order_aggregation(self):
+        """Vectorized results equal the per-order _aggregate_orders path."""
+        orders = (
+            make_orders(34, [(100.0, 1000), (90.0, 20)], [(110.0, 500)])
+            + make_orders(35, [], [(55.0, 1000), (54.5, 3), (60.0, 7)])
+            + make_orders(37, [(5.0, 1)], [])
+        )
+        aggregator = RegionOrderAggregator([34, 35, 37])
+        aggregator.add_page(orders[:3])
+        aggregator.add_page(orders[3:])
+
+        ctx = MagicMock(prices={})
+        MarketScopeFetcher._aggregate_orders(MagicMock(), ctx, orders)
+        for price in ctx.prices.values():
+            price.calculate_spread()
+
+        assert aggregator.results() == ctx.prices
+
+    def test_filters_by_location(self):
+        """filter_key/filter_value keep only orders at the target station."""
+        orders = make_orders(34, [(100.0, 1000)], [])
+        orders.append(dict(orders[0], order_id=99, price=200.0, location_id=60003761))
+
+        aggregator = RegionOrderAggregator([34], "location_id", 60003760)
+        aggregator.add_page(orders)
+
+        assert aggregator.results()[34].buy_max == 100.0
+        assert aggregator.results()[34].buy_order_count == 1
+
+
+class TestScopeFetcherBulk:
+    """Tests for bulk region pulls on large watchlists."""
+
+    @pytest.mark.asyncio
+    async def test_large_watchlist_pulls_region_once(self, temp_db, mock_esi_client):
+        """Watchlists at the threshold fetch the region book instead of per type."""
+        sync_db, db_path = temp_db
+        async_db = AsyncMarketDatabase(db_path)
+
+        try:
+            scope, items = create_test_scope(sync_db, "bulk_region", "region", region_id=10000002)
+            async_client = FakeAsyncESIClient(
+                [
+                    make_orders(34, [(100.0, 1000)], [(110.0, 500)]),
+                    make_orders(36, [(1.0, 1)], [(2.0, 1)]),
+                    make_orders(35, [(50.0, 2000)], [(55.0, 1000)]),
+                ]
+            )
+
+            fetcher = MarketScopeFetcher(async_db, mock_esi_client, async_client=async_client)
+            fetcher.BULK_REGION_THRESHOLD = 2
+            result = await fetcher.refresh_scope(scope, force_refresh=True)
+
+            assert async_client.calls == [("/markets/10000002/orders/", {"order_type": "all"})]
+            mock_esi_client.get_with_headers.assert_not_called()
+            assert result.scan_status == "complete"
+            assert result.pages_fetched == 3
+            assert result.items_refreshed == 2
+            assert result.items_with_orders == 2
+            assert result.http_last_modified is not None
+
+            stored = {p.type_id: p for p in await async_db.get_scope_prices(scope.scope_id)}
+            assert stored[34].buy_max == 100.0
+            assert stored[35].sell_min == 55.0
+        finally:
+            await async_db.close()
+
+    @pytest.mark.asyncio
+    async def test_bulk_station_scope_filters_location(self, temp_db, mock_esi_client):
+        """Bulk pulls apply the station filter."""
+        sync_db, db_path = temp_db
+        async_db = AsyncMarketDatabase(db_path)
+
+        try:
+            scope, items = create_test_scope(
+                sync_db,
+                "bulk_station",
+                "station",
+                station_id=60003760,
+                parent_region_id=10000002,
+            )
+            orders = make_orders(34, [(100.0, 1000)], [])
+            orders.append(dict(orders[0], order_id=99, price=200.0, location_id=60003761))
+
+            fetcher = MarketScopeFetcher(
+                async_db, mock_esi_client, async_client=FakeAsyncESIClient([orders])
+            )
+            fetcher.BULK_REGION_THRESHOLD = 2
+            result = await fetcher.refresh_scope(scope, force_refresh=True)
+
+            trit_price = next(p for p in result.prices if p.type_id == 34)
+            assert trit_price.order_count_buy == 1
+            assert trit_price.buy_max == 100.0
+        finally:
+            await async_db.close()
+
+    @pytest.mark.asyncio
+    async def test_small_watchlist_fetches_per_type(self, temp_db, mock_esi_client):
+        """Watchlists below the threshold keep per-type requests."""
+        sync_db, db_path = temp_db
+        async_db = AsyncMarketDatabase(db_path)
+
+        try:
+            scope, items = create_test_scope(sync_db, "small_region", "region", region_id=10000002)
+            async_client = FakeAsyncESIClient([])
+            mock_esi_client.get_with_headers = MagicMock(return_value=make_esi_response([]))
+
+            fetcher = MarketScopeFetcher(async_db, mock_esi_client, async_client=async_client)
+            result = await fetcher.refresh_scope(scope, force_refresh=True)
+
+            assert async_client.calls == []
+            assert mock_esi_client.get_with_headers.call_count == 2
+            assert result.pages_fetched is None
+        finally:
+            await async_db.close()
+
+    @pytest.mark.asyncio
+    async def test_bulk_failure_falls_back_to_per_type(self, temp_db, mock_esi_client):
+        """A failed region pull falls back to per-type requests with a warning."""
+        sync_db, db_path = temp_db
+        async_db = AsyncMarketDatabase(db_path)
+
+        try:
+            scope, items = create_test_scope(sync_db, "fallback", "region", region_id=10000002)
+            async_client = FakeAsyncESIClient([], error=AsyncESIError("boom", status_code=500))
+            mock_esi_client.get_with_headers = MagicMock(
+                return_value=make_esi_response(make_orders(34, [(100.0, 1)], []))
+            )
+
+            fetcher = MarketScopeFetcher(async_db, mock_esi_client, async_client=async_client)
+            fetcher.BULK_REGION_THRESHOLD = 2
+            result = await fetcher.refresh_scope(scope, force_refresh=True)
+
+            assert mock_esi_client.get_with_headers.call_count == 2
+            assert result.scan_status == "complete"
+            assert result.pages_fetched is None
+            assert any("fell back to per-type" in w for w in result.warnings)
+        finally:
+            await async_db.close()
+
+
 class TestScopeFetcherStructure:
     """Tests for structure scope refresh (paginated)."""
 
@@ -11,6 +11,8 @@ import asyncio
 from collections import deque
 from typing import TYPE_CHECKING, Literal
 
+import numpy as np
+
 from aria_esi.core.logging import get_logger
 from aria_esi.mcp.market.cache import MarketCache, get_market_cache
 from aria_esi.mcp.market.database import get_market_database
@@ -20,6 +22,7 @@ from aria_esi.models.market import (
     SourceFilter,
 )
 from aria_esi.models.sde import CATEGORY_BLUEPRINT, CATEGORY_SKILL
+from aria_esi.universe.graph import JUMPS_UNREACHABLE
 
 if TYPE_CHECKING:
     from mcp.server.fastmcp import FastMCP
@@ -143,6 +146,12 @@ def compute_distances_bounded_bfs(
     Returns:
         Dict mapping system_id to jump distance
     """
+    if universe.jump_matrix is not None:
+        # O(1) row lookup from the precomputed hop matrix
+        row = universe.jumps_from(origin_idx)
+        within = np.flatnonzero(row <= min(max_jumps, JUMPS_UNREACHABLE - 1))
+        return dict(zip(universe.system_ids[within].tolist(), row[within].tolist()))
+
     distances: dict[int, int] = {}
     queue: deque[tuple[int, int]] = deque([(origin_idx, 0)])
     visited: set[int] = {origin_idx}
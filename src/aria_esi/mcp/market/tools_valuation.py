@@ -98,11 +98,13 @@ def register_valuation_tools(server: FastMCP) -> None:
         quantities: dict[int, int] = {}
         unresolved_items: list[dict] = []
 
+        resolved = db.batch_resolve_names([item.get("name", "") for item in items])
+
         for item in items:
             name = item.get("name", "")
             qty = item.get("quantity", 1)
 
-            type_info = db.resolve_type_name(name)
+            type_info = resolved.get(name)
             if type_info:
                 type_id = type_info.type_id
                 type_ids.append(type_id)
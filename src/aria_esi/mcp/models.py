@@ -13,6 +13,8 @@ from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from ..services.loop_planning.tsp import TourMethod
+
 # =============================================================================
 # Type Aliases for Tool Parameters
 # =============================================================================
@@ -125,6 +127,30 @@ class RouteResult(MCPModel):
     )
 
 
+class RouteSummary(MCPModel):
+    """Compact route to one destination of a multi-destination request."""
+
+    destination: str
+    jumps: int = Field(ge=0)
+    systems: list[str] = Field(description="System names from origin to destination")
+    security_summary: SecuritySummary
+    warnings: list[str] = Field(default_factory=list)
+
+
+class MultiRouteResult(MCPModel):
+    """Routes from one origin to several destinations, sorted by jumps."""
+
+    origin: str
+    mode: Literal["shortest", "safe", "unsafe"]
+    routes: list[RouteSummary]
+    unreachable: list[str] = Field(default_factory=list)
+    warnings: list[str] = Field(default_factory=list)
+    corrections: dict[str, str] = Field(
+        default_factory=dict,
+        description="Auto-corrected system names: {input: canonical}",
+    )
+
+
 # =============================================================================
 # Border System Models
 # =============================================================================
@@ -150,6 +176,12 @@ class LoopResult(MCPModel):
     border_systems_visited: list[BorderSystem]
     backtrack_jumps: int = Field(ge=0)
     efficiency: float = Field(ge=0.0, le=1.0)
+    tour_method: TourMethod = Field(
+        default="greedy", description="Algorithm that produced the border visit order"
+    )
+    jumps_saved: int = Field(
+        default=0, ge=0, description="Jumps saved versus the nearest-neighbor visit order"
+    )
     warnings: list[str] = Field(default_factory=list)
     corrections: dict[str, str] = Field(
         default_factory=dict,
@@ -239,6 +271,12 @@ class OptimizedWaypointResult(MCPModel):
     total_jumps: int = Field(ge=0, description="Total jumps to complete the route")
     route_systems: list[SystemInfo] = Field(description="Full route with all intermediate systems")
     is_loop: bool = Field(description="True if route returns to origin")
+    tour_method: TourMethod = Field(
+        default="greedy", description="Algorithm that produced the visit order"
+    )
+    jumps_saved: int = Field(
+        default=0, ge=0, description="Jumps saved versus the nearest-neighbor visit order"
+    )
     unresolved_waypoints: list[str] = Field(
         default_factory=list, description="Waypoint names that could not be resolved"
     )
@@ -354,6 +354,7 @@ class SDEImporter:
             if progress_callback:
                 progress_callback("types", 0)
             result.types_imported = self._import_types(sde_conn, target_conn)
+            self.market_db.rebuild_type_name_index()
             if progress_callback:
                 progress_callback("types", result.types_imported)
 
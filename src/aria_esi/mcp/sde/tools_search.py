@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING
 
 from aria_esi.core.logging import get_logger
 from aria_esi.mcp.market.database import get_market_database
+from aria_esi.mcp.market.name_index import contains_clause, has_types_fts
 from aria_esi.models.sde import (
     CATEGORY_BLUEPRINT,
     SDESearchResult,
@@ -66,11 +67,14 @@ async def _search_impl(
             warnings=["SDE data not seeded. Run 'aria-esi sde-seed' first."],
         ).model_dump()
 
+    # Substring match via the trigram index where available
+    name_clause, name_params = contains_clause(query_lower, has_types_fts(conn))
+
     # Build query based on filters
     if category:
         category_lower = category.lower()
         cursor = conn.execute(
-            """
+            f"""
             SELECT
                 t.type_id,
                 t.type_name,
@@ -80,17 +84,17 @@ async def _search_impl(
             FROM types t
             LEFT JOIN groups g ON t.group_id = g.group_id
             LEFT JOIN categories c ON t.category_id = c.category_id
-            WHERE t.type_name_lower LIKE ?
+            WHERE {name_clause}
             AND c.category_name_lower = ?
             AND t.published = 1
             ORDER BY length(t.type_name), t.type_name
             LIMIT ?
             """,
-            (f"%{query_lower}%", category_lower, limit),
+            (*name_params, category_lower, limit),
         )
     else:
         cursor = conn.execute(
-            """
+            f"""
             SELECT
                 t.type_id,
                 t.type_name,
@@ -100,12 +104,12 @@ async def _search_impl(
             FROM types t
             LEFT JOIN groups g ON t.group_id = g.group_id
             LEFT JOIN categories c ON t.category_id = c.category_id
-            WHERE t.type_name_lower LIKE ?
+            WHERE {name_clause}
             AND t.published = 1
             ORDER BY length(t.type_name), t.type_name
             LIMIT ?
             """,
-            (f"%{query_lower}%", limit),
+            (*name_params, limit),
         )
 
     items = []
@@ -126,25 +130,25 @@ async def _search_impl(
     # Get total count (without limit) for informational purposes
     if category:
         count_cursor = conn.execute(
-            """
+            f"""
             SELECT COUNT(*)
             FROM types t
             LEFT JOIN categories c ON t.category_id = c.category_id
-            WHERE t.type_name_lower LIKE ?
+            WHERE {name_clause}
             AND c.category_name_lower = ?
             AND t.published = 1
             """,
-            (f"%{query_lower}%", category.lower()),
+            (*name_params, category.lower()),
         )
     else:
         count_cursor = conn.execute(
-            """
+            f"""
             SELECT COUNT(*)
             FROM types t
-            WHERE t.type_name_lower LIKE ?
+            WHERE {name_clause}
             AND t.published = 1
             """,
-            (f"%{query_lower}%",),
+            name_params,
         )
 
     total_found = count_cursor.fetchone()[0]
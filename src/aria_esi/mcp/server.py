@@ -17,6 +17,8 @@ from mcp.server.fastmcp import FastMCP
 
 from ..core.config import get_settings
 from ..core.logging import get_logger
+from ..services.navigation.route_cache import get_route_cache
+from ..services.navigation.weights import warm_route_weights
 from ..universe.builder import load_universe_graph
 
 if TYPE_CHECKING:
@@ -78,6 +80,15 @@ class UniverseServer:
             elapsed * 1000,
         )
 
+        # Build per-mode route weight vectors once, up front
+        warm_route_weights(self.universe)
+
+        settings = get_settings()
+        get_route_cache(
+            self.universe,
+            db_path=settings.route_cache_path if settings.route_cache_persist else None,
+        )
+
     def register_tools(self) -> None:
         """Register all MCP tools with the server."""
         if self._tools_registered:
@@ -177,15 +177,20 @@ def collect_corrections(*resolved: ResolvedSystem) -> dict[str, str]:
     return corrections
 
 
-def _levenshtein_distance(s1: str, s2: str) -> int:
+def _levenshtein_distance(s1: str, s2: str, max_distance: int | None = None) -> int:
     """
     Calculate Levenshtein edit distance between two strings.
 
-    Uses O(min(m,n)) space dynamic programming approach.
+    Uses O(min(m,n)) space dynamic programming approach. With max_distance,
+    stops as soon as the distance must exceed it and returns
+    max_distance + 1.
     """
     if len(s1) < len(s2):
         s1, s2 = s2, s1
 
+    if max_distance is not None and len(s1) - len(s2) > max_distance:
+        return max_distance + 1
+
     if len(s2) == 0:
         return len(s1)
 
@@ -202,6 +207,8 @@ def _levenshtein_distance(s1: str, s2: str) -> int:
                     prev_row[j] + cost,  # substitution
                 )
             )
+        if max_distance is not None and min(curr_row) > max_distance:
+            return max_distance + 1
         prev_row = curr_row
 
     return prev_row[-1]
@@ -247,7 +254,7 @@ def _find_suggestions(name: str, universe: UniverseGraph, limit: int = 3) -> lis
         if abs(len(canonical_lower) - len(name_lower)) > max_distance:
             continue
 
-        distance = _levenshtein_distance(name_lower, canonical_lower)
+        distance = _levenshtein_distance(name_lower, canonical_lower, max_distance)
         if distance <= max_distance:
             candidates.append((distance, canonical))
 
@@ -15,15 +15,22 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+from ..services.loop_planning.tsp import VALID_TSP_SOLVERS, is_tsp_solver
 from .context_policy import UNIVERSE
 from .errors import InsufficientBordersError, InvalidParameterError
-from .models import VALID_OPTIMIZE_MODES, VALID_SECURITY_FILTERS, BorderSystem, LoopResult
+from .models import (
+    VALID_OPTIMIZE_MODES,
+    VALID_SECURITY_FILTERS,
+    BorderSystem,
+    LoopResult,
+)
 from .tools import collect_corrections, get_universe, resolve_system_name
 from .utils import build_system_info
 
 if TYPE_CHECKING:
     from mcp.server.fastmcp import FastMCP
 
+    from ..services.loop_planning.tsp import TourMethod, TspSolver
     from ..universe.graph import UniverseGraph
 
 
@@ -46,6 +53,9 @@ MAX_BORDERS_CAP = UNIVERSE.LOOP_MAX_BORDERS_CAP
 # with excessive backtracking. A tighter radius produces better routes.
 SEARCH_RADIUS_DIVISOR = UNIVERSE.LOOP_SEARCH_RADIUS_DIVISOR
 
+# Time budget for improving the border visit order (seconds)
+TSP_TIME_BUDGET = UNIVERSE.TSP_TIME_BUDGET_MS / 1000
+
 
 def register_loop_tools(server: FastMCP, universe: UniverseGraph) -> None:
     """
@@ -65,13 +75,14 @@ def register_loop_tools(server: FastMCP, universe: UniverseGraph) -> None:
         optimize: str = "density",
         security_filter: str = "highsec",
         avoid_systems: list[str] | None = None,
+        solver: str = "optimize",
     ) -> dict:
         """
         Plan a circular route visiting multiple border systems.
 
         PREFER THIS TOOL over writing custom loop planning scripts. Handles:
         - Distance matrix precomputation for O(1) lookups
-        - TSP approximation via nearest-neighbor heuristic
+        - Visit ordering: exact for small loops, 2-opt/Or-opt improvement otherwise
         - Configurable security constraints via security_filter
         - Spatial diversity selection for border coverage
         - System avoidance for known danger zones
@@ -93,6 +104,9 @@ def register_loop_tools(server: FastMCP, universe: UniverseGraph) -> None:
                 - "lowsec": Allow low-sec, avoid null-sec
                 - "any": No security restrictions
             avoid_systems: List of system names to avoid (e.g., known gatecamp systems)
+            solver: Border visit-order solver:
+                - "optimize": Improve on nearest-neighbor ordering (default)
+                - "greedy": Nearest-neighbor ordering only (fastest)
 
         Returns:
             LoopResult with optimized route minimizing backtracking:
@@ -101,6 +115,7 @@ def register_loop_tools(server: FastMCP, universe: UniverseGraph) -> None:
             - border_systems_visited: Details on each border system
             - backtrack_jumps: Number of repeated systems
             - efficiency: Ratio of unique to total systems
+            - tour_method / jumps_saved: Solver used and gain over nearest-neighbor
 
         Examples:
             # Default high-sec only loop
@@ -145,6 +160,12 @@ def register_loop_tools(server: FastMCP, universe: UniverseGraph) -> None:
                 security_filter,
                 f"Must be one of: {', '.join(sorted(VALID_SECURITY_FILTERS))}",
             )
+        if not is_tsp_solver(solver):
+            raise InvalidParameterError(
+                "solver",
+                solver,
+                f"Must be one of: {', '.join(sorted(VALID_TSP_SOLVERS))}",
+            )
 
         origin_resolved = resolve_system_name(origin)
         corrections = collect_corrections(origin_resolved)
@@ -171,6 +192,7 @@ def register_loop_tools(server: FastMCP, universe: UniverseGraph) -> None:
             avoid_systems=avoid_indices,
             unresolved_avoids=unresolved_avoids,
             corrections=corrections,
+            solver=solver,
         )
 
         return result
@@ -187,6 +209,7 @@ def _plan_loop(
     avoid_systems: set[int] | None = None,
     unresolved_avoids: list[str] | None = None,
     corrections: dict[str, str] | None = None,
+    solver: TspSolver = "optimize",
 ) -> dict[str, Any]:
     """
     Plan circular route through border systems.
@@ -205,6 +228,7 @@ def _plan_loop(
         avoid_systems: Set of vertex indices to avoid
         unresolved_avoids: List of system names that couldn't be resolved
         corrections: Auto-corrected system names {input: canonical}
+        solver: Border visit-order solver ("greedy" or "optimize")
 
     Returns:
         LoopResult as dict
@@ -229,6 +253,8 @@ def _plan_loop(
             avoid_systems=avoid_systems,
             search_radius_divisor=SEARCH_RADIUS_DIVISOR,
             max_borders_cap=MAX_BORDERS_CAP,
+            solver=solver,
+            time_budget=TSP_TIME_BUDGET,
         )
     except ServiceInsufficientBordersError as e:
         # Re-raise as MCP error for MCP-compatible error handling
@@ -247,6 +273,8 @@ def _plan_loop(
         summary.borders_visited,
         unresolved_avoids,
         corrections,
+        tour_method=summary.tour_method,
+        jumps_saved=summary.jumps_saved,
     )
 
 
@@ -335,6 +363,8 @@ def _build_loop_result(
     borders_visited: list[tuple[int, int]],
     unresolved_avoids: list[str] | None = None,
     corrections: dict[str, str] | None = None,
+    tour_method: TourMethod = "greedy",
+    jumps_saved: int = 0,
 ) -> dict[str, Any]:
     """
     Build LoopResult from computed route.
@@ -346,6 +376,8 @@ def _build_loop_result(
         borders_visited: Border systems visited with distances
         unresolved_avoids: List of system names that couldn't be resolved
         corrections: Auto-corrected system names {input: canonical}
+        tour_method: Algorithm that produced the border visit order
+        jumps_saved: Jumps saved versus the nearest-neighbor visit order
 
     Returns:
         LoopResult as dictionary
@@ -382,6 +414,8 @@ def _build_loop_result(
         border_systems_visited=border_systems,
         backtrack_jumps=max(0, backtrack),
         efficiency=min(1.0, efficiency),
+        tour_method=tour_method,
+        jumps_saved=jumps_saved,
         warnings=warnings,
         corrections=corrections or {},
     ).model_dump()
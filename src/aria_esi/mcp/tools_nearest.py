@@ -10,10 +10,12 @@ STP-014: Activity-aware predicates for local intel
 
 from __future__ import annotations
 
-from collections import deque
 from collections.abc import Callable
 from typing import TYPE_CHECKING
 
+import numpy as np
+
+from ..universe.neighborhood import iter_layers, nearest_matching, system_mask
 from .activity import ActivityData, classify_activity, get_activity_cache
 from .context_policy import UNIVERSE
 from .errors import InvalidParameterError
@@ -22,6 +24,7 @@ from .tools import collect_corrections, get_universe, resolve_system_name
 
 if TYPE_CHECKING:
     from mcp.server.fastmcp import FastMCP
+    from numpy.typing import NDArray
 
     from ..universe.graph import UniverseGraph
 
@@ -30,6 +33,9 @@ if TYPE_CHECKING:
 MAX_LIMIT = UNIVERSE.NEAREST_MAX_LIMIT
 MAX_JUMPS = UNIVERSE.NEAREST_MAX_JUMPS
 
+# classify_activity(kills, "kills") is the same for every value >= 50
+_KILL_LEVEL_CAP = 51
+
 
 def register_nearest_tools(server: FastMCP, universe: UniverseGraph) -> None:
     """
@@ -216,6 +222,23 @@ def register_nearest_tools(server: FastMCP, universe: UniverseGraph) -> None:
         return response
 
 
+class _MaskPredicate:
+    """
+    Vertex predicate backed by a precomputed boolean mask.
+
+    Callable like any predicate, but also lets _find_nearest apply the
+    whole mask to a BFS radius in one vectorized step.
+    """
+
+    __slots__ = ("mask",)
+
+    def __init__(self, mask: NDArray[np.bool_]) -> None:
+        self.mask = mask
+
+    def __call__(self, idx: int) -> bool:
+        return bool(self.mask[idx])
+
+
 def _build_predicate(
     universe: UniverseGraph,
     is_border: bool | None,
@@ -227,11 +250,12 @@ def _build_predicate(
     min_npc_kills: int | None = None,
     activity_level: str | None = None,
     activity_data: dict[int, ActivityData] | None = None,
-) -> Callable[[int], bool]:
+) -> _MaskPredicate:
     """
-    Build a predicate function from filter parameters.
+    Build a predicate from filter parameters.
 
-    Returns a function that takes a vertex index and returns True if it matches.
+    All filters are evaluated up front for every system; the returned
+    predicate takes a vertex index and returns True if it matches.
 
     Args:
         universe: UniverseGraph for system lookups
@@ -245,62 +269,40 @@ def _build_predicate(
         activity_level: Required activity level (none/low/medium/high/extreme)
         activity_data: Pre-fetched activity data (required if activity filters used)
     """
+    mask = system_mask(
+        universe,
+        security_min=security_min,
+        security_max=security_max,
+        region_id=region_id,
+        is_border=is_border,
+        min_adjacent_lowsec=min_adjacent_lowsec,
+    )
 
-    def predicate(idx: int) -> bool:
-        # Border filter
-        if is_border is True and idx not in universe.border_systems:
-            return False
-        if is_border is False and idx in universe.border_systems:
-            return False
-
-        # Adjacent low-sec count filter
-        if min_adjacent_lowsec is not None:
-            lowsec_neighbors = sum(
-                1 for n in universe.graph.neighbors(idx) if universe.security[n] < 0.45
-            )
-            if lowsec_neighbors < min_adjacent_lowsec:
-                return False
-
-        # Security range filter
-        sec = universe.security[idx]
-        if security_min is not None and sec < security_min:
-            return False
-        if security_max is not None and sec > security_max:
-            return False
-
-        # Region filter
-        if region_id is not None and int(universe.region_ids[idx]) != region_id:
-            return False
-
-        # Activity filters (require activity_data to be pre-fetched)
-        if max_kills is not None or min_npc_kills is not None or activity_level is not None:
-            system_id = int(universe.system_ids[idx])
-            activity = activity_data.get(system_id) if activity_data else None
-
-            # Get kill counts (default to 0 if no data)
-            pvp_kills = 0
-            npc_kills = 0
-            if activity:
-                pvp_kills = activity.ship_kills + activity.pod_kills
-                npc_kills = activity.npc_kills
-
-            # Max kills filter (for finding quiet systems)
-            if max_kills is not None and pvp_kills > max_kills:
-                return False
+    # Activity filters (require activity_data to be pre-fetched)
+    if max_kills is not None or min_npc_kills is not None or activity_level is not None:
+        # Kill counts per vertex (default to 0 if no data)
+        pvp_kills = np.zeros(universe.system_count, dtype=np.int64)
+        npc_kills = np.zeros(universe.system_count, dtype=np.int64)
+        for system_id, activity in (activity_data or {}).items():
+            idx = universe.id_to_idx.get(system_id)
+            if idx is not None:
+                pvp_kills[idx] = activity.ship_kills + activity.pod_kills
+                npc_kills[idx] = activity.npc_kills
 
-            # Min NPC kills filter (for finding ratting pockets)
-            if min_npc_kills is not None and npc_kills < min_npc_kills:
-                return False
+        # Max kills filter (for finding quiet systems)
+        if max_kills is not None:
+            mask &= pvp_kills <= max_kills
 
-            # Activity level filter
-            if activity_level is not None:
-                current_level = classify_activity(pvp_kills, "kills")
-                if current_level != activity_level:
-                    return False
+        # Min NPC kills filter (for finding ratting pockets)
+        if min_npc_kills is not None:
+            mask &= npc_kills >= min_npc_kills
 
-        return True
+        # Activity level filter
+        if activity_level is not None:
+            levels = np.array([classify_activity(k, "kills") for k in range(_KILL_LEVEL_CAP)])
+            mask &= levels[np.minimum(pvp_kills, _KILL_LEVEL_CAP - 1)] == activity_level
 
-    return predicate
+    return _MaskPredicate(mask)
 
 
 def _find_nearest(
@@ -311,10 +313,11 @@ def _find_nearest(
     max_jumps: int,
 ) -> list[SystemSearchResult]:
     """
-    Find nearest systems matching predicate using BFS.
+    Find nearest systems matching predicate.
 
-    BFS guarantees distance-ordered results, so we can stop as soon
-    as we have enough matches.
+    BFS layers are visited in (distance, vertex index) order and the
+    search stops as soon as enough matches are found. Mask predicates are
+    applied a whole layer at a time; other callables per system.
 
     Args:
         universe: UniverseGraph for traversal
@@ -326,31 +329,25 @@ def _find_nearest(
     Returns:
         List of SystemSearchResult sorted by distance
     """
-    g = universe.graph
-    results: list[SystemSearchResult] = []
-
-    # BFS with distance tracking
-    visited: set[int] = {origin_idx}
-    queue: deque[tuple[int, int]] = deque([(origin_idx, 0)])
-
-    while queue and len(results) < limit:
-        vertex, dist = queue.popleft()
+    if isinstance(predicate, _MaskPredicate):
+        vertices, distances = nearest_matching(
+            universe, origin_idx, predicate.mask, limit, max_jumps
+        )
+        return [
+            _build_result(universe, idx, dist)
+            for idx, dist in zip(vertices.tolist(), distances.tolist())
+        ]
 
-        # Stop if beyond max_jumps
-        if dist > max_jumps:
+    results: list[SystemSearchResult] = []
+    for dist, layer in iter_layers(universe, origin_idx, max_jumps):
+        # Skip origin
+        if dist == 0:
             continue
-
-        # Check if this system matches predicate (skip origin)
-        if dist > 0 and predicate(vertex):
-            results.append(_build_result(universe, vertex, dist))
-            if len(results) >= limit:
-                break
-
-        # Expand to neighbors
-        for neighbor in g.neighbors(vertex):
-            if neighbor not in visited:
-                visited.add(neighbor)
-                queue.append((neighbor, dist + 1))
+        for idx in layer.tolist():
+            if predicate(idx):
+                results.append(_build_result(universe, idx, dist))
+                if len(results) >= limit:
+                    return results
 
     return results
 
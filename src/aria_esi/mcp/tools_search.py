@@ -9,9 +9,11 @@ STP-008: Search Tool (universe_search)
 
 from __future__ import annotations
 
-from collections import deque
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
+from ..universe.neighborhood import system_mask, within_jumps
 from .context_policy import UNIVERSE
 from .errors import InvalidParameterError
 from .models import SystemSearchResult
@@ -193,10 +195,10 @@ def _search_systems(
     Execute system search with filters.
 
     Strategy:
-    - If origin + max_jumps: BFS within range, then filter
-    - If region: Iterate region systems, then filter
-    - If is_border: Use border index
-    - Otherwise: Full scan with filters (less efficient)
+    - Every filter is evaluated as a boolean mask over all systems
+    - If origin + max_jumps: one BFS yields the radius with hop counts,
+      and the mask is applied to it (results in distance order)
+    - Otherwise: matching systems in vertex index order
 
     Args:
         universe: UniverseGraph for lookups
@@ -211,49 +213,23 @@ def _search_systems(
     Returns:
         List of SystemSearchResult objects
     """
-    results: list[SystemSearchResult] = []
-    distances: dict[int, int] = {}
+    mask = system_mask(
+        universe,
+        security_min=security_min,
+        security_max=security_max,
+        region_id=region_id,
+        is_border=is_border,
+    )
 
-    # Determine candidate set based on most restrictive filter
     if origin_idx is not None and max_jumps is not None:
-        # BFS to find systems within range
-        candidates, distances = _bfs_within_range(universe, origin_idx, max_jumps)
-    elif region_id is not None:
-        # Use region index
-        candidates = set(universe.region_systems.get(region_id, []))
-    elif is_border is True:
-        # Use border index
-        candidates = set(universe.border_systems)
-    else:
-        # Full scan
-        candidates = set(range(universe.system_count))
-
-    # Apply filters to candidates
-    for idx in candidates:
-        if len(results) >= limit:
-            break
-
-        # Security filter
-        sec = universe.security[idx]
-        if security_min is not None and sec < security_min:
-            continue
-        if security_max is not None and sec > security_max:
-            continue
-
-        # Region filter (if not already applied as candidate set)
-        if region_id is not None and origin_idx is not None:
-            if int(universe.region_ids[idx]) != region_id:
-                continue
-
-        # Border filter (if not already applied as candidate set)
-        if is_border is True and idx not in universe.border_systems:
-            continue
-        if is_border is False and idx in universe.border_systems:
-            continue
-
-        results.append(_build_search_result(universe, idx, distances.get(idx)))
-
-    return results
+        vertices, distances = within_jumps(universe, origin_idx, max_jumps)
+        keep = mask[vertices]
+        matches = zip(vertices[keep][:limit].tolist(), distances[keep][:limit].tolist())
+        return [_build_search_result(universe, idx, dist) for idx, dist in matches]
+
+    return [
+        _build_search_result(universe, idx, None) for idx in np.flatnonzero(mask)[:limit].tolist()
+    ]
 
 
 def _bfs_within_range(
@@ -262,7 +238,7 @@ def _bfs_within_range(
     max_jumps: int,
 ) -> tuple[set[int], dict[int, int]]:
     """
-    BFS to find all systems within max_jumps.
+    Find all systems within max_jumps.
 
     Args:
         universe: UniverseGraph for traversal
@@ -272,21 +248,9 @@ def _bfs_within_range(
     Returns:
         Tuple of (set of vertex indices, dict of distances)
     """
-    g = universe.graph
-    visited: dict[int, int] = {origin_idx: 0}
-    queue: deque[tuple[int, int]] = deque([(origin_idx, 0)])
-
-    while queue:
-        vertex, dist = queue.popleft()
-        if dist >= max_jumps:
-            continue
-
-        for neighbor in g.neighbors(vertex):
-            if neighbor not in visited:
-                visited[neighbor] = dist + 1
-                queue.append((neighbor, dist + 1))
-
-    return set(visited.keys()), visited
+    vertices, distances = within_jumps(universe, origin_idx, max_jumps)
+    found = dict(zip(vertices.tolist(), distances.tolist()))
+    return set(found), found
 
 
 def _build_search_result(
@@ -12,15 +12,21 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+from ..services.loop_planning.tsp import VALID_TSP_SOLVERS, is_tsp_solver, solve_tour
 from .context_policy import UNIVERSE
 from .errors import InvalidParameterError
-from .models import VALID_SECURITY_FILTERS, OptimizedWaypointResult, WaypointInfo
+from .models import (
+    VALID_SECURITY_FILTERS,
+    OptimizedWaypointResult,
+    WaypointInfo,
+)
 from .tools import collect_corrections, get_universe, resolve_system_name
 from .utils import DistanceMatrix, build_system_info
 
 if TYPE_CHECKING:
     from mcp.server.fastmcp import FastMCP
 
+    from ..services.loop_planning.tsp import TourMethod, TspSolver
     from ..universe.graph import UniverseGraph
 
 
@@ -30,6 +36,7 @@ if TYPE_CHECKING:
 
 MIN_WAYPOINTS = UNIVERSE.WAYPOINTS_MIN_COUNT
 MAX_WAYPOINTS = UNIVERSE.WAYPOINTS_MAX_COUNT
+TSP_TIME_BUDGET = UNIVERSE.TSP_TIME_BUDGET_MS / 1000
 
 
 def register_waypoints_tools(server: FastMCP, universe: UniverseGraph) -> None:
@@ -48,13 +55,15 @@ def register_waypoints_tools(server: FastMCP, universe: UniverseGraph) -> None:
         return_to_origin: bool = True,
         security_filter: str = "any",
         avoid_systems: list[str] | None = None,
+        solver: str = "optimize",
     ) -> dict:
         """
         Optimize visit order for multiple waypoints (TSP approximation).
 
         PREFER THIS TOOL over writing custom TSP scripts. Handles:
         - Distance matrix precomputation for O(1) lookups
-        - Nearest-neighbor TSP heuristic for fast approximation
+        - Exact ordering (Held-Karp) for up to 12 stops, nearest-neighbor
+          plus 2-opt/Or-opt improvement for larger sets
         - Security-constrained routing
         - System avoidance for known danger zones
         - Optional origin/return handling
@@ -74,6 +83,9 @@ def register_waypoints_tools(server: FastMCP, universe: UniverseGraph) -> None:
                 - "highsec": Only traverse high-sec (>= 0.45)
                 - "lowsec": Allow low-sec, avoid null-sec
             avoid_systems: List of system names to avoid in routing
+            solver: Visit-order solver:
+                - "optimize": Improve on nearest-neighbor ordering (default)
+                - "greedy": Nearest-neighbor ordering only (fastest)
 
         Returns:
             OptimizedWaypointResult with:
@@ -81,6 +93,8 @@ def register_waypoints_tools(server: FastMCP, universe: UniverseGraph) -> None:
             - total_jumps: Total route length
             - route_systems: Full route with all intermediate systems
             - is_loop: Whether route returns to origin
+            - tour_method: Algorithm that produced the visit order
+            - jumps_saved: Jumps saved versus nearest-neighbor ordering
             - unresolved_waypoints: Names that couldn't be found
 
         Examples:
@@ -129,6 +143,12 @@ def register_waypoints_tools(server: FastMCP, universe: UniverseGraph) -> None:
                 security_filter,
                 f"Must be one of: {', '.join(sorted(VALID_SECURITY_FILTERS))}",
             )
+        if not is_tsp_solver(solver):
+            raise InvalidParameterError(
+                "solver",
+                solver,
+                f"Must be one of: {', '.join(sorted(VALID_TSP_SOLVERS))}",
+            )
 
         # Resolve origin if specified (with auto-correction)
         origin_idx: int | None = None
@@ -182,6 +202,7 @@ def register_waypoints_tools(server: FastMCP, universe: UniverseGraph) -> None:
             unresolved_waypoints=unresolved,
             unresolved_avoids=unresolved_avoids,
             corrections=corrections,
+            solver=solver,
         )
 
         return result
@@ -198,6 +219,7 @@ def _optimize_waypoints(
     unresolved_waypoints: list[str] | None = None,
     unresolved_avoids: list[str] | None = None,
     corrections: dict[str, str] | None = None,
+    solver: TspSolver = "optimize",
 ) -> dict[str, Any]:
     """
     Optimize waypoint visit order using TSP approximation.
@@ -205,7 +227,7 @@ def _optimize_waypoints(
     Algorithm:
     1. Build distance matrix for all waypoints (+ origin if specified)
     2. If no origin: find optimal starting point (minimum total tour cost)
-    3. Apply nearest-neighbor TSP heuristic
+    3. Order waypoints (nearest-neighbor, then exact or 2-opt/Or-opt)
     4. Optionally add return leg to origin
     5. Expand tour to full route with intermediate systems
     6. Build result
@@ -219,6 +241,7 @@ def _optimize_waypoints(
         avoid_systems: Set of vertex indices to avoid
         unresolved_waypoints: Waypoint names that couldn't be resolved
         unresolved_avoids: Avoid system names that couldn't be resolved
+        solver: Visit-order solver ("greedy" or "optimize")
 
     Returns:
         OptimizedWaypointResult as dict
@@ -249,14 +272,23 @@ def _optimize_waypoints(
         # Use the vertex with minimum average distance to others
         start_idx = _find_best_start(waypoint_indices, matrix)
 
-    # Step 4: Apply nearest-neighbor TSP
+    # Step 4: Order waypoints
     # Tour visits all waypoints (excluding origin if separate)
     if origin_idx is not None and origin_idx not in waypoint_indices:
         to_visit = waypoint_indices
     else:
         to_visit = [v for v in waypoint_indices if v != start_idx]
 
-    tour = _nearest_neighbor_tsp(start_idx, to_visit, matrix)
+    returns = return_to_origin and origin_idx is not None
+    solution = solve_tour(
+        start_idx,
+        to_visit,
+        matrix,
+        closed=returns,
+        solver=solver,
+        time_budget=TSP_TIME_BUDGET,
+    )
+    tour = solution.tour
 
     # Step 5: Build full route
     full_route: list[int] = []
@@ -294,6 +326,8 @@ def _optimize_waypoints(
         unresolved_waypoints=unresolved_waypoints,
         unresolved_avoids=unresolved_avoids,
         corrections=corrections,
+        tour_method=solution.method,
+        jumps_saved=solution.jumps_saved,
     )
 
 
@@ -369,6 +403,8 @@ def _build_optimization_result(
     unresolved_waypoints: list[str] | None = None,
     unresolved_avoids: list[str] | None = None,
     corrections: dict[str, str] | None = None,
+    tour_method: TourMethod = "greedy",
+    jumps_saved: int = 0,
 ) -> dict[str, Any]:
     """
     Build OptimizedWaypointResult from computed tour.
@@ -383,6 +419,8 @@ def _build_optimization_result(
         unresolved_waypoints: Waypoint names that couldn't be resolved
         unresolved_avoids: Avoid system names that couldn't be resolved
         corrections: Auto-corrected system names {input: canonical}
+        tour_method: Algorithm that produced the visit order
+        jumps_saved: Jumps saved versus the nearest-neighbor visit order
 
     Returns:
         OptimizedWaypointResult as dictionary
@@ -419,6 +457,8 @@ def _build_optimization_result(
         total_jumps=total_jumps,
         route_systems=route_systems,
         is_loop=is_loop,
+        tour_method=tour_method,
+        jumps_saved=jumps_saved,
         unresolved_waypoints=unresolved_waypoints or [],
         warnings=warnings,
         corrections=corrections or {},
@@ -9,13 +9,20 @@ STP-006: Systems Tool (extracted for sharing)
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from itertools import chain
 from typing import TYPE_CHECKING
 
+import numpy as np
+
+from ..services.navigation.weights import get_weight_cache
 from ..services.redisq.notifications.npc_factions import get_npc_faction_mapper
+from ..universe.graph import JUMPS_UNREACHABLE
 from .errors import InvalidParameterError
 from .models import NeighborInfo, SecurityFilter, SovereigntyInfo, SystemInfo
 
 if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
     from ..universe.graph import UniverseGraph
 
 
@@ -32,6 +39,10 @@ class DistanceMatrix:
     Computes all-pairs shortest paths between a set of waypoints in a single
     operation, then provides O(1) distance lookups and path retrieval.
 
+    Distances are held as a float32 array. Paths are not stored: each source
+    keeps a predecessor array over all vertices (its shortest-path tree) and
+    a path is rebuilt by walking it back from the destination on request.
+
     Usage:
         matrix = DistanceMatrix.compute(universe, waypoint_indices)
         dist = matrix.distance(0, 3)  # Distance from waypoint 0 to 3
@@ -39,8 +50,10 @@ class DistanceMatrix:
     """
 
     waypoints: list[int]
-    _distances: list[list[float]] = field(repr=False)
-    _paths: list[list[list[int]]] = field(repr=False)
+    # (n, n) jumps between waypoints, inf where unreachable
+    _distances: NDArray[np.float32] = field(repr=False)
+    # (n, system_count) previous vertex on the path from each source, -1 if none
+    _predecessors: NDArray[np.int32] = field(repr=False)
     _idx_map: dict[int, int] = field(repr=False)
 
     @classmethod
@@ -64,7 +77,7 @@ class DistanceMatrix:
             avoid_systems: Set of vertex indices to avoid (infinite weight)
 
         Returns:
-            DistanceMatrix with precomputed distances and paths
+            DistanceMatrix with precomputed distances and shortest-path trees
 
         Raises:
             InvalidParameterError: If waypoints contains invalid vertex indices
@@ -88,25 +101,20 @@ class DistanceMatrix:
             avoid_systems=avoid_systems,
         )
 
-        # Compute all-pairs shortest paths in one call
-        # This is O(V * E * log(V)) total instead of O(n² * V * E * log(V))
-        distances: list[list[float]] = []
-        paths: list[list[list[int]]] = []
-
-        for src in waypoints:
-            # Single call gets distances and paths to ALL targets
-            row_paths = g.get_shortest_paths(src, waypoints, weights=weights)
-            row_dists = [len(p) - 1 if p else float("inf") for p in row_paths]
-            distances.append(row_dists)
-            paths.append(row_paths)
-
         # Build index map: vertex_idx -> matrix position
         idx_map = {v: i for i, v in enumerate(waypoints)}
 
+        if weights is None and universe.jump_matrix is not None:
+            # Unweighted: hop counts come straight from the precomputed matrix
+            # and the shortest-path trees follow from its rows
+            distances, predecessors = _trees_from_jump_matrix(universe, waypoints)
+        else:
+            distances, predecessors = _trees_from_paths(universe, waypoints, weights)
+
         return cls(
             waypoints=waypoints,
             _distances=distances,
-            _paths=paths,
+            _predecessors=predecessors,
             _idx_map=idx_map,
         )
 
@@ -123,62 +131,113 @@ class DistanceMatrix:
         """
         i = self._idx_map[src_idx]
         j = self._idx_map[dst_idx]
-        return self._distances[i][j]
+        return float(self._distances[i, j])
 
     def path(self, src_idx: int, dst_idx: int) -> list[int]:
         """
-        Get precomputed path between two waypoints.
+        Get shortest path between two waypoints.
 
         Args:
             src_idx: Source vertex index (must be in waypoints)
             dst_idx: Destination vertex index (must be in waypoints)
 
         Returns:
-            List of vertex indices forming the path
+            List of vertex indices forming the path (empty if unreachable)
         """
         i = self._idx_map[src_idx]
         j = self._idx_map[dst_idx]
-        return self._paths[i][j]
+        if not np.isfinite(self._distances[i, j]):
+            return []
+
+        predecessors = self._predecessors[i]
+        path = [dst_idx]
+        vertex = dst_idx
+        while vertex != src_idx:
+            vertex = int(predecessors[vertex])
+            path.append(vertex)
+        path.reverse()
+        return path
+
+    def submatrix(self, vertices: list[int]) -> NDArray[np.float64]:
+        """
+        Get the distances between a subset of waypoints as an array.
+
+        Args:
+            vertices: Vertex indices (must be in waypoints), in output order
+
+        Returns:
+            Square float array where [i, j] is the distance from vertices[i]
+            to vertices[j] (inf if unreachable)
+        """
+        rows = [self._idx_map[v] for v in vertices]
+        return self._distances[np.ix_(rows, rows)].astype(np.float64)
 
     def __len__(self) -> int:
         """Number of waypoints in matrix."""
         return len(self.waypoints)
 
 
-def _compute_safe_weights(universe: UniverseGraph) -> list[float]:
+def _trees_from_jump_matrix(
+    universe: UniverseGraph,
+    waypoints: list[int],
+) -> tuple[NDArray[np.float32], NDArray[np.int32]]:
     """
-    Compute edge weights that penalize lowsec/nullsec travel.
+    Derive waypoint distances and unweighted shortest-path trees.
 
-    Weights:
-        - Highsec destination (>= HIGHSEC_THRESHOLD): WEIGHT_NORMAL
-        - Lowsec destination (LOWSEC_THRESHOLD to HIGHSEC_THRESHOLD): WEIGHT_LOWSEC_PENALTY
-        - Nullsec destination (< LOWSEC_THRESHOLD): WEIGHT_NULLSEC_PENALTY
+    An edge (u, v) lies on a shortest path from a source exactly when
+    hops(v) == hops(u) + 1, so every tree is found with one vectorized pass
+    over the edge arrays.
+    """
+    assert universe.jump_matrix is not None
+    rows = universe.jump_matrix[waypoints].astype(np.int16)
 
-    Args:
-        universe: UniverseGraph with security data
+    distances = rows[:, waypoints].astype(np.float32)
+    distances[distances == JUMPS_UNREACHABLE] = np.inf
 
-    Returns:
-        List of edge weights indexed by edge ID
-    """
-    weights = []
-    for edge in universe.graph.es:
-        dst_sec = universe.security[edge.target]
-        if dst_sec >= HIGHSEC_THRESHOLD:
-            weights.append(WEIGHT_NORMAL)
-        elif dst_sec >= LOWSEC_THRESHOLD:
-            weights.append(WEIGHT_LOWSEC_PENALTY)
-        else:
-            weights.append(WEIGHT_NULLSEC_PENALTY)
-    return weights
+    predecessors = np.full(rows.shape, -1, dtype=np.int32)
+    sources = universe.edge_sources
+    targets = universe.edge_targets
+    for u, v in ((sources, targets), (targets, sources)):
+        tight = (rows[:, v] != JUMPS_UNREACHABLE) & (rows[:, u] + 1 == rows[:, v])
+        tree, edge = np.nonzero(tight)
+        predecessors[tree, v[edge]] = u[edge]
 
+    return distances, predecessors
 
-def compute_safe_weights(universe: UniverseGraph) -> list[float]:
+
+def _trees_from_paths(
+    universe: UniverseGraph,
+    waypoints: list[int],
+    weights: tuple[float, ...] | None,
+) -> tuple[NDArray[np.float32], NDArray[np.int32]]:
     """
-    Public API for computing safe edge weights.
+    Run one shortest-path search per waypoint and fold the paths into trees.
 
-    See _compute_safe_weights for details.
+    Each source needs a single get_shortest_paths() call for all targets;
+    the returned paths are flattened into the predecessor array and dropped.
     """
-    return _compute_safe_weights(universe)
+    g = universe.graph
+    n = len(waypoints)
+    distances = np.full((n, n), np.inf, dtype=np.float32)
+    predecessors = np.full((n, universe.system_count), -1, dtype=np.int32)
+
+    for i, src in enumerate(waypoints):
+        # Single call gets paths to ALL targets from one search tree
+        row_paths = g.get_shortest_paths(src, waypoints, weights=weights)
+        lengths = np.fromiter(map(len, row_paths), dtype=np.int64, count=n)
+        distances[i] = np.where(lengths > 0, lengths - 1, np.inf)
+
+        flat = np.array(list(chain.from_iterable(row_paths)), dtype=np.int32)
+        ends = np.cumsum(lengths)[lengths > 0]
+        starts = ends - lengths[lengths > 0]
+        # Each vertex's predecessor is the entry before it in the same path
+        has_prev = np.ones(len(flat), dtype=np.bool_)
+        has_prev[starts] = False
+        is_prev = np.ones(len(flat), dtype=np.bool_)
+        is_prev[ends - 1] = False
+        predecessors[i, flat[has_prev]] = flat[is_prev]
+
+    return distances, predecessors
 
 
 # =============================================================================
@@ -197,15 +256,63 @@ WEIGHT_NULLSEC_PENALTY = 1000.0
 WEIGHT_AVOID = float("inf")  # Effectively blocks the edge
 
 
+def _highsec_filter_weights(universe: UniverseGraph) -> NDArray[np.float64]:
+    """Only allow high-sec, heavy penalty for low/null."""
+    dst_sec = universe.security[universe.edge_targets]
+    weights = np.full(len(dst_sec), WEIGHT_NULLSEC_PENALTY, dtype=np.float64)
+    weights[dst_sec >= LOWSEC_THRESHOLD] = WEIGHT_LOWSEC_PENALTY
+    weights[dst_sec >= HIGHSEC_THRESHOLD] = WEIGHT_NORMAL
+    return weights
+
+
+def _lowsec_filter_weights(universe: UniverseGraph) -> NDArray[np.float64]:
+    """Allow high and low-sec, penalize null-sec."""
+    dst_sec = universe.security[universe.edge_targets]
+    return np.where(dst_sec >= LOWSEC_THRESHOLD, WEIGHT_NORMAL, WEIGHT_NULLSEC_PENALTY)
+
+
+def _any_filter_weights(universe: UniverseGraph) -> NDArray[np.float64]:
+    """No security penalty."""
+    return np.full(len(universe.edge_targets), WEIGHT_NORMAL, dtype=np.float64)
+
+
+_FILTER_WEIGHT_BUILDERS = {
+    "highsec": _highsec_filter_weights,
+    "lowsec": _lowsec_filter_weights,
+    "any": _any_filter_weights,
+}
+
+
+def compute_safe_weights(universe: UniverseGraph) -> list[float]:
+    """
+    Compute edge weights that penalize lowsec/nullsec travel.
+
+    Weights:
+        - Highsec destination (>= HIGHSEC_THRESHOLD): WEIGHT_NORMAL
+        - Lowsec destination (LOWSEC_THRESHOLD to HIGHSEC_THRESHOLD): WEIGHT_LOWSEC_PENALTY
+        - Nullsec destination (< LOWSEC_THRESHOLD): WEIGHT_NULLSEC_PENALTY
+
+    Args:
+        universe: UniverseGraph with security data
+
+    Returns:
+        List of edge weights indexed by edge ID
+    """
+    weights = compute_filtered_weights(universe, security_filter="highsec")
+    return list(weights) if weights is not None else []
+
+
 def compute_filtered_weights(
     universe: UniverseGraph,
     security_filter: SecurityFilter = "highsec",
     avoid_systems: set[int] | None = None,
-) -> list[float] | None:
+) -> tuple[float, ...] | None:
     """
     Compute edge weights based on security filter and avoided systems.
 
     This is the unified weight computation function for all routing tools.
+    Results are served from the universe's edge weight cache, so repeated
+    calls with the same filter and avoid set are O(1).
 
     Args:
         universe: UniverseGraph with security data
@@ -216,49 +323,15 @@ def compute_filtered_weights(
         avoid_systems: Set of vertex indices to avoid completely
 
     Returns:
-        List of edge weights indexed by edge ID, or None for unweighted
+        Tuple of edge weights indexed by edge ID, or None for unweighted
         (only when security_filter="any" and no avoid_systems)
     """
     # Fast path: no constraints at all
     if security_filter == "any" and not avoid_systems:
         return None  # Unweighted shortest path
 
-    g = universe.graph
-    security = universe.security
-    avoid = avoid_systems or set()
-    weights: list[float] = []
-
-    for edge in g.es:
-        dst_idx = edge.target
-
-        # Check if destination is in avoid set
-        if dst_idx in avoid:
-            weights.append(WEIGHT_AVOID)
-            continue
-
-        dst_sec = security[dst_idx]
-
-        if security_filter == "highsec":
-            # Only allow high-sec, heavy penalty for low/null
-            if dst_sec >= HIGHSEC_THRESHOLD:
-                weights.append(WEIGHT_NORMAL)
-            elif dst_sec >= LOWSEC_THRESHOLD:
-                weights.append(WEIGHT_LOWSEC_PENALTY)
-            else:
-                weights.append(WEIGHT_NULLSEC_PENALTY)
-
-        elif security_filter == "lowsec":
-            # Allow high and low-sec, penalize null-sec
-            if dst_sec >= LOWSEC_THRESHOLD:
-                weights.append(WEIGHT_NORMAL)
-            else:
-                weights.append(WEIGHT_NULLSEC_PENALTY)
-
-        else:  # security_filter == "any"
-            # No security penalty, but still handle avoid_systems
-            weights.append(WEIGHT_NORMAL)
-
-    return weights
+    builder = _FILTER_WEIGHT_BUILDERS.get(security_filter, _any_filter_weights)
+    return get_weight_cache(universe).weights(f"filter:{security_filter}", builder, avoid_systems)
 
 
 def get_security_threshold(security_filter: SecurityFilter) -> float:
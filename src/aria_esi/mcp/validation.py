@@ -40,6 +40,7 @@ UNIVERSE_ACTION_PARAMS: dict[str, set[str]] = {
         "optimize",
         "security_filter",
         "avoid_systems",
+        "solver",
     },
     "analyze": {"systems"},
     "nearest": {
@@ -58,6 +59,7 @@ UNIVERSE_ACTION_PARAMS: dict[str, set[str]] = {
         "return_to_origin",
         "security_filter",
         "avoid_systems",
+        "solver",
     },
     "activity": {"systems", "include_realtime"},
     "hotspots": {
@@ -215,6 +217,7 @@ def get_default_values(dispatcher: str) -> dict[str, Any]:
             "min_borders": 4,
             "optimize": "density",
             "security_filter": "highsec",
+            "solver": "optimize",
             "return_to_origin": True,
             "activity_type": "kills",
             "include_realtime": False,
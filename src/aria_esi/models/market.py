@@ -1068,7 +1068,7 @@ class ScopeRefreshResult(MarketModel):
         default=False, description="True if ESI returned 304 Not Modified"
     )
     pages_fetched: int | None = Field(
-        default=None, description="Pages fetched (structure scopes only)"
+        default=None, description="Pages fetched (structure scopes and bulk region pulls)"
     )
     pages_truncated: bool = Field(default=False, description="True if pagination was truncated")
     prices: list[ScopePriceRefreshInfo] = Field(
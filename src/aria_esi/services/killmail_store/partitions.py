@@ -0,0 +1,130 @@
+"""
+Day Partitions for the Killmail Store.
+
+Optional SQLiteKillmailStore layout where killmails live in one table per
+UTC day (killmails_YYYYMMDD), each with its own esi_details_YYYYMMDD
+table cascading from it. Retention drops whole partitions instead of
+range-deleting from one large table, so expunge neither fragments the
+B-trees nor holds the write lock for long. Time-bounded queries only
+touch the partitions overlapping their window.
+
+The unpartitioned killmails/esi_details tables stay in the schema and are
+read as a legacy partition, so enabling partitioning on an existing
+database keeps its data visible until it ages out.
+"""
+
+from __future__ import annotations
+
+import re
+from datetime import datetime, timezone
+
+SECONDS_PER_DAY = 86400
+
+_PARTITION_NAME = re.compile(r"^killmails_(\d{8})$")
+
+_KILLMAILS_DDL = """
+CREATE TABLE IF NOT EXISTS {table} (
+    kill_id INTEGER PRIMARY KEY,
+    kill_time INTEGER NOT NULL,
+    solar_system_id INTEGER NOT NULL,
+    zkb_hash TEXT NOT NULL,
+    zkb_total_value REAL,
+    zkb_points INTEGER,
+    zkb_is_npc BOOLEAN DEFAULT FALSE,
+    zkb_is_solo BOOLEAN DEFAULT FALSE,
+    zkb_is_awox BOOLEAN DEFAULT FALSE,
+    ingested_at INTEGER NOT NULL,
+    victim_ship_type_id INTEGER,
+    victim_corporation_id INTEGER,
+    victim_alliance_id INTEGER
+)
+"""
+
+_KILLMAILS_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_{table}_system_time ON {table}(solar_system_id, kill_time)",
+    "CREATE INDEX IF NOT EXISTS idx_{table}_time ON {table}(kill_time)",
+    "CREATE INDEX IF NOT EXISTS idx_{table}_value ON {table}(zkb_total_value)",
+)
+
+_ESI_DETAILS_DDL = """
+CREATE TABLE IF NOT EXISTS {table} (
+    kill_id INTEGER PRIMARY KEY REFERENCES {parent}(kill_id) ON DELETE CASCADE,
+    fetched_at INTEGER NOT NULL,
+    fetch_status TEXT DEFAULT 'success',
+    fetch_attempts INTEGER DEFAULT 1,
+    victim_character_id INTEGER,
+    victim_ship_type_id INTEGER,
+    victim_corporation_id INTEGER,
+    victim_alliance_id INTEGER,
+    victim_damage_taken INTEGER,
+    attacker_count INTEGER,
+    final_blow_character_id INTEGER,
+    final_blow_ship_type_id INTEGER,
+    final_blow_corporation_id INTEGER,
+    attackers_json TEXT,
+    items_json TEXT,
+    position_json TEXT
+)
+"""
+
+
+def day_of(timestamp: int) -> int:
+    """UTC day number (days since the epoch) of a Unix timestamp."""
+    return timestamp // SECONDS_PER_DAY
+
+
+def day_start(day: int) -> int:
+    """Unix timestamp at the start of a UTC day."""
+    return day * SECONDS_PER_DAY
+
+
+def _suffix(day: int) -> str:
+    return datetime.fromtimestamp(day_start(day), tz=timezone.utc).strftime("%Y%m%d")
+
+
+def killmails_table(day: int | None) -> str:
+    """Killmail table for a day (None for the legacy unpartitioned table)."""
+    return "killmails" if day is None else f"killmails_{_suffix(day)}"
+
+
+def esi_details_table(day: int | None) -> str:
+    """ESI details table for a day (None for the legacy unpartitioned table)."""
+    return "esi_details" if day is None else f"esi_details_{_suffix(day)}"
+
+
+def parse_partition(table_name: str) -> int | None:
+    """Day number of a killmail partition table name, or None if not one."""
+    match = _PARTITION_NAME.match(table_name)
+    if match is None:
+        return None
+    parsed = datetime.strptime(match.group(1), "%Y%m%d").replace(tzinfo=timezone.utc)
+    return day_of(int(parsed.timestamp()))
+
+
+def partition_ddl(day: int) -> list[str]:
+    """Statements creating a day's killmail and ESI detail tables."""
+    table = killmails_table(day)
+    return [
+        _KILLMAILS_DDL.format(table=table),
+        *(index.format(table=table) for index in _KILLMAILS_INDEXES),
+        _ESI_DETAILS_DDL.format(table=esi_details_table(day), parent=table),
+    ]
+
+
+def days_overlapping(days: list[int], since: int | None, until: int | None) -> list[int]:
+    """
+    Select partitions that can hold kills in [since, until].
+
+    Args:
+        days: Partition days, ascending
+        since: Inclusive lower bound timestamp (None for unbounded)
+        until: Inclusive upper bound timestamp (None for unbounded)
+
+    Returns:
+        Matching days, ascending
+    """
+    first = day_of(since) if since is not None else None
+    last = day_of(until) if until is not None else None
+    return [
+        day for day in days if (first is None or day >= first) and (last is None or day <= last)
+    ]
@@ -312,6 +312,29 @@ class KillmailStore(Protocol):
         """
         ...
 
+    @abstractmethod
+    async def filter_unprocessed(self, worker_name: str, kill_ids: list[int]) -> set[int]:
+        """
+        Return the kill IDs not yet processed by this worker.
+
+        Set-based counterpart of is_kill_processed: one query per batch.
+        """
+        ...
+
+    @abstractmethod
+    async def mark_processed_batch(
+        self, worker_name: str, kill_ids: list[int], status: str = "delivered"
+    ) -> None:
+        """
+        Record that several kills have been processed in one transaction.
+
+        Args:
+            worker_name: The processing worker
+            kill_ids: The killmail IDs
+            status: 'delivered', 'failed', or 'pending'
+        """
+        ...
+
     @abstractmethod
     async def get_delivery_attempts(self, worker_name: str, kill_id: int) -> int:
         """Get number of delivery attempts for a kill."""
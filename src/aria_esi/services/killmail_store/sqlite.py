@@ -3,12 +3,16 @@ SQLite Implementation of Killmail Store.
 
 Uses WAL mode for concurrent read/write access across multiple processes.
 See KILLMAIL_STORE_REDESIGN_PROPOSAL.md D1: Storage Engine.
+
+Killmails can optionally be stored in day partitions (see partitions.py).
 """
 
 from __future__ import annotations
 
 import logging
+import sqlite3
 import time
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -16,6 +20,15 @@ from typing import TYPE_CHECKING
 import aiosqlite
 
 from .migrations import MigrationRunner
+from .partitions import (
+    day_of,
+    day_start,
+    days_overlapping,
+    esi_details_table,
+    killmails_table,
+    parse_partition,
+    partition_ddl,
+)
 from .protocol import (
     ESIClaim,
     ESIKillmail,
@@ -29,6 +42,17 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_KILLMAIL_COLUMNS = """kill_id, kill_time, solar_system_id, zkb_hash,
+                   zkb_total_value, zkb_points, zkb_is_npc, zkb_is_solo, zkb_is_awox,
+                   ingested_at, victim_ship_type_id, victim_corporation_id, victim_alliance_id"""
+
+_ESI_COLUMNS = """kill_id, fetched_at, fetch_status, fetch_attempts,
+                   victim_character_id, victim_ship_type_id, victim_corporation_id,
+                   victim_alliance_id, victim_damage_taken,
+                   attacker_count, final_blow_character_id, final_blow_ship_type_id,
+                   final_blow_corporation_id,
+                   attackers_json, items_json, position_json"""
+
 
 class SQLiteKillmailStore:
     """
@@ -42,12 +66,18 @@ class SQLiteKillmailStore:
         PRAGMA busy_timeout=5000
         PRAGMA synchronous=NORMAL
         PRAGMA foreign_keys=ON
+
+    With partition_by_day, new kills are written to per-day partitions.
+    A database with partitions is read as partitioned whatever the flag,
+    including partitions another writer creates after this store opened,
+    so read-only processes need no configuration.
     """
 
     def __init__(
         self,
         db_path: Path | str | None = None,
         read_only: bool = False,
+        partition_by_day: bool = False,
     ):
         """
         Initialize the store.
@@ -55,6 +85,7 @@ class SQLiteKillmailStore:
         Args:
             db_path: Path to database file. Defaults to {instance_root}/cache/killmails.db.
             read_only: Open in read-only mode (for MCP server).
+            partition_by_day: Store killmails in one table per UTC day.
         """
         if db_path is None:
             from ...core.config import get_settings
@@ -63,8 +94,14 @@ class SQLiteKillmailStore:
 
         self.db_path = Path(db_path)
         self.read_only = read_only
+        self.partition_by_day = partition_by_day
         self._db: aiosqlite.Connection | None = None
 
+        # Partition days (ascending) and the schema version they were read at
+        self._partition_days: list[int] = []
+        self._schema_version: int | None = None
+        self._legacy_rows = True  # Unpartitioned killmails table may hold rows
+
     async def initialize(self) -> None:
         """
         Initialize database, running migrations if needed.
@@ -96,6 +133,11 @@ class SQLiteKillmailStore:
         # Enable row factory for dict access
         self._db.row_factory = aiosqlite.Row
 
+        await self._refresh_partitions()
+        if self.partitioned:
+            cursor = await self._db.execute("SELECT 1 FROM killmails LIMIT 1")
+            self._legacy_rows = await cursor.fetchone() is not None
+
         logger.info(
             "Killmail store initialized: %s (read_only=%s)",
             self.db_path,
@@ -116,36 +158,80 @@ class SQLiteKillmailStore:
             raise RuntimeError("Store not initialized. Call initialize() first.")
         return self._db
 
+    @property
+    def partitioned(self) -> bool:
+        """Whether killmails are stored in day partitions."""
+        return self.partition_by_day or bool(self._partition_days)
+
+    # -------------------------------------------------------------------------
+    # Day Partitions
+    # -------------------------------------------------------------------------
+
+    async def _refresh_partitions(self) -> None:
+        """Re-read the partition list if the schema changed (e.g. another writer)."""
+        cursor = await self.db.execute("PRAGMA schema_version")
+        version = (await cursor.fetchone())[0]
+        if version == self._schema_version:
+            return
+
+        cursor = await self.db.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name GLOB 'killmails_*'"
+        )
+        days = (parse_partition(row[0]) for row in await cursor.fetchall())
+        self._partition_days = sorted(day for day in days if day is not None)
+        self._schema_version = version
+
+    async def _ensure_partition(self, day: int) -> str:
+        """Create a day's partition if missing, returning its killmail table."""
+        if day not in self._partition_days:
+            for statement in partition_ddl(day):
+                await self.db.execute(statement)
+            self._partition_days = sorted({*self._partition_days, day})
+        return killmails_table(day)
+
+    async def _killmail_tables(self) -> list[str]:
+        """Every table holding killmails, legacy table first."""
+        await self._refresh_partitions()
+        if not self.partitioned:
+            return ["killmails"]
+        return ["killmails", *(killmails_table(day) for day in self._partition_days)]
+
+    async def _locate_kill(self, kill_id: int) -> tuple[bool, int | None]:
+        """
+        Find the partition holding a kill.
+
+        Returns:
+            (found, day), with day None for the legacy table
+        """
+        await self._refresh_partitions()
+        sources = [(None, "killmails"), *((d, killmails_table(d)) for d in self._partition_days)]
+        query = " UNION ALL ".join(
+            f"SELECT {-1 if day is None else day} FROM {table} WHERE kill_id = ?"
+            for day, table in sources
+        )
+        cursor = await self.db.execute(f"{query} LIMIT 1", [kill_id] * len(sources))
+        row = await cursor.fetchone()
+        if row is None:
+            return False, None
+        return True, None if row[0] == -1 else row[0]
+
+    async def _esi_details_table(self, kill_id: int) -> str:
+        """ESI details table for a kill, mirroring the foreign key check."""
+        await self._refresh_partitions()
+        if not self.partitioned:
+            return "esi_details"
+        found, day = await self._locate_kill(kill_id)
+        if not found:
+            raise sqlite3.IntegrityError("FOREIGN KEY constraint failed")
+        return esi_details_table(day)
+
     # -------------------------------------------------------------------------
     # Core Killmail Operations
     # -------------------------------------------------------------------------
 
     async def insert_kill(self, kill: KillmailRecord) -> None:
         """Insert a killmail record from RedisQ (idempotent)."""
-        await self.db.execute(
-            """
-            INSERT OR IGNORE INTO killmails (
-                kill_id, kill_time, solar_system_id, zkb_hash,
-                zkb_total_value, zkb_points, zkb_is_npc, zkb_is_solo, zkb_is_awox,
-                ingested_at, victim_ship_type_id, victim_corporation_id, victim_alliance_id
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                kill.kill_id,
-                kill.kill_time,
-                kill.solar_system_id,
-                kill.zkb_hash,
-                kill.zkb_total_value,
-                kill.zkb_points,
-                kill.zkb_is_npc,
-                kill.zkb_is_solo,
-                kill.zkb_is_awox,
-                kill.ingested_at,
-                kill.victim_ship_type_id,
-                kill.victim_corporation_id,
-                kill.victim_alliance_id,
-            ),
-        )
+        await self._insert_kills([kill])
         await self.db.commit()
 
     async def insert_kills_batch(self, kills: list[KillmailRecord]) -> int:
@@ -153,41 +239,58 @@ class SQLiteKillmailStore:
         if not kills:
             return 0
 
-        cursor = await self.db.executemany(
-            """
-            INSERT OR IGNORE INTO killmails (
-                kill_id, kill_time, solar_system_id, zkb_hash,
-                zkb_total_value, zkb_points, zkb_is_npc, zkb_is_solo, zkb_is_awox,
-                ingested_at, victim_ship_type_id, victim_corporation_id, victim_alliance_id
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            [
-                (
-                    k.kill_id,
-                    k.kill_time,
-                    k.solar_system_id,
-                    k.zkb_hash,
-                    k.zkb_total_value,
-                    k.zkb_points,
-                    k.zkb_is_npc,
-                    k.zkb_is_solo,
-                    k.zkb_is_awox,
-                    k.ingested_at,
-                    k.victim_ship_type_id,
-                    k.victim_corporation_id,
-                    k.victim_alliance_id,
-                )
-                for k in kills
-            ],
-        )
+        inserted = await self._insert_kills(kills)
         await self.db.commit()
-        return cursor.rowcount
+        return inserted
+
+    async def _insert_kills(self, kills: list[KillmailRecord]) -> int:
+        """Insert kills into their tables without committing."""
+        by_table: dict[str, list[KillmailRecord]] = defaultdict(list)
+        for kill in kills:
+            if self.partitioned:
+                table = await self._ensure_partition(day_of(kill.kill_time))
+            else:
+                table = "killmails"
+            by_table[table].append(kill)
+
+        inserted = 0
+        for table, table_kills in by_table.items():
+            cursor = await self.db.executemany(
+                f"""
+                INSERT OR IGNORE INTO {table} (
+                    kill_id, kill_time, solar_system_id, zkb_hash,
+                    zkb_total_value, zkb_points, zkb_is_npc, zkb_is_solo, zkb_is_awox,
+                    ingested_at, victim_ship_type_id, victim_corporation_id, victim_alliance_id
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        k.kill_id,
+                        k.kill_time,
+                        k.solar_system_id,
+                        k.zkb_hash,
+                        k.zkb_total_value,
+                        k.zkb_points,
+                        k.zkb_is_npc,
+                        k.zkb_is_solo,
+                        k.zkb_is_awox,
+                        k.ingested_at,
+                        k.victim_ship_type_id,
+                        k.victim_corporation_id,
+                        k.victim_alliance_id,
+                    )
+                    for k in table_kills
+                ],
+            )
+            inserted += cursor.rowcount
+        return inserted
 
     async def insert_esi_details(self, kill_id: int, details: ESIKillmail) -> None:
         """Insert or update ESI details for a killmail."""
+        table = await self._esi_details_table(kill_id)
         await self.db.execute(
-            """
-            INSERT OR REPLACE INTO esi_details (
+            f"""
+            INSERT OR REPLACE INTO {table} (
                 kill_id, fetched_at, fetch_status, fetch_attempts,
                 victim_character_id, victim_ship_type_id, victim_corporation_id,
                 victim_alliance_id, victim_damage_taken,
@@ -219,9 +322,10 @@ class SQLiteKillmailStore:
 
     async def insert_esi_unfetchable(self, kill_id: int) -> None:
         """Mark a killmail as permanently unfetchable."""
+        table = await self._esi_details_table(kill_id)
         await self.db.execute(
-            """
-            INSERT OR REPLACE INTO esi_details (
+            f"""
+            INSERT OR REPLACE INTO {table} (
                 kill_id, fetched_at, fetch_status, fetch_attempts
             ) VALUES (?, 0, 'unfetchable', 0)
             """,
@@ -231,19 +335,14 @@ class SQLiteKillmailStore:
 
     async def get_esi_details(self, kill_id: int) -> ESIKillmail | None:
         """Get ESI details for a killmail."""
-        cursor = await self.db.execute(
-            """
-            SELECT kill_id, fetched_at, fetch_status, fetch_attempts,
-                   victim_character_id, victim_ship_type_id, victim_corporation_id,
-                   victim_alliance_id, victim_damage_taken,
-                   attacker_count, final_blow_character_id, final_blow_ship_type_id,
-                   final_blow_corporation_id,
-                   attackers_json, items_json, position_json
-            FROM esi_details
-            WHERE kill_id = ?
-            """,
-            (kill_id,),
-        )
+        await self._refresh_partitions()
+        tables = [esi_details_table(None)]
+        if self.partitioned:
+            tables.extend(esi_details_table(day) for day in self._partition_days)
+        query = " UNION ALL ".join(
+            f"SELECT {_ESI_COLUMNS} FROM {table} WHERE kill_id = ?" for table in tables
+        )
+        cursor = await self.db.execute(f"{query} LIMIT 1", [kill_id] * len(tables))
         row = await cursor.fetchone()
         if row is None:
             return None
@@ -310,6 +409,9 @@ class SQLiteKillmailStore:
         cursor: tuple[int, int] | None = None,
     ) -> list[KillmailRecord]:
         """Query killmails with optional filters."""
+        since_ts = int(since.timestamp()) if since else None
+        until_ts = int(until.timestamp()) if until else None
+
         conditions: list[str] = []
         params: list[int | float] = []
 
@@ -318,13 +420,13 @@ class SQLiteKillmailStore:
             conditions.append(f"solar_system_id IN ({placeholders})")
             params.extend(systems)
 
-        if since:
+        if since_ts is not None:
             conditions.append("kill_time >= ?")
-            params.append(int(since.timestamp()))
+            params.append(since_ts)
 
-        if until:
+        if until_ts is not None:
             conditions.append("kill_time <= ?")
-            params.append(int(until.timestamp()))
+            params.append(until_ts)
 
         if min_value is not None:
             conditions.append("zkb_total_value >= ?")
@@ -337,35 +439,59 @@ class SQLiteKillmailStore:
             params.append(cursor_id)
 
         where_clause = " AND ".join(conditions) if conditions else "1=1"
-        params.append(limit)
 
-        query = f"""
-            SELECT kill_id, kill_time, solar_system_id, zkb_hash,
-                   zkb_total_value, zkb_points, zkb_is_npc, zkb_is_solo, zkb_is_awox,
-                   ingested_at, victim_ship_type_id, victim_corporation_id, victim_alliance_id
-            FROM killmails
+        await self._refresh_partitions()
+        if not self.partitioned:
+            rows = await self._select_kills("killmails", where_clause, params, limit)
+            return [self._row_to_killmail(row) for row in rows]
+
+        # Partitions hold disjoint days: walk them newest first and stop once
+        # the limit is met. The legacy table can overlap any day, so its rows
+        # are merged in.
+        newest = until_ts
+        if cursor:
+            newest = cursor[0] if newest is None else min(newest, cursor[0])
+
+        rows = []
+        for day in reversed(days_overlapping(self._partition_days, since_ts, newest)):
+            rows.extend(
+                await self._select_kills(
+                    killmails_table(day), where_clause, params, limit - len(rows)
+                )
+            )
+            if len(rows) >= limit:
+                break
+
+        kills = [self._row_to_killmail(row) for row in rows]
+        if self._legacy_rows:
+            legacy = await self._select_kills("killmails", where_clause, params, limit)
+            kills.extend(self._row_to_killmail(row) for row in legacy)
+            kills.sort(key=lambda k: (k.kill_time, k.kill_id), reverse=True)
+        return kills[:limit]
+
+    async def _select_kills(
+        self, table: str, where_clause: str, params: list[int | float], limit: int
+    ) -> list[aiosqlite.Row]:
+        """Run the query_kills SELECT against one table."""
+        cursor = await self.db.execute(
+            f"""
+            SELECT {_KILLMAIL_COLUMNS}
+            FROM {table}
             WHERE {where_clause}
             ORDER BY kill_time DESC, kill_id DESC
             LIMIT ?
-        """
-
-        cursor_result = await self.db.execute(query, params)
-        rows = await cursor_result.fetchall()
-
-        return [self._row_to_killmail(row) for row in rows]
+            """,
+            [*params, limit],
+        )
+        return list(await cursor.fetchall())
 
     async def get_kill(self, kill_id: int) -> KillmailRecord | None:
         """Get a single killmail by ID."""
-        cursor = await self.db.execute(
-            """
-            SELECT kill_id, kill_time, solar_system_id, zkb_hash,
-                   zkb_total_value, zkb_points, zkb_is_npc, zkb_is_solo, zkb_is_awox,
-                   ingested_at, victim_ship_type_id, victim_corporation_id, victim_alliance_id
-            FROM killmails
-            WHERE kill_id = ?
-            """,
-            (kill_id,),
+        tables = await self._killmail_tables()
+        query = " UNION ALL ".join(
+            f"SELECT {_KILLMAIL_COLUMNS} FROM {table} WHERE kill_id = ?" for table in tables
         )
+        cursor = await self.db.execute(f"{query} LIMIT 1", [kill_id] * len(tables))
         row = await cursor.fetchone()
         if row is None:
             return None
@@ -485,6 +611,40 @@ class SQLiteKillmailStore:
         )
         await self.db.commit()
 
+    async def filter_unprocessed(self, worker_name: str, kill_ids: list[int]) -> set[int]:
+        """Return the kill IDs not yet processed by this worker."""
+        if not kill_ids:
+            return set()
+
+        placeholders = ",".join("?" * len(kill_ids))
+        cursor = await self.db.execute(
+            f"""
+            SELECT kill_id FROM processed_kills
+            WHERE worker_name = ? AND kill_id IN ({placeholders})
+            """,
+            (worker_name, *kill_ids),
+        )
+        processed = {row["kill_id"] for row in await cursor.fetchall()}
+        return set(kill_ids) - processed
+
+    async def mark_processed_batch(
+        self, worker_name: str, kill_ids: list[int], status: str = "delivered"
+    ) -> None:
+        """Record that several kills have been processed in one transaction."""
+        if not kill_ids:
+            return
+
+        now = int(time.time())
+        await self.db.executemany(
+            """
+            INSERT OR REPLACE INTO processed_kills (
+                worker_name, kill_id, processed_at, delivery_status, delivery_attempts
+            ) VALUES (?, ?, ?, ?, 1)
+            """,
+            [(worker_name, kill_id, now, status) for kill_id in kill_ids],
+        )
+        await self.db.commit()
+
     async def get_delivery_attempts(self, worker_name: str, kill_id: int) -> int:
         """Get number of delivery attempts for a kill."""
         cursor = await self.db.execute(
@@ -573,14 +733,46 @@ class SQLiteKillmailStore:
     # -------------------------------------------------------------------------
 
     async def expunge_before(self, cutoff: datetime) -> int:
-        """Delete killmails older than cutoff."""
+        """
+        Delete killmails older than cutoff.
+
+        With day partitions, days entirely before the cutoff are dropped
+        whole; only the day containing the cutoff is range-deleted.
+        """
         cutoff_ts = int(cutoff.timestamp())
-        cursor = await self.db.execute(
-            "DELETE FROM killmails WHERE kill_time < ?",
-            (cutoff_ts,),
-        )
+        deleted = 0
+        await self._refresh_partitions()
+        if not self.partitioned or self._legacy_rows:
+            cursor = await self.db.execute(
+                "DELETE FROM killmails WHERE kill_time < ?",
+                (cutoff_ts,),
+            )
+            deleted += cursor.rowcount
+
+        if self.partitioned:
+            dropped = []
+            for day in days_overlapping(self._partition_days, None, cutoff_ts):
+                table = killmails_table(day)
+                if day_start(day + 1) <= cutoff_ts:
+                    cursor = await self.db.execute(f"SELECT COUNT(*) FROM {table}")
+                    deleted += (await cursor.fetchone())[0]
+                    # Child first, so dropping the parent needs no FK scan
+                    await self.db.execute(f"DROP TABLE IF EXISTS {esi_details_table(day)}")
+                    await self.db.execute(f"DROP TABLE IF EXISTS {table}")
+                    dropped.append(day)
+                elif day_start(day) < cutoff_ts:
+                    cursor = await self.db.execute(
+                        f"DELETE FROM {table} WHERE kill_time < ?",
+                        (cutoff_ts,),
+                    )
+                    deleted += cursor.rowcount
+            self._partition_days = [d for d in self._partition_days if d not in dropped]
+
+            cursor = await self.db.execute("SELECT 1 FROM killmails LIMIT 1")
+            self._legacy_rows = await cursor.fetchone() is not None
+
         await self.db.commit()
-        return cursor.rowcount
+        return deleted
 
     async def expunge_processed_kills(self, older_than_seconds: int = 3600) -> int:
         """Delete old processed_kills entries."""
@@ -604,10 +796,12 @@ class SQLiteKillmailStore:
 
     async def expunge_orphaned_esi_attempts(self) -> int:
         """Delete ESI fetch attempts for expunged killmails."""
+        tables = await self._killmail_tables()
+        known = " UNION ALL ".join(f"SELECT kill_id FROM {table}" for table in tables)
         cursor = await self.db.execute(
-            """
+            f"""
             DELETE FROM esi_fetch_attempts
-            WHERE kill_id NOT IN (SELECT kill_id FROM killmails)
+            WHERE kill_id NOT IN ({known})
             """
         )
         await self.db.commit()
@@ -647,31 +841,36 @@ class SQLiteKillmailStore:
 
     async def get_stats(self) -> StoreStats:
         """Get storage statistics for observability."""
-        # Count killmails
-        cursor = await self.db.execute("SELECT COUNT(*) FROM killmails")
+        tables = await self._killmail_tables()
+        killmails = " UNION ALL ".join(f"SELECT kill_time FROM {table}" for table in tables)
+        esi_details = " UNION ALL ".join(
+            f"SELECT fetch_status FROM {esi_details_table(parse_partition(table))}"
+            for table in tables
+        )
+
+        # Count killmails and get time bounds
+        cursor = await self.db.execute(
+            f"SELECT COUNT(*), MIN(kill_time), MAX(kill_time) FROM ({killmails})"
+        )
         row = await cursor.fetchone()
         total_killmails = row[0]
+        oldest_time = row[1]
+        newest_time = row[2]
 
         # Count ESI details
         cursor = await self.db.execute(
-            "SELECT COUNT(*) FROM esi_details WHERE fetch_status = 'success'"
+            f"SELECT COUNT(*) FROM ({esi_details}) WHERE fetch_status = 'success'"
         )
         row = await cursor.fetchone()
         total_esi_details = row[0]
 
         # Count unfetchable
         cursor = await self.db.execute(
-            "SELECT COUNT(*) FROM esi_details WHERE fetch_status = 'unfetchable'"
+            f"SELECT COUNT(*) FROM ({esi_details}) WHERE fetch_status = 'unfetchable'"
         )
         row = await cursor.fetchone()
         total_esi_unfetchable = row[0]
 
-        # Get time bounds
-        cursor = await self.db.execute("SELECT MIN(kill_time), MAX(kill_time) FROM killmails")
-        row = await cursor.fetchone()
-        oldest_time = row[0]
-        newest_time = row[1]
-
         # Get database size
         try:
             db_size = self.db_path.stat().st_size
@@ -28,6 +28,12 @@ __all__ = [
     "select_borders_coverage",
     "nearest_neighbor_tsp",
     "expand_tour",
+    # Tour optimization
+    "solve_tour",
+    "TourSolution",
+    "TspSolver",
+    "VALID_TSP_SOLVERS",
+    "is_tsp_solver",
     # Border search
     "find_borders_with_distance",
     "SecurityFilter",
@@ -66,6 +72,18 @@ def __getattr__(name: str):
 
         return getattr(algorithms, name)
 
+    # Tour optimization
+    if name in (
+        "solve_tour",
+        "TourSolution",
+        "TspSolver",
+        "VALID_TSP_SOLVERS",
+        "is_tsp_solver",
+    ):
+        from . import tsp
+
+        return getattr(tsp, name)
+
     # Border search
     if name in ("find_borders_with_distance", "SecurityFilter"):
         from . import border_search
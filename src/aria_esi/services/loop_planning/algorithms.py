@@ -9,6 +9,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
     from ...mcp.utils import DistanceMatrix
 
@@ -26,6 +28,7 @@ def select_borders_density(
     Algorithm: Greedy chain-building that tracks cumulative route cost.
     Adds borders in order of proximity to current position, stopping when
     the route (including return to origin) would exceed the target.
+    Each step is an argmin over the current row of the candidate distances.
 
     Args:
         origin_idx: Starting vertex index
@@ -40,38 +43,32 @@ def select_borders_density(
     if not candidates:
         return []
 
+    # Row/column 0 is the origin, 1..n are the candidates in input order
+    dist = matrix.submatrix([origin_idx] + [c[0] for c in candidates])
+    return_costs = dist[1:, 0]
+    legs = dist[:, 1:].copy()
+
     selected: list[tuple[int, int]] = []
-    remaining = list(candidates)
-    current = origin_idx
+    current = 0
     cumulative_distance: float = 0.0
 
-    while remaining:
-        # Find nearest unvisited border to current position
-        best_idx = -1
-        best_distance = float("inf")
-
-        for i, (vertex, _) in enumerate(remaining):
-            dist = matrix.distance(current, vertex)
-            if dist < best_distance:
-                best_distance = dist
-                best_idx = i
-
-        if best_idx < 0:
+    while len(selected) < len(candidates):
+        # Find nearest unvisited border to current position (first on ties)
+        best = int(legs[current].argmin())
+        leg_cost = float(legs[current, best])
+        if leg_cost == np.inf:
             break
 
-        border_idx, dist_from_origin = remaining[best_idx]
-
         # Calculate cost: leg to this border + return to origin
-        leg_cost = matrix.distance(current, border_idx)
-        return_cost = matrix.distance(border_idx, origin_idx)
+        return_cost = float(return_costs[best])
         projected_total = cumulative_distance + leg_cost + return_cost
 
         # Add if: under budget OR we haven't met minimum yet
         if projected_total <= target_jumps or len(selected) < min_borders:
-            selected.append((border_idx, dist_from_origin))
+            selected.append(candidates[best])
             cumulative_distance += leg_cost
-            current = border_idx
-            remaining.pop(best_idx)
+            current = best + 1
+            legs[:, best] = np.inf
         else:
             # Over budget and have enough borders - stop
             break
@@ -92,7 +89,8 @@ def select_borders_coverage(
 
     Algorithm: Greedy selection maximizing minimum distance to selected set.
     Start with closest to origin, then iteratively add the candidate most
-    distant from the currently selected set.
+    distant from the currently selected set. The distance to the selected
+    set is kept as one array and updated with the newly selected column.
 
     Args:
         candidates: List of (vertex_idx, distance_from_origin) tuples
@@ -104,25 +102,17 @@ def select_borders_coverage(
     if not candidates:
         return []
 
+    dist = matrix.submatrix([c[0] for c in candidates])
+    min_dist = dist[:, 0].copy()
+    min_dist[0] = -np.inf
     selected: list[tuple[int, int]] = [candidates[0]]
-    remaining = list(candidates[1:])
-
-    while remaining:
-        # Find candidate maximizing minimum distance to selected set
-        best_idx = -1
-        best_min_dist = -1.0
-
-        for i, (vertex, _) in enumerate(remaining):
-            # O(1) lookup instead of pathfinding
-            min_dist = min(matrix.distance(vertex, s[0]) for s in selected)
-            if min_dist > best_min_dist:
-                best_min_dist = min_dist
-                best_idx = i
-
-        if best_idx >= 0:
-            selected.append(remaining.pop(best_idx))
-        else:
-            break
+
+    while len(selected) < len(candidates):
+        # Candidate maximizing minimum distance to selected set (first on ties)
+        best = int(min_dist.argmax())
+        selected.append(candidates[best])
+        np.minimum(min_dist, dist[:, best], out=min_dist)
+        min_dist[best] = -np.inf
 
     return selected
 
@@ -1,7 +1,9 @@
 """
 Border System Search.
 
-Provides BFS-based border system discovery for loop planning.
+Provides border system discovery for loop planning: a lookup in the
+precomputed nearest-border index for the common high-sec case, and BFS
+for other security filters or when systems must be avoided.
 """
 
 from __future__ import annotations
@@ -9,14 +11,15 @@ from __future__ import annotations
 from collections import deque
 from typing import TYPE_CHECKING, Literal
 
+from ...universe.border_index import HIGHSEC_THRESHOLD, get_border_index
+
 if TYPE_CHECKING:
     from ...universe.graph import UniverseGraph
 
 
 SecurityFilter = Literal["highsec", "lowsec", "any"]
 
-# Security thresholds for classification
-HIGHSEC_THRESHOLD = 0.45
+# Security thresholds for classification (high-sec shared with the border index)
 LOWSEC_THRESHOLD = 0.0
 
 
@@ -47,9 +50,11 @@ def find_borders_with_distance(
     avoid_systems: set[int] | None = None,
 ) -> list[tuple[int, int]]:
     """
-    Find border systems with their distances from origin using BFS.
+    Find border systems with their distances from origin.
 
-    Traversal is constrained by security_filter and avoid_systems.
+    Traversal is constrained by security_filter and avoid_systems. High-sec
+    searches from a high-sec origin with nothing to avoid are answered from
+    the universe's nearest-border index; everything else runs a BFS.
 
     Args:
         universe: UniverseGraph for lookups
@@ -60,8 +65,30 @@ def find_borders_with_distance(
         avoid_systems: Set of vertex indices to avoid
 
     Returns:
-        List of (vertex_idx, distance) tuples sorted by distance
+        List of (vertex_idx, distance) tuples sorted by distance, ties
+        broken by vertex index
     """
+    if (
+        security_filter == "highsec"
+        and not avoid_systems
+        and universe.security[origin_idx] >= HIGHSEC_THRESHOLD
+    ):
+        indexed = get_border_index(universe).nearest(origin_idx, limit, max_jumps)
+        if indexed is not None:
+            return indexed
+
+    return _bfs_borders(universe, origin_idx, limit, max_jumps, security_filter, avoid_systems)
+
+
+def _bfs_borders(
+    universe: UniverseGraph,
+    origin_idx: int,
+    limit: int,
+    max_jumps: int,
+    security_filter: SecurityFilter,
+    avoid_systems: set[int] | None,
+) -> list[tuple[int, int]]:
+    """BFS from origin collecting border systems (see find_borders_with_distance)."""
     g = universe.graph
     borders: list[tuple[int, int]] = []
     visited: dict[int, int] = {origin_idx: 0}
@@ -86,5 +113,5 @@ def find_borders_with_distance(
                     visited[neighbor] = dist + 1
                     queue.append((neighbor, dist + 1))
 
-    borders.sort(key=lambda x: x[1])
+    borders.sort(key=lambda x: (x[1], x[0]))
     return borders[:limit]
@@ -13,13 +13,13 @@ from typing import TYPE_CHECKING, Literal
 
 from .algorithms import (
     expand_tour,
-    nearest_neighbor_tsp,
     select_borders_coverage,
     select_borders_density,
 )
 from .border_search import SecurityFilter, find_borders_with_distance
 from .errors import InsufficientBordersError
 from .result_builder import LoopSummary, compute_loop_summary
+from .tsp import DEFAULT_TIME_BUDGET, TspSolver, solve_tour
 
 if TYPE_CHECKING:
     from ...universe.graph import UniverseGraph
@@ -68,6 +68,8 @@ class LoopPlanningService:
         avoid_systems: set[int] | None = None,
         search_radius_divisor: int = 3,
         max_borders_cap: int = 15,
+        solver: TspSolver = "optimize",
+        time_budget: float = DEFAULT_TIME_BUDGET,
     ) -> LoopSummary:
         """
         Plan a circular route through border systems.
@@ -76,7 +78,7 @@ class LoopPlanningService:
         1. BFS to find border systems within range
         2. Precompute distance matrix for all candidates (OPTIMIZATION)
         3. Select borders based on optimize mode (density or coverage)
-        4. Solve TSP approximation using matrix
+        4. Order borders using matrix (greedy, then exact or 2-opt/Or-opt)
         5. Expand tour to full route using matrix paths
         6. Build summary
 
@@ -90,6 +92,8 @@ class LoopPlanningService:
             avoid_systems: Set of vertex indices to avoid
             search_radius_divisor: Divisor for calculating search radius from target_jumps
             max_borders_cap: Absolute maximum borders for internal calculations
+            solver: Visit-order solver ("greedy" or "optimize")
+            time_budget: Maximum seconds spent improving the visit order
 
         Returns:
             LoopSummary with computed route metrics
@@ -150,14 +154,26 @@ class LoopPlanningService:
             )
             selected = selected[:effective_max]
 
-        # Step 4: Solve TSP approximation using matrix
-        tour = nearest_neighbor_tsp(origin_idx, [s[0] for s in selected], matrix)
+        # Step 4: Order borders using matrix
+        solution = solve_tour(
+            origin_idx,
+            [s[0] for s in selected],
+            matrix,
+            closed=True,
+            solver=solver,
+            time_budget=time_budget,
+        )
 
         # Step 5: Expand tour to full route using matrix paths
-        full_route = expand_tour(tour, matrix)
+        full_route = expand_tour(solution.tour, matrix)
 
         # Step 6: Build summary
-        return compute_loop_summary(full_route, selected)
+        return compute_loop_summary(
+            full_route,
+            selected,
+            tour_method=solution.method,
+            jumps_saved=solution.jumps_saved,
+        )
 
     def find_borders(
         self,
@@ -7,6 +7,10 @@ Provides transport-agnostic result construction for loop planning.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .tsp import TourMethod
 
 
 @dataclass(frozen=True)
@@ -36,10 +40,18 @@ class LoopSummary:
     efficiency: float
     """Ratio of unique systems to total route length (0.0 to 1.0)."""
 
+    tour_method: TourMethod = "greedy"
+    """Algorithm that produced the border visit order."""
+
+    jumps_saved: int = 0
+    """Jumps saved versus the nearest-neighbor visit order."""
+
 
 def compute_loop_summary(
     full_route: list[int],
     borders_visited: list[tuple[int, int]],
+    tour_method: TourMethod = "greedy",
+    jumps_saved: int = 0,
 ) -> LoopSummary:
     """
     Compute transport-agnostic loop summary from route data.
@@ -47,6 +59,8 @@ def compute_loop_summary(
     Args:
         full_route: Complete route as vertex indices
         borders_visited: Border systems visited with distances
+        tour_method: Algorithm that produced the visit order
+        jumps_saved: Jumps saved versus the nearest-neighbor visit order
 
     Returns:
         LoopSummary with computed metrics
@@ -63,4 +77,6 @@ def compute_loop_summary(
         unique_systems=unique_count,
         backtrack_jumps=max(0, backtrack),
         efficiency=min(1.0, efficiency),
+        tour_method=tour_method,
+        jumps_saved=jumps_saved,
     )
@@ -0,0 +1,258 @@
+"""
+Tour Optimization.
+
+Solves the visit-order problem for waypoint routes and loops on a
+precomputed DistanceMatrix.
+
+Solvers:
+- greedy: Nearest-neighbor construction only (fast fallback)
+- optimize: Held-Karp dynamic programming (exact) for up to
+  EXACT_MAX_WAYPOINTS stops; otherwise nearest-neighbor followed by
+  2-opt and Or-opt local search until no move improves the tour or the
+  time budget runs out
+
+Tours always start at a fixed vertex. Closed tours return to it (loops,
+round trips); open tours end at whichever stop is visited last.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal, TypeGuard
+
+import numpy as np
+
+from .algorithms import nearest_neighbor_tsp
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from ...mcp.utils import DistanceMatrix
+
+
+TspSolver = Literal["greedy", "optimize"]
+"""
+Visit-order solver for waypoint and loop tours:
+- "greedy": Nearest-neighbor heuristic only (fastest)
+- "optimize": Exact for small tours, 2-opt/Or-opt improvement otherwise (default)
+"""
+
+VALID_TSP_SOLVERS: frozenset[str] = frozenset({"greedy", "optimize"})
+
+TourMethod = Literal["greedy", "held_karp", "local_search"]
+"""Algorithm that produced the reported visit order."""
+
+# Largest stop count (excluding start) solved exactly; 2^12 * 12 DP states
+EXACT_MAX_WAYPOINTS = 12
+
+# Default local-search budget in seconds
+DEFAULT_TIME_BUDGET = 0.05
+
+# Stand-in for unreachable legs so tour costs stay comparable
+UNREACHABLE_COST = 1e6
+
+# Longest segment Or-opt relocates
+OR_OPT_MAX_SEGMENT = 3
+
+
+def is_tsp_solver(value: str) -> TypeGuard[TspSolver]:
+    """Check whether a string names a visit-order solver."""
+    return value in VALID_TSP_SOLVERS
+
+
+@dataclass(frozen=True)
+class TourSolution:
+    """Visit order produced by solve_tour."""
+
+    tour: list[int]
+    """Vertex indices in visit order, starting with the start vertex."""
+
+    cost: float
+    """Tour length in jumps (including the return leg for closed tours)."""
+
+    greedy_cost: float
+    """Length of the nearest-neighbor tour for the same stops."""
+
+    method: TourMethod
+    """Solver that produced the tour."""
+
+    @property
+    def jumps_saved(self) -> int:
+        """Jumps saved relative to the nearest-neighbor tour."""
+        if not np.isfinite(self.cost) or not np.isfinite(self.greedy_cost):
+            return 0
+        return max(0, round(self.greedy_cost - self.cost))
+
+    @property
+    def improvement(self) -> float:
+        """Fraction of the nearest-neighbor tour length saved (0.0 to 1.0)."""
+        if not np.isfinite(self.greedy_cost) or self.greedy_cost <= 0:
+            return 0.0
+        return self.jumps_saved / self.greedy_cost
+
+
+def solve_tour(
+    start: int,
+    waypoints: list[int],
+    matrix: DistanceMatrix,
+    closed: bool = True,
+    solver: TspSolver = "optimize",
+    time_budget: float = DEFAULT_TIME_BUDGET,
+) -> TourSolution:
+    """
+    Order waypoints into a short tour starting at start.
+
+    Args:
+        start: Starting vertex index (must be in matrix)
+        waypoints: Vertex indices to visit (must be in matrix, start excluded)
+        matrix: Precomputed DistanceMatrix covering start and waypoints
+        closed: Whether the tour returns to start
+        solver: "greedy" for nearest-neighbor only, "optimize" to improve it
+        time_budget: Maximum seconds spent in local search
+
+    Returns:
+        TourSolution with the tour, its cost and the greedy baseline
+    """
+    greedy = nearest_neighbor_tsp(start, waypoints, matrix)
+    nodes = [start] + list(waypoints)
+    raw = matrix.submatrix(nodes)
+    greedy_order = [nodes.index(v) for v in greedy]
+    greedy_cost = _tour_cost(raw, greedy_order, closed)
+
+    if solver == "greedy" or len(waypoints) < 3:
+        return TourSolution(greedy, greedy_cost, greedy_cost, "greedy")
+
+    dist = np.where(np.isfinite(raw), raw, UNREACHABLE_COST)
+    if len(waypoints) <= EXACT_MAX_WAYPOINTS:
+        order = _held_karp(dist, closed)
+        method: TourMethod = "held_karp"
+    else:
+        deadline = time.perf_counter() + time_budget
+        order = _local_search(dist, greedy_order, closed, deadline)
+        method = "local_search"
+
+    cost = _tour_cost(raw, order, closed)
+    if cost >= greedy_cost:
+        return TourSolution(greedy, greedy_cost, greedy_cost, "greedy")
+    return TourSolution([nodes[i] for i in order], cost, greedy_cost, method)
+
+
+def _tour_cost(dist: NDArray[np.float64], order: list[int], closed: bool) -> float:
+    """Sum of leg lengths along order (plus the return leg if closed)."""
+    stops = order + [order[0]] if closed else order
+    return float(dist[stops[:-1], stops[1:]].sum())
+
+
+def _held_karp(dist: NDArray[np.float64], closed: bool) -> list[int]:
+    """
+    Exact tour by dynamic programming over visited subsets.
+
+    Node 0 is the fixed start. best[mask, j] is the cheapest path from the
+    start through the stops in mask that ends at stop j; each subset size
+    is filled with one vectorized step per end stop.
+    """
+    n = len(dist) - 1
+    full = (1 << n) - 1
+    masks = np.arange(1 << n)
+    popcount = np.zeros(1 << n, dtype=np.int64)
+    for j in range(n):
+        popcount += (masks >> j) & 1
+
+    legs = dist[1:, 1:]
+    best = np.full((1 << n, n), np.inf)
+    parent = np.full((1 << n, n), -1, dtype=np.int64)
+    for j in range(n):
+        best[1 << j, j] = dist[0, j + 1]
+
+    for size in range(2, n + 1):
+        layer = masks[popcount == size]
+        for j in range(n):
+            ending = layer[(layer >> j) & 1 == 1]
+            via = best[ending ^ (1 << j)] + legs[:, j]
+            choice = via.argmin(axis=1)
+            best[ending, j] = via[np.arange(len(ending)), choice]
+            parent[ending, j] = choice
+
+    final = best[full] + (dist[1:, 0] if closed else 0.0)
+    last = int(final.argmin())
+    order: list[int] = []
+    mask = full
+    while last >= 0:
+        order.append(last + 1)
+        mask, last = mask ^ (1 << last), int(parent[mask, last])
+    return [0] + order[::-1]
+
+
+def _local_search(
+    dist: NDArray[np.float64],
+    order: list[int],
+    closed: bool,
+    deadline: float,
+) -> list[int]:
+    """
+    Improve a tour with 2-opt and Or-opt moves until stuck or out of time.
+
+    The tour is handled as start, stops..., end where end is the start
+    again (closed) or a zero-cost sentinel (open), so both variants share
+    the same move evaluation.
+    """
+    m = len(order)
+    ext = np.zeros((m + 1, m + 1))
+    ext[:m, :m] = dist
+    if closed:
+        ext[:m, m] = dist[:, 0]
+        ext[m, :m] = dist[0, :]
+    seq = np.array(order + [m], dtype=np.int64)
+
+    improved = True
+    while improved and time.perf_counter() < deadline:
+        improved = _two_opt(ext, seq) or _or_opt(ext, seq)
+    return seq[:-1].tolist()
+
+
+def _two_opt(ext: NDArray[np.float64], seq: NDArray[np.int64]) -> bool:
+    """Apply the best improving segment reversal in place, if any."""
+    # Reverse seq[i..j] for 1 <= i < j <= len(seq) - 2
+    prev, first = seq[:-2], seq[1:-1]
+    last, succ = seq[1:-1], seq[2:]
+    delta = (
+        ext[prev[:, None], last[None, :]]
+        + ext[first[:, None], succ[None, :]]
+        - ext[prev, first][:, None]
+        - ext[last, succ][None, :]
+    )
+    delta[np.tril_indices_from(delta)] = 0.0
+    i, j = np.unravel_index(int(delta.argmin()), delta.shape)
+    if delta[i, j] >= -1e-9:
+        return False
+
+    before = ext[seq[:-1], seq[1:]].sum()
+    candidate = seq.copy()
+    candidate[i + 1 : j + 2] = candidate[i + 1 : j + 2][::-1]
+    # Exact check: distances need not be perfectly symmetric
+    if ext[candidate[:-1], candidate[1:]].sum() >= before - 1e-9:
+        return False
+    seq[:] = candidate
+    return True
+
+
+def _or_opt(ext: NDArray[np.float64], seq: NDArray[np.int64]) -> bool:
+    """Relocate the first improving short segment in place, if any."""
+    stops = len(seq) - 2
+    for length in range(1, min(OR_OPT_MAX_SEGMENT, stops - 1) + 1):
+        for i in range(1, stops - length + 2):
+            head, tail = seq[i], seq[i + length - 1]
+            before, after = seq[i - 1], seq[i + length]
+            removal_gain = ext[before, head] + ext[tail, after] - ext[before, after]
+
+            # Insert between rest[p] and rest[p + 1]
+            rest = np.concatenate([seq[:i], seq[i + length :]])
+            insert_cost = ext[rest[:-1], head] + ext[tail, rest[1:]] - ext[rest[:-1], rest[1:]]
+            insert_cost[i - 1] = np.inf  # Original position
+            p = int(insert_cost.argmin())
+            if insert_cost[p] < removal_gain - 1e-9:
+                segment = seq[i : i + length].copy()
+                seq[:] = np.concatenate([rest[: p + 1], segment, rest[p + 1 :]])
+                return True
+    return False
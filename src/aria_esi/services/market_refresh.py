@@ -505,25 +505,25 @@ class MarketRefreshService:
                 # Fetch buy orders
                 buy_orders: list[dict] = []
                 try:
-                    data = await client.get(
+                    async for page in client.get_all_pages(
                         f"/markets/{region_id}/orders/",
                         params={"type_id": str(type_id), "order_type": "buy"},
-                    )
-                    if isinstance(data, list):
-                        buy_orders = data
+                    ):
+                        buy_orders.extend(page)
                 except Exception as e:
+                    buy_orders = []  # Don't aggregate a truncated order book
                     logger.debug("ESI buy orders failed for %d: %s", type_id, e)
 
                 # Fetch sell orders
                 sell_orders: list[dict] = []
                 try:
-                    data = await client.get(
+                    async for page in client.get_all_pages(
                         f"/markets/{region_id}/orders/",
                         params={"type_id": str(type_id), "order_type": "sell"},
-                    )
-                    if isinstance(data, list):
-                        sell_orders = data
+                    ):
+                        sell_orders.extend(page)
                 except Exception as e:
+                    sell_orders = []  # Don't aggregate a truncated order book
                     logger.debug("ESI sell orders failed for %d: %s", type_id, e)
 
                 # Aggregate to Fuzzwork-compatible format
@@ -10,6 +10,9 @@ Usage:
 
     service = NavigationService(universe)
     path = service.calculate_route(origin_idx, dest_idx, "safe")
+
+    # Many destinations at once
+    table = service.calculate_routes([origin_idx], dest_indices, "safe")
 """
 
 from __future__ import annotations
@@ -18,12 +21,20 @@ __all__ = [
     # Core service
     "NavigationService",
     "RouteMode",
+    "RouteTable",
     "VALID_MODES",
+    # Route cache
+    "RouteCache",
+    "get_route_cache",
     # Errors
     "NavigationError",
     "RouteNotFoundError",
     "SystemNotFoundError",
     # Weight computation
+    "EdgeWeightCache",
+    "get_route_weights",
+    "get_weight_cache",
+    "warm_route_weights",
     "compute_avoid_weights",
     "compute_safe_weights",
     "compute_unsafe_weights",
@@ -53,11 +64,17 @@ def __getattr__(name: str):
         from .router import NavigationService
 
         return NavigationService
-    if name in ("RouteMode", "VALID_MODES"):
+    if name in ("RouteMode", "RouteTable", "VALID_MODES"):
         from . import router
 
         return getattr(router, name)
 
+    # Route cache
+    if name in ("RouteCache", "get_route_cache"):
+        from . import route_cache
+
+        return getattr(route_cache, name)
+
     # Errors
     if name in ("NavigationError", "RouteNotFoundError", "SystemNotFoundError"):
         from . import errors
@@ -66,6 +83,10 @@ def __getattr__(name: str):
 
     # Weights
     if name in (
+        "EdgeWeightCache",
+        "get_route_weights",
+        "get_weight_cache",
+        "warm_route_weights",
         "compute_avoid_weights",
         "compute_safe_weights",
         "compute_unsafe_weights",
@@ -0,0 +1,387 @@
+"""
+Route Result Cache.
+
+Bounded, thread-safe LRU of computed routes, keyed by
+(origin, destination, mode, avoid-set hash) and scoped to one graph
+version. Optionally persisted to a small SQLite file so warm starts keep
+previously computed routes; new routes are written in batches rather
+than one transaction per miss.
+
+Persisted rows carry a graph key built from ``UniverseGraph.version`` and
+the source file checksum, and only rows for the current key are loaded,
+so rebuilding the graph invalidates them automatically. Processes on
+different graphs can share the file: rows are trimmed per graph key and
+expire by age rather than being deleted when another graph opens it.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from ...core.logging import get_logger
+
+if TYPE_CHECKING:
+    from ...universe.graph import UniverseGraph
+
+logger = get_logger(__name__)
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+ROUTE_CACHE_SIZE = 4096
+"""Maximum routes held in memory (and persisted) per graph."""
+
+ROUTE_CACHE_FLUSH_BATCH = 64
+"""New routes buffered before they are written to SQLite in one transaction."""
+
+ROUTE_CACHE_FLUSH_SECONDS = 30.0
+"""Maximum age of buffered routes before the next put flushes them."""
+
+ROUTE_CACHE_MAX_AGE_SECONDS = 30 * 86400
+"""Persisted rows older than this are pruned when the cache is opened."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS routes (
+    graph_key TEXT NOT NULL,
+    origin INTEGER NOT NULL,
+    destination INTEGER NOT NULL,
+    mode TEXT NOT NULL,
+    avoid_hash TEXT NOT NULL,
+    path BLOB NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (graph_key, origin, destination, mode, avoid_hash)
+);
+CREATE INDEX IF NOT EXISTS idx_routes_created ON routes(created_at);
+"""
+
+RouteKey = tuple[int, int, str, str]
+
+
+# =============================================================================
+# Key Helpers
+# =============================================================================
+
+
+def graph_cache_key(universe: UniverseGraph) -> str:
+    """
+    Build the cache scope for a graph.
+
+    Args:
+        universe: UniverseGraph the routes were computed on
+
+    Returns:
+        "<version>:<checksum>" (checksum is "unverified" when unknown)
+    """
+    return f"{universe.version}:{universe.source_checksum or 'unverified'}"
+
+
+def avoid_set_hash(avoid_systems: Iterable[int] | None) -> str:
+    """
+    Stable hash of an avoid-set, independent of iteration order.
+
+    Args:
+        avoid_systems: Vertex indices to avoid, or None
+
+    Returns:
+        Hex digest, or an empty string when nothing is avoided
+    """
+    if not avoid_systems:
+        return ""
+    ids = np.unique(np.fromiter(avoid_systems, dtype=np.int32))
+    return hashlib.blake2b(ids.tobytes(), digest_size=8).hexdigest()
+
+
+# =============================================================================
+# Route Cache
+# =============================================================================
+
+
+class RouteCache:
+    """
+    LRU cache of route paths for a single graph.
+
+    Thread-safe. New routes are buffered and written to the optional
+    SQLite file in batches (every ROUTE_CACHE_FLUSH_BATCH routes or
+    ROUTE_CACHE_FLUSH_SECONDS, on flush() and on close()); the write
+    runs outside the LRU lock so lookups are not blocked by disk I/O.
+    Persistence failures are logged and disable persistence rather than
+    failing the route request.
+
+    Example:
+        cache = RouteCache(graph_cache_key(universe), db_path=path)
+        path = cache.get(origin, dest, "safe", avoid)
+        if path is None:
+            path = compute(...)
+            cache.put(origin, dest, "safe", avoid, path)
+    """
+
+    def __init__(
+        self,
+        graph_key: str,
+        maxsize: int = ROUTE_CACHE_SIZE,
+        db_path: Path | None = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            graph_key: Scope of cached routes (see graph_cache_key)
+            maxsize: Maximum cached routes
+            db_path: Optional SQLite file for persistence
+        """
+        self.graph_key = graph_key
+        self.maxsize = maxsize
+        self.db_path = db_path
+        self._entries: OrderedDict[RouteKey, tuple[int, ...]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()  # Serializes SQLite writes; taken before _lock
+        self._conn: sqlite3.Connection | None = None
+        self._dirty: dict[RouteKey, tuple[int, ...]] = {}
+        self._last_flush = time.monotonic()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.loaded = 0
+
+        if db_path is not None:
+            self._open(db_path)
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    def get(
+        self,
+        origin_idx: int,
+        dest_idx: int,
+        mode: str,
+        avoid_systems: Iterable[int] | None = None,
+    ) -> list[int] | None:
+        """
+        Look up a cached route.
+
+        Args:
+            origin_idx: Origin vertex index
+            dest_idx: Destination vertex index
+            mode: Routing mode
+            avoid_systems: Vertex indices avoided when routing
+
+        Returns:
+            Copy of the cached path, or None on a miss
+        """
+        key = (origin_idx, dest_idx, mode, avoid_set_hash(avoid_systems))
+        with self._lock:
+            path = self._entries.get(key)
+            if path is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return list(path)
+
+    def put(
+        self,
+        origin_idx: int,
+        dest_idx: int,
+        mode: str,
+        avoid_systems: Iterable[int] | None,
+        path: list[int],
+    ) -> None:
+        """
+        Store a computed route.
+
+        Args:
+            origin_idx: Origin vertex index
+            dest_idx: Destination vertex index
+            mode: Routing mode
+            avoid_systems: Vertex indices avoided when routing
+            path: Computed path (empty if unreachable)
+        """
+        key = (origin_idx, dest_idx, mode, avoid_set_hash(avoid_systems))
+        value = tuple(path)
+        with self._lock:
+            self._insert(key, value)
+            if self._conn is None:
+                return
+            self._dirty[key] = value
+            due = (
+                len(self._dirty) >= ROUTE_CACHE_FLUSH_BATCH
+                or time.monotonic() - self._last_flush >= ROUTE_CACHE_FLUSH_SECONDS
+            )
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered routes to SQLite in one transaction."""
+        with self._db_lock:
+            with self._lock:
+                conn, dirty = self._conn, self._dirty
+                self._dirty = {}
+                self._last_flush = time.monotonic()
+            if conn is None or not dirty:
+                return
+
+            now = time.time()
+            rows = [
+                (self.graph_key, *key, np.asarray(value, dtype="<i4").tobytes(), now)
+                for key, value in dirty.items()
+            ]
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO routes VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+                    )
+                    conn.execute(
+                        """
+                        DELETE FROM routes WHERE rowid IN (
+                            SELECT rowid FROM routes WHERE graph_key = ?
+                            ORDER BY created_at DESC LIMIT -1 OFFSET ?
+                        )
+                        """,
+                        (self.graph_key, self.maxsize),
+                    )
+            except sqlite3.Error as e:
+                with self._lock:
+                    self._disable_persistence(e)
+
+    def clear(self) -> None:
+        """Drop all cached routes for this graph, including persisted ones, and reset counters."""
+        with self._db_lock, self._lock:
+            self._entries.clear()
+            self._dirty.clear()
+            self.hits = self.misses = self.evictions = self.loaded = 0
+            if self._conn is not None:
+                try:
+                    with self._conn:
+                        self._conn.execute(
+                            "DELETE FROM routes WHERE graph_key = ?", (self.graph_key,)
+                        )
+                except sqlite3.Error as e:
+                    self._disable_persistence(e)
+
+    def close(self) -> None:
+        """Flush buffered routes and close the SQLite connection. In-memory entries are kept."""
+        self.flush()
+        with self._db_lock, self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache counters for status reporting.
+
+        Returns:
+            Dict with hits, misses, hit_rate, entries, evictions and
+            persistence details
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "graph_key": self.graph_key,
+                "persistent": self._conn is not None,
+                "pending_writes": len(self._dirty),
+                "loaded_from_disk": self.loaded,
+                "db_path": str(self.db_path) if self.db_path else None,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # -------------------------------------------------------------------------
+    # Internals (call with lock held)
+    # -------------------------------------------------------------------------
+
+    def _insert(self, key: RouteKey, value: tuple[int, ...]) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _open(self, db_path: Path) -> None:
+        """Open the SQLite file, prune expired rows and load this graph's routes."""
+        try:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(db_path), check_same_thread=False)
+            conn.executescript(_SCHEMA)
+            with conn:
+                expired = conn.execute(
+                    "DELETE FROM routes WHERE created_at < ?",
+                    (time.time() - ROUTE_CACHE_MAX_AGE_SECONDS,),
+                ).rowcount
+            rows = conn.execute(
+                """
+                SELECT origin, destination, mode, avoid_hash, path FROM routes
+                WHERE graph_key = ?
+                ORDER BY created_at DESC LIMIT ?
+                """,
+                (self.graph_key, self.maxsize),
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning("Route cache persistence unavailable (%s): %s", db_path, e)
+            return
+
+        if expired:
+            logger.info("Route cache: pruned %d expired routes", expired)
+
+        # Oldest first so the most recent rows end up most-recently-used
+        for origin, dest, mode, avoid_hash, blob in reversed(rows):
+            path = tuple(np.frombuffer(blob, dtype="<i4").tolist())
+            self._entries[(origin, dest, mode, avoid_hash)] = path
+        self.loaded = len(rows)
+        self._conn = conn
+        # Buffered routes would otherwise be lost at shutdown
+        atexit.register(self.close)
+
+    def _disable_persistence(self, error: sqlite3.Error) -> None:
+        logger.warning("Route cache persistence disabled: %s", error)
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+# =============================================================================
+# Per-Universe Accessor
+# =============================================================================
+
+
+def get_route_cache(universe: UniverseGraph, *, db_path: Path | None = None) -> RouteCache:
+    """
+    Get the route cache attached to a universe, creating it on first use.
+
+    Args:
+        universe: UniverseGraph routes are computed on
+        db_path: Optional SQLite file for persistence. Only used when the
+            cache is created; persistence is skipped for graphs without a
+            verified source checksum, since their rows could not be
+            invalidated reliably.
+
+    Returns:
+        RouteCache for this universe
+    """
+    cache = universe._route_cache
+    if cache is None:
+        if db_path is not None and universe.source_checksum is None:
+            logger.debug("Route cache persistence skipped: graph checksum unknown")
+            db_path = None
+        cache = RouteCache(graph_cache_key(universe), db_path=db_path)
+        universe._route_cache = cache
+    return cache
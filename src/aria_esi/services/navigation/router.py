@@ -8,14 +8,12 @@ different routing modes and system avoidance.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Literal
 
-from .weights import (
-    compute_avoid_weights,
-    compute_safe_weights,
-    compute_unsafe_weights,
-)
+from .route_cache import get_route_cache
+from .weights import get_route_weights
 
 if TYPE_CHECKING:
     from ...universe.graph import UniverseGraph
@@ -25,6 +23,117 @@ RouteMode = Literal["shortest", "safe", "unsafe"]
 VALID_MODES: frozenset[str] = frozenset({"shortest", "safe", "unsafe"})
 
 
+@dataclass
+class RouteTable:
+    """
+    Routes from a set of origins to a set of destinations.
+
+    Route costs for every pair are computed up front in a single igraph
+    ``distances()`` call. Paths are only materialized when requested, one
+    multi-target ``get_shortest_paths()`` call per origin, and then cached.
+
+    Example:
+        table = service.calculate_routes([jita], hub_indices, "safe")
+        for dest in table.reachable(jita):
+            print(dest, table.jumps(jita, dest))
+    """
+
+    universe: UniverseGraph
+    origins: list[int]
+    destinations: list[int]
+    mode: RouteMode
+    weights: Sequence[float] | None = field(repr=False)
+    costs: list[list[float]] = field(repr=False)
+    _origin_pos: dict[int, int] = field(default_factory=dict, repr=False)
+    _dest_pos: dict[int, int] = field(default_factory=dict, repr=False)
+    _paths: dict[int, list[list[int]]] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        # First occurrence wins when callers pass duplicates
+        for i, v in enumerate(self.origins):
+            self._origin_pos.setdefault(v, i)
+        for j, v in enumerate(self.destinations):
+            self._dest_pos.setdefault(v, j)
+
+    def cost(self, origin_idx: int, dest_idx: int) -> float:
+        """
+        Get the weighted route cost (equals jumps in unweighted mode).
+
+        Args:
+            origin_idx: Origin vertex index (must be in origins)
+            dest_idx: Destination vertex index (must be in destinations)
+
+        Returns:
+            Route cost, or inf if unreachable
+        """
+        return self.costs[self._origin_pos[origin_idx]][self._dest_pos[dest_idx]]
+
+    def is_reachable(self, origin_idx: int, dest_idx: int) -> bool:
+        """Check whether a route exists, without materializing it."""
+        return self.cost(origin_idx, dest_idx) != float("inf")
+
+    def reachable(self, origin_idx: int) -> list[int]:
+        """
+        Get destinations reachable from an origin, in destination order.
+
+        Args:
+            origin_idx: Origin vertex index (must be in origins)
+
+        Returns:
+            List of reachable destination vertex indices
+        """
+        row = self.costs[self._origin_pos[origin_idx]]
+        return [d for d in self.destinations if row[self._dest_pos[d]] != float("inf")]
+
+    def path(self, origin_idx: int, dest_idx: int) -> list[int]:
+        """
+        Get the route between an origin and destination.
+
+        Args:
+            origin_idx: Origin vertex index (must be in origins)
+            dest_idx: Destination vertex index (must be in destinations)
+
+        Returns:
+            List of vertex indices from origin to destination.
+            Empty list if no route exists.
+        """
+        row = self._paths.get(origin_idx)
+        if row is None:
+            row = self._materialize(origin_idx)
+        return row[self._dest_pos[dest_idx]]
+
+    def jumps(self, origin_idx: int, dest_idx: int) -> int | None:
+        """
+        Get the jump count of a route.
+
+        Args:
+            origin_idx: Origin vertex index (must be in origins)
+            dest_idx: Destination vertex index (must be in destinations)
+
+        Returns:
+            Number of jumps, or None if unreachable
+        """
+        if not self.is_reachable(origin_idx, dest_idx):
+            return None
+        if self.weights is None:
+            return int(self.cost(origin_idx, dest_idx))
+        return len(self.path(origin_idx, dest_idx)) - 1
+
+    def _materialize(self, origin_idx: int) -> list[list[int]]:
+        """Compute and cache all paths from one origin in a single call."""
+        row = self._origin_pos[origin_idx]
+        targets = [d for d, cost in zip(self.destinations, self.costs[row]) if cost != float("inf")]
+        found = (
+            self.universe.graph.get_shortest_paths(origin_idx, targets, weights=self.weights)
+            if targets
+            else []
+        )
+        by_dest = dict(zip(targets, found))
+        paths = [list(by_dest.get(d) or []) for d in self.destinations]
+        self._paths[origin_idx] = paths
+        return paths
+
+
 @dataclass
 class NavigationService:
     """
@@ -68,28 +177,69 @@ class NavigationService:
             The returned path includes both origin and destination.
             A direct jump returns [origin_idx, dest_idx] (2 elements, 1 jump).
         """
-        g = self.universe.graph
+        if mode not in VALID_MODES:
+            return []
 
-        if mode == "shortest":
-            if avoid_systems:
-                weights = compute_avoid_weights(self.universe, avoid_systems)
-                paths = g.get_shortest_paths(origin_idx, dest_idx, weights=weights)
-            else:
-                # Unweighted BFS - O(V + E)
-                paths = g.get_shortest_paths(origin_idx, dest_idx)
-            return paths[0] if paths and paths[0] else []
+        cache = get_route_cache(self.universe)
+        cached = cache.get(origin_idx, dest_idx, mode, avoid_systems)
+        if cached is not None:
+            return cached
+
+        # Cached per (mode, avoid set); None means unweighted BFS - O(V + E)
+        weights = get_route_weights(self.universe, mode, avoid_systems)
+        paths = self.universe.graph.get_shortest_paths(origin_idx, dest_idx, weights=weights)
+        path = paths[0] if paths and paths[0] else []
+        cache.put(origin_idx, dest_idx, mode, avoid_systems, path)
+        return path
+
+    def calculate_routes(
+        self,
+        origins: Sequence[int],
+        destinations: Sequence[int],
+        mode: RouteMode = "shortest",
+        avoid_systems: set[int] | None = None,
+    ) -> RouteTable:
+        """
+        Calculate routes between many origins and destinations at once.
+
+        Edge weights are resolved once for the whole batch and route costs
+        for every pair come from one igraph ``distances()`` call. Paths are
+        materialized lazily by the returned table.
+
+        Args:
+            origins: Origin vertex indices
+            destinations: Destination vertex indices
+            mode: Routing mode (see calculate_route)
+            avoid_systems: Set of vertex indices to avoid (treated as blocked)
+
+        Returns:
+            RouteTable covering every (origin, destination) pair
+
+        Raises:
+            ValueError: If mode is not a valid routing mode
+        """
+        if mode not in VALID_MODES:
+            raise ValueError(f"Invalid route mode: {mode}")
 
-        elif mode == "safe":
-            weights = compute_safe_weights(self.universe, avoid_systems)
-            paths = g.get_shortest_paths(origin_idx, dest_idx, weights=weights)
-            return paths[0] if paths and paths[0] else []
+        origins = list(origins)
+        destinations = list(destinations)
+        weights = get_route_weights(self.universe, mode, avoid_systems)
 
-        elif mode == "unsafe":
-            weights = compute_unsafe_weights(self.universe, avoid_systems)
-            paths = g.get_shortest_paths(origin_idx, dest_idx, weights=weights)
-            return paths[0] if paths and paths[0] else []
+        if origins and destinations:
+            costs = self.universe.graph.distances(
+                source=origins, target=destinations, weights=weights
+            )
+        else:
+            costs = [[] for _ in origins]
 
-        return []
+        return RouteTable(
+            universe=self.universe,
+            origins=origins,
+            destinations=destinations,
+            mode=mode,
+            weights=weights,
+            costs=costs,
+        )
 
     def resolve_avoid_systems(
         self,
@@ -9,15 +9,29 @@ Weight Schemes:
 - Shortest: All edges weight 1 (unless avoiding systems)
 - Safe: Penalize low-sec entry, penalize null-sec heavily
 - Unsafe: Prefer null-sec, acceptable low-sec, avoid high-sec
+
+Weights are computed with NumPy over the universe's edge endpoint arrays.
+Each scheme's base vector is built once per UniverseGraph; avoid-lists are
+applied as a masked copy and the result kept in a small per-graph LRU keyed
+by (scheme, frozenset(avoid_systems)).
 """
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
     from ...universe.graph import UniverseGraph
 
+    WeightBuilder = Callable[[UniverseGraph], NDArray[np.float64]]
+
 
 # =============================================================================
 # Security Thresholds
@@ -47,6 +61,199 @@ WEIGHT_UNSAFE_HIGHSEC = 10.0  # Avoided: high-sec
 WEIGHT_AVOID = float("inf")  # Effectively blocks the edge
 
 
+# =============================================================================
+# Vectorized Base Weights
+# =============================================================================
+
+# Maximum number of (scheme, avoid-set) weight vectors kept per universe
+ROUTE_WEIGHT_CACHE_SIZE = 32
+
+
+def _shortest_base_weights(universe: UniverseGraph) -> NDArray[np.float64]:
+    """Uniform weights: every jump costs WEIGHT_NORMAL."""
+    return np.full(len(universe.edge_targets), WEIGHT_NORMAL, dtype=np.float64)
+
+
+def _safe_base_weights(universe: UniverseGraph) -> NDArray[np.float64]:
+    """Safe-mode weights keyed on source and destination security."""
+    src_sec = universe.security[universe.edge_sources]
+    dst_sec = universe.security[universe.edge_targets]
+
+    weights = np.full(len(dst_sec), WEIGHT_NULLSEC, dtype=np.float64)
+    lowsec_dst = (dst_sec > LOWSEC_THRESHOLD) & (dst_sec < HIGHSEC_THRESHOLD)
+    weights[lowsec_dst] = np.where(
+        src_sec[lowsec_dst] >= HIGHSEC_THRESHOLD,
+        WEIGHT_LOWSEC_ENTRY,
+        WEIGHT_LOWSEC_STAY,
+    )
+    weights[dst_sec >= HIGHSEC_THRESHOLD] = WEIGHT_NORMAL
+    return weights
+
+
+def _unsafe_base_weights(universe: UniverseGraph) -> NDArray[np.float64]:
+    """Unsafe-mode weights keyed on destination security."""
+    dst_sec = universe.security[universe.edge_targets]
+
+    weights = np.full(len(dst_sec), WEIGHT_UNSAFE_LOWSEC, dtype=np.float64)
+    weights[dst_sec <= LOWSEC_THRESHOLD] = WEIGHT_UNSAFE_NULLSEC
+    weights[dst_sec >= HIGHSEC_THRESHOLD] = WEIGHT_UNSAFE_HIGHSEC
+    return weights
+
+
+_MODE_BUILDERS: dict[str, WeightBuilder] = {
+    "shortest": _shortest_base_weights,
+    "safe": _safe_base_weights,
+    "unsafe": _unsafe_base_weights,
+}
+
+
+class EdgeWeightCache:
+    """
+    Per-universe cache of edge weight vectors.
+
+    Base vectors are stored per scheme as read-only NumPy arrays. Avoid-list
+    variants are masked copies of the base, converted to tuples (igraph
+    consumes tuples faster than ndarrays) and kept in a bounded LRU.
+
+    Schemes are free-form keys so other routing layers (e.g. the MCP
+    security filters) can share the cache with their own builders.
+    """
+
+    def __init__(self, universe: UniverseGraph, maxsize: int = ROUTE_WEIGHT_CACHE_SIZE):
+        self._universe = universe
+        self._maxsize = maxsize
+        self._base: dict[str, NDArray[np.float64]] = {}
+        self._weights: OrderedDict[tuple[str, frozenset[int]], tuple[float, ...]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def base(self, scheme: str, builder: WeightBuilder) -> NDArray[np.float64]:
+        """
+        Get the base weight vector for a scheme, building it on first use.
+
+        Args:
+            scheme: Cache key for the weight scheme
+            builder: Function computing the base vector from the universe
+
+        Returns:
+            Read-only array of edge weights indexed by edge ID
+        """
+        with self._lock:
+            base = self._base.get(scheme)
+            if base is None:
+                base = np.ascontiguousarray(builder(self._universe), dtype=np.float64)
+                base.flags.writeable = False
+                self._base[scheme] = base
+            return base
+
+    def weights(
+        self,
+        scheme: str,
+        builder: WeightBuilder,
+        avoid_systems: Iterable[int] | None = None,
+    ) -> tuple[float, ...]:
+        """
+        Get edge weights for a scheme with avoided systems blocked.
+
+        Edges whose target is an avoided system get WEIGHT_AVOID.
+
+        Args:
+            scheme: Cache key for the weight scheme
+            builder: Function computing the base vector from the universe
+            avoid_systems: Vertex indices to avoid
+
+        Returns:
+            Tuple of edge weights indexed by edge ID
+        """
+        avoid = frozenset(avoid_systems) if avoid_systems else frozenset()
+        key = (scheme, avoid)
+
+        with self._lock:
+            cached = self._weights.get(key)
+            if cached is not None:
+                self._weights.move_to_end(key)
+                return cached
+
+        base = self.base(scheme, builder)
+        if avoid:
+            avoid_arr = np.fromiter(avoid, dtype=np.int64, count=len(avoid))
+            masked = base.copy()
+            masked[np.isin(self._universe.edge_targets, avoid_arr)] = WEIGHT_AVOID
+            result = tuple(masked.tolist())
+        else:
+            result = tuple(base.tolist())
+
+        with self._lock:
+            self._weights[key] = result
+            self._weights.move_to_end(key)
+            while len(self._weights) > self._maxsize:
+                self._weights.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        """Drop all cached weight vectors."""
+        with self._lock:
+            self._base.clear()
+            self._weights.clear()
+
+
+def get_weight_cache(universe: UniverseGraph) -> EdgeWeightCache:
+    """
+    Get the edge weight cache attached to a universe, creating it if needed.
+
+    Args:
+        universe: UniverseGraph owning the cache
+
+    Returns:
+        EdgeWeightCache bound to this universe
+    """
+    cache = universe._weight_cache
+    if not isinstance(cache, EdgeWeightCache):
+        cache = EdgeWeightCache(universe)
+        universe._weight_cache = cache
+    return cache
+
+
+def get_route_weights(
+    universe: UniverseGraph,
+    mode: str,
+    avoid_systems: Iterable[int] | None = None,
+) -> tuple[float, ...] | None:
+    """
+    Get cached edge weights for a routing mode.
+
+    Args:
+        universe: UniverseGraph with security data
+        mode: Routing mode ("shortest", "safe", "unsafe")
+        avoid_systems: Optional vertex indices to avoid
+
+    Returns:
+        Tuple of edge weights indexed by edge ID, or None when the route
+        can use unweighted BFS ("shortest" with nothing to avoid)
+
+    Raises:
+        KeyError: If mode is not a known routing mode
+    """
+    builder = _MODE_BUILDERS[mode]
+    if mode == "shortest" and not avoid_systems:
+        return None
+    return get_weight_cache(universe).weights(mode, builder, avoid_systems)
+
+
+def warm_route_weights(universe: UniverseGraph) -> None:
+    """
+    Build the base weight vector for every routing mode.
+
+    Called after the graph is loaded so the first routed request does not
+    pay for weight construction.
+
+    Args:
+        universe: UniverseGraph to warm
+    """
+    cache = get_weight_cache(universe)
+    for mode, builder in _MODE_BUILDERS.items():
+        cache.weights(mode, builder)
+
+
 # =============================================================================
 # Weight Computation Functions
 # =============================================================================
@@ -69,16 +276,8 @@ def compute_avoid_weights(
     Returns:
         List of edge weights indexed by edge ID
     """
-    g = universe.graph
-    weights = []
-
-    for edge in g.es:
-        if edge.target in avoid_systems:
-            weights.append(WEIGHT_AVOID)
-        else:
-            weights.append(WEIGHT_NORMAL)
-
-    return weights
+    cache = get_weight_cache(universe)
+    return list(cache.weights("shortest", _shortest_base_weights, avoid_systems))
 
 
 def compute_safe_weights(
@@ -102,36 +301,8 @@ def compute_safe_weights(
     Returns:
         List of edge weights indexed by edge ID
     """
-    g = universe.graph
-    security = universe.security
-    avoid = avoid_systems or set()
-    weights = []
-
-    for edge in g.es:
-        dst_idx = edge.target
-
-        # Check avoid list first
-        if dst_idx in avoid:
-            weights.append(WEIGHT_AVOID)
-            continue
-
-        src_sec = security[edge.source]
-        dst_sec = security[dst_idx]
-
-        if dst_sec >= HIGHSEC_THRESHOLD:
-            # Destination is high-sec
-            weights.append(WEIGHT_NORMAL)
-        elif dst_sec > LOWSEC_THRESHOLD:
-            # Destination is low-sec
-            if src_sec >= HIGHSEC_THRESHOLD:
-                weights.append(WEIGHT_LOWSEC_ENTRY)  # Entering low-sec penalty
-            else:
-                weights.append(WEIGHT_LOWSEC_STAY)  # Staying in low-sec
-        else:
-            # Destination is null-sec
-            weights.append(WEIGHT_NULLSEC)
-
-    return weights
+    cache = get_weight_cache(universe)
+    return list(cache.weights("safe", _safe_base_weights, avoid_systems))
 
 
 def compute_unsafe_weights(
@@ -154,26 +325,5 @@ def compute_unsafe_weights(
     Returns:
         List of edge weights indexed by edge ID
     """
-    g = universe.graph
-    security = universe.security
-    avoid = avoid_systems or set()
-    weights = []
-
-    for edge in g.es:
-        dst_idx = edge.target
-
-        # Check avoid list first
-        if dst_idx in avoid:
-            weights.append(WEIGHT_AVOID)
-            continue
-
-        dst_sec = security[dst_idx]
-
-        if dst_sec <= LOWSEC_THRESHOLD:
-            weights.append(WEIGHT_UNSAFE_NULLSEC)  # Prefer null-sec
-        elif dst_sec < HIGHSEC_THRESHOLD:
-            weights.append(WEIGHT_UNSAFE_LOWSEC)  # Low-sec acceptable
-        else:
-            weights.append(WEIGHT_UNSAFE_HIGHSEC)  # Avoid high-sec
-
-    return weights
+    cache = get_weight_cache(universe)
+    return list(cache.weights("unsafe", _unsafe_base_weights, avoid_systems))
@@ -7,8 +7,11 @@ Uses the shared ARIA database (aria.db).
 
 from __future__ import annotations
 
+import queue
 import sqlite3
+import threading
 import time
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -97,21 +100,7 @@ class RealtimeKillsDatabase:
             kill: ProcessedKill to save
             entity_match: Optional entity match result for watched entity tracking
         """
-        import json
-
         conn = self._get_connection()
-
-        # Build base row
-        row = kill.to_db_row()
-
-        # Add entity match data
-        watched_match = 1 if (entity_match and entity_match.has_match) else 0
-        watched_ids = (
-            json.dumps(entity_match.all_matched_ids)
-            if (entity_match and entity_match.has_match)
-            else None
-        )
-
         conn.execute(
             """
             INSERT OR REPLACE INTO realtime_kills (
@@ -122,22 +111,29 @@ class RealtimeKillsDatabase:
                 watched_entity_match, watched_entity_ids
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
-            row + (watched_match, watched_ids),
+            kill.to_db_row() + _entity_columns(entity_match),
         )
         conn.commit()
 
-    def save_kills_batch(self, kills: list[ProcessedKill]) -> int:
+    def save_kills_batch(
+        self,
+        kills: list[ProcessedKill],
+        entity_matches: list[EntityMatchResult | None] | None = None,
+    ) -> int:
         """
         Save multiple kills in a transaction.
 
         Args:
             kills: List of ProcessedKill objects
+            entity_matches: Optional entity match results, parallel to kills
 
         Returns:
             Number of rows inserted
         """
         if not kills:
             return 0
+        if entity_matches is None:
+            entity_matches = [None] * len(kills)
 
         conn = self._get_connection()
         cursor = conn.executemany(
@@ -146,10 +142,14 @@ class RealtimeKillsDatabase:
                 kill_id, kill_time, solar_system_id, victim_ship_type_id,
                 victim_corporation_id, victim_alliance_id, attacker_count,
                 attacker_corps, attacker_alliances, attacker_ship_types,
-                final_blow_ship_type_id, total_value, is_pod_kill
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                final_blow_ship_type_id, total_value, is_pod_kill,
+                watched_entity_match, watched_entity_ids
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
-            [k.to_db_row() for k in kills],
+            [
+                k.to_db_row() + _entity_columns(match)
+                for k, match in zip(kills, entity_matches, strict=True)
+            ],
         )
         conn.commit()
         return cursor.rowcount
@@ -219,6 +219,34 @@ class RealtimeKillsDatabase:
 
         return [ProcessedKill.from_db_row(row) for row in rows]
 
+    def get_kills_since(self, since_minutes: int = 1440) -> list[tuple[ProcessedKill, bool]]:
+        """
+        Get all kills within a window with their watched-entity flag.
+
+        Used to bootstrap in-memory indexes; unlike get_recent_kills
+        there is no row limit.
+
+        Args:
+            since_minutes: How far back to look
+
+        Returns:
+            List of (ProcessedKill, is_watched_entity_kill), oldest first
+        """
+        from .models import ProcessedKill
+
+        conn = self._get_connection()
+        cutoff = int(time.time()) - (since_minutes * 60)
+        rows = conn.execute(
+            """
+            SELECT * FROM realtime_kills
+            WHERE kill_time > ?
+            ORDER BY kill_time ASC
+            """,
+            (cutoff,),
+        ).fetchall()
+
+        return [(ProcessedKill.from_db_row(row), bool(row["watched_entity_match"])) for row in rows]
+
     def get_kills_in_systems(
         self,
         system_ids: list[int],
@@ -287,6 +315,23 @@ class RealtimeKillsDatabase:
         ).fetchone()
         return row is not None
 
+    def get_recent_kill_ids(self, limit: int = 10000) -> list[int]:
+        """
+        Get IDs of the most recently stored kills.
+
+        Args:
+            limit: Maximum IDs to return
+
+        Returns:
+            Kill IDs, newest first
+        """
+        conn = self._get_connection()
+        rows = conn.execute(
+            "SELECT kill_id FROM realtime_kills ORDER BY kill_time DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+        return [row[0] for row in rows]
+
     def cleanup_old_kills(self, retention_hours: int = 24) -> int:
         """
         Remove kills older than retention period.
@@ -524,6 +569,250 @@ class RealtimeKillsDatabase:
         }
 
 
+def _entity_columns(entity_match: EntityMatchResult | None) -> tuple[int, str | None]:
+    """Build the watched_entity_match/watched_entity_ids column values."""
+    import json
+
+    if entity_match and entity_match.has_match:
+        return 1, json.dumps(entity_match.all_matched_ids)
+    return 0, None
+
+
+# =============================================================================
+# Recent Kill IDs
+# =============================================================================
+
+
+class RecentKillIds:
+    """
+    Bounded LRU set of recently saved kill IDs.
+
+    Lets the poller skip RedisQ duplicates of kills already in
+    realtime_kills without a database round trip per package. Oldest IDs are evicted once capacity is reached,
+    so a very late duplicate may be fetched again, which is harmless
+    because saves are INSERT OR REPLACE.
+    """
+
+    def __init__(self, capacity: int = 10000):
+        self.capacity = capacity
+        self._ids: OrderedDict[int, None] = OrderedDict()
+
+    def __contains__(self, kill_id: object) -> bool:
+        return kill_id in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, kill_id: int) -> None:
+        """Record a kill ID, evicting the oldest if over capacity."""
+        self._ids[kill_id] = None
+        self._ids.move_to_end(kill_id)
+        while len(self._ids) > self.capacity:
+            self._ids.popitem(last=False)
+
+    def update(self, kill_ids: list[int]) -> None:
+        """Record kill IDs given oldest first."""
+        for kill_id in kill_ids:
+            self.add(kill_id)
+
+
+# =============================================================================
+# Background Writer
+# =============================================================================
+
+
+class _FlushMarker:
+    """Queue entry signalling that everything before it has been written."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+
+
+class RealtimeKillWriter:
+    """
+    Writes processed kills to realtime_kills from a dedicated thread.
+
+    Kills submitted from the event loop are queued without blocking and
+    committed in batches through save_kills_batch, either every
+    flush_interval_ms or once max_batch kills are waiting. The thread
+    owns its own connection, so it never contends with the event loop's
+    connection for a cursor.
+
+    Usage:
+        writer = RealtimeKillWriter(db.db_path)
+        writer.start()
+        writer.submit(kill, entity_match)
+        writer.flush()  # Block until submitted kills are committed
+        writer.stop()
+    """
+
+    def __init__(
+        self,
+        db_path: Path | str,
+        flush_interval_ms: int = 250,
+        max_batch: int = 200,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            db_path: Path to the SQLite database holding realtime_kills
+            flush_interval_ms: Maximum time a kill waits before commit
+            max_batch: Kills per commit before flushing early
+        """
+        self.db_path = Path(db_path)
+        self.flush_interval_ms = flush_interval_ms
+        self.max_batch = max_batch
+
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._kills_written = 0
+        self._batches_written = 0
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the writer thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def kills_written(self) -> int:
+        """Total kills committed by the writer."""
+        return self._kills_written
+
+    @property
+    def batches_written(self) -> int:
+        """Total commits made by the writer."""
+        return self._batches_written
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        if self.is_running:
+            return
+        self._thread = threading.Thread(target=self._run, name="realtime-kill-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Flush pending kills and stop the writer thread.
+
+        Blocking; call via asyncio.to_thread from async code.
+
+        Args:
+            timeout: Maximum time to wait for the thread to finish
+        """
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning("Realtime kill writer did not stop within %.1fs", timeout)
+        self._thread = None
+
+    def submit(
+        self,
+        kill: ProcessedKill,
+        entity_match: EntityMatchResult | None = None,
+    ) -> None:
+        """
+        Queue a kill for writing. Never blocks.
+
+        Args:
+            kill: ProcessedKill to save
+            entity_match: Optional entity match result for watched entity tracking
+        """
+        self._queue.put((kill, entity_match))
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """
+        Wait until every kill submitted so far is committed.
+
+        Blocking; call via asyncio.to_thread from async code.
+
+        Args:
+            timeout: Maximum time to wait
+
+        Returns:
+            True if the flush completed, False on timeout or if not running
+        """
+        if not self.is_running:
+            return False
+        marker = _FlushMarker()
+        self._queue.put(marker)
+        return marker.done.wait(timeout)
+
+    def _run(self) -> None:
+        """Writer thread main loop."""
+        db = RealtimeKillsDatabase(self.db_path, ensure_schema=False)
+        interval = self.flush_interval_ms / 1000
+        stopping = False
+
+        try:
+            while not stopping:
+                kills: list[ProcessedKill] = []
+                matches: list[EntityMatchResult | None] = []
+                markers: list[_FlushMarker] = []
+
+                # Block for the first entry, then collect until the deadline
+                item = self._queue.get()
+                deadline = time.monotonic() + interval
+                while True:
+                    if item is None:
+                        stopping = True
+                    elif isinstance(item, _FlushMarker):
+                        markers.append(item)
+                    else:
+                        kills.append(item[0])
+                        matches.append(item[1])
+
+                    if stopping or markers or len(kills) >= self.max_batch:
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = self._queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+
+                # Pick up anything already queued behind a marker or sentinel
+                while stopping or markers:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        stopping = True
+                    elif isinstance(item, _FlushMarker):
+                        markers.append(item)
+                    else:
+                        kills.append(item[0])
+                        matches.append(item[1])
+
+                self._write(db, kills, matches)
+                for marker in markers:
+                    marker.done.set()
+        finally:
+            db.close()
+
+    def _write(
+        self,
+        db: RealtimeKillsDatabase,
+        kills: list[ProcessedKill],
+        matches: list[EntityMatchResult | None],
+    ) -> None:
+        """Commit one batch, logging rather than raising on failure."""
+        if not kills:
+            return
+        try:
+            db.save_kills_batch(kills, matches)
+        except Exception as e:
+            logger.warning("Failed to write %d realtime kills: %s", len(kills), e)
+            return
+        self._kills_written += len(kills)
+        self._batches_written += 1
+        logger.debug("Wrote %d realtime kills", len(kills))
+
+
 # =============================================================================
 # Module-level singleton
 # =============================================================================
@@ -3,11 +3,14 @@ Kill Fetch Queue.
 
 Rate-limited queue for fetching full killmail data from ESI.
 RedisQ only provides kill ID and hash; full data must be fetched separately.
+A fixed pool of workers streams kills from a priority queue, sharing the
+process-wide ESI token bucket.
 """
 
 from __future__ import annotations
 
 import asyncio
+import itertools
 import time
 from collections import deque
 from collections.abc import Callable
@@ -17,8 +20,10 @@ from typing import TYPE_CHECKING, Any
 import httpx
 
 from ...core.logging import get_logger
+from ...core.rate_limit import get_esi_rate_limiter
 
 if TYPE_CHECKING:
+    from ...core.rate_limit import TokenBucket
     from .models import ProcessedKill, QueuedKill
 
 logger = get_logger(__name__)
@@ -93,50 +98,103 @@ async def fetch_killmail(
         )
 
 
+# Priority lanes (lower is served first)
+FETCH_PRIORITY_HIGH = 0
+FETCH_PRIORITY_NORMAL = 1
+
+# Latency samples kept per stage for percentile reporting
+LATENCY_SAMPLE_SIZE = 1000
+
+
+@dataclass
+class StageLatency:
+    """Rolling latency samples for one stage of the fetch pipeline."""
+
+    samples: deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_SAMPLE_SIZE))
+    count: int = 0
+
+    def record(self, seconds: float) -> None:
+        """Record one sample."""
+        self.samples.append(seconds)
+        self.count += 1
+
+    def percentiles(self) -> dict[str, float | int | None]:
+        """Get p50/p95/p99 in milliseconds over the retained samples."""
+        if not self.samples:
+            return {"count": self.count, "p50_ms": None, "p95_ms": None, "p99_ms": None}
+        ordered = sorted(self.samples)
+        last = len(ordered) - 1
+
+        def pct(p: float) -> float:
+            return round(ordered[min(last, int(p * len(ordered)))] * 1000, 2)
+
+        return {
+            "count": self.count,
+            "p50_ms": pct(0.50),
+            "p95_ms": pct(0.95),
+            "p99_ms": pct(0.99),
+        }
+
+
 @dataclass
 class KillFetchQueue:
     """
     Rate-limited queue for fetching killmails from ESI.
 
-    Manages concurrent requests and respects ESI rate limits.
+    MAX_CONCURRENT_FETCHES worker tasks pull from a priority queue and
+    fetch independently, so one slow ESI response only occupies its own
+    worker. Every request draws from the shared ESI token bucket.
+    Kills enqueued with FETCH_PRIORITY_HIGH are served before normal
+    kills; within a lane order is FIFO.
     """
 
     # Rate limiting settings
     MAX_CONCURRENT_FETCHES: int = 5
-    FETCH_RATE_LIMIT: int = 20  # requests per second
     MAX_QUEUE_SIZE: int = 1000
 
-    # Queue state
-    _queue: deque[QueuedKill] = field(default_factory=deque)
+    # Queue state: (priority, sequence, enqueued_at, kill)
+    _queue: asyncio.PriorityQueue[tuple[int, int, float, QueuedKill]] = field(
+        default_factory=asyncio.PriorityQueue
+    )
+    _sequence: itertools.count = field(default_factory=itertools.count)
     _processing: bool = False
     _client: httpx.AsyncClient | None = None
-    _task: asyncio.Task | None = None
+    _workers: list[asyncio.Task] = field(default_factory=list)
 
-    # Rate limiting state
-    _request_times: deque[float] = field(default_factory=deque)
+    # Rate limiting state (defaults to the shared ESI limiter on start)
+    _rate_limiter: TokenBucket | None = None
 
     # Metrics
     _fetched_count: int = 0
     _error_count: int = 0
+    _high_priority_count: int = 0
+    _latency: dict[str, StageLatency] = field(
+        default_factory=lambda: {
+            stage: StageLatency() for stage in ("queue_wait", "rate_limit", "fetch", "process")
+        }
+    )
 
     # Callback for processed kills
     _on_kill_processed: Callable[[ProcessedKill], None] | None = None
 
-    async def enqueue(self, kill: QueuedKill) -> bool:
+    async def enqueue(self, kill: QueuedKill, priority: int = FETCH_PRIORITY_NORMAL) -> bool:
         """
         Add a kill to the fetch queue.
 
         Args:
             kill: QueuedKill from RedisQ
+            priority: FETCH_PRIORITY_HIGH to jump ahead of normal kills
 
         Returns:
             True if queued, False if queue is full
         """
-        if len(self._queue) >= self.MAX_QUEUE_SIZE:
+        if self._queue.qsize() >= self.MAX_QUEUE_SIZE:
             logger.warning("Fetch queue full, dropping kill %d", kill.kill_id)
             return False
 
-        self._queue.append(kill)
+        self._queue.put_nowait((priority, next(self._sequence), time.monotonic(), kill))
+        if priority == FETCH_PRIORITY_HIGH:
+            self._high_priority_count += 1
         return True
 
     async def start_processing(
@@ -154,6 +212,8 @@ class KillFetchQueue:
 
         self._processing = True
         self._on_kill_processed = on_kill_processed
+        if self._rate_limiter is None:
+            self._rate_limiter = get_esi_rate_limiter()
 
         # Create HTTP client with connection pooling
         self._client = httpx.AsyncClient(
@@ -167,21 +227,21 @@ class KillFetchQueue:
             },
         )
 
-        # Start processing task
-        self._task = asyncio.create_task(self._process_loop())
-        logger.info("Kill fetch queue started")
+        # Start worker tasks
+        self._workers = [
+            asyncio.create_task(self._worker_loop()) for _ in range(self.MAX_CONCURRENT_FETCHES)
+        ]
+        logger.info("Kill fetch queue started (%d workers)", len(self._workers))
 
     async def stop_processing(self) -> None:
         """Stop processing and clean up."""
         self._processing = False
 
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
-            self._task = None
+        for task in self._workers:
+            task.cancel()
+        if self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
 
         if self._client:
             await self._client.aclose()
@@ -193,10 +253,14 @@ class KillFetchQueue:
             self._error_count,
         )
 
+    async def join(self) -> None:
+        """Wait until every queued kill has been handled."""
+        await self._queue.join()
+
     @property
     def backlog_size(self) -> int:
         """Get current queue size."""
-        return len(self._queue)
+        return self._queue.qsize()
 
     @property
     def fetched_count(self) -> int:
@@ -208,84 +272,67 @@ class KillFetchQueue:
         """Get total error count."""
         return self._error_count
 
-    async def _process_loop(self) -> None:
-        """Main processing loop."""
+    async def _worker_loop(self) -> None:
+        """Pull kills from the queue and fetch them one at a time."""
+        while self._processing:
+            _, _, enqueued_at, kill = await self._queue.get()
+            try:
+                await self._fetch_one(kill, enqueued_at)
+            except Exception as e:
+                logger.warning("Fetch exception for %d: %s", kill.kill_id, e)
+                self._error_count += 1
+            finally:
+                self._queue.task_done()
+
+    async def _fetch_one(self, kill: QueuedKill, enqueued_at: float) -> None:
+        """Fetch, parse and hand off a single kill, recording stage latencies."""
         from .processor import parse_esi_killmail
 
-        assert self._client is not None, "_process_loop called without initialized client"
+        assert self._client is not None, "_fetch_one called without initialized client"
 
-        while self._processing:
-            if not self._queue:
-                await asyncio.sleep(0.1)
-                continue
-
-            # Check rate limit
-            await self._wait_for_rate_limit()
-
-            # Get batch of kills to fetch
-            batch_size = min(self.MAX_CONCURRENT_FETCHES, len(self._queue))
-            batch = [self._queue.popleft() for _ in range(batch_size)]
-
-            # Fetch in parallel
-            tasks = [fetch_killmail(self._client, kill.kill_id, kill.hash) for kill in batch]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Process results
-            for kill, result in zip(batch, results):
-                if isinstance(result, BaseException):
-                    logger.warning("Fetch exception for %d: %s", kill.kill_id, result)
-                    self._error_count += 1
-                    continue
-
-                if result.success and result.esi_data:
-                    try:
-                        processed = parse_esi_killmail(
-                            result.esi_data,
-                            kill.zkb_data,
-                        )
-                        self._fetched_count += 1
-
-                        if self._on_kill_processed:
-                            self._on_kill_processed(processed)
-
-                    except Exception as e:
-                        logger.warning("Parse error for %d: %s", kill.kill_id, e)
-                        self._error_count += 1
-                else:
-                    logger.debug("Fetch failed for %d: %s", kill.kill_id, result.error)
-                    self._error_count += 1
-
-            # Record request times for rate limiting
-            now = time.monotonic()
-            for _ in range(len(batch)):
-                self._request_times.append(now)
-
-    async def _wait_for_rate_limit(self) -> None:
-        """Wait if rate limit would be exceeded."""
-        now = time.monotonic()
-
-        # Remove old request times (older than 1 second)
-        while self._request_times and now - self._request_times[0] > 1.0:
-            self._request_times.popleft()
-
-        # Wait if at rate limit
-        if len(self._request_times) >= self.FETCH_RATE_LIMIT:
-            wait_time = 1.0 - (now - self._request_times[0])
-            if wait_time > 0:
-                await asyncio.sleep(wait_time)
+        started = time.monotonic()
+        self._latency["queue_wait"].record(started - enqueued_at)
+
+        if self._rate_limiter is not None:
+            self._latency["rate_limit"].record(await self._rate_limiter.acquire())
+
+        fetch_started = time.monotonic()
+        result = await fetch_killmail(self._client, kill.kill_id, kill.hash)
+        fetch_done = time.monotonic()
+        self._latency["fetch"].record(fetch_done - fetch_started)
+
+        if not (result.success and result.esi_data):
+            logger.debug("Fetch failed for %d: %s", kill.kill_id, result.error)
+            self._error_count += 1
+            return
+
+        try:
+            processed = parse_esi_killmail(result.esi_data, kill.zkb_data)
+            self._fetched_count += 1
+
+            if self._on_kill_processed:
+                self._on_kill_processed(processed)
+        except Exception as e:
+            logger.warning("Parse error for %d: %s", kill.kill_id, e)
+            self._error_count += 1
+        finally:
+            self._latency["process"].record(time.monotonic() - fetch_done)
 
     def get_stats(self) -> dict:
         """
         Get queue statistics.
 
         Returns:
-            Dict with queue metrics
+            Dict with queue metrics and per-stage latency percentiles
         """
         return {
             "queue_size": self.backlog_size,
             "fetched_count": self._fetched_count,
             "error_count": self._error_count,
+            "high_priority_count": self._high_priority_count,
+            "workers": len(self._workers),
             "processing": self._processing,
+            "latency": {stage: lat.percentiles() for stage, lat in self._latency.items()},
         }
 
 
@@ -4,6 +4,11 @@ Geographic Interest Layer.
 Calculates interest based on distance from operational systems.
 Supports system classification (home/hunting/transit) with different
 expansion radii and decay weights.
+
+Expansion is a single multi-source BFS over the universe graph: every
+operational system is walked at once, one NumPy step per hop. The result
+is kept as a dense interest array indexed by universe vertex, alongside
+the per-system detail map used for scoring reasons and serialization.
 """
 
 from __future__ import annotations
@@ -12,11 +17,15 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
 from .....core.logging import get_logger
 from ..models import LayerScore
 from .base import BaseLayer
 
 if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
     from .....universe.graph import UniverseGraph
 
 logger = get_logger(__name__)
@@ -174,6 +183,10 @@ class GeographicLayer(BaseLayer):
     - transit: 1 hop (passing through)
 
     Interest scores decay with distance based on classification weights.
+
+    Layers built from a graph also carry vertex_interest, a dense array
+    over every universe vertex (0.0 for untracked systems), so callers
+    holding the same graph can read interest with array indexing.
     """
 
     _name: str = "geographic"
@@ -184,6 +197,11 @@ class GeographicLayer(BaseLayer):
     # Configuration used to build this layer
     config: GeographicConfig = field(default_factory=GeographicConfig)
 
+    # Interest per universe vertex (None when not built from a graph)
+    _vertex_interest: NDArray[np.float64] | None = field(default=None, repr=False)
+
+    _system_ids: list[int] | None = field(default=None, init=False, repr=False)
+
     @property
     def name(self) -> str:
         return self._name
@@ -193,6 +211,22 @@ class GeographicLayer(BaseLayer):
         """Total number of systems in the interest map."""
         return len(self._interest_map)
 
+    @property
+    def vertex_interest(self) -> NDArray[np.float64] | None:
+        """Read-only interest array indexed by universe vertex, if built from a graph."""
+        return self._vertex_interest
+
+    @property
+    def system_ids(self) -> list[int]:
+        """
+        Tracked system IDs in ascending order.
+
+        Computed once per layer and shared; treat as read-only.
+        """
+        if self._system_ids is None:
+            self._system_ids = sorted(self._interest_map)
+        return self._system_ids
+
     def score_system(self, system_id: int) -> LayerScore:
         """
         Score a system based on geographic proximity.
@@ -249,8 +283,8 @@ class GeographicLayer(BaseLayer):
         """
         Build geographic layer from configuration.
 
-        Performs BFS expansion from each operational system based on
-        its classification.
+        Expands all operational systems in one multi-source BFS, each
+        to the depth of its classification.
 
         Args:
             config: Geographic configuration
@@ -259,27 +293,28 @@ class GeographicLayer(BaseLayer):
         Returns:
             Configured GeographicLayer with pre-computed interest map
         """
-        interest_map: dict[int, tuple[float, str, str | None]] = {}
-
+        sources: list[tuple[int, GeographicSystem]] = []
         for geo_sys in config.systems:
             # Resolve system name to vertex index
             idx = graph.resolve_name(geo_sys.name)
             if idx is None:
                 logger.warning("Unknown system in geographic config: %s", geo_sys.name)
                 continue
+            sources.append((idx, geo_sys))
 
-            weights = config.get_weights(geo_sys.classification)
-            max_hops = config.get_max_hops(geo_sys.classification)
+        vertex_interest, vertices, source_of, parent_of = cls._expand_from_systems(
+            graph, sources, config
+        )
 
-            # BFS expansion
-            cls._expand_from_system(
-                interest_map=interest_map,
-                graph=graph,
-                start_idx=idx,
-                start_name=geo_sys.name,
-                classification=geo_sys.classification.value,
-                weights=weights,
-                max_hops=max_hops,
+        interest_map: dict[int, tuple[float, str, str | None]] = {}
+        for idx, source, parent in zip(
+            vertices.tolist(), source_of.tolist(), parent_of.tolist(), strict=True
+        ):
+            from_system = graph.idx_to_name.get(parent) if parent >= 0 else None
+            interest_map[graph.get_system_id(idx)] = (
+                float(vertex_interest[idx]),
+                sources[source][1].classification.value,
+                from_system,
             )
 
         logger.info(
@@ -288,7 +323,7 @@ class GeographicLayer(BaseLayer):
             len(config.systems),
         )
 
-        return cls(_interest_map=interest_map, config=config)
+        return cls(_interest_map=interest_map, config=config, _vertex_interest=vertex_interest)
 
     @classmethod
     def from_legacy_config(
@@ -317,59 +352,105 @@ class GeographicLayer(BaseLayer):
         return cls.from_config(config, graph)
 
     @staticmethod
-    def _expand_from_system(
-        interest_map: dict[int, tuple[float, str, str | None]],
+    def _expand_from_systems(
         graph: UniverseGraph,
-        start_idx: int,
-        start_name: str,
-        classification: str,
-        weights: dict[int, float],
-        max_hops: int,
-    ) -> None:
-        """
-        BFS expansion from a single system.
-
-        Updates interest_map in place. If a system already has higher
-        interest from another source, it's preserved.
+        sources: list[tuple[int, GeographicSystem]],
+        config: GeographicConfig,
+    ) -> tuple[NDArray[np.float64], NDArray[np.int64], NDArray[np.int64], NDArray[np.int64]]:
         """
-        # BFS queue: (vertex_idx, hop_level, from_system_name)
-        from collections import deque
-
-        visited: set[int] = set()
-        queue: deque[tuple[int, int, str | None]] = deque()
-
-        # Start with the operational system itself
-        queue.append((start_idx, 0, None))
+        Multi-source BFS from all operational systems at once.
 
-        while queue:
-            idx, hop_level, from_system = queue.popleft()
+        The search state is (source, vertex), so each source keeps its own
+        hop counts and weights while every hop is one frontier expansion
+        through UniverseGraph.neighbor_table. A source stops expanding at
+        its max hops or at the first hop without a weight.
 
-            if idx in visited:
-                continue
-            if hop_level > max_hops:
-                continue
-            if hop_level not in weights:
-                continue
+        Each reached system takes the highest weight over all sources;
+        ties go to the source listed first. The predecessor recorded for a
+        system is its lowest-indexed neighbor one hop closer to the
+        winning source, not the first one in BFS discovery order.
 
-            visited.add(idx)
-
-            system_id = graph.get_system_id(idx)
-            interest = weights[hop_level]
-
-            # Only update if this is higher interest than existing
-            existing = interest_map.get(system_id)
-            if existing is None or existing[0] < interest:
-                # For hop 0, from_system is None (it IS the operational system)
-                # For hop 1+, from_system is the previous system name
-                actual_from = from_system if hop_level > 0 else None
-                interest_map[system_id] = (interest, classification, actual_from)
-
-            # Queue neighbors for next hop
-            if hop_level < max_hops:
-                current_name = graph.idx_to_name.get(idx, start_name)
-                for neighbor_idx in graph.graph.neighbors(idx):
-                    if neighbor_idx not in visited:
-                        queue.append((neighbor_idx, hop_level + 1, current_name))
+        Returns:
+            Tuple of (interest per vertex, tracked vertices ascending,
+            winning source per tracked vertex, predecessor vertex per
+            tracked vertex or -1 for operational systems)
+        """
+        n = graph.system_count
+        vertex_interest = np.zeros(n, dtype=np.float64)
+        empty = np.empty(0, dtype=np.int64)
+        if not sources:
+            vertex_interest.flags.writeable = False
+            return vertex_interest, empty, empty.copy(), empty.copy()
+
+        # hop_weights[s, h]: weight of source s at hop h (NaN past its reach)
+        reach = []
+        for _, geo_sys in sources:
+            weights = config.get_weights(geo_sys.classification)
+            max_hops = config.get_max_hops(geo_sys.classification)
+            weights_by_hop = []
+            for hop in range(max_hops + 1):
+                if hop not in weights:
+                    break
+                weights_by_hop.append(weights[hop])
+            reach.append(weights_by_hop)
+        hop_weights = np.full((len(sources), max(map(len, reach)) + 1), np.nan)
+        for row, weights_by_hop in enumerate(reach):
+            hop_weights[row, : len(weights_by_hop)] = weights_by_hop
+
+        # Flattened (source, vertex) state; column n is the neighbor_table padding
+        table = graph.neighbor_table
+        width = n + 1
+        seen = np.zeros(len(sources) * width, dtype=np.bool_)
+        seen[np.arange(len(sources)) * width + n] = True
+
+        src = np.arange(len(sources), dtype=np.int64)
+        vert = np.array([idx for idx, _ in sources], dtype=np.int64)
+        parent = np.full(len(sources), -1, dtype=np.int64)
+        hop = 0
+        found_src, found_vert, found_parent, found_interest = [], [], [], []
+
+        while src.size:
+            interest = hop_weights[src, hop]
+            active = ~np.isnan(interest)
+            src, vert, parent, interest = (
+                src[active],
+                vert[active],
+                parent[active],
+                interest[active],
+            )
+            if not src.size:
+                break
+            seen[src * width + vert] = True
+            found_src.append(src)
+            found_vert.append(vert)
+            found_parent.append(parent)
+            found_interest.append(interest)
+
+            # Expand every (source, vertex) in the frontier by one hop
+            neighbors = table[vert]
+            next_src = np.repeat(src, neighbors.shape[1])
+            next_parent = np.repeat(vert, neighbors.shape[1])
+            keys = next_src * width + neighbors.ravel()
+            fresh = ~seen[keys]
+            # First occurrence wins; frontiers are ordered by (source, vertex)
+            keys, first = np.unique(keys[fresh], return_index=True)
+            src, vert = np.divmod(keys, width)
+            parent = next_parent[fresh][first]
+            hop += 1
+
+        all_src = np.concatenate(found_src)
+        all_vert = np.concatenate(found_vert)
+        all_parent = np.concatenate(found_parent)
+        all_interest = np.concatenate(found_interest)
+
+        # Best (interest desc, source asc) per vertex
+        order = np.lexsort((all_src, -all_interest, all_vert))
+        tracked, first = np.unique(all_vert[order], return_index=True)
+        best = order[first]
+
+        vertex_interest[tracked] = all_interest[best]
+        vertex_interest.flags.writeable = False
+        return vertex_interest, tracked, all_src[best], all_parent[best]
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize to dictionary for caching."""
@@ -190,6 +190,46 @@ def calculate_prefetch_bounds(
     return prefetch_score, lower_bound, upper_bound
 
 
+def calculate_score_upper_bound(
+    category_scores: dict[str, CategoryScore],
+    pending_weight: float,
+    mode: AggregationMode = AggregationMode.WEIGHTED,
+) -> float:
+    """
+    Calculate the highest final score reachable from a partial scoring.
+
+    The post-fetch counterpart of the upper bound in calculate_prefetch_bounds:
+    scored categories contribute their actual score and categories still to be
+    scored are assumed to score 1.0. Unlike the prefetch bound it follows the
+    aggregation mode, since RMS can exceed the linear average.
+
+    Args:
+        category_scores: Dict of category -> CategoryScore scored so far
+        pending_weight: Total weight of enabled categories not yet scored
+        mode: Aggregation mode
+
+    Returns:
+        Upper bound on the final interest score in [0, 1]
+    """
+    active = [c for c in category_scores.values() if c.is_configured and c.is_enabled]
+
+    if mode == AggregationMode.MAX:
+        if pending_weight > 0:
+            return 1.0
+        return aggregate_max(active) if active else 0.0
+
+    total_weight = sum(c.weight for c in active) + pending_weight
+    if total_weight <= 0:
+        return 0.0
+
+    if mode == AggregationMode.LINEAR:
+        known_sum = sum(c.weight * c.penalized_score for c in active)
+        return min(1.0, (known_sum + pending_weight) / total_weight)
+
+    known_sum = sum(c.weight * c.penalized_score**2 for c in active)
+    return min(1.0, math.sqrt((known_sum + pending_weight) / total_weight))
+
+
 def compare_aggregation_modes(
     category_scores: dict[str, CategoryScore],
 ) -> dict[str, float]:
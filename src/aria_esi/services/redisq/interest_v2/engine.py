@@ -8,9 +8,10 @@ to produce a final interest result for notification filtering.
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
-from .aggregation import aggregate_scores
+from .aggregation import aggregate_scores, calculate_score_upper_bound
 from .config import InterestConfigV2
 from .models import (
     CANONICAL_CATEGORIES,
@@ -28,6 +29,34 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Margin keeping float rounding from short-circuiting a kill that lands exactly
+# on the notify threshold
+_BOUND_EPSILON = 1e-9
+
+
+@dataclass(frozen=True)
+class CompiledSignal:
+    """A signal provider with its configuration resolved at engine construction."""
+
+    name: str
+    provider: SignalProvider
+    config: dict[str, Any]  # Engine context merged with signal config
+    prefetch_capable: bool
+
+
+@dataclass(frozen=True)
+class CompiledCategory:
+    """An enabled category and the signals that score it."""
+
+    category: str
+    weight: float
+    signals: tuple[CompiledSignal, ...]  # Prefetch-capable signals first
+
+    @property
+    def prefetch_capable(self) -> bool:
+        """Check if every signal in the category is prefetch-capable."""
+        return all(s.prefetch_capable for s in self.signals)
+
 
 class InterestEngineV2:
     """
@@ -64,17 +93,23 @@ class InterestEngineV2:
         # Resolve effective weights (from preset + customize or explicit)
         self._weights = self._resolve_weights()
 
-        # Cache signal providers
-        self._signal_providers: dict[str, dict[str, SignalProvider]] = {}
+        # Providers, configs and scoring order resolved once per engine
+        self._plan = self._compile_plan()
 
         # Lazy-initialized prefetch scorer
         self._prefetch_scorer: PrefetchScorer | None = None
 
+    @property
+    def plan(self) -> tuple[CompiledCategory, ...]:
+        """Compiled scoring plan, in scoring order."""
+        return self._plan
+
     def calculate_interest(
         self,
         kill: ProcessedKill | None,
         system_id: int,
         is_prefetch: bool = False,
+        notify_only: bool = False,
     ) -> InterestResultV2:
         """
         Calculate interest score for a kill.
@@ -83,6 +118,9 @@ class InterestEngineV2:
             kill: ProcessedKill with full data, or None for prefetch
             system_id: Solar system ID
             is_prefetch: Whether this is a prefetch evaluation
+            notify_only: Stop scoring once the notify threshold is out of
+                reach. The result is then LOG_ONLY with score_upper_bound
+                set and a partial category breakdown.
 
         Returns:
             InterestResultV2 with complete scoring breakdown
@@ -112,9 +150,18 @@ class InterestEngineV2:
         always_notify = any(m.matched for m in notify_matches)
 
         # Step 3: Score all configured categories
-        category_scores = self._score_categories(kill, system_id)
+        stop_below = None
+        if notify_only and not always_notify:
+            stop_below = self._config.thresholds.notify
+        category_scores, upper_bound = self._score_categories(kill, system_id, stop_below)
         result.category_scores = category_scores
 
+        if upper_bound is not None:
+            # Notify is out of reach; the exact sub-notify tier is not needed
+            result.tier = NotificationTier.LOG_ONLY
+            result.score_upper_bound = upper_bound
+            return result
+
         # Step 4: Evaluate gates (if not bypassed by always_notify)
         if not always_notify:
             all_passed, any_passed, reason = self._rule_evaluator.evaluate_gates(category_scores)
@@ -231,116 +278,144 @@ class InterestEngineV2:
 
         return weights
 
-    def _score_categories(
-        self,
-        kill: ProcessedKill | None,
-        system_id: int,
-    ) -> dict[str, CategoryScore]:
+    def _compile_plan(self) -> tuple[CompiledCategory, ...]:
         """
-        Score all configured categories.
+        Resolve providers and configs for every enabled category.
 
-        Args:
-            kill: ProcessedKill or None
-            system_id: Solar system ID
+        Zero-weight categories and categories without registered signals are
+        dropped. Signal configs are merged with the engine context here rather
+        than per kill. Categories that score entirely from RedisQ data come
+        first, so an early exit skips the expensive post-fetch signals.
 
         Returns:
-            Dict of category name -> CategoryScore
+            Compiled categories in scoring order
         """
         from .providers.registry import get_provider_registry
 
         registry = get_provider_registry()
-        category_scores: dict[str, CategoryScore] = {}
+        plan: list[CompiledCategory] = []
 
         for category in CANONICAL_CATEGORIES:
             weight = self._weights.get(category, 0.0)
-
-            # Create category score object
-            cat_score = CategoryScore(
-                category=category,
-                score=0.0,
-                weight=weight,
-                match=False,
-            )
-
             if weight <= 0:
-                # Category disabled
-                category_scores[category] = cat_score
                 continue
 
-            # Get signal configuration for this category
             signals_config = {}
             if self._config.signals:
-                signals_config = self._config.signals.get(category, {})
+                signals_config = self._config.signals.get(category, {}) or {}
+
+            signals = []
+            for signal_name, provider in registry.get_signals_for_category(category).items():
+                signal_config = signals_config.get(signal_name, {}) or {}
+                signals.append(
+                    CompiledSignal(
+                        name=signal_name,
+                        provider=provider,
+                        config={**self._context, **signal_config},
+                        prefetch_capable=provider.prefetch_capable,
+                    )
+                )
+            if not signals:
+                continue
 
-            # Score signals for this category
-            signal_scores = self._score_category_signals(
-                category, kill, system_id, signals_config, registry
-            )
+            signals.sort(key=lambda s: not s.prefetch_capable)
+            plan.append(CompiledCategory(category, weight, tuple(signals)))
+
+        plan.sort(key=lambda c: not c.prefetch_capable)
+        return tuple(plan)
 
-            if signal_scores:
-                cat_score.signals = signal_scores
+    def _score_categories(
+        self,
+        kill: ProcessedKill | None,
+        system_id: int,
+        stop_below: float | None = None,
+    ) -> tuple[dict[str, CategoryScore], float | None]:
+        """
+        Score all configured categories.
+
+        Args:
+            kill: ProcessedKill or None
+            system_id: Solar system ID
+            stop_below: Stop once the achievable score falls below this
+
+        Returns:
+            Tuple of (category name -> CategoryScore, upper bound if stopped early)
+        """
+        scored: dict[str, CategoryScore] = {}
+        pending_weight = sum(c.weight for c in self._plan)
+        upper_bound = None
 
-                # Aggregate signal scores within category
-                signal_sum = sum(s.score * s.weight for s in signal_scores.values())
-                weight_sum = sum(s.weight for s in signal_scores.values())
+        for compiled in self._plan:
+            scored[compiled.category] = self._score_category(compiled, kill, system_id)
+            pending_weight -= compiled.weight
 
-                if weight_sum > 0:
-                    cat_score.score = signal_sum / weight_sum
-                    # Determine match based on penalized score
-                    cat_score.match = cat_score.penalized_score >= 0.3
+            if stop_below is not None and pending_weight > 0:
+                bound = calculate_score_upper_bound(scored, pending_weight, self._config.mode)
+                if bound < stop_below - _BOUND_EPSILON:
+                    upper_bound = bound
+                    break
 
-            category_scores[category] = cat_score
+        # Report every canonical category, in canonical order
+        category_scores: dict[str, CategoryScore] = {}
+        for category in CANONICAL_CATEGORIES:
+            category_scores[category] = scored.get(category) or CategoryScore(
+                category=category,
+                score=0.0,
+                weight=self._weights.get(category, 0.0),
+                match=False,
+            )
 
-        return category_scores
+        return category_scores, upper_bound
 
-    def _score_category_signals(
+    def _score_category(
         self,
-        category: str,
+        compiled: CompiledCategory,
         kill: ProcessedKill | None,
         system_id: int,
-        signals_config: dict[str, Any],
-        registry: Any,
-    ) -> dict[str, SignalScore]:
+    ) -> CategoryScore:
         """
-        Score all signals for a category.
+        Score one compiled category.
 
         Args:
-            category: Category name
+            compiled: Compiled category
             kill: ProcessedKill or None
             system_id: Solar system ID
-            signals_config: Per-signal configuration
-            registry: Provider registry
 
         Returns:
-            Dict of signal name -> SignalScore
+            CategoryScore with signal breakdown
         """
-        signal_scores: dict[str, SignalScore] = {}
-
-        # Get all registered signals for this category
-        providers = registry.get_signals_for_category(category)
-
-        for signal_name, provider in providers.items():
-            # Get signal-specific config
-            signal_config = signals_config.get(signal_name, {})
-            if signal_config is None:
-                signal_config = {}
-
-            # Merge with context
-            merged_config = {**self._context, **signal_config}
+        cat_score = CategoryScore(
+            category=compiled.category,
+            score=0.0,
+            weight=compiled.weight,
+            match=False,
+        )
 
+        signal_scores: dict[str, SignalScore] = {}
+        for signal in compiled.signals:
             try:
-                score = provider.score(kill, system_id, merged_config)
-                signal_scores[signal_name] = score
+                signal_scores[signal.name] = signal.provider.score(kill, system_id, signal.config)
             except Exception as e:
-                logger.warning(f"Signal {category}.{signal_name} scoring failed: {e}")
-                signal_scores[signal_name] = SignalScore(
-                    signal=signal_name,
+                logger.warning(f"Signal {compiled.category}.{signal.name} scoring failed: {e}")
+                signal_scores[signal.name] = SignalScore(
+                    signal=signal.name,
                     score=0.0,
                     reason=f"Scoring error: {e}",
-                    prefetch_capable=provider.prefetch_capable,
+                    prefetch_capable=signal.prefetch_capable,
                 )
 
-        return signal_scores
+        cat_score.signals = signal_scores
+
+        # Aggregate signal scores within category
+        signal_sum = sum(s.score * s.weight for s in signal_scores.values())
+        weight_sum = sum(s.weight for s in signal_scores.values())
+
+        if weight_sum > 0:
+            cat_score.score = signal_sum / weight_sum
+            # Determine match based on penalized score
+            cat_score.match = cat_score.penalized_score >= 0.3
+
+        return cat_score
 
     def _determine_tier(self, interest: float) -> NotificationTier:
         """
@@ -235,6 +235,9 @@ class InterestResultV2:
     prefetch_score: float | None = None  # Prefetch-only score
     prefetch_upper_bound: float | None = None  # For conservative mode
 
+    # Set when scoring stopped early because notify was out of reach
+    score_upper_bound: float | None = None
+
     # Thresholds used
     thresholds: dict[str, float] = field(default_factory=dict)
 
@@ -352,6 +355,9 @@ class InterestResultV2:
                 ),
             }
 
+        if self.score_upper_bound is not None:
+            result["score_upper_bound"] = round(self.score_upper_bound, 3)
+
         # Thresholds
         if self.thresholds:
             result["thresholds"] = self.thresholds
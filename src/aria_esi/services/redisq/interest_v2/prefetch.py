@@ -131,17 +131,9 @@ class PrefetchScorer:
         registry = get_provider_registry()
 
         # Check if we have any prefetch-capable categories
-        has_prefetch_capable = False
-        weights = self._engine._weights
-
-        for category in CANONICAL_CATEGORIES:
-            if weights.get(category, 0) <= 0:
-                continue
-
-            providers = registry.get_signals_for_category(category)
-            if any(p.prefetch_capable for p in providers.values()):
-                has_prefetch_capable = True
-                break
+        has_prefetch_capable = any(
+            s.prefetch_capable for compiled in self._engine.plan for s in compiled.signals
+        )
 
         if not has_prefetch_capable:
             logger.debug("No prefetch-capable categories, using conservative mode")
@@ -311,54 +303,44 @@ class PrefetchScorer:
         Returns:
             Dict of category -> CategoryScore (prefetch only)
         """
-        from .providers.registry import get_provider_registry
-
-        registry = get_provider_registry()
         category_scores: dict[str, CategoryScore] = {}
         weights = self._engine._weights
+        plan = {compiled.category: compiled for compiled in self._engine.plan}
 
         for category in CANONICAL_CATEGORIES:
-            weight = weights.get(category, 0.0)
-
             cat_score = CategoryScore(
                 category=category,
                 score=0.0,
-                weight=weight,
+                weight=weights.get(category, 0.0),
                 match=False,
             )
 
-            if weight <= 0:
+            compiled = plan.get(category)
+            if compiled is None:
+                # Disabled, or no registered signals
                 category_scores[category] = cat_score
                 continue
 
-            # Get signal configuration
-            signals_config = {}
-            if self._config.signals:
-                signals_config = self._config.signals.get(category, {})
-
             # Score only prefetch-capable signals
-            providers = registry.get_signals_for_category(category)
             signal_scores: dict[str, SignalScore] = {}
 
-            for signal_name, provider in providers.items():
-                if not provider.prefetch_capable:
+            for signal in compiled.signals:
+                if not signal.prefetch_capable:
                     # Skip non-prefetch signals - they'll be evaluated post-fetch
                     continue
 
-                signal_config = signals_config.get(signal_name, {}) or {}
-                merged_config = {**self._engine._context, **signal_config}
-
+                config = signal.config
                 # Add redisq data to config for victim matching
                 if redisq_data:
-                    merged_config["redisq_data"] = redisq_data
+                    config = {**config, "redisq_data": redisq_data}
 
                 try:
-                    score = provider.score(None, system_id, merged_config)
-                    signal_scores[signal_name] = score
+                    score = signal.provider.score(None, system_id, config)
+                    signal_scores[signal.name] = score
                 except Exception as e:
-                    logger.warning(f"Prefetch signal {category}.{signal_name} failed: {e}")
-                    signal_scores[signal_name] = SignalScore(
-                        signal=signal_name,
+                    logger.warning(f"Prefetch signal {category}.{signal.name} failed: {e}")
+                    signal_scores[signal.name] = SignalScore(
+                        signal=signal.name,
                         score=0.0,
                         reason=f"Scoring error: {e}",
                         prefetch_capable=True,
@@ -0,0 +1,269 @@
+"""
+Recent Kill Index.
+
+In-process sliding window over recent realtime kills, keyed by solar
+system. Answers the per-system questions ThreatCache asks on every
+route and gatecamp check (kills and pods in the last 10m/1h/24h,
+the kills feeding gatecamp detection, watched-entity kills) without
+touching SQLite.
+
+The poller feeds it from _on_kill_processed and bootstraps it from
+realtime_kills on startup; the table remains the durable store and the
+fallback for processes that do not run a poller.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_right, insort
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from ...core.logging import get_logger
+
+if TYPE_CHECKING:
+    from .database import RealtimeKillsDatabase
+    from .models import ProcessedKill
+
+logger = get_logger(__name__)
+
+# Width of a count bucket
+BUCKET_SECONDS = 60
+
+# Oldest kill counted (24h spike baseline)
+INDEX_HORIZON_SECONDS = 86400
+
+# Kills newer than this are kept whole for gatecamp analysis and display
+DETAIL_WINDOW_SECONDS = 3600
+
+
+@dataclass
+class _SystemWindow:
+    """Per-system kill counts and recent kill details."""
+
+    # bucket number -> [kills, pod kills]
+    buckets: dict[int, list[int]] = field(default_factory=dict)
+    # (timestamp, kill_id, is_watched, kill), ascending by timestamp
+    details: list[tuple[int, int, bool, ProcessedKill]] = field(default_factory=list)
+
+
+class RecentKillIndex:
+    """
+    Time-bucketed index of recent kills per system.
+
+    Counts are kept in BUCKET_SECONDS buckets for INDEX_HORIZON_SECONDS,
+    so a count is a sum over at most horizon / bucket buckets. Windows
+    up to DETAIL_WINDOW_SECONDS are answered exactly from the retained
+    kills; longer windows are bucket-aligned (off by at most one bucket
+    at the old edge).
+
+    Windows follow the realtime_kills queries: a kill counts for a
+    window of W seconds if its timestamp is strictly after now - W.
+
+    Thread-safe: the poller adds kills on the event loop while
+    notification lookups read from worker threads.
+
+    Usage:
+        index = RecentKillIndex()
+        index.bootstrap(get_realtime_database())
+        index.add(kill, watched=True)
+        index.count(system_id, 600)
+    """
+
+    def __init__(
+        self,
+        horizon_seconds: int = INDEX_HORIZON_SECONDS,
+        detail_seconds: int = DETAIL_WINDOW_SECONDS,
+        bucket_seconds: int = BUCKET_SECONDS,
+    ):
+        self.horizon_seconds = horizon_seconds
+        self.detail_seconds = detail_seconds
+        self.bucket_seconds = bucket_seconds
+
+        self._systems: dict[int, _SystemWindow] = {}
+        self._kill_times: dict[int, int] = {}  # kill_id -> timestamp, for dedup
+        self._lock = threading.Lock()
+        self._last_prune_bucket = 0
+        self._bootstrapped = False
+
+    @property
+    def is_bootstrapped(self) -> bool:
+        """Whether the index has been loaded from the database."""
+        return self._bootstrapped
+
+    @property
+    def kill_count(self) -> int:
+        """Number of kills currently indexed."""
+        return len(self._kill_times)
+
+    @property
+    def system_count(self) -> int:
+        """Number of systems with indexed kills."""
+        return len(self._systems)
+
+    def covers(self, since_seconds: int) -> bool:
+        """Check whether a window can be answered from the index."""
+        return self._bootstrapped and since_seconds <= self.horizon_seconds
+
+    def bootstrap(self, db: RealtimeKillsDatabase) -> int:
+        """
+        Load kills within the horizon from realtime_kills.
+
+        Blocking; call via asyncio.to_thread from async code.
+
+        Args:
+            db: Realtime kills database
+
+        Returns:
+            Number of kills loaded
+        """
+        rows = db.get_kills_since(since_minutes=self.horizon_seconds // 60)
+        now = time.time()
+        for kill, watched in rows:
+            self.add(kill, watched=watched, now=now)
+        self._bootstrapped = True
+        logger.info(
+            "Recent kill index loaded %d kills across %d systems",
+            self.kill_count,
+            self.system_count,
+        )
+        return len(rows)
+
+    def add(self, kill: ProcessedKill, watched: bool = False, now: float | None = None) -> bool:
+        """
+        Index a kill.
+
+        Args:
+            kill: Processed kill
+            watched: Whether the kill involves a watched entity
+            now: Current time (defaults to time.time())
+
+        Returns:
+            True if indexed, False if a duplicate or outside the horizon
+        """
+        now = time.time() if now is None else now
+        ts = int(kill.kill_time.timestamp())
+        if ts <= now - self.horizon_seconds:
+            return False
+
+        with self._lock:
+            if kill.kill_id in self._kill_times:
+                return False
+            self._kill_times[kill.kill_id] = ts
+
+            window = self._systems.setdefault(kill.solar_system_id, _SystemWindow())
+            bucket = window.buckets.setdefault(ts // self.bucket_seconds, [0, 0])
+            bucket[0] += 1
+            if kill.is_pod_kill:
+                bucket[1] += 1
+
+            if ts > now - self.detail_seconds:
+                insort(window.details, (ts, kill.kill_id, watched, kill), key=lambda d: d[:2])
+
+            current_bucket = int(now) // self.bucket_seconds
+            if current_bucket != self._last_prune_bucket:
+                self._prune(now)
+                self._last_prune_bucket = current_bucket
+        return True
+
+    def count(self, system_id: int, since_seconds: int, now: float | None = None) -> int:
+        """Count kills in a system within the last since_seconds."""
+        return self._counts(system_id, since_seconds, now)[0]
+
+    def pod_count(self, system_id: int, since_seconds: int, now: float | None = None) -> int:
+        """Count pod kills in a system within the last since_seconds."""
+        return self._counts(system_id, since_seconds, now)[1]
+
+    def recent_kills(
+        self,
+        system_id: int,
+        since_seconds: int,
+        limit: int | None = None,
+        watched_only: bool = False,
+        now: float | None = None,
+    ) -> list[ProcessedKill]:
+        """
+        Get kills in a system within the last since_seconds, newest first.
+
+        Args:
+            system_id: Solar system ID
+            since_seconds: Window length (at most the detail window)
+            limit: Maximum kills to return
+            watched_only: Only kills involving watched entities
+            now: Current time (defaults to time.time())
+
+        Returns:
+            Matching kills, newest first
+        """
+        if since_seconds > self.detail_seconds:
+            raise ValueError(
+                f"Kill details are only kept for {self.detail_seconds}s, requested {since_seconds}s"
+            )
+        now = time.time() if now is None else now
+        cutoff = now - since_seconds
+
+        with self._lock:
+            window = self._systems.get(system_id)
+            if window is None:
+                return []
+            result = []
+            for ts, _, watched, kill in reversed(window.details):
+                if ts <= cutoff or (limit is not None and len(result) >= limit):
+                    break
+                if watched or not watched_only:
+                    result.append(kill)
+        return result
+
+    def _counts(self, system_id: int, since_seconds: int, now: float | None) -> tuple[int, int]:
+        """Count (kills, pod kills) in a system within the window."""
+        now = time.time() if now is None else now
+        cutoff = now - since_seconds
+
+        with self._lock:
+            window = self._systems.get(system_id)
+            if window is None:
+                return 0, 0
+
+            if since_seconds <= self.detail_seconds:
+                # Exact, from retained kills
+                start = bisect_right(window.details, cutoff, key=lambda d: d[0])
+                recent = window.details[start:]
+                return len(recent), sum(1 for d in recent if d[3].is_pod_kill)
+
+            first_bucket = int(cutoff) // self.bucket_seconds
+            kills = pods = 0
+            for number, (bucket_kills, bucket_pods) in window.buckets.items():
+                if number >= first_bucket:
+                    kills += bucket_kills
+                    pods += bucket_pods
+            return kills, pods
+
+    def _prune(self, now: float) -> None:
+        """Drop buckets past the horizon and details past the detail window."""
+        oldest_bucket = int(now - self.horizon_seconds) // self.bucket_seconds
+        detail_cutoff = now - self.detail_seconds
+        horizon_cutoff = now - self.horizon_seconds
+
+        for system_id in list(self._systems):
+            window = self._systems[system_id]
+            for number in [n for n in window.buckets if n < oldest_bucket]:
+                del window.buckets[number]
+            start = bisect_right(window.details, detail_cutoff, key=lambda d: d[0])
+            if start:
+                del window.details[:start]
+            if not window.buckets:
+                del self._systems[system_id]
+
+        self._kill_times = {
+            kill_id: ts for kill_id, ts in self._kill_times.items() if ts > horizon_cutoff
+        }
+
+    def get_stats(self) -> dict:
+        """Get index statistics."""
+        return {
+            "bootstrapped": self._bootstrapped,
+            "kills": self.kill_count,
+            "systems": self.system_count,
+            "horizon_seconds": self.horizon_seconds,
+        }
@@ -0,0 +1,386 @@
+"""
+Kill Dispatcher.
+
+Reads new kills from the killmail store once per poll on behalf of all
+notification workers and routes them to per-profile queues. Kills are
+grouped by solar system and fanned out through an inverted
+system -> profiles index, so store load stays flat as profiles are added
+and workers only do delivery. Per-profile queues are bounded: a worker
+that falls too far behind loses its oldest batches and catches up from
+its own checkpoint in the store instead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from ....core.logging import get_logger
+
+if TYPE_CHECKING:
+    from ...killmail_store import KillmailRecord, SQLiteKillmailStore
+    from .profiles import NotificationProfile
+
+logger = get_logger(__name__)
+
+
+def profile_system_ids(profile: NotificationProfile) -> list[int] | None:
+    """
+    Get the solar systems a profile's topology filter is interested in.
+
+    Args:
+        profile: Notification profile
+
+    Returns:
+        System IDs from the geographic layer (the layer's cached list,
+        read-only), or None for all systems
+    """
+    if profile._topology_filter is None:
+        return None
+    geo_layer = profile._topology_filter.get_layer("geographic")
+    if geo_layer is not None and hasattr(geo_layer, "system_ids"):
+        return geo_layer.system_ids
+    return None
+
+
+class KillInbox(asyncio.Queue["list[KillmailRecord]"]):
+    """
+    Bounded queue of kill batches routed to one worker.
+
+    When full, the oldest batch is dropped to make room and `overflowed`
+    is set. The worker clears it and re-reads the store from its
+    checkpoint, so dropped kills are still delivered.
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        super().__init__(maxsize)
+        self.overflowed = False
+        self.dropped_batches = 0
+
+    def put_dropping_oldest(self, batch: list[KillmailRecord]) -> bool:
+        """
+        Queue a batch, dropping the oldest one if the queue is full.
+
+        Returns:
+            True if a batch was dropped
+        """
+        dropped = False
+        if self.full():
+            self.get_nowait()
+            self.overflowed = True
+            self.dropped_batches += 1
+            dropped = True
+        self.put_nowait(batch)
+        return dropped
+
+
+@dataclass
+class DispatcherMetrics:
+    """Metrics for the kill dispatcher."""
+
+    polls: int = 0
+    kills_read: int = 0
+    kills_routed: int = 0  # Kill deliveries to queues (one per kill per profile)
+    batches_dropped: int = 0  # Oldest batches dropped from full queues
+    last_poll_time: datetime | None = None
+
+
+@dataclass
+class KillDispatcher:
+    """
+    Shared store poller that fans kills out to notification workers.
+
+    Each poll:
+    1. Queries the store once for kills since high_water - overlap, over
+       the union of subscribed systems (or all systems if any profile
+       has no geographic filter), paging until the window is drained
+    2. Drops kills already dispatched within the overlap window
+    3. Groups the rest by solar_system_id and puts one batch per
+       interested profile on that profile's queue, dropping the oldest
+       batch when the queue is full
+
+    Workers still dedup against processed_kills, so the overlap and
+    restarts never cause duplicate notifications.
+
+    Usage:
+        dispatcher = KillDispatcher.for_profiles(store, profiles)
+        inbox = dispatcher.subscribe(profile.name, profile_system_ids(profile))
+        await dispatcher.start()
+    """
+
+    store: SQLiteKillmailStore
+
+    # Polling configuration
+    interval_seconds: float = 5.0
+    batch_size: int = 50
+    overlap_window_seconds: int = 60
+    max_pages: int = 10  # Pages read per poll when catching up
+    max_queued_batches: int = 100  # Per-profile queue bound
+
+    # Subscriptions and inverted index
+    _queues: dict[str, KillInbox] = field(default_factory=dict, repr=False)
+    _subscriptions: dict[str, frozenset[int] | None] = field(default_factory=dict, repr=False)
+    _system_index: dict[int, set[str]] = field(default_factory=dict, repr=False)
+    _wildcard: set[str] = field(default_factory=set, repr=False)
+
+    # Runtime state
+    _high_water: int = field(default=0, repr=False)
+    _recent: dict[int, int] = field(default_factory=dict, repr=False)  # kill_id -> kill_time
+    _task: asyncio.Task | None = field(default=None, repr=False)
+    _stop_event: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+    _metrics: DispatcherMetrics = field(default_factory=DispatcherMetrics, repr=False)
+
+    @classmethod
+    def for_profiles(
+        cls, store: SQLiteKillmailStore, profiles: Iterable[NotificationProfile]
+    ) -> KillDispatcher:
+        """
+        Create a dispatcher whose polling satisfies every profile.
+
+        Uses the shortest interval, largest batch and longest overlap.
+        """
+        polling = [p.polling for p in profiles]
+        if not polling:
+            return cls(store=store)
+        return cls(
+            store=store,
+            interval_seconds=min(p.interval_seconds for p in polling),
+            batch_size=max(p.batch_size for p in polling),
+            overlap_window_seconds=max(p.overlap_window_seconds for p in polling),
+        )
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the dispatch loop is running."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def metrics(self) -> DispatcherMetrics:
+        """Get dispatcher metrics."""
+        return self._metrics
+
+    def subscribe(self, name: str, systems: Iterable[int] | None) -> KillInbox:
+        """
+        Subscribe a profile to kills in the given systems.
+
+        Subscribing an existing name updates its systems and keeps its
+        queue, so a restarted worker picks up batches routed meanwhile.
+
+        Args:
+            name: Profile name
+            systems: Solar system IDs of interest, or None for all systems
+
+        Returns:
+            Queue receiving one list of kills per dispatch
+        """
+        self._subscriptions[name] = frozenset(systems) if systems is not None else None
+        queue = self._queues.setdefault(name, KillInbox(self.max_queued_batches))
+        self._rebuild_index()
+        return queue
+
+    def unsubscribe(self, name: str) -> None:
+        """Remove a profile's subscription and queue."""
+        self._subscriptions.pop(name, None)
+        self._queues.pop(name, None)
+        self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        """Rebuild the system -> profiles index from subscriptions."""
+        index: dict[int, set[str]] = defaultdict(set)
+        wildcard: set[str] = set()
+        for name, systems in self._subscriptions.items():
+            if systems is None:
+                wildcard.add(name)
+                continue
+            for system_id in systems:
+                index[system_id].add(name)
+        self._system_index = dict(index)
+        self._wildcard = wildcard
+
+    async def start(self) -> asyncio.Task:
+        """
+        Start the dispatch loop.
+
+        Resumes from the oldest persisted checkpoint of the subscribed
+        profiles, so no profile misses kills ingested while stopped.
+
+        Returns:
+            The asyncio task running the dispatch loop
+        """
+        if self.is_running:
+            raise RuntimeError("Dispatcher already running")
+
+        checkpoints = []
+        for name in self._subscriptions:
+            state = await self.store.get_worker_state(name)
+            checkpoints.append(state.last_processed_time if state else 0)
+        self._high_water = min(checkpoints, default=0)
+        self._recent.clear()
+
+        self._stop_event.clear()
+        self._task = asyncio.create_task(self._run_loop())
+        return self._task
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop the dispatch loop.
+
+        Args:
+            timeout: Maximum time to wait for shutdown
+        """
+        if self._task is None:
+            return
+
+        self._stop_event.set()
+        try:
+            await asyncio.wait_for(self._task, timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Dispatcher stop timed out, cancelling")
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run_loop(self) -> None:
+        """Main dispatch loop."""
+        logger.info("Kill dispatcher started (%d profiles)", len(self._subscriptions))
+        consecutive_errors = 0
+
+        while not self._stop_event.is_set():
+            try:
+                await self.dispatch_once()
+                consecutive_errors = 0
+                delay = self.interval_seconds
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                consecutive_errors += 1
+                logger.error("Dispatcher poll error (consecutive=%d): %s", consecutive_errors, e)
+                delay = min(30, 2**consecutive_errors)
+
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+        logger.info("Kill dispatcher stopped")
+
+    async def dispatch_once(self) -> int:
+        """
+        Read new kills once and route them to subscriber queues.
+
+        Returns:
+            Number of kill deliveries queued (one per kill per profile)
+        """
+        self._metrics.polls += 1
+        self._metrics.last_poll_time = datetime.utcnow()
+
+        if not self._queues:
+            return 0
+        systems = None if self._wildcard else sorted(self._system_index)
+        if systems == []:
+            return 0
+
+        kills = await self._read_window(systems)
+        self._metrics.kills_read += len(kills)
+
+        fresh = [kill for kill in kills if kill.kill_id not in self._recent]
+        if not fresh:
+            return 0
+        self._remember(fresh)
+
+        routed = self.route(fresh)
+        for name, batch in routed.items():
+            if self._queues[name].put_dropping_oldest(batch):
+                self._metrics.batches_dropped += 1
+                logger.warning("Queue for '%s' full, dropped oldest batch", name)
+
+        count = sum(len(batch) for batch in routed.values())
+        self._metrics.kills_routed += count
+        logger.debug(
+            "Dispatched %d kills to %d profiles (%d deliveries)",
+            len(fresh),
+            len(routed),
+            count,
+        )
+        return count
+
+    async def _read_window(self, systems: list[int] | None) -> list[KillmailRecord]:
+        """Query kills since the high-water mark, paging through backlogs."""
+        since_time = self._high_water - self.overlap_window_seconds if self._high_water > 0 else 0
+        since = datetime.fromtimestamp(since_time) if since_time > 0 else None
+
+        # Cold start reads one batch of recent kills, like a fresh worker
+        pages = self.max_pages if since is not None else 1
+        kills: list[KillmailRecord] = []
+        cursor: tuple[int, int] | None = None
+        for _ in range(pages):
+            page = await self.store.query_kills(
+                systems=systems, since=since, limit=self.batch_size, cursor=cursor
+            )
+            kills.extend(page)
+            if len(page) < self.batch_size:
+                break
+            cursor = (page[-1].kill_time, page[-1].kill_id)
+        return kills
+
+    def _remember(self, kills: list[KillmailRecord]) -> None:
+        """Advance the high-water mark and forget kills outside the overlap."""
+        for kill in kills:
+            self._recent[kill.kill_id] = kill.kill_time
+            if kill.kill_time > self._high_water:
+                self._high_water = kill.kill_time
+
+        horizon = self._high_water - self.overlap_window_seconds
+        self._recent = {kid: kt for kid, kt in self._recent.items() if kt >= horizon}
+
+    def route(self, kills: list[KillmailRecord]) -> dict[str, list[KillmailRecord]]:
+        """
+        Split kills into per-profile batches.
+
+        Args:
+            kills: Kills in store order
+
+        Returns:
+            Mapping of profile name to its kills (profiles with none omitted)
+        """
+        by_system: dict[int, list[KillmailRecord]] = defaultdict(list)
+        for kill in kills:
+            by_system[kill.solar_system_id].append(kill)
+
+        routed: dict[str, list[KillmailRecord]] = {name: list(kills) for name in self._wildcard}
+        for system_id, system_kills in by_system.items():
+            for name in self._system_index.get(system_id, ()):
+                routed.setdefault(name, []).extend(system_kills)
+        return routed
+
+    def get_status(self) -> dict:
+        """Get dispatcher status."""
+        return {
+            "running": self.is_running,
+            "subscriptions": len(self._subscriptions),
+            "indexed_systems": len(self._system_index),
+            "wildcard_subscriptions": len(self._wildcard),
+            "high_water": self._high_water,
+            "queued_batches": {name: q.qsize() for name, q in self._queues.items()},
+            "dropped_batches": {name: q.dropped_batches for name, q in self._queues.items()},
+            "metrics": {
+                "polls": self._metrics.polls,
+                "kills_read": self._metrics.kills_read,
+                "kills_routed": self._metrics.kills_routed,
+                "batches_dropped": self._metrics.batches_dropped,
+                "last_poll_time": (
+                    self._metrics.last_poll_time.isoformat()
+                    if self._metrics.last_poll_time
+                    else None
+                ),
+            },
+        }
@@ -3,6 +3,11 @@ Profile Evaluator.
 
 Evaluates kills against multiple notification profiles, returning which
 profiles should send notifications for a given kill.
+
+Facts that depend only on the kill are computed once per kill and shared
+across profiles (KillFacts). Geographic interest of v1 profiles is stacked
+into a profile x universe-vertex matrix, so the topology check for every
+profile is a single column gather.
 """
 
 from __future__ import annotations
@@ -10,12 +15,15 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
 from ....core.logging import get_logger
 from .quiet_hours import QuietHoursChecker
 from .throttle import ThrottleManager
-from .triggers import TriggerResult, TriggerType, evaluate_triggers
+from .triggers import TriggerResult, TriggerType, evaluate_triggers, map_npc_corps
 
 if TYPE_CHECKING:
+    from ....universe import UniverseGraph
     from ..entity_filter import EntityMatchResult
     from ..interest import InterestCalculator
     from ..interest_v2 import InterestEngineV2, InterestResultV2
@@ -41,6 +49,30 @@ class ProfileMatch:
     interest_result: InterestResultV2 | None = None  # v2 engine result
 
 
+@dataclass
+class KillFacts:
+    """
+    Facts about a kill shared by every profile evaluation.
+
+    Built once per kill by ProfileEvaluator.evaluate; profiles only do the
+    work that depends on their own configuration.
+    """
+
+    kill: ProcessedKill
+    entity_match: EntityMatchResult | None = None
+    gatecamp_status: GatecampStatus | None = None
+    war_context: KillWarContext | None = None
+    # Geographic interest of each vectorized profile, in topology matrix row order
+    geographic_scores: np.ndarray | None = None
+    _npc_corp_factions: dict[int, str] | None = field(default=None, repr=False)
+
+    def npc_corp_factions(self, mapper: NPCFactionMapper) -> dict[int, str]:
+        """NPC corporations on the kill mapped to faction keys (computed on first use)."""
+        if self._npc_corp_factions is None:
+            self._npc_corp_factions = map_npc_corps(self.kill, mapper)
+        return self._npc_corp_factions
+
+
 @dataclass
 class EvaluationResult:
     """Result of evaluating a kill against all profiles."""
@@ -76,7 +108,10 @@ class ProfileEvaluator:
     - Quiet hours (per-profile suppression windows)
 
     The evaluator initializes runtime state for each profile and provides
-    O(profiles) evaluation per kill.
+    O(profiles) evaluation per kill. Kill-level facts are computed once and
+    shared; v1 geographic interest is answered for all profiles from one
+    column of the topology matrix, falling back to the profile's
+    InterestCalculator only when other layers could still pass the kill.
     """
 
     def __init__(self, profiles: list[NotificationProfile]):
@@ -89,6 +124,11 @@ class ProfileEvaluator:
         self.profiles = profiles
         self._initialized = False
         self._npc_faction_mapper: NPCFactionMapper | None = None
+        self._graph: UniverseGraph | None = None
+
+        # Profile x vertex geographic interest, with profile name -> (row, geographic_only)
+        self._topology_matrix: np.ndarray | None = None
+        self._topology_rows: dict[str, tuple[int, bool]] = {}
 
         # Warn about profile count
         if len(profiles) > MAX_PROFILES_SOFT:
@@ -121,6 +161,8 @@ class ProfileEvaluator:
             self._npc_faction_mapper = get_npc_faction_mapper()
             logger.debug("Initialized NPC faction mapper for profile evaluator")
 
+        self._build_topology_matrix()
+
         self._initialized = True
         logger.info("Initialized runtime state for %d profiles", len(self.profiles))
 
@@ -190,8 +232,60 @@ class ProfileEvaluator:
 
         config = ContextAwareTopologyConfig.from_dict(topology)
         config.enabled = True  # Force enabled for profile topology
+
+        # Share one graph across profiles (and with the topology matrix)
+        if config.has_geographic or config.has_routes or config.archetype:
+            if self._graph is None:
+                from ....universe import load_universe_graph
+
+                self._graph = load_universe_graph()
+            return config.build_calculator(self._graph)
         return config.build_calculator()
 
+    def _build_topology_matrix(self) -> None:
+        """
+        Stack v1 geographic interest into a profile x vertex matrix.
+
+        Only profiles with a real InterestCalculator holding a geographic
+        layer are vectorized; everything else keeps calling should_fetch.
+        """
+        from ..interest import InterestCalculator
+        from ..interest.layers import GeographicLayer
+
+        self._topology_matrix = None
+        self._topology_rows = {}
+        if self._graph is None:
+            return
+
+        id_to_idx = self._graph.id_to_idx
+        rows: list[np.ndarray] = []
+        for profile in self.profiles:
+            calculator = profile._topology_filter
+            if profile.uses_interest_v2 or not isinstance(calculator, InterestCalculator):
+                continue
+            geo_layers = [
+                layer for layer in calculator.layers if isinstance(layer, GeographicLayer)
+            ]
+            if len(geo_layers) != 1 or profile.name in self._topology_rows:
+                continue
+            row = geo_layers[0].vertex_interest
+            if row is None or row.shape != (self._graph.system_count,):
+                # Layer not built from this graph; lay out its map by vertex
+                interest_map = geo_layers[0]._interest_map
+                if any(system_id not in id_to_idx for system_id in interest_map):
+                    continue
+                row = np.zeros(self._graph.system_count, dtype=np.float64)
+                for system_id, (interest, _, _) in interest_map.items():
+                    row[id_to_idx[system_id]] = interest
+
+            geographic_only = len(calculator.layers) == 1 and calculator.pattern_layer is None
+            self._topology_rows[profile.name] = (len(rows), geographic_only)
+            rows.append(row)
+
+        if rows:
+            self._topology_matrix = np.vstack(rows)
+            logger.debug("Vectorized geographic interest for %d profiles", len(rows))
+
     def _build_v2_engine(self, profile: NotificationProfile) -> InterestEngineV2:
         """
         Build an InterestEngineV2 from profile interest config.
@@ -242,18 +336,13 @@ class ProfileEvaluator:
             EvaluationResult with matching profiles
         """
         result = EvaluationResult(kill_id=kill.kill_id)
+        facts = self._kill_facts(kill, entity_match, gatecamp_status, war_context)
 
         for profile in self.profiles:
             if not profile.enabled:
                 continue
 
-            match_result = self._evaluate_profile(
-                profile=profile,
-                kill=kill,
-                entity_match=entity_match,
-                gatecamp_status=gatecamp_status,
-                war_context=war_context,
-            )
+            match_result = self._evaluate_profile(profile, facts)
 
             if match_result is None:
                 # Profile was filtered
@@ -285,13 +374,30 @@ class ProfileEvaluator:
 
         return result
 
-    def _evaluate_profile(
+    def _kill_facts(
         self,
-        profile: NotificationProfile,
         kill: ProcessedKill,
         entity_match: EntityMatchResult | None,
         gatecamp_status: GatecampStatus | None,
-        war_context: KillWarContext | None = None,
+        war_context: KillWarContext | None,
+    ) -> KillFacts:
+        """Build the shared fact sheet for a kill, gathering geographic interest."""
+        facts = KillFacts(
+            kill=kill,
+            entity_match=entity_match,
+            gatecamp_status=gatecamp_status,
+            war_context=war_context,
+        )
+        if self._topology_matrix is not None and self._graph is not None:
+            vertex = self._graph.id_to_idx.get(kill.solar_system_id)
+            if vertex is not None:
+                facts.geographic_scores = self._topology_matrix[:, vertex]
+        return facts
+
+    def _evaluate_profile(
+        self,
+        profile: NotificationProfile,
+        facts: KillFacts,
     ) -> dict[str, Any] | None:
         """
         Evaluate a kill against a single profile.
@@ -300,10 +406,7 @@ class ProfileEvaluator:
 
         Args:
             profile: Profile to evaluate against
-            kill: Kill to evaluate
-            entity_match: Entity match result
-            gatecamp_status: Gatecamp status
-            war_context: Optional war context for the kill
+            facts: Shared facts for the kill
 
         Returns:
             Dict with trigger_result if matched, filtered_by key if filtered, None if error
@@ -313,30 +416,15 @@ class ProfileEvaluator:
 
         # Check for v2 engine
         if profile.uses_interest_v2:
-            return self._evaluate_profile_v2(
-                profile=profile,
-                kill=kill,
-                entity_match=entity_match,
-                gatecamp_status=gatecamp_status,
-                war_context=war_context,
-            )
+            return self._evaluate_profile_v2(profile, facts)
 
         # v1 evaluation path
-        return self._evaluate_profile_v1(
-            profile=profile,
-            kill=kill,
-            entity_match=entity_match,
-            gatecamp_status=gatecamp_status,
-            war_context=war_context,
-        )
+        return self._evaluate_profile_v1(profile, facts)
 
     def _evaluate_profile_v2(
         self,
         profile: NotificationProfile,
-        kill: ProcessedKill,
-        entity_match: EntityMatchResult | None,
-        gatecamp_status: GatecampStatus | None,
-        war_context: KillWarContext | None = None,
+        facts: KillFacts,
     ) -> dict[str, Any] | None:
         """
         Evaluate a kill using v2 interest engine.
@@ -349,14 +437,12 @@ class ProfileEvaluator:
 
         Args:
             profile: Profile with v2 engine
-            kill: Kill to evaluate
-            entity_match: Entity match result
-            gatecamp_status: Gatecamp status
-            war_context: War context
+            facts: Shared facts for the kill
 
         Returns:
             Dict with trigger_result and interest_result, or filtered_by key
         """
+        kill = facts.kill
         try:
             engine = profile._interest_engine_v2
             if engine is None:
@@ -367,6 +453,7 @@ class ProfileEvaluator:
                 kill=kill,
                 system_id=kill.solar_system_id,
                 is_prefetch=False,
+                notify_only=True,
             )
 
             # Check if filtered by interest engine
@@ -438,16 +525,14 @@ class ProfileEvaluator:
     def _evaluate_profile_v1(
         self,
         profile: NotificationProfile,
-        kill: ProcessedKill,
-        entity_match: EntityMatchResult | None,
-        gatecamp_status: GatecampStatus | None,
-        war_context: KillWarContext | None = None,
+        facts: KillFacts,
     ) -> dict[str, Any] | None:
         """
         Evaluate a kill using v1 topology + triggers.
 
         This is the legacy evaluation path for profiles without v2 interest config.
         """
+        kill = facts.kill
         try:
             # Determine if we should skip topology for NPC faction kills
             # If npc_faction_kill is enabled with ignore_topology=True, we evaluate
@@ -460,7 +545,7 @@ class ProfileEvaluator:
             # Check topology filter (unless we're potentially bypassing for NPC faction)
             topology_passed = True
             if profile._topology_filter is not None:
-                if not profile._topology_filter.should_fetch(kill.solar_system_id):
+                if not self._topology_allows(profile, facts):
                     if not skip_topology_for_npc:
                         # Topology check failed and we're not bypassing
                         logger.debug(
@@ -474,13 +559,7 @@ class ProfileEvaluator:
                         topology_passed = False
 
             # Evaluate triggers
-            trigger_result = self._evaluate_triggers_for_profile(
-                profile=profile,
-                kill=kill,
-                entity_match=entity_match,
-                gatecamp_status=gatecamp_status,
-                war_context=war_context,
-            )
+            trigger_result = self._evaluate_triggers_for_profile(profile, facts)
 
             # If topology didn't pass, only allow NPC_FACTION_KILL trigger
             if not topology_passed:
@@ -556,26 +635,49 @@ class ProfileEvaluator:
             )
             return None
 
+    def _topology_allows(self, profile: NotificationProfile, facts: KillFacts) -> bool:
+        """
+        Check a v1 profile's topology filter for the kill's system.
+
+        Uses the gathered geographic score when the profile is vectorized.
+        Other layers can only raise the score, so a geographic pass is final;
+        a geographic miss is final only for geographic-only calculators.
+        """
+        calculator = profile._topology_filter
+        if calculator is None:
+            return True
+        row = self._topology_rows.get(profile.name)
+        if row is not None and facts.geographic_scores is not None:
+            index, geographic_only = row
+            if facts.geographic_scores[index] > calculator.fetch_threshold:
+                return True
+            if geographic_only:
+                return False
+        return calculator.should_fetch(facts.kill.solar_system_id)
+
     def _evaluate_triggers_for_profile(
         self,
         profile: NotificationProfile,
-        kill: ProcessedKill,
-        entity_match: EntityMatchResult | None,
-        gatecamp_status: GatecampStatus | None,
-        war_context: KillWarContext | None = None,
+        facts: KillFacts,
     ) -> TriggerResult:
         """
         Evaluate triggers for a profile.
 
-        Passes profile triggers directly to evaluate_triggers.
+        Passes profile triggers directly to evaluate_triggers, with the
+        kill's NPC corporation mapping shared across profiles.
         """
+        npc_corp_factions = None
+        if self._npc_faction_mapper is not None and profile.triggers.npc_faction_kill.enabled:
+            npc_corp_factions = facts.npc_corp_factions(self._npc_faction_mapper)
+
         return evaluate_triggers(
-            kill=kill,
-            entity_match=entity_match,
-            gatecamp_status=gatecamp_status,
+            kill=facts.kill,
+            entity_match=facts.entity_match,
+            gatecamp_status=facts.gatecamp_status,
             triggers=profile.triggers,
-            war_context=war_context,
+            war_context=facts.war_context,
             npc_faction_mapper=self._npc_faction_mapper,
+            npc_corp_factions=npc_corp_factions,
         )
 
     def cleanup_throttles(self) -> int:
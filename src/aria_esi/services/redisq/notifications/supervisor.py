@@ -1,8 +1,9 @@
 """
 Worker Supervisor.
 
-Manages the lifecycle of notification workers, one per enabled profile.
-Handles startup, health monitoring, restart on failure, and graceful shutdown.
+Manages the lifecycle of notification workers, one per enabled profile,
+and the shared KillDispatcher that feeds them. Handles startup, health
+monitoring, restart on failure, and graceful shutdown.
 """
 
 from __future__ import annotations
@@ -13,6 +14,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 from ....core.logging import get_logger
+from .dispatcher import KillDispatcher, profile_system_ids
 from .esi_coordinator import ESICoordinator
 from .worker import NotificationWorker, WorkerState
 
@@ -40,8 +42,9 @@ class WorkerSupervisor:
     Manages notification workers for all enabled profiles.
 
     Responsibilities:
-    1. Create a worker for each enabled profile
-    2. Start all workers on supervisor start
+    1. Create a worker for each enabled profile, subscribed to the
+       shared dispatcher for its systems
+    2. Start all workers and the dispatcher on supervisor start
     3. Health check loop (every 5 seconds)
     4. Restart failed workers with exponential backoff
     5. Graceful shutdown with timeout
@@ -65,6 +68,9 @@ class WorkerSupervisor:
     # Shared ESI coordinator
     esi_coordinator: ESICoordinator | None = field(default=None, repr=False)
 
+    # Shared store poller feeding all workers
+    dispatcher: KillDispatcher | None = field(default=None, repr=False)
+
     # Callbacks to inject into workers
     _send_notification: Any = field(default=None, repr=False)
     _format_kill: Any = field(default=None, repr=False)
@@ -79,9 +85,12 @@ class WorkerSupervisor:
     _metrics: SupervisorMetrics = field(default_factory=SupervisorMetrics, repr=False)
 
     def __post_init__(self) -> None:
-        """Initialize ESI coordinator if not provided."""
+        """Initialize ESI coordinator and dispatcher if not provided."""
         if self.esi_coordinator is None:
             self.esi_coordinator = ESICoordinator(store=self.store)
+        if self.dispatcher is None:
+            enabled = [p for p in self.profiles if p.enabled]
+            self.dispatcher = KillDispatcher.for_profiles(self.store, enabled)
 
     @property
     def is_running(self) -> bool:
@@ -145,6 +154,10 @@ class WorkerSupervisor:
                     e,
                 )
 
+        # Start the shared poller once all workers are subscribed
+        assert self.dispatcher is not None
+        await self.dispatcher.start()
+
         # Start health check loop
         self._health_task = asyncio.create_task(self._health_loop())
 
@@ -178,6 +191,10 @@ class WorkerSupervisor:
                 pass
             self._health_task = None
 
+        # Stop feeding workers before stopping them
+        if self.dispatcher:
+            await self.dispatcher.stop(timeout=effective_timeout / 2)
+
         # Stop all workers concurrently
         stop_tasks = [
             worker.stop(timeout=effective_timeout / 2) for worker in self._workers.values()
@@ -192,13 +209,16 @@ class WorkerSupervisor:
         logger.info("Supervisor stopped")
 
     def _create_worker(self, profile: NotificationProfile) -> NotificationWorker:
-        """Create a worker for a profile."""
-        # ESI coordinator is guaranteed non-None after __post_init__
+        """Create a worker for a profile, subscribed to the dispatcher."""
+        # ESI coordinator and dispatcher are guaranteed non-None after __post_init__
         assert self.esi_coordinator is not None
+        assert self.dispatcher is not None
+        inbox = self.dispatcher.subscribe(profile.name, profile_system_ids(profile))
         return NotificationWorker(
             profile=profile,
             store=self.store,
             esi_coordinator=self.esi_coordinator,
+            inbox=inbox,
             _send_notification=self._send_notification,
             _format_kill=self._format_kill,
             _evaluate_triggers=self._evaluate_triggers,
@@ -293,4 +313,5 @@ class WorkerSupervisor:
             "esi_coordinator": (
                 self.esi_coordinator.get_metrics() if self.esi_coordinator else None
             ),
+            "dispatcher": self.dispatcher.get_status() if self.dispatcher else None,
         }
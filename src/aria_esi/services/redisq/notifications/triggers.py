@@ -85,6 +85,7 @@ def evaluate_triggers(
     triggers: TriggerConfig,
     war_context: KillWarContext | None = None,
     npc_faction_mapper: NPCFactionMapper | None = None,
+    npc_corp_factions: dict[int, str] | None = None,
 ) -> TriggerResult:
     """
     Evaluate all triggers for a kill.
@@ -96,6 +97,8 @@ def evaluate_triggers(
         triggers: Trigger configuration
         war_context: Optional war context for the kill
         npc_faction_mapper: Optional NPC faction mapper for npc_faction_kill trigger
+        npc_corp_factions: Optional precomputed map_npc_corps() result, shared
+            when evaluating the same kill for several profiles
 
     Returns:
         TriggerResult with matched triggers
@@ -133,6 +136,7 @@ def evaluate_triggers(
             kill=kill,
             config=triggers.npc_faction_kill,
             mapper=npc_faction_mapper,
+            npc_corp_factions=npc_corp_factions,
         )
         if npc_faction_result and npc_faction_result.matched:
             matched_triggers.append(TriggerType.NPC_FACTION_KILL)
@@ -156,10 +160,34 @@ def evaluate_triggers(
     )
 
 
+def map_npc_corps(kill: ProcessedKill, mapper: NPCFactionMapper) -> dict[int, str]:
+    """
+    Map the NPC corporations on a kill to their faction keys.
+
+    Covers attacker corporations and the victim corporation. Depends only
+    on the kill, so it can be computed once and shared by every profile.
+
+    Args:
+        kill: The processed killmail
+        mapper: NPC faction mapper
+
+    Returns:
+        Dict of corporation ID -> faction key for NPC corporations
+    """
+    corp_factions: dict[int, str] = {}
+    for corp_id in [*kill.attacker_corps, kill.victim_corporation_id]:
+        if corp_id and corp_id not in corp_factions:
+            faction = mapper.get_faction_for_corp(corp_id)
+            if faction:
+                corp_factions[corp_id] = faction
+    return corp_factions
+
+
 def _evaluate_npc_faction_kill(
     kill: ProcessedKill,
     config: NPCFactionKillConfig,
     mapper: NPCFactionMapper,
+    npc_corp_factions: dict[int, str] | None = None,
 ) -> NPCFactionTriggerResult | None:
     """
     Evaluate NPC faction kill trigger.
@@ -168,51 +196,51 @@ def _evaluate_npc_faction_kill(
         kill: The processed killmail
         config: NPC faction kill configuration
         mapper: NPC faction mapper
+        npc_corp_factions: Precomputed map_npc_corps() result for the kill
 
     Returns:
         NPCFactionTriggerResult if matched, None otherwise
     """
-    # Build set of watched NPC corporation IDs
-    watched_corps: set[int] = set()
-    for faction in config.factions:
-        watched_corps.update(mapper.get_corps_for_faction(faction))
-
-    if not watched_corps:
+    watched_factions = {faction.lower() for faction in config.factions}
+    if not watched_factions:
         return None
 
+    if npc_corp_factions is None:
+        npc_corp_factions = map_npc_corps(kill, mapper)
+
     # Check attackers (NPC killed someone)
     if config.as_attacker:
         for attacker_corp_id in kill.attacker_corps:
-            if attacker_corp_id in watched_corps:
-                attacker_faction = mapper.get_faction_for_corp(attacker_corp_id)
+            attacker_faction = npc_corp_factions.get(attacker_corp_id)
+            if attacker_faction in watched_factions:
                 corp_name = mapper.get_corp_name(attacker_corp_id) or f"Corp {attacker_corp_id}"
-                if attacker_faction:
-                    return NPCFactionTriggerResult(
-                        matched=True,
-                        faction=attacker_faction,
-                        corporation_id=attacker_corp_id,
-                        corporation_name=corp_name,
-                        role="attacker",
-                    )
-
-    # Check victim (someone killed the NPC)
-    if config.as_victim:
-        if kill.victim_corporation_id and kill.victim_corporation_id in watched_corps:
-            victim_faction = mapper.get_faction_for_corp(kill.victim_corporation_id)
-            corp_name = (
-                mapper.get_corp_name(kill.victim_corporation_id)
-                or f"Corp {kill.victim_corporation_id}"
-            )
-            if victim_faction:
                 return NPCFactionTriggerResult(
                     matched=True,
-                    faction=victim_faction,
-                    corporation_id=kill.victim_corporation_id,
+                    faction=attacker_faction,
+                    corporation_id=attacker_corp_id,
                     corporation_name=corp_name,
-                    role="victim",
+                    role="attacker",
                 )
 
-    return None
+    # Check victim (someone killed the NPC)
+    if not config.as_victim:
+        return None
+
+    victim_corp_id = kill.victim_corporation_id
+    if victim_corp_id is None:
+        return None
+    victim_faction = npc_corp_factions.get(victim_corp_id)
+    if victim_faction is None or victim_faction not in watched_factions:
+        return None
+
+    corp_name = mapper.get_corp_name(victim_corp_id) or f"Corp {victim_corp_id}"
+    return NPCFactionTriggerResult(
+        matched=True,
+        faction=victim_faction,
+        corporation_id=victim_corp_id,
+        corporation_name=corp_name,
+        role="victim",
+    )
 
 
 def _resolve_entity_name(entity_type: str, entity_id: int) -> str:
@@ -1,9 +1,9 @@
 """
 Notification Worker.
 
-A single worker that polls the killmail store and processes kills
-for a specific notification profile. Workers are managed by the
-WorkerSupervisor.
+A single worker that processes kills for a specific notification
+profile, either routed to it by the KillDispatcher or polled from the
+killmail store. Workers are managed by the WorkerSupervisor.
 """
 
 from __future__ import annotations
@@ -18,6 +18,7 @@ from typing import TYPE_CHECKING, Any
 import httpx
 
 from ....core.logging import get_logger
+from .dispatcher import KillInbox, profile_system_ids
 
 if TYPE_CHECKING:
     from ...killmail_store import ESIKillmail, KillmailRecord, SQLiteKillmailStore
@@ -47,6 +48,7 @@ class WorkerMetrics:
     notifications_sent: int = 0
     notifications_failed: int = 0
     rollups_sent: int = 0
+    inbox_catch_ups: int = 0  # Store re-reads after the inbox dropped batches
     last_poll_time: datetime | None = None
     last_notification_time: datetime | None = None
     consecutive_errors: int = 0
@@ -56,10 +58,14 @@ class WorkerMetrics:
 @dataclass
 class NotificationWorker:
     """
-    Worker that polls killmail store for a single profile.
+    Worker that delivers kills for a single profile.
+
+    Kills arrive on the inbox queue fed by a shared KillDispatcher or, when
+    no inbox is set, the worker polls the store itself.
 
     Each worker:
-    1. Polls the store for kills since last_processed_time - overlap_window
+    1. Receives routed kills, or polls the store for kills since
+       last_processed_time - overlap_window
     2. Checks processed_kills table for duplicates
     3. Evaluates triggers against each kill
     4. Coordinates ESI fetch if needed
@@ -79,6 +85,9 @@ class NotificationWorker:
     _format_kill: Any = None  # Callable[[KillmailRecord, ...], dict]
     _evaluate_triggers: Any = None  # Callable[[KillmailRecord], TriggerResult | None]
 
+    # Kill batches routed by the KillDispatcher (None = poll the store directly)
+    inbox: KillInbox | None = field(default=None, repr=False)
+
     # Runtime state
     _state: WorkerState = field(default=WorkerState.STOPPED, repr=False)
     _task: asyncio.Task | None = field(default=None, repr=False)
@@ -88,6 +97,7 @@ class NotificationWorker:
     # Rate limit tracking
     _pending_kills: list[KillmailRecord] = field(default_factory=list, repr=False)
     _rate_limited_until: float = 0.0
+    _backlog: list[KillmailRecord] = field(default_factory=list, repr=False)
 
     # HTTP client for ESI fetches (lazy-initialized)
     _http_client: httpx.AsyncClient | None = field(default=None, repr=False)
@@ -250,7 +260,10 @@ class NotificationWorker:
         try:
             while not self._stop_event.is_set():
                 try:
-                    await self._poll_once()
+                    if self.inbox is not None:
+                        await self._receive_once()
+                    else:
+                        await self._poll_once()
                     self._metrics.consecutive_errors = 0
                 except asyncio.CancelledError:
                     raise
@@ -280,8 +293,9 @@ class NotificationWorker:
                     await asyncio.sleep(wait_time)
                     continue
 
-                # Normal poll interval
-                await asyncio.sleep(self.profile.polling.interval_seconds)
+                # Normal poll interval (inbox waits already pace the loop)
+                if self.inbox is None:
+                    await asyncio.sleep(self.profile.polling.interval_seconds)
 
         except asyncio.CancelledError:
             logger.debug("Worker '%s' cancelled", self.name)
@@ -295,11 +309,8 @@ class NotificationWorker:
                 self._state = WorkerState.STOPPED
             logger.info("Worker '%s' stopped", self.name)
 
-    async def _poll_once(self) -> None:
-        """Execute a single poll iteration."""
-        self._metrics.last_poll_time = datetime.utcnow()
-
-        # Check if we should send rollup (after rate limit clears)
+    async def _maybe_send_rollup(self) -> None:
+        """Send a rollup if enough kills are pending (after rate limit clears)."""
         if (
             self._pending_kills
             and len(self._pending_kills) >= self.profile.rate_limit_strategy.rollup_threshold
@@ -307,6 +318,48 @@ class NotificationWorker:
             max_rollup = self.profile.rate_limit_strategy.max_rollup_kills
             await self._send_rollup(self._pending_kills[:max_rollup])
 
+    async def _receive_once(self) -> None:
+        """
+        Deliver the next batch routed to this worker by the KillDispatcher.
+
+        Waits up to one polling interval so pending rollups and kills left
+        over from a rate limit are retried even when no new kills arrive.
+        If the dispatcher dropped batches because this worker fell behind,
+        polls the store from the checkpoint first instead.
+        """
+        assert self.inbox is not None
+        if self.inbox.overflowed:
+            self.inbox.overflowed = False
+            self._metrics.inbox_catch_ups += 1
+            logger.warning("Worker '%s' inbox overflowed, catching up from store", self.name)
+            await self._poll_once()
+            return
+
+        try:
+            kills = await asyncio.wait_for(
+                self.inbox.get(), timeout=self.profile.polling.interval_seconds
+            )
+        except asyncio.TimeoutError:
+            kills = []
+
+        self._metrics.last_poll_time = datetime.utcnow()
+        await self._maybe_send_rollup()
+
+        # Kills cut off by a rate limit go first, deduplicated by ID
+        batch = list({kill.kill_id: kill for kill in self._backlog + kills}.values())
+        self._backlog = []
+        if not batch:
+            return
+
+        worker_state = await self.store.get_worker_state(self.name)
+        last_processed_time = worker_state.last_processed_time if worker_state else 0
+        self._backlog = await self._process_kills(batch, last_processed_time)
+
+    async def _poll_once(self) -> None:
+        """Execute a single poll iteration."""
+        self._metrics.last_poll_time = datetime.utcnow()
+        await self._maybe_send_rollup()
+
         # Get worker state from database
         worker_state = await self.store.get_worker_state(self.name)
         last_processed_time = worker_state.last_processed_time if worker_state else 0
@@ -315,14 +368,8 @@ class NotificationWorker:
         overlap = self.profile.polling.overlap_window_seconds
         since_time = last_processed_time - overlap if last_processed_time > 0 else 0
 
-        # Extract system IDs from topology filter (if configured)
-        system_ids: list[int] | None = None
-        if self.profile._topology_filter is not None:
-            geo_layer = self.profile._topology_filter.get_layer("geographic")
-            if geo_layer is not None and hasattr(geo_layer, "_interest_map"):
-                system_ids = list(geo_layer._interest_map.keys())
-
         # Query kills from store with system filtering
+        system_ids = profile_system_ids(self.profile)
         since = datetime.fromtimestamp(since_time) if since_time > 0 else None
         kills = await self.store.query_kills(
             systems=system_ids,
@@ -339,86 +386,115 @@ class NotificationWorker:
             len(kills),
             since.isoformat() if since else "start",
         )
+        await self._process_kills(kills, last_processed_time)
+
+    async def _process_kills(
+        self, kills: list[KillmailRecord], last_processed_time: int
+    ) -> list[KillmailRecord]:
+        """
+        Evaluate, deliver and record a batch of kills.
+
+        Args:
+            kills: Kills to process
+            last_processed_time: Persisted high-water mark
+
+        Returns:
+            Kills not processed because delivery hit a rate limit (starting
+            with the rate-limited kill), or an empty list
+        """
+        # Dedup the whole window in one query. Processed kills are recorded
+        # in one transaction when the window ends, including early exits.
+        unprocessed = await self.store.filter_unprocessed(
+            self.name, [kill.kill_id for kill in kills]
+        )
+        processed: list[int] = []
 
         # Process each kill
         new_high_water = last_processed_time
-        for kill in kills:
-            # Check for duplicates
-            if await self.store.is_kill_processed(self.name, kill.kill_id):
-                self._metrics.kills_skipped_duplicate += 1
-                continue
-
-            # Evaluate triggers (if callback set)
-            trigger_result = None
-            if self._evaluate_triggers:
-                trigger_result = self._evaluate_triggers(kill)
-                if trigger_result is None:
-                    self._metrics.kills_skipped_filter += 1
-                    # Still mark as processed to avoid re-evaluating
-                    await self.store.mark_kill_processed(self.name, kill.kill_id)
+        try:
+            for position, kill in enumerate(kills):
+                # Check for duplicates
+                if kill.kill_id not in unprocessed:
+                    self._metrics.kills_skipped_duplicate += 1
                     continue
 
-            # Check if we need ESI data and coordinate fetch
-            esi_data = None
-            if trigger_result and getattr(trigger_result, "requires_esi", False):
-                claimed, existing = await self.esi_coordinator.try_claim(kill, self.name)
-                if existing:
-                    esi_data = existing
-                elif claimed:
-                    # Fetch from ESI with coordination
-                    try:
-                        fetched = await self._fetch_esi_killmail(kill)
-                        if fetched:
-                            await self.esi_coordinator.complete_success(kill.kill_id, fetched)
-                            esi_data = fetched
-                        else:
-                            # Fetch failed - let coordinator track attempts
+                # Evaluate triggers (if callback set)
+                trigger_result = None
+                if self._evaluate_triggers:
+                    trigger_result = self._evaluate_triggers(kill)
+                    if trigger_result is None:
+                        self._metrics.kills_skipped_filter += 1
+                        # Still mark as processed to avoid re-evaluating
+                        processed.append(kill.kill_id)
+                        continue
+
+                # Check if we need ESI data and coordinate fetch
+                esi_data = None
+                if trigger_result and getattr(trigger_result, "requires_esi", False):
+                    claimed, existing = await self.esi_coordinator.try_claim(kill, self.name)
+                    if existing:
+                        esi_data = existing
+                    elif claimed:
+                        # Fetch from ESI with coordination
+                        try:
+                            fetched = await self._fetch_esi_killmail(kill)
+                            if fetched:
+                                await self.esi_coordinator.complete_success(kill.kill_id, fetched)
+                                esi_data = fetched
+                            else:
+                                # Fetch failed - let coordinator track attempts
+                                await self.esi_coordinator.complete_failure(
+                                    kill.kill_id, "Fetch returned None", self.name
+                                )
+                        except Exception as e:
+                            logger.warning("ESI fetch error for kill %d: %s", kill.kill_id, e)
                             await self.esi_coordinator.complete_failure(
-                                kill.kill_id, "Fetch returned None", self.name
+                                kill.kill_id, str(e), self.name
+                            )
+
+                # Format and send notification
+                if self._format_kill and self._send_notification:
+                    payload = self._format_kill(kill, trigger_result, esi_data)
+                    result = await self._send_notification(payload, self.profile.webhook_url)
+
+                    # Handle SendResult object or bool return
+                    if hasattr(result, "success"):
+                        success = result.success
+                        # Check for rate limit
+                        if hasattr(result, "is_rate_limited") and result.is_rate_limited:
+                            backoff = (
+                                result.retry_after
+                                or self.profile.rate_limit_strategy.backoff_seconds
+                            )
+                            self._rate_limited_until = time.time() + backoff
+                            self._pending_kills.append(kill)
+                            self._metrics.notifications_failed += 1
+                            logger.warning(
+                                "Worker '%s' rate limited for %.1fs, %d kills pending",
+                                self.name,
+                                backoff,
+                                len(self._pending_kills),
                             )
-                    except Exception as e:
-                        logger.warning("ESI fetch error for kill %d: %s", kill.kill_id, e)
-                        await self.esi_coordinator.complete_failure(kill.kill_id, str(e), self.name)
-
-            # Format and send notification
-            if self._format_kill and self._send_notification:
-                payload = self._format_kill(kill, trigger_result, esi_data)
-                result = await self._send_notification(payload, self.profile.webhook_url)
-
-                # Handle SendResult object or bool return
-                if hasattr(result, "success"):
-                    success = result.success
-                    # Check for rate limit
-                    if hasattr(result, "is_rate_limited") and result.is_rate_limited:
-                        backoff = (
-                            result.retry_after or self.profile.rate_limit_strategy.backoff_seconds
-                        )
-                        self._rate_limited_until = time.time() + backoff
-                        self._pending_kills.append(kill)
+                            # Exit early; marks for kills before this one are still flushed
+                            return kills[position:]
+                    else:
+                        success = bool(result)
+
+                    if success:
+                        self._metrics.notifications_sent += 1
+                        self._metrics.last_notification_time = datetime.utcnow()
+                    else:
                         self._metrics.notifications_failed += 1
-                        logger.warning(
-                            "Worker '%s' rate limited for %.1fs, %d kills pending",
-                            self.name,
-                            backoff,
-                            len(self._pending_kills),
-                        )
-                        return  # Exit poll iteration early
-                else:
-                    success = bool(result)
-
-                if success:
-                    self._metrics.notifications_sent += 1
-                    self._metrics.last_notification_time = datetime.utcnow()
-                else:
-                    self._metrics.notifications_failed += 1
-
-            # Mark as processed
-            await self.store.mark_kill_processed(self.name, kill.kill_id)
-            self._metrics.kills_processed += 1
-
-            # Update high-water mark
-            if kill.kill_time > new_high_water:
-                new_high_water = kill.kill_time
+
+                # Mark as processed
+                processed.append(kill.kill_id)
+                self._metrics.kills_processed += 1
+
+                # Update high-water mark
+                if kill.kill_time > new_high_water:
+                    new_high_water = kill.kill_time
+        finally:
+            await self.store.mark_processed_batch(self.name, processed)
 
         # Persist worker state
         if new_high_water > last_processed_time:
@@ -428,6 +504,7 @@ class NotificationWorker:
                 last_poll_at=int(time.time()),
                 consecutive_failures=self._metrics.consecutive_errors,
             )
+        return []
 
     async def _send_rollup(self, kills: list[KillmailRecord]) -> bool:
         """
@@ -486,8 +563,7 @@ class NotificationWorker:
             if success:
                 self._metrics.rollups_sent += 1
                 # Mark all as processed
-                for kill in kills:
-                    await self.store.mark_kill_processed(self.name, kill.kill_id)
+                await self.store.mark_processed_batch(self.name, [k.kill_id for k in kills])
                 # Clear pending kills that were rolled up
                 self._pending_kills = [k for k in self._pending_kills if k not in kills]
                 return True
@@ -507,6 +583,7 @@ class NotificationWorker:
                 "notifications_sent": self._metrics.notifications_sent,
                 "notifications_failed": self._metrics.notifications_failed,
                 "rollups_sent": self._metrics.rollups_sent,
+                "inbox_catch_ups": self._metrics.inbox_catch_ups,
                 "consecutive_errors": self._metrics.consecutive_errors,
                 "total_errors": self._metrics.total_errors,
             },
@@ -17,18 +17,20 @@ import httpx
 
 from ...core.logging import get_logger
 from ..killmail_store import BoundedKillQueue, SQLiteKillmailStore
-from .database import get_realtime_database
-from .fetch_queue import get_fetch_queue
+from .database import RealtimeKillWriter, RecentKillIds, get_realtime_database
+from .fetch_queue import FETCH_PRIORITY_NORMAL, get_fetch_queue
+from .kill_index import RecentKillIndex
 from .models import IngestMetrics, PollerStatus, QueuedKill, RedisQConfig
 from .processor import KillFilter, create_filter_from_config
 
 if TYPE_CHECKING:
-    from .entity_filter import EntityAwareFilter
+    from .entity_filter import EntityAwareFilter, EntityMatchResult
     from .models import ProcessedKill
     from .name_resolver import NameResolver
     from .notifications import NotificationManager
+    from .threat_cache import GatecampStatus, GatecampTracker
     from .topology import TopologyFilter
-    from .war_context import WarContextProvider
+    from .war_context import KillWarContext, WarContextProvider
 
 logger = get_logger(__name__)
 
@@ -92,6 +94,17 @@ class RedisQPoller:
     _writer_interval_seconds: float = 1.0
     _writer_batch_size: int = 100
 
+    # Legacy realtime_kills writes (off the event loop) and dedup set
+    _kill_writer: RealtimeKillWriter | None = None
+    _recent_kill_ids: RecentKillIds = field(default_factory=RecentKillIds)
+    _notification_tasks: set[asyncio.Task] = field(default_factory=set)
+
+    # In-memory recent kill index, shared with the threat cache
+    _kill_index: RecentKillIndex | None = None
+
+    # Incremental gatecamp detection, shared with the threat cache
+    _gatecamp_tracker: GatecampTracker | None = None
+
     async def start(self) -> None:
         """
         Start the poller service.
@@ -172,9 +185,13 @@ class RedisQPoller:
         try:
             from ...core.config import get_settings
 
-            store_path = get_settings().killmail_db_path
+            settings = get_settings()
+            store_path = settings.killmail_db_path
             store_path.parent.mkdir(parents=True, exist_ok=True)
-            self._killmail_store = SQLiteKillmailStore(db_path=store_path)
+            self._killmail_store = SQLiteKillmailStore(
+                db_path=store_path,
+                partition_by_day=settings.killmail_partition_by_day,
+            )
             await self._killmail_store.initialize()
             self._ingest_queue = BoundedKillQueue(maxsize=1000)
             logger.info("Killmail store initialized: %s", store_path)
@@ -205,6 +222,48 @@ class RedisQPoller:
             logger.warning("Failed to initialize name resolver: %s", e)
             self._name_resolver = None
 
+        # Start background writer for realtime_kills and seed the dedup set
+        self._kill_writer = RealtimeKillWriter(db.db_path)
+        self._kill_writer.start()
+        try:
+            recent_ids = await asyncio.to_thread(
+                db.get_recent_kill_ids, self._recent_kill_ids.capacity
+            )
+            self._recent_kill_ids.update(list(reversed(recent_ids)))
+        except Exception as e:
+            logger.warning("Failed to load recent kill IDs: %s", e)
+
+        # Bootstrap the recent kill index so threat queries skip SQLite
+        try:
+            from .threat_cache import get_threat_cache
+
+            kill_index = RecentKillIndex()
+            await asyncio.to_thread(kill_index.bootstrap, db)
+            get_threat_cache().attach_index(kill_index)
+            self._kill_index = kill_index
+        except Exception as e:
+            logger.warning("Failed to bootstrap recent kill index: %s", e)
+            self._kill_index = None
+
+        # Seed gatecamp detection with kills still inside its window
+        try:
+            from .threat_cache import (
+                GATECAMP_WINDOW_SECONDS,
+                GatecampTracker,
+                get_threat_cache,
+            )
+
+            tracker = GatecampTracker(war_context=self._war_context_provider)
+            recent = await asyncio.to_thread(
+                db.get_kills_since, since_minutes=GATECAMP_WINDOW_SECONDS // 60
+            )
+            tracker.bootstrap(kill for kill, _ in recent)
+            get_threat_cache().attach_gatecamp_tracker(tracker)
+            self._gatecamp_tracker = tracker
+        except Exception as e:
+            logger.warning("Failed to bootstrap gatecamp tracker: %s", e)
+            self._gatecamp_tracker = None
+
         # Create HTTP client with long timeout for polling
         # follow_redirects required: /listen.php redirects to /object.php as of Aug 2025
         self._client = httpx.AsyncClient(
@@ -306,6 +365,25 @@ class RedisQPoller:
         fetch_queue = get_fetch_queue()
         await fetch_queue.stop_processing()
 
+        # Let in-flight notifications finish, then flush pending realtime kills
+        if self._notification_tasks:
+            await asyncio.gather(*self._notification_tasks, return_exceptions=True)
+        if self._kill_writer:
+            await asyncio.to_thread(self._kill_writer.stop)
+            self._kill_writer = None
+
+        # Detach the kill index; the threat cache falls back to the database
+        if self._kill_index is not None:
+            from .threat_cache import get_threat_cache
+
+            get_threat_cache().attach_index(None)
+            self._kill_index = None
+        if self._gatecamp_tracker is not None:
+            from .threat_cache import get_threat_cache
+
+            get_threat_cache().attach_gatecamp_tracker(None)
+            self._gatecamp_tracker = None
+
         # Persist final poll time for gap recovery on next startup
         if self._last_poll_time:
             db = get_realtime_database()
@@ -492,9 +570,11 @@ class RedisQPoller:
                 await self._ingest_queue.put(record)
                 logger.debug("Enqueued kill %d for storage", queued_kill.kill_id)
 
-            # Check if already in legacy database (for ESI fetch decision)
-            db = get_realtime_database()
-            if db.kill_exists(queued_kill.kill_id):
+            # Skip kills already saved (for ESI fetch decision). The set is
+            # seeded from the legacy database on start and updated as kills
+            # are saved, so no query per kill. Kills that were dropped,
+            # filtered or failed to fetch stay eligible for a later fetch.
+            if queued_kill.kill_id in self._recent_kill_ids:
                 logger.debug(
                     "Kill %d already in legacy db, skipping ESI fetch", queued_kill.kill_id
                 )
@@ -502,14 +582,17 @@ class RedisQPoller:
 
             # Apply topology pre-filter for ESI fetch decision (saves API quota)
             # Storage happens unconditionally above; this only affects ESI enrichment
+            priority = FETCH_PRIORITY_NORMAL
             if self._topology_filter and self._topology_filter.is_active:
-                if not self._topology_filter.should_fetch(queued_kill):
+                fetch_priority = self._topology_filter.fetch_priority(queued_kill)
+                if fetch_priority is None:
                     # Kill stored but not worth fetching ESI details
                     return
+                priority = fetch_priority
 
-            # Queue for ESI fetch
+            # Queue for ESI fetch (high-interest systems jump the queue)
             fetch_queue = get_fetch_queue()
-            await fetch_queue.enqueue(queued_kill)
+            await fetch_queue.enqueue(queued_kill, priority)
 
             logger.debug("Queued kill %d for ESI fetch", queued_kill.kill_id)
 
@@ -522,6 +605,8 @@ class RedisQPoller:
         Callback when a kill is fetched and parsed.
 
         Applies filters and saves to database with entity match data.
+        Runs on the event loop, so the save is handed to the background
+        writer and notification lookups run in a worker thread.
         """
         # Apply topology filter post-fetch (pre-fetch filter may not have system ID)
         # This is the authoritative filter - pre-fetch is just an optimization
@@ -564,53 +649,31 @@ class RedisQPoller:
             entity_match = None
 
         # Save to database with entity match data
-        db = get_realtime_database()
-        db.save_kill(kill, entity_match)
+        if self._kill_writer is not None and self._kill_writer.is_running:
+            self._kill_writer.submit(kill, entity_match)
+        else:
+            db = get_realtime_database()
+            db.save_kill(kill, entity_match)
+        self._recent_kill_ids.add(kill.kill_id)
+
+        if self._kill_index is not None:
+            self._kill_index.add(kill, watched=bool(entity_match and entity_match.has_match))
+
+        # Classify war engagement once; the tracker and notification share it
+        war_context = None
+        if self._war_context_provider:
+            war_context = self._war_context_provider.check_kill(kill)
+        if self._gatecamp_tracker is not None:
+            self._gatecamp_tracker.add(kill, war=war_context)
 
         self._kills_processed += 1
         self._last_kill_time = kill.kill_time
 
         # Trigger notifications if configured
         if self._notification_manager and self._notification_manager.is_configured:
-            try:
-                # Get war context for the kill
-                war_context = None
-                if self._war_context_provider:
-                    war_context = self._war_context_provider.check_kill(kill)
-
-                # Get gatecamp status for the system (with war context filtering)
-                from .threat_cache import get_threat_cache
-
-                threat_cache = get_threat_cache()
-                gatecamp_status = threat_cache.get_gatecamp_status(
-                    kill.solar_system_id,
-                    war_context=self._war_context_provider,
-                )
-
-                # Resolve display names for notification
-                system_name = None
-                ship_name = None
-                if self._name_resolver:
-                    system_name = self._name_resolver.resolve_system_name(kill.solar_system_id)
-                    ship_name = (
-                        self._name_resolver.resolve_type_name(kill.victim_ship_type_id)
-                        if kill.victim_ship_type_id
-                        else None
-                    )
-
-                # Fire async notification processing
-                asyncio.create_task(
-                    self._notification_manager.process_kill(
-                        kill=kill,
-                        entity_match=entity_match,
-                        gatecamp_status=gatecamp_status,
-                        war_context=war_context,
-                        system_name=system_name,
-                        ship_name=ship_name,
-                    )
-                )
-            except Exception as e:
-                logger.debug("Notification trigger failed: %s", e)
+            task = asyncio.create_task(self._notify(kill, entity_match, war_context))
+            self._notification_tasks.add(task)
+            task.add_done_callback(self._notification_tasks.discard)
 
         # Track watched entity kills
         if entity_match and entity_match.has_match:
@@ -629,6 +692,67 @@ class RedisQPoller:
                 kill.total_value,
             )
 
+    async def _notify(
+        self,
+        kill: ProcessedKill,
+        entity_match: EntityMatchResult | None,
+        war_context: KillWarContext | None = None,
+    ) -> None:
+        """Gather notification context off the event loop and send the notification."""
+        if self._notification_manager is None:
+            return
+
+        try:
+            # Without the kill index, gatecamp detection reads realtime_kills,
+            # so this kill must be committed first
+            if self._kill_index is None and self._kill_writer is not None:
+                await asyncio.to_thread(self._kill_writer.flush)
+
+            gatecamp_status, system_name, ship_name = await asyncio.to_thread(
+                self._notification_context, kill
+            )
+
+            await self._notification_manager.process_kill(
+                kill=kill,
+                entity_match=entity_match,
+                gatecamp_status=gatecamp_status,
+                war_context=war_context,
+                system_name=system_name,
+                ship_name=ship_name,
+            )
+        except Exception as e:
+            logger.debug("Notification trigger failed: %s", e)
+
+    def _notification_context(
+        self, kill: ProcessedKill
+    ) -> tuple[GatecampStatus | None, str | None, str | None]:
+        """
+        Look up gatecamp status and display names for a kill.
+
+        Blocking (SQLite and SDE lookups); run via asyncio.to_thread.
+        """
+        # Get gatecamp status for the system (with war context filtering)
+        from .threat_cache import get_threat_cache
+
+        threat_cache = get_threat_cache()
+        gatecamp_status = threat_cache.get_gatecamp_status(
+            kill.solar_system_id,
+            war_context=self._war_context_provider,
+        )
+
+        # Resolve display names for notification
+        system_name = None
+        ship_name = None
+        if self._name_resolver:
+            system_name = self._name_resolver.resolve_system_name(kill.solar_system_id)
+            ship_name = (
+                self._name_resolver.resolve_type_name(kill.victim_ship_type_id)
+                if kill.victim_ship_type_id
+                else None
+            )
+
+        return gatecamp_status, system_name, ship_name
+
     async def _cleanup_loop(self) -> None:
         """Periodic cleanup of old kills and detections."""
         while self._running:
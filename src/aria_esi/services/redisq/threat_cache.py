@@ -8,17 +8,21 @@ real-time kill data for ARIA skills.
 from __future__ import annotations
 
 import json
+import threading
 import time
+from bisect import insort
 from collections import Counter
-from dataclasses import dataclass, field
+from collections.abc import Iterable
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING
 
 from ...core.logging import get_logger
 
 if TYPE_CHECKING:
+    from .kill_index import RecentKillIndex
     from .models import ProcessedKill
-    from .war_context import WarContextProvider
+    from .war_context import KillWarContext, WarContextProvider
 
 logger = get_logger(__name__)
 
@@ -248,34 +252,50 @@ def detect_gatecamp(
     if len(kills) < GATECAMP_MIN_KILLS:
         return None
 
-    # Analyze kill pattern
-    victim_corps: set[int] = set()
-    attacker_corps: set[int] = set()
-    attacker_alliances: set[int] = set()
-    attacker_corp_counts: Counter[int] = Counter()
-    all_attacker_ships: set[int] = set()
-    total_attacker_count = 0
-
+    aggregate = _CampAggregate()
     for kill in kills:
-        if kill.victim_corporation_id:
-            victim_corps.add(kill.victim_corporation_id)
+        aggregate.add(kill)
 
-        attacker_corps.update(kill.attacker_corps)
-        attacker_alliances.update(kill.attacker_alliances)
-        all_attacker_ships.update(kill.attacker_ship_types)
-        total_attacker_count += kill.attacker_count
+    return _score_gatecamp(
+        system_id,
+        system_name,
+        aggregate,
+        first_kill_time=min(k.kill_time for k in kills),
+        last_kill_time=max(k.kill_time for k in kills),
+        war_kills_filtered=war_kills_filtered,
+        war_attacker_alliance=war_attacker_alliance,
+        war_defender_alliance=war_defender_alliance,
+    )
 
-        for corp in kill.attacker_corps:
-            attacker_corp_counts[corp] += 1
+
+def _score_gatecamp(
+    system_id: int,
+    system_name: str | None,
+    aggregate: _CampAggregate,
+    first_kill_time: datetime,
+    last_kill_time: datetime,
+    war_kills_filtered: int = 0,
+    war_attacker_alliance: int | None = None,
+    war_defender_alliance: int | None = None,
+) -> GatecampStatus | None:
+    """
+    Apply the gatecamp heuristics to aggregated kill statistics.
+
+    Shared by detect_gatecamp and GatecampTracker so both paths score
+    identically. See detect_gatecamp for the heuristics.
+    """
+    kill_count = aggregate.kill_count
+    if kill_count < GATECAMP_MIN_KILLS:
+        return None
 
     # Calculate force asymmetry (average attackers per kill)
-    avg_attacker_count = total_attacker_count / len(kills) if kills else 0
+    avg_attacker_count = aggregate.total_attackers / kill_count
     high_force_asymmetry = avg_attacker_count >= FORCE_ASYMMETRY_THRESHOLD
 
     # Camp detection: multiple victim corps OR high force asymmetry
     # Single victim corp with similar-sized forces = fleet fight
     # Single victim corp but 5:1 attacker ratio = still a camp
-    is_camp = len(victim_corps) > 1 or high_force_asymmetry
+    is_camp = len(aggregate.victim_corps) > 1 or high_force_asymmetry
 
     if not is_camp:
         return None
@@ -284,25 +304,26 @@ def detect_gatecamp(
     confidence_score = 0
 
     # Factor 1: Kill count
-    if len(kills) >= 5:
+    if kill_count >= 5:
         confidence_score += 2
     else:
         confidence_score += 1
 
     # Factor 2: Pod kill ratio (camps kill pods, fights often don't)
-    pod_kills = sum(1 for k in kills if k.is_pod_kill)
-    ship_kills = len(kills) - pod_kills
+    pod_kills = aggregate.pod_kills
+    ship_kills = kill_count - pod_kills
     if ship_kills > 0 and pod_kills / ship_kills >= 0.5:
         confidence_score += 1
 
     # Factor 3: Attacker consistency (same group across kills)
-    if attacker_corp_counts:
-        most_common_count = attacker_corp_counts.most_common(1)[0][1]
-        if most_common_count >= len(kills) * 0.7:
-            confidence_score += 1
+    if aggregate.max_corp_count and aggregate.max_corp_count >= kill_count * 0.7:
+        confidence_score += 1
 
-    # Factor 4: Smartbomb camp detection
-    is_smartbomb = detect_smartbomb_camp(kills, all_attacker_ships)
+    # Factor 4: Smartbomb camp detection (same test as detect_smartbomb_camp)
+    is_smartbomb = (
+        aggregate.has_smartbomb_ships()
+        and (last_kill_time - first_kill_time).total_seconds() <= SMARTBOMB_WINDOW_SECONDS
+    )
     if is_smartbomb:
         confidence_score += 1
 
@@ -321,13 +342,13 @@ def detect_gatecamp(
     return GatecampStatus(
         system_id=system_id,
         system_name=system_name,
-        kill_count=len(kills),
+        kill_count=kill_count,
         window_minutes=GATECAMP_WINDOW_SECONDS // 60,
-        attacker_corps=list(attacker_corps),
-        attacker_alliances=list(attacker_alliances),
-        attacker_ships=list(all_attacker_ships),
+        attacker_corps=list(aggregate.attacker_corps),
+        attacker_alliances=list(aggregate.attacker_alliances),
+        attacker_ships=list(aggregate.attacker_ships),
         confidence=confidence,
-        last_kill_time=max(k.kill_time for k in kills),
+        last_kill_time=last_kill_time,
         is_smartbomb_camp=is_smartbomb,
         force_asymmetry=round(avg_attacker_count, 1),
         war_kills_filtered=war_kills_filtered,
@@ -336,6 +357,325 @@ def detect_gatecamp(
     )
 
 
+# =============================================================================
+# Incremental Gatecamp Detection
+# =============================================================================
+
+
+def _bump(counter: Counter[int], key: int, delta: int) -> None:
+    """Adjust a count, dropping the key when it reaches zero."""
+    value = counter[key] + delta
+    if value:
+        counter[key] = value
+    else:
+        del counter[key]
+
+
+class _CampAggregate:
+    """
+    Running gatecamp statistics over a set of kills.
+
+    Supports removing kills as well as adding them, so a sliding window
+    can be maintained with work proportional to the kill being added or
+    expired rather than the whole window.
+    """
+
+    def __init__(self) -> None:
+        self.kill_count = 0
+        self.pod_kills = 0
+        self.total_attackers = 0
+        self.victim_corps: Counter[int] = Counter()
+        # Attacker corp -> kills it appeared on
+        self.attacker_corps: Counter[int] = Counter()
+        self.attacker_alliances: Counter[int] = Counter()
+        self.attacker_ships: Counter[int] = Counter()
+        # Kills-per-corp value -> number of corps with that value, to track
+        # the most common attacker corp under removal
+        self._corp_count_freq: Counter[int] = Counter()
+        self.max_corp_count = 0
+
+    def add(self, kill: ProcessedKill) -> None:
+        """Include a kill."""
+        self._apply(kill, 1)
+
+    def remove(self, kill: ProcessedKill) -> None:
+        """Exclude a previously added kill."""
+        self._apply(kill, -1)
+
+    def has_smartbomb_ships(self) -> bool:
+        """Whether any known smartbomb platform is among the attackers."""
+        return any(self.attacker_ships[ship] for ship in SMARTBOMB_SHIP_TYPES)
+
+    def _apply(self, kill: ProcessedKill, sign: int) -> None:
+        self.kill_count += sign
+        if kill.is_pod_kill:
+            self.pod_kills += sign
+        self.total_attackers += sign * kill.attacker_count
+
+        if kill.victim_corporation_id:
+            _bump(self.victim_corps, kill.victim_corporation_id, sign)
+        for alliance in kill.attacker_alliances:
+            _bump(self.attacker_alliances, alliance, sign)
+        for ship in kill.attacker_ship_types:
+            _bump(self.attacker_ships, ship, sign)
+
+        for corp in kill.attacker_corps:
+            old = self.attacker_corps[corp]
+            new = old + sign
+            _bump(self.attacker_corps, corp, sign)
+            if old:
+                _bump(self._corp_count_freq, old, -1)
+            if new:
+                self._corp_count_freq[new] += 1
+            if new > self.max_corp_count:
+                self.max_corp_count = new
+            elif old == self.max_corp_count and not self._corp_count_freq[old]:
+                # The only corp at the maximum dropped by one
+                self.max_corp_count = new
+
+
+@dataclass
+class _CampWindow:
+    """Kills in one system's detection window and their aggregates."""
+
+    # (kill_time, kill_id, timestamp, kill, is_war, war relationship ids), ascending
+    entries: list[tuple[datetime, int, int, ProcessedKill, bool, tuple[int, int] | None]] = field(
+        default_factory=list
+    )
+    all_kills: _CampAggregate = field(default_factory=_CampAggregate)
+    non_war_kills: _CampAggregate = field(default_factory=_CampAggregate)
+    war_count: int = 0
+    # exclude_war -> last computed status, cleared when the window changes
+    status_cache: dict[bool, GatecampStatus | None] = field(default_factory=dict)
+
+
+class GatecampTracker:
+    """
+    Sliding-window gatecamp detector fed one kill at a time.
+
+    Keeps the last GATECAMP_WINDOW_SECONDS of kills per system together
+    with running aggregates (victim and attacker sets, attacker totals,
+    pod count, most common attacker corp), so adding or expiring a kill
+    costs time proportional to that kill's attackers. The GatecampStatus
+    for a system is rescored only after its window changes and is
+    otherwise served from cache; it matches detect_gatecamp over the
+    same kills.
+
+    War engagement is classified once, when a kill is added, using the
+    provider the tracker was created with; queries that filter war kills
+    must use that same provider.
+
+    Thread-safe: the poller adds kills on the event loop while
+    notification lookups read from worker threads.
+
+    Usage:
+        tracker = GatecampTracker(war_context=get_war_context_provider())
+        tracker.add(kill, war=provider.check_kill(kill))
+        tracker.status(system_id, exclude_war=True)
+    """
+
+    def __init__(
+        self,
+        war_context: WarContextProvider | None = None,
+        window_seconds: int = GATECAMP_WINDOW_SECONDS,
+    ):
+        self.war_context = war_context
+        self.window_seconds = window_seconds
+
+        self._systems: dict[int, _CampWindow] = {}
+        self._kill_ids: set[int] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def system_count(self) -> int:
+        """Number of systems with kills in the window."""
+        return len(self._systems)
+
+    def bootstrap(self, kills: Iterable[ProcessedKill], now: float | None = None) -> int:
+        """
+        Load kills from before the tracker started.
+
+        Args:
+            kills: Recent kills, e.g. realtime_kills rows from the last window
+            now: Current time (defaults to time.time())
+
+        Returns:
+            Number of kills added
+        """
+        added = 0
+        for kill in kills:
+            war = self.war_context.check_kill(kill) if self.war_context else None
+            if self.add(kill, war=war, now=now):
+                added += 1
+        return added
+
+    def add(
+        self,
+        kill: ProcessedKill,
+        war: KillWarContext | None = None,
+        now: float | None = None,
+    ) -> bool:
+        """
+        Add a kill to its system's window.
+
+        Args:
+            kill: Processed kill
+            war: War context for the kill from the tracker's provider
+            now: Current time (defaults to time.time())
+
+        Returns:
+            True if added, False if a duplicate or already outside the window
+        """
+        now = time.time() if now is None else now
+        ts = int(kill.kill_time.timestamp())
+        if ts <= now - self.window_seconds:
+            return False
+
+        is_war = bool(war and war.is_war_engagement)
+        relationship = None
+        if war is not None and is_war and war.relationship:
+            relationship = (war.relationship.aggressor_id, war.relationship.defender_id)
+
+        with self._lock:
+            if kill.kill_id in self._kill_ids:
+                return False
+            self._kill_ids.add(kill.kill_id)
+
+            window = self._systems.get(kill.solar_system_id)
+            if window is not None:
+                self._expire(kill.solar_system_id, window, now)
+            window = self._systems.setdefault(kill.solar_system_id, _CampWindow())
+            insort(
+                window.entries,
+                (kill.kill_time, kill.kill_id, ts, kill, is_war, relationship),
+                key=lambda e: e[:2],
+            )
+            window.all_kills.add(kill)
+            if is_war:
+                window.war_count += 1
+            else:
+                window.non_war_kills.add(kill)
+            window.status_cache.clear()
+        return True
+
+    def status(
+        self,
+        system_id: int,
+        system_name: str | None = None,
+        exclude_war: bool = False,
+        now: float | None = None,
+    ) -> GatecampStatus | None:
+        """
+        Get the current gatecamp status for a system.
+
+        Args:
+            system_id: System ID to check
+            system_name: Optional system name for display
+            exclude_war: Leave out war engagements (see detect_gatecamp)
+            now: Current time (defaults to time.time())
+
+        Returns:
+            GatecampStatus if camp detected, None otherwise
+        """
+        now = time.time() if now is None else now
+
+        with self._lock:
+            window = self._systems.get(system_id)
+            if window is None:
+                return None
+            if not self._expire(system_id, window, now):
+                return None
+
+            if exclude_war in window.status_cache:
+                result = window.status_cache[exclude_war]
+            else:
+                result = self._score(system_id, window, exclude_war)
+                window.status_cache[exclude_war] = result
+
+        if result is not None and result.system_name != system_name:
+            result = replace(result, system_name=system_name)
+        return result
+
+    def _score(
+        self, system_id: int, window: _CampWindow, exclude_war: bool
+    ) -> GatecampStatus | None:
+        """Score a window. Caller holds the lock."""
+        if not exclude_war:
+            return _score_gatecamp(
+                system_id,
+                None,
+                window.all_kills,
+                first_kill_time=window.entries[0][0],
+                last_kill_time=window.entries[-1][0],
+            )
+
+        if window.war_count == len(window.entries):
+            # Pure war engagement, not a camp
+            return None
+
+        aggregate = window.non_war_kills
+        if aggregate.kill_count < GATECAMP_MIN_KILLS:
+            return None
+
+        non_war_times = [entry[0] for entry in window.entries if not entry[4]]
+
+        # Metadata comes from the newest war kill, as detect_gatecamp reads
+        # kills newest first
+        war_attacker_alliance = war_defender_alliance = None
+        newest_war = next((entry for entry in reversed(window.entries) if entry[4]), None)
+        if newest_war is not None and newest_war[5] is not None:
+            war_attacker_alliance, war_defender_alliance = newest_war[5]
+
+        return _score_gatecamp(
+            system_id,
+            None,
+            aggregate,
+            first_kill_time=non_war_times[0],
+            last_kill_time=non_war_times[-1],
+            war_kills_filtered=window.war_count,
+            war_attacker_alliance=war_attacker_alliance,
+            war_defender_alliance=war_defender_alliance,
+        )
+
+    def _expire(self, system_id: int, window: _CampWindow, now: float) -> bool:
+        """
+        Drop kills that have left the window. Caller holds the lock.
+
+        Returns:
+            False if the system's window is now empty (and removed)
+        """
+        cutoff = now - self.window_seconds
+        expired = 0
+        for _, kill_id, ts, kill, is_war, _ in window.entries:
+            if ts > cutoff:
+                break
+            expired += 1
+            self._kill_ids.discard(kill_id)
+            window.all_kills.remove(kill)
+            if is_war:
+                window.war_count -= 1
+            else:
+                window.non_war_kills.remove(kill)
+
+        if expired:
+            del window.entries[:expired]
+            window.status_cache.clear()
+        if not window.entries:
+            del self._systems[system_id]
+            return False
+        return True
+
+    def get_stats(self) -> dict:
+        """Get tracker statistics."""
+        with self._lock:
+            kills = sum(len(w.entries) for w in self._systems.values())
+        return {
+            "systems": self.system_count,
+            "kills": kills,
+            "window_seconds": self.window_seconds,
+        }
+
+
 # =============================================================================
 # Threat Cache Class
 # =============================================================================
@@ -347,11 +687,63 @@ class ThreatCache:
 
     Provides high-level query methods for threat assessment,
     gatecamp detection, and activity summaries.
+
+    When a bootstrapped RecentKillIndex is attached (the poller does this
+    in its own process), per-system queries are answered from memory and
+    the database is only used for detection tracking and cleanup. An
+    attached GatecampTracker likewise serves gatecamp status without
+    rescanning the detection window.
     """
 
     def __init__(self):
         """Initialize the threat cache."""
         self._db = None
+        self._index: RecentKillIndex | None = None
+        self._gatecamp_tracker: GatecampTracker | None = None
+
+    def attach_index(self, index: RecentKillIndex | None) -> None:
+        """
+        Attach (or with None, detach) an in-memory recent kill index.
+
+        Args:
+            index: Index fed with every saved kill, or None
+        """
+        self._index = index
+
+    def attach_gatecamp_tracker(self, tracker: GatecampTracker | None) -> None:
+        """
+        Attach (or with None, detach) an incremental gatecamp tracker.
+
+        Args:
+            tracker: Tracker fed with every saved kill, or None
+        """
+        self._gatecamp_tracker = tracker
+
+    def _tracked_gatecamp(
+        self,
+        system_id: int,
+        system_name: str | None,
+        war_context: WarContextProvider | None,
+    ) -> tuple[bool, GatecampStatus | None]:
+        """
+        Get gatecamp status from the attached tracker.
+
+        Returns:
+            (answered, status); answered is False when no tracker is
+            attached or it classified war kills with a different provider
+        """
+        tracker = self._gatecamp_tracker
+        if tracker is None:
+            return False, None
+        if war_context is not None and war_context is not tracker.war_context:
+            return False, None
+        return True, tracker.status(system_id, system_name, exclude_war=war_context is not None)
+
+    def _indexed(self, since_minutes: int) -> RecentKillIndex | None:
+        """Get the attached index if it can answer a window."""
+        if self._index is not None and self._index.covers(since_minutes * 60):
+            return self._index
+        return None
 
     def _get_db(self):
         """Lazy-load database connection."""
@@ -403,6 +795,14 @@ class ThreatCache:
         Returns:
             List of ProcessedKill objects, newest first
         """
+        index = self._indexed(since_minutes)
+        if (
+            index is not None
+            and system_id is not None
+            and since_minutes * 60 <= index.detail_seconds
+        ):
+            return index.recent_kills(system_id, since_minutes * 60, limit=limit)
+
         db = self._get_db()
         return db.get_recent_kills(
             system_id=system_id,
@@ -445,14 +845,14 @@ class ThreatCache:
         Returns:
             GatecampStatus if camp detected, None otherwise
         """
-        # Get kills from detection window
-        db = self._get_db()
-        kills = db.get_recent_kills(
-            system_id=system_id,
-            since_minutes=GATECAMP_WINDOW_SECONDS // 60,
-        )
-
-        result = detect_gatecamp(system_id, kills, system_name, war_context)
+        answered, result = self._tracked_gatecamp(system_id, system_name, war_context)
+        if not answered:
+            # Get kills from detection window
+            kills = self.get_recent_kills(
+                system_id=system_id,
+                since_minutes=GATECAMP_WINDOW_SECONDS // 60,
+            )
+            result = detect_gatecamp(system_id, kills, system_name, war_context)
 
         # Save detection to tracking table if detected
         if result:
@@ -475,16 +875,20 @@ class ThreatCache:
         Returns:
             RealtimeActivitySummary with kill counts and gatecamp status
         """
-        db = self._get_db()
+        index = self._indexed(60)
 
         # Get kills for different time windows
-        kills_1h = db.get_recent_kills(system_id=system_id, since_minutes=60)
-        kills_10m = [
-            k
-            for k in kills_1h
-            if k.kill_time
-            >= datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(minutes=10)
-        ]
+        if index is not None:
+            kills_1h = index.recent_kills(system_id, 3600)
+            kills_10m = index.recent_kills(system_id, 600)
+        else:
+            kills_1h = self._get_db().get_recent_kills(system_id=system_id, since_minutes=60)
+            kills_10m = [
+                k
+                for k in kills_1h
+                if k.kill_time
+                >= datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(minutes=10)
+            ]
 
         # Count pod kills separately
         pod_kills_1h = sum(1 for k in kills_1h if k.is_pod_kill)
@@ -507,17 +911,22 @@ class ThreatCache:
                     break
 
         # Check for gatecamp
-        gatecamp = detect_gatecamp(system_id, kills_10m, system_name) if kills_10m else None
+        answered, gatecamp = self._tracked_gatecamp(system_id, system_name, None)
+        if not answered:
+            gatecamp = detect_gatecamp(system_id, kills_10m, system_name) if kills_10m else None
 
         if gatecamp:
             self._save_detection(gatecamp)
 
         # Get watched entity kill data
-        watched_kills = db.get_watched_entity_kills(
-            since_minutes=60,
-            system_ids=[system_id],
-            limit=10,
-        )
+        if index is not None:
+            watched_kills = index.recent_kills(system_id, 3600, limit=10, watched_only=True)
+        else:
+            watched_kills = self._get_db().get_watched_entity_kills(
+                since_minutes=60,
+                system_ids=[system_id],
+                limit=10,
+            )
         watched_entity_details = []
         for wk in watched_kills[:5]:  # Limit details to 5
             watched_entity_details.append(
@@ -584,24 +993,28 @@ class ThreatCache:
             (is_spike, current_hourly_rate, baseline_rate) if sufficient data,
             None if insufficient historical data (<24 hours)
         """
-        db = self._get_db()
-
-        # Get kills from last hour
-        kills_1h = db.get_recent_kills(system_id=system_id, since_minutes=60)
-        current_hourly_rate = float(len(kills_1h))
+        index = self._indexed(1440)
+        if index is not None:
+            # Exact counts from memory (the database path caps each query at 100 rows)
+            count_1h = index.count(system_id, 3600)
+            count_24h = index.count(system_id, 86400)
+        else:
+            db = self._get_db()
+            count_1h = len(db.get_recent_kills(system_id=system_id, since_minutes=60))
+            count_24h = len(db.get_recent_kills(system_id=system_id, since_minutes=1440))
 
-        # Get kills from last 24 hours (for baseline calculation)
-        kills_24h = db.get_recent_kills(system_id=system_id, since_minutes=1440)
+        # Kills in the last hour
+        current_hourly_rate = float(count_1h)
 
         # Need at least some historical data beyond the current hour
         # If we only have data from the last hour, we can't calculate a baseline
-        if len(kills_24h) <= len(kills_1h):
+        if count_24h <= count_1h:
             # Not enough historical data - the 24h kills are all from the last hour
             return None
 
         # Calculate baseline: average hourly rate over 24h excluding current hour
         # This prevents the current spike from inflating the baseline
-        historical_kills = len(kills_24h) - len(kills_1h)
+        historical_kills = count_24h - count_1h
         historical_hours = 23  # 24 hours minus the current hour
         baseline_rate = historical_kills / historical_hours
 
@@ -441,32 +441,57 @@ class TopologyFilter:
         Returns:
             True if kill should be fetched, False to filter out
         """
+        return self.fetch_priority(queued_kill) is not None
+
+    def fetch_priority(self, queued_kill: QueuedKill) -> int | None:
+        """
+        Decide whether and how urgently a kill should be fetched from ESI.
+
+        Kills scoring at or above the priority threshold (the calculator's
+        priority_threshold, or PRIORITY_THRESHOLD for a legacy interest
+        map) go in the high-priority fetch lane.
+
+        Args:
+            queued_kill: QueuedKill from RedisQ
+
+        Returns:
+            FETCH_PRIORITY_HIGH or FETCH_PRIORITY_NORMAL, or None to filter out
+        """
+        from .fetch_queue import FETCH_PRIORITY_HIGH, FETCH_PRIORITY_NORMAL
+
         # Passthrough if not active
         if not self.is_active:
-            return True
+            return FETCH_PRIORITY_NORMAL
 
         # Passthrough if system ID not available (conservative)
         if queued_kill.solar_system_id is None:
             self._passed += 1
-            return True
+            return FETCH_PRIORITY_NORMAL
 
         # Use calculator if available (context-aware mode)
         if self.calculator is not None:
-            if self.calculator.should_fetch(queued_kill.solar_system_id):
+            score = self.calculator.calculate_system_interest(queued_kill.solar_system_id)
+            if score.interest > self.calculator.fetch_threshold:
                 self._passed += 1
-                return True
+                if score.interest >= self.calculator.priority_threshold:
+                    return FETCH_PRIORITY_HIGH
+                return FETCH_PRIORITY_NORMAL
             self._filtered += 1
             logger.debug(
                 "Context-aware filter: kill %d in system %d filtered (below threshold)",
                 queued_kill.kill_id,
                 queued_kill.solar_system_id,
             )
-            return False
+            return None
 
         # Fallback to legacy interest map
         if self.interest_map and self.interest_map.is_interesting(queued_kill.solar_system_id):
+            from .interest import PRIORITY_THRESHOLD
+
             self._passed += 1
-            return True
+            if self.interest_map.get_interest(queued_kill.solar_system_id) >= PRIORITY_THRESHOLD:
+                return FETCH_PRIORITY_HIGH
+            return FETCH_PRIORITY_NORMAL
 
         # Filter out
         self._filtered += 1
@@ -475,7 +500,7 @@ class TopologyFilter:
             queued_kill.kill_id,
             queued_kill.solar_system_id,
         )
-        return False
+        return None
 
     def get_metrics(self) -> dict[str, Any]:
         """Get filter metrics."""
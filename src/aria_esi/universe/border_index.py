@@ -0,0 +1,136 @@
+"""
+Nearest-border index for loop planning.
+
+For every high-sec system, stores the BORDER_INDEX_SIZE closest border
+systems reachable without leaving high-sec, with their hop counts. Loop
+planning with the default high-sec filter reads candidates from this
+table instead of searching the graph from the origin.
+
+The index is written to the .universe container at build time (BROW/BIDX/
+BJMP sections) and, for files built without it, computed once on first use.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .graph import JUMPS_UNREACHABLE
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from .graph import UniverseGraph
+
+
+# Candidates kept per origin; loop planning asks for up to 3 * 15 borders
+BORDER_INDEX_SIZE = 48
+
+# Security at or above this is high-sec (matches UniverseGraph.highsec_systems)
+HIGHSEC_THRESHOLD = 0.45
+
+
+@dataclass(frozen=True)
+class BorderIndex:
+    """
+    Nearest border systems through high-sec, one row per high-sec system.
+
+    Rows are ordered by (jumps, border vertex index). The tail of rows with
+    fewer reachable borders than the index size is padding.
+    """
+
+    rows: NDArray[np.int32]
+    """(system_count,) row of each vertex, -1 for systems outside high-sec."""
+
+    systems: NDArray[np.int32]
+    """(row_count, size) border vertex indices, -1 for padding."""
+
+    jumps: NDArray[np.uint8]
+    """(row_count, size) hop counts, JUMPS_UNREACHABLE for padding."""
+
+    @property
+    def size(self) -> int:
+        """Border systems stored per origin."""
+        return int(self.systems.shape[1])
+
+    def nearest(self, origin_idx: int, limit: int, max_jumps: int) -> list[tuple[int, int]] | None:
+        """
+        Look up the closest border systems to a high-sec origin.
+
+        Args:
+            origin_idx: Origin vertex index
+            limit: Maximum borders to return
+            max_jumps: Maximum distance (inclusive)
+
+        Returns:
+            List of (vertex_idx, distance) tuples sorted by distance, or None
+            when the origin is not indexed or its row is full and more
+            borders may lie within max_jumps
+        """
+        position = int(self.rows[origin_idx])
+        if position < 0:
+            return None
+
+        row = self.jumps[position]
+        within = int(np.searchsorted(row, min(max_jumps, JUMPS_UNREACHABLE - 1), side="right"))
+        if within < limit and within == self.size:
+            return None
+
+        count = min(within, limit)
+        systems = self.systems[position, :count].tolist()
+        return list(zip(systems, row[:count].tolist(), strict=True))
+
+
+def compute_border_index(universe: UniverseGraph, size: int = BORDER_INDEX_SIZE) -> BorderIndex:
+    """
+    Build the nearest-border table for every high-sec system.
+
+    Runs one multi-source BFS over the high-sec subgraph (every high-sec
+    system to every border system) and keeps the closest `size` per row.
+
+    Args:
+        universe: UniverseGraph with border_systems populated
+        size: Border systems to keep per origin
+
+    Returns:
+        BorderIndex covering all high-sec systems
+    """
+    highsec = np.flatnonzero(universe.security >= HIGHSEC_THRESHOLD)
+    rows = np.full(universe.system_count, -1, dtype=np.int32)
+    rows[highsec] = np.arange(highsec.size, dtype=np.int32)
+    systems = np.full((highsec.size, size), -1, dtype=np.int32)
+    jumps = np.full((highsec.size, size), JUMPS_UNREACHABLE, dtype=np.uint8)
+
+    # Border systems are high-sec, so they are subgraph vertices too
+    borders = np.array(sorted(universe.border_systems), dtype=np.int64)
+    borders = borders[rows[borders] >= 0]
+    if borders.size:
+        # Induced subgraph numbers vertices in ascending original order (= rows)
+        subgraph = universe.graph.induced_subgraph(highsec.tolist())
+        hops = np.asarray(subgraph.distances(target=rows[borders].tolist()), dtype=np.float64)
+        hops[~np.isfinite(hops) | (hops > JUMPS_UNREACHABLE)] = JUMPS_UNREACHABLE
+
+        order = np.argsort(hops, axis=1, kind="stable")[:, :size]
+        nearest = np.take_along_axis(hops, order, axis=1).astype(np.uint8)
+        width = order.shape[1]
+        systems[:, :width] = np.where(nearest < JUMPS_UNREACHABLE, borders[order], -1)
+        jumps[:, :width] = nearest
+
+    return BorderIndex(rows=rows, systems=systems, jumps=jumps)
+
+
+def get_border_index(universe: UniverseGraph) -> BorderIndex:
+    """
+    Get the universe's border index, computing it on first use if not loaded.
+
+    Args:
+        universe: UniverseGraph to index
+
+    Returns:
+        BorderIndex stored on universe.border_index
+    """
+    if universe.border_index is None:
+        universe.border_index = compute_border_index(universe)
+    return universe.border_index
@@ -23,7 +23,8 @@ import numpy as np
 
 from aria_esi.core.logging import get_logger
 
-from .graph import UniverseGraph
+from .border_index import compute_border_index
+from .graph import JUMPS_UNREACHABLE, UniverseGraph
 from .serialization import (
     SerializationError,
     detect_format,
@@ -53,10 +54,16 @@ DEFAULT_CACHE_PATH = DATA_DIR / "universe_cache.json"
 # New default: .universe format (safe serialization)
 DEFAULT_GRAPH_PATH = DATA_DIR / "universe.universe"
 
+# Sources per igraph distances() call when building the jump matrix
+JUMP_MATRIX_BATCH_SIZE = 256
+
 
 def build_universe_graph(
     cache_path: Path | None = None,
     output_path: Path | None = None,
+    *,
+    include_jump_matrix: bool = False,
+    include_border_index: bool = True,
 ) -> UniverseGraph:
     """
     Convert universe_cache.json to optimized UniverseGraph.
@@ -64,6 +71,11 @@ def build_universe_graph(
     Args:
         cache_path: Path to universe_cache.json (defaults to package data dir)
         output_path: Optional path to save .universe graph
+        include_jump_matrix: Precompute the all-pairs hop matrix and store it
+            as a memory-mapped sidecar section (~n² bytes)
+        include_border_index: Precompute each high-sec system's nearest
+            border systems for loop planning (~5 bytes * BORDER_INDEX_SIZE
+            per high-sec system)
 
     Returns:
         UniverseGraph instance ready for queries
@@ -190,6 +202,12 @@ def build_universe_graph(
         stargate_count=len(edges),
     )
 
+    if include_jump_matrix:
+        universe.jump_matrix = compute_jump_matrix(g)
+
+    if include_border_index:
+        universe.border_index = compute_border_index(universe)
+
     if output_path:
         # Use safe serialization format
         save_safe(universe, output_path)
@@ -252,6 +270,35 @@ def _compute_border_systems(
     )
 
 
+def compute_jump_matrix(g: ig.Graph) -> np.ndarray:
+    """
+    Compute all-pairs stargate hop counts.
+
+    Isolated vertices (wormhole space) have no gate connections, so BFS only
+    runs between connected vertices; everything else stays unreachable.
+
+    Args:
+        g: igraph Graph instance
+
+    Returns:
+        (n, n) uint8 matrix with JUMPS_UNREACHABLE for unreachable pairs
+    """
+    n = g.vcount()
+    matrix = np.full((n, n), JUMPS_UNREACHABLE, dtype=np.uint8)
+    np.fill_diagonal(matrix, 0)
+
+    connected = [v for v, degree in enumerate(g.degree()) if degree > 0]
+    targets = np.asarray(connected, dtype=np.int64)
+
+    for start in range(0, len(connected), JUMP_MATRIX_BATCH_SIZE):
+        batch = connected[start : start + JUMP_MATRIX_BATCH_SIZE]
+        dists = np.asarray(g.distances(source=batch, target=connected), dtype=np.float64)
+        dists[~np.isfinite(dists) | (dists > JUMPS_UNREACHABLE)] = JUMPS_UNREACHABLE
+        matrix[np.ix_(np.asarray(batch, dtype=np.int64), targets)] = dists.astype(np.uint8)
+
+    return matrix
+
+
 def _build_region_index(
     system_list: list[tuple[int, dict[str, Any]]],
     const_to_region: dict[int, int],
@@ -324,18 +371,19 @@ def load_universe_graph(
 
     if file_format == "universe":
         # New safe format - integrity check on msgpack data
+        checksum: str | None = None
         if not skip_integrity_check:
             from aria_esi.core.data_integrity import IntegrityError, verify_universe_graph_integrity
 
             try:
-                verify_universe_graph_integrity(graph_path)
+                _, checksum = verify_universe_graph_integrity(graph_path)
             except IntegrityError:
                 raise
             except Exception as e:
                 logger.warning("Integrity check failed with unexpected error: %s", e)
 
         try:
-            return load_safe(graph_path)
+            universe = load_safe(graph_path)
         except SerializationError as e:
             raise UniverseBuildError(
                 f"Failed to load universe graph: {graph_path}\n"
@@ -343,6 +391,11 @@ def load_universe_graph(
                 "The file may be corrupted. Try rebuilding with 'uv run aria-esi universe --build'."
             ) from e
 
+        # Lets derived caches (e.g. persisted routes) detect a rebuilt file
+        if checksum and checksum != "unknown":
+            universe.source_checksum = checksum
+        return universe
+
     else:
         raise UniverseBuildError(
             f"Unknown file format for {graph_path}. "
@@ -9,8 +9,8 @@ STP-001: Core Data Model
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Literal
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal
 
 import igraph as ig
 import numpy as np
@@ -18,8 +18,31 @@ import numpy as np
 if TYPE_CHECKING:
     from numpy.typing import NDArray
 
+    from .border_index import BorderIndex
+
 SecurityClass = Literal["HIGH", "LOW", "NULL"]
 
+# Sentinel hop count in the all-pairs jump matrix for unreachable pairs
+JUMPS_UNREACHABLE = 255
+
+# Indexes derivable from name_to_idx and the NumPy arrays. When not passed
+# to __init__ they are built on first access (see UniverseGraph.__getattr__).
+DERIVED_FIELDS: tuple[str, ...] = (
+    "idx_to_name",
+    "name_to_id",
+    "id_to_idx",
+    "name_lookup",
+    "region_systems",
+    "highsec_systems",
+    "lowsec_systems",
+    "nullsec_systems",
+)
+
+
+def _derived() -> Any:
+    """Keyword-only dataclass field that is built lazily when omitted."""
+    return field(default=None, kw_only=True)
+
 
 @dataclass(frozen=False, slots=True)
 class UniverseGraph:
@@ -31,6 +54,8 @@ class UniverseGraph:
     - NumPy arrays for vectorized attribute access
     - Dict indexes for O(1) name resolution
     - Frozen sets for O(1) membership tests
+    - Derivable indexes (DERIVED_FIELDS) built on first access when not
+      supplied, so short-lived processes only pay for what they touch
 
     Attributes:
         graph: Core igraph structure representing the stargate network
@@ -54,6 +79,15 @@ class UniverseGraph:
         version: Cache version for invalidation
         system_count: Total number of systems in the graph
         stargate_count: Total number of stargate connections
+        jump_matrix: Optional all-pairs hop counts (uint8, JUMPS_UNREACHABLE
+            for unreachable pairs), usually memory-mapped from the container
+        border_index: Optional nearest-border table for high-sec systems,
+            memory-mapped from the container (see universe.border_index)
+        source_checksum: SHA256 of the file the graph was loaded from, when
+            it was verified at load time (None for in-memory graphs)
+        edge_sources: Array of edge source vertices indexed by edge ID (derived)
+        edge_targets: Array of edge target vertices indexed by edge ID (derived)
+        neighbor_table: Padded per-vertex neighbor array for vectorized BFS (derived)
     """
 
     # Core graph structure
@@ -61,9 +95,9 @@ class UniverseGraph:
 
     # Bidirectional name mapping
     name_to_idx: dict[str, int]
-    idx_to_name: dict[int, str]
-    name_to_id: dict[str, int]
-    id_to_idx: dict[int, int]
+    idx_to_name: dict[int, str] = _derived()
+    name_to_id: dict[str, int] = _derived()
+    id_to_idx: dict[int, int] = _derived()
 
     # Vectorized system attributes (indexed by graph vertex)
     security: NDArray[np.float32]
@@ -72,7 +106,7 @@ class UniverseGraph:
     region_ids: NDArray[np.int32]
 
     # Name resolution (case-insensitive)
-    name_lookup: dict[str, str]
+    name_lookup: dict[str, str] = _derived()
 
     # Hierarchy names
     constellation_names: dict[int, str]
@@ -83,16 +117,144 @@ class UniverseGraph:
 
     # Pre-computed indexes
     border_systems: frozenset[int]
-    region_systems: dict[int, list[int]]
-    highsec_systems: frozenset[int]
-    lowsec_systems: frozenset[int]
-    nullsec_systems: frozenset[int]
+    region_systems: dict[int, list[int]] = _derived()
+    highsec_systems: frozenset[int] = _derived()
+    lowsec_systems: frozenset[int] = _derived()
+    nullsec_systems: frozenset[int] = _derived()
 
     # Metadata
     version: str
     system_count: int
     stargate_count: int
 
+    # Optional all-pairs hop matrix (memory-mapped sidecar section)
+    jump_matrix: NDArray[np.uint8] | None = field(default=None, repr=False, compare=False)
+
+    # Optional nearest-border index (memory-mapped sidecar sections)
+    border_index: BorderIndex | None = field(default=None, repr=False, compare=False)
+
+    # Checksum of the source file (set by the loader, never serialized)
+    source_checksum: str | None = field(default=None, compare=False)
+
+    # Derived runtime state (built lazily from the graph, never serialized)
+    _edge_sources: NDArray[np.int32] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _edge_targets: NDArray[np.int32] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _neighbor_table: NDArray[np.int32] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _weight_cache: Any = field(default=None, init=False, repr=False, compare=False)
+    _route_cache: Any = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Leave omitted derived slots unset so __getattr__ builds them on demand
+        for name in DERIVED_FIELDS:
+            if getattr(self, name) is None:
+                object.__delattr__(self, name)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for unset slots, i.e. derived indexes not built yet
+        if name not in DERIVED_FIELDS:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        value = getattr(self, f"_build_{name}")()
+        object.__setattr__(self, name, value)
+        return value
+
+    # =========================================================================
+    # Derived Index Builders
+    # =========================================================================
+
+    def _build_idx_to_name(self) -> dict[int, str]:
+        return {idx: name for name, idx in self.name_to_idx.items()}
+
+    def _build_name_to_id(self) -> dict[str, int]:
+        ids = self.system_ids.tolist()
+        return {name: ids[idx] for name, idx in self.name_to_idx.items()}
+
+    def _build_id_to_idx(self) -> dict[int, int]:
+        return {sys_id: idx for idx, sys_id in enumerate(self.system_ids.tolist())}
+
+    def _build_name_lookup(self) -> dict[str, str]:
+        return {name.lower(): name for name in self.name_to_idx}
+
+    def _build_region_systems(self) -> dict[int, list[int]]:
+        # Group vertex indices by region, regions in order of first appearance
+        if self.region_ids.size == 0:
+            return {}
+        order = np.argsort(self.region_ids, kind="stable")
+        regions, starts = np.unique(self.region_ids[order], return_index=True)
+        groups = np.split(order, starts[1:])
+        first_seen = np.argsort([group[0] for group in groups], kind="stable")
+        return {int(regions[i]): groups[i].tolist() for i in first_seen}
+
+    def _build_highsec_systems(self) -> frozenset[int]:
+        return frozenset(np.flatnonzero(self.security >= 0.45).tolist())
+
+    def _build_lowsec_systems(self) -> frozenset[int]:
+        return frozenset(np.flatnonzero((self.security > 0.0) & (self.security < 0.45)).tolist())
+
+    def _build_nullsec_systems(self) -> frozenset[int]:
+        return frozenset(np.flatnonzero(self.security <= 0.0).tolist())
+
+    @property
+    def edge_sources(self) -> NDArray[np.int32]:
+        """
+        Source vertex of every edge, indexed by igraph edge ID.
+
+        Built once from the graph's edge list on first access.
+        """
+        if self._edge_sources is None:
+            self._build_edge_arrays()
+        return self._edge_sources  # type: ignore[return-value]
+
+    @property
+    def edge_targets(self) -> NDArray[np.int32]:
+        """
+        Target vertex of every edge, indexed by igraph edge ID.
+
+        Matches ``graph.es[i].target``; for the undirected stargate graph
+        this is the higher vertex index of the pair.
+        """
+        if self._edge_targets is None:
+            self._build_edge_arrays()
+        return self._edge_targets  # type: ignore[return-value]
+
+    def _build_edge_arrays(self) -> None:
+        """Materialize read-only edge endpoint arrays from the igraph edge list."""
+        edges = np.asarray(self.graph.get_edgelist(), dtype=np.int32).reshape(-1, 2)
+        sources = np.ascontiguousarray(edges[:, 0])
+        targets = np.ascontiguousarray(edges[:, 1])
+        sources.flags.writeable = False
+        targets.flags.writeable = False
+        self._edge_sources = sources
+        self._edge_targets = targets
+
+    @property
+    def neighbor_table(self) -> NDArray[np.int32]:
+        """
+        Neighbors of every vertex as a padded (system_count, max_degree) array.
+
+        Row i lists the neighbors of vertex i in ascending order, padded with
+        system_count (one past the last vertex). Lets a BFS expand a whole
+        frontier with a single fancy-indexing step.
+        """
+        if self._neighbor_table is None:
+            n = self.system_count
+            sources = np.concatenate([self.edge_sources, self.edge_targets])
+            targets = np.concatenate([self.edge_targets, self.edge_sources])
+            order = np.lexsort((targets, sources))
+            sources, targets = sources[order], targets[order]
+            degree = np.bincount(sources, minlength=n)
+            starts = np.cumsum(degree) - degree
+            table = np.full((n, int(degree.max(initial=0))), n, dtype=np.int32)
+            table[sources, np.arange(sources.size) - starts[sources]] = targets
+            table.flags.writeable = False
+            self._neighbor_table = table
+        return self._neighbor_table
+
     def resolve_name(self, name: str) -> int | None:
         """
         Resolve system name to vertex index (case-insensitive).
@@ -209,6 +371,46 @@ class UniverseGraph:
             return []
         return [self.idx_to_name[n] for n in self.graph.neighbors(idx) if self.security[n] < 0.45]
 
+    def jumps(self, src_idx: int, dst_idx: int) -> int | None:
+        """
+        Get the stargate hop count between two systems.
+
+        O(1) when the jump matrix is loaded; falls back to a BFS otherwise.
+
+        Args:
+            src_idx: Source vertex index
+            dst_idx: Destination vertex index
+
+        Returns:
+            Number of jumps, or None if unreachable
+        """
+        if self.jump_matrix is not None:
+            hops = int(self.jump_matrix[src_idx, dst_idx])
+            return None if hops == JUMPS_UNREACHABLE else hops
+
+        dist = self.graph.distances(source=src_idx, target=dst_idx)[0][0]
+        return int(dist) if dist != float("inf") else None
+
+    def jumps_from(self, src_idx: int) -> NDArray[np.uint8]:
+        """
+        Get hop counts from one system to every system.
+
+        Returns a row view of the jump matrix when loaded (no copy);
+        otherwise runs a single BFS from the source.
+
+        Args:
+            src_idx: Source vertex index
+
+        Returns:
+            uint8 array indexed by vertex, JUMPS_UNREACHABLE where unreachable
+        """
+        if self.jump_matrix is not None:
+            return self.jump_matrix[src_idx]
+
+        dists = np.asarray(self.graph.distances(source=src_idx)[0], dtype=np.float64)
+        dists[~np.isfinite(dists) | (dists > JUMPS_UNREACHABLE)] = JUMPS_UNREACHABLE
+        return dists.astype(np.uint8)
+
     def resolve_region(self, name: str) -> int | None:
         """
         Resolve region name to region ID (case-insensitive, O(1)).
@@ -221,7 +423,7 @@ class UniverseGraph:
         """
         return self.region_name_lookup.get(name.lower())
 
-    def to_dict(self) -> dict:
+    def to_dict(self, *, include_derived: bool = True) -> dict:
         """
         Convert UniverseGraph to a dictionary for safe serialization.
 
@@ -231,44 +433,58 @@ class UniverseGraph:
         Note: msgpack doesn't support int keys in dicts, so we convert them
         to strings. NumPy arrays are converted to lists with dtype metadata.
 
+        Args:
+            include_derived: Include DERIVED_FIELDS. When False they are
+                neither built nor written, and from_dict() rebuilds them
+                lazily.
+
         Returns:
             Dictionary representation suitable for msgpack serialization
         """
-        return {
-            # Convert int-keyed dicts to string keys for msgpack compatibility
+        data = {
             "name_to_idx": self.name_to_idx,
-            "idx_to_name": {str(k): v for k, v in self.idx_to_name.items()},
-            "name_to_id": self.name_to_id,
-            "id_to_idx": {str(k): v for k, v in self.id_to_idx.items()},
             # NumPy arrays with dtype preservation
             "security": {"dtype": "float32", "data": self.security.tolist()},
             "system_ids": {"dtype": "int32", "data": self.system_ids.tolist()},
             "constellation_ids": {"dtype": "int32", "data": self.constellation_ids.tolist()},
             "region_ids": {"dtype": "int32", "data": self.region_ids.tolist()},
-            # String-keyed dicts (already compatible)
-            "name_lookup": self.name_lookup,
             # Int-keyed dicts to string keys
             "constellation_names": {str(k): v for k, v in self.constellation_names.items()},
             "region_names": {str(k): v for k, v in self.region_names.items()},
             "region_name_lookup": self.region_name_lookup,
             # Frozensets to sorted lists (for deterministic serialization)
             "border_systems": sorted(self.border_systems),
-            "highsec_systems": sorted(self.highsec_systems),
-            "lowsec_systems": sorted(self.lowsec_systems),
-            "nullsec_systems": sorted(self.nullsec_systems),
-            # Region systems: int keys to string keys
-            "region_systems": {str(k): v for k, v in self.region_systems.items()},
             # Metadata
             "version": self.version,
             "system_count": self.system_count,
             "stargate_count": self.stargate_count,
         }
+        if include_derived:
+            data.update(
+                {
+                    # Convert int-keyed dicts to string keys for msgpack compatibility
+                    "idx_to_name": {str(k): v for k, v in self.idx_to_name.items()},
+                    "name_to_id": self.name_to_id,
+                    "id_to_idx": {str(k): v for k, v in self.id_to_idx.items()},
+                    "name_lookup": self.name_lookup,
+                    "highsec_systems": sorted(self.highsec_systems),
+                    "lowsec_systems": sorted(self.lowsec_systems),
+                    "nullsec_systems": sorted(self.nullsec_systems),
+                    "region_systems": {str(k): v for k, v in self.region_systems.items()},
+                }
+            )
+        return data
 
     @classmethod
     def from_dict(cls, data: dict, graph: ig.Graph) -> UniverseGraph:
         """
         Reconstruct UniverseGraph from dictionary and igraph instance.
 
+        Array fields may be given either in to_dict() form or as ready
+        NumPy arrays (e.g. views into a memory-mapped file), which are used
+        without copying. Derived indexes missing from data are built lazily
+        on first access.
+
         Args:
             data: Dictionary from to_dict()
             graph: igraph.Graph instance (deserialized separately)
@@ -276,33 +492,45 @@ class UniverseGraph:
         Returns:
             Reconstructed UniverseGraph instance
         """
+        derived: dict[str, Any] = {}
+        if "idx_to_name" in data:
+            derived["idx_to_name"] = {int(k): v for k, v in data["idx_to_name"].items()}
+        if "name_to_id" in data:
+            derived["name_to_id"] = data["name_to_id"]
+        if "id_to_idx" in data:
+            derived["id_to_idx"] = {int(k): v for k, v in data["id_to_idx"].items()}
+        if "name_lookup" in data:
+            derived["name_lookup"] = data["name_lookup"]
+        for key in ("highsec_systems", "lowsec_systems", "nullsec_systems"):
+            if key in data:
+                derived[key] = frozenset(data[key])
+        if "region_systems" in data:
+            derived["region_systems"] = {int(k): v for k, v in data["region_systems"].items()}
+
         return cls(
             graph=graph,
-            # Restore int keys from string keys
             name_to_idx=data["name_to_idx"],
-            idx_to_name={int(k): v for k, v in data["idx_to_name"].items()},
-            name_to_id=data["name_to_id"],
-            id_to_idx={int(k): v for k, v in data["id_to_idx"].items()},
             # Restore NumPy arrays with correct dtype
-            security=np.array(data["security"]["data"], dtype=np.float32),
-            system_ids=np.array(data["system_ids"]["data"], dtype=np.int32),
-            constellation_ids=np.array(data["constellation_ids"]["data"], dtype=np.int32),
-            region_ids=np.array(data["region_ids"]["data"], dtype=np.int32),
-            # String-keyed dicts (no conversion needed)
-            name_lookup=data["name_lookup"],
+            security=_restore_array(data["security"], np.float32),
+            system_ids=_restore_array(data["system_ids"], np.int32),
+            constellation_ids=_restore_array(data["constellation_ids"], np.int32),
+            region_ids=_restore_array(data["region_ids"], np.int32),
             # Restore int keys
             constellation_names={int(k): v for k, v in data["constellation_names"].items()},
             region_names={int(k): v for k, v in data["region_names"].items()},
             region_name_lookup=data["region_name_lookup"],
             # Restore frozensets from sorted lists
             border_systems=frozenset(data["border_systems"]),
-            highsec_systems=frozenset(data["highsec_systems"]),
-            lowsec_systems=frozenset(data["lowsec_systems"]),
-            nullsec_systems=frozenset(data["nullsec_systems"]),
-            # Restore int keys for region_systems
-            region_systems={int(k): v for k, v in data["region_systems"].items()},
             # Metadata
             version=data["version"],
             system_count=data["system_count"],
             stargate_count=data["stargate_count"],
+            **derived,
         )
+
+
+def _restore_array(value: dict | np.ndarray, dtype: type[np.generic]) -> np.ndarray:
+    """Rebuild a serialized array field, passing ndarrays through uncopied."""
+    if isinstance(value, np.ndarray):
+        return np.asarray(value, dtype=dtype)
+    return np.array(value["data"], dtype=dtype)
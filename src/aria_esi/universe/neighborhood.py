@@ -0,0 +1,213 @@
+"""
+Neighborhood queries over the stargate graph.
+
+Shared engine behind universe_search and universe_nearest. A radius query
+is a breadth-first traversal that expands a whole frontier per NumPy step
+(or slices a row of the precomputed jump matrix when loaded) and yields
+every vertex within range together with its hop count. System filters
+(security, region, border, adjacent low-sec) are evaluated as boolean
+NumPy masks over all vertices, so combining a radius with filters is one
+vectorized pass.
+
+Results are always ordered by (distance, vertex index), which keeps
+responses deterministic regardless of the traversal backend.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .border_index import HIGHSEC_THRESHOLD
+from .graph import JUMPS_UNREACHABLE
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from .graph import UniverseGraph
+
+
+def iter_layers(
+    universe: UniverseGraph,
+    origin_idx: int,
+    max_jumps: int,
+) -> Iterator[tuple[int, NDArray[np.int64]]]:
+    """
+    Walk the BFS layers around an origin, nearest first.
+
+    Each frontier is expanded in one step through UniverseGraph.neighbor_table,
+    so the cost is a handful of NumPy operations per jump rather than per
+    system. With the jump matrix loaded, layers are sliced from its row.
+
+    Args:
+        universe: UniverseGraph to traverse
+        origin_idx: Starting vertex index (yielded alone at distance 0)
+        max_jumps: Maximum hop count (inclusive)
+
+    Yields:
+        (distance, vertex indices at that distance in ascending order)
+    """
+    if max_jumps < 0:
+        return
+
+    if universe.jump_matrix is not None:
+        row = universe.jumps_from(origin_idx)
+        within = np.flatnonzero(row <= min(max_jumps, JUMPS_UNREACHABLE - 1))
+        hops = row[within]
+        ordering = np.argsort(hops, kind="stable")
+        within, hops = within[ordering], hops[ordering]
+        bounds = np.flatnonzero(np.diff(hops)) + 1
+        for layer in np.split(within, bounds):
+            yield int(row[layer[0]]), layer
+        return
+
+    table = universe.neighbor_table
+    n = universe.system_count
+    # Padding entries in table point at index n, pre-marked as visited
+    seen = np.zeros(n + 1, dtype=np.bool_)
+    seen[n] = True
+    seen[origin_idx] = True
+    frontier = np.array([origin_idx], dtype=np.int64)
+    yield 0, frontier
+
+    for distance in range(1, max_jumps + 1):
+        reached = table[frontier].ravel()
+        reached = reached[~seen[reached]]
+        if reached.size == 0:
+            return
+        frontier = np.unique(reached).astype(np.int64)
+        seen[frontier] = True
+        yield distance, frontier
+
+
+def within_jumps(
+    universe: UniverseGraph,
+    origin_idx: int,
+    max_jumps: int,
+) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+    """
+    Find every system within max_jumps of an origin.
+
+    Args:
+        universe: UniverseGraph to traverse
+        origin_idx: Starting vertex index (included at distance 0)
+        max_jumps: Maximum hop count (inclusive)
+
+    Returns:
+        Tuple of (vertex indices, hop counts), ordered by distance then index
+    """
+    layers = list(iter_layers(universe, origin_idx, max_jumps))
+    if not layers:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty.copy()
+
+    vertices = np.concatenate([layer for _, layer in layers]).astype(np.int64)
+    distances = np.repeat(
+        np.array([d for d, _ in layers], dtype=np.int64), [len(layer) for _, layer in layers]
+    )
+    return vertices, distances
+
+
+def adjacent_lowsec_counts(universe: UniverseGraph) -> NDArray[np.int64]:
+    """
+    Count low-sec or null-sec neighbors of every system.
+
+    Args:
+        universe: UniverseGraph to inspect
+
+    Returns:
+        Array indexed by vertex with the number of adjacent systems whose
+        security is below 0.45
+    """
+    sources = universe.edge_sources
+    targets = universe.edge_targets
+    dangerous = universe.security < HIGHSEC_THRESHOLD
+    n = universe.system_count
+    return np.bincount(sources[dangerous[targets]], minlength=n) + np.bincount(
+        targets[dangerous[sources]], minlength=n
+    )
+
+
+def system_mask(
+    universe: UniverseGraph,
+    *,
+    security_min: float | None = None,
+    security_max: float | None = None,
+    region_id: int | None = None,
+    is_border: bool | None = None,
+    min_adjacent_lowsec: int | None = None,
+) -> NDArray[np.bool_]:
+    """
+    Evaluate system filters for every vertex at once.
+
+    Filters left as None are not applied.
+
+    Args:
+        universe: UniverseGraph for system attributes
+        security_min: Minimum security status (inclusive)
+        security_max: Maximum security status (inclusive)
+        region_id: Restrict to a single region
+        is_border: True for border systems only, False to exclude them
+        min_adjacent_lowsec: Minimum number of adjacent low-sec systems
+
+    Returns:
+        Boolean array indexed by vertex, True where every filter passes
+    """
+    mask = np.ones(universe.system_count, dtype=np.bool_)
+
+    if security_min is not None:
+        mask &= universe.security >= security_min
+    if security_max is not None:
+        mask &= universe.security <= security_max
+    if region_id is not None:
+        mask &= universe.region_ids == region_id
+    if is_border is not None:
+        border = np.zeros(universe.system_count, dtype=np.bool_)
+        border[list(universe.border_systems)] = True
+        mask &= border if is_border else ~border
+    if min_adjacent_lowsec is not None:
+        mask &= adjacent_lowsec_counts(universe) >= min_adjacent_lowsec
+
+    return mask
+
+
+def nearest_matching(
+    universe: UniverseGraph,
+    origin_idx: int,
+    mask: NDArray[np.bool_],
+    limit: int,
+    max_jumps: int,
+) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+    """
+    Find the closest systems (excluding the origin) selected by a mask.
+
+    Args:
+        universe: UniverseGraph to traverse
+        origin_idx: Starting vertex index
+        mask: Boolean array indexed by vertex (see system_mask)
+        limit: Maximum number of systems to return
+        max_jumps: Maximum search radius
+
+    Returns:
+        Tuple of (vertex indices, hop counts), ordered by distance then index
+    """
+    found: list[NDArray[np.int64]] = []
+    hops: list[int] = []
+    remaining = limit
+    for distance, layer in iter_layers(universe, origin_idx, max_jumps):
+        if remaining <= 0:
+            break
+        if distance == 0:
+            continue
+        # Layers are complete, so stopping once limit is met keeps the nearest
+        matches = layer[mask[layer]][:remaining]
+        found.append(matches)
+        hops.extend([distance] * len(matches))
+        remaining -= len(matches)
+
+    if not found:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty.copy()
+    return np.concatenate(found).astype(np.int64), np.array(hops, dtype=np.int64)
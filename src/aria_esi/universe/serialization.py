@@ -2,23 +2,50 @@
 Safe serialization for UniverseGraph.
 
 This module provides pickle-free serialization using a hybrid format:
-- msgpack for Python data structures (dicts, arrays, frozensets)
-- igraph's native binary format for graph topology
+- msgpack for Python data structures (dicts, frozensets)
+- raw little-endian sections for NumPy arrays and the edge list (v2)
+- igraph's native binary format for graph topology (v1, read-only)
 
-Container format (.universe file):
+Container format (.universe file), version 2:
     Offset  Size  Description
     0       4     Magic: b'ARIA'
-    4       2     Version: 0x0001 (big-endian)
+    4       2     Version: 0x0002 (big-endian)
     6       4     Metadata length N (big-endian)
-    10      N     msgpack metadata
+    10      N     msgpack metadata (array and derived index fields omitted)
+    10+N    ...   Sections, repeated until EOF:
+                  4  Section tag (e.g. b'SECU')
+                  8  Payload length L (big-endian)
+                  P  Zero padding so the payload is SECTION_ALIGNMENT-aligned
+                  L  Raw payload
+
+Version 1 (still readable) has a graph blob between metadata and sections
+and keeps the arrays in the msgpack metadata:
     10+N    4     Graph length M (big-endian)
     14+N    M     igraph picklez blob (gzipped)
+    14+N+M  ...   Optional sections (JMPS only)
+
+Sections:
+    SECU    Security status, n float32 (required in v2)
+    SYSI    EVE system IDs, n int32 (required in v2)
+    CONS    Constellation IDs, n int32 (required in v2)
+    REGN    Region IDs, n int32 (required in v2)
+    EDGE    Stargate edge list, m*2 int32 row-major (required in v2)
+    JMPS    All-pairs hop matrix, n*n uint8 row-major (255 = unreachable).
+    BROW    Nearest-border row per system, n int32 (-1 = not high-sec)
+    BIDX    Nearest-border systems, r*k int32 row-major (-1 = padding)
+    BJMP    Nearest-border hop counts, r*k uint8 row-major (255 = padding)
+
+Version 2 files are loaded by memory-mapping the file once and viewing the
+array sections with np.frombuffer, so arrays are never copied or parsed,
+and the igraph graph is built directly from the int32 edge list. Readers
+skip unknown section tags.
 
 Security:
     This format eliminates pickle.load() for Python data, removing the
-    primary RCE attack vector. The igraph picklez format is still used
-    for graph topology, but only contains graph structure (vertices/edges),
-    not arbitrary Python objects.
+    primary RCE attack vector. Version 1 still uses the igraph picklez
+    format for graph topology, but it only contains graph structure
+    (vertices/edges), not arbitrary Python objects. Version 2 stores
+    topology as a plain int32 edge list.
 
 STP-001: Core Data Model - Safe Serialization Extension
 """
@@ -26,25 +53,45 @@ STP-001: Core Data Model - Safe Serialization Extension
 from __future__ import annotations
 
 import io
+import os
 import struct
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import igraph as ig
 import msgpack
+import numpy as np
 
 from aria_esi.core.logging import get_logger
 
 if TYPE_CHECKING:
+    from aria_esi.universe.border_index import BorderIndex
     from aria_esi.universe.graph import UniverseGraph
 
 logger = get_logger(__name__)
 
 # Container format constants
 MAGIC = b"ARIA"
-FORMAT_VERSION = 1  # Increment when format changes incompatibly
+FORMAT_VERSION = 2  # Increment when format changes incompatibly
 HEADER_SIZE = 10  # 4 (magic) + 2 (version) + 4 (metadata length)
 
+# Sidecar sections
+SECTION_HEADER_SIZE = 12  # 4 (tag) + 8 (payload length)
+SECTION_ALIGNMENT = 64  # Payload offset alignment for memory mapping
+SECTION_JUMP_MATRIX = b"JMPS"
+SECTION_EDGES = b"EDGE"
+SECTION_BORDER_ROWS = b"BROW"
+SECTION_BORDER_SYSTEMS = b"BIDX"
+SECTION_BORDER_JUMPS = b"BJMP"
+
+# Array fields stored as raw sections in v2: field -> (tag, little-endian dtype)
+ARRAY_SECTIONS: dict[str, tuple[bytes, str]] = {
+    "security": (b"SECU", "<f4"),
+    "system_ids": (b"SYSI", "<i4"),
+    "constellation_ids": (b"CONS", "<i4"),
+    "region_ids": (b"REGN", "<i4"),
+}
+
 
 class SerializationError(Exception):
     """Error during serialization or deserialization."""
@@ -52,59 +99,250 @@ class SerializationError(Exception):
     pass
 
 
-def save_universe_graph(universe: UniverseGraph, path: Path) -> None:
+def save_universe_graph(
+    universe: UniverseGraph,
+    path: Path,
+    *,
+    format_version: int = FORMAT_VERSION,
+) -> None:
     """
     Serialize UniverseGraph to container format.
 
     Args:
         universe: UniverseGraph instance to serialize
         path: Output file path (should use .universe extension)
+        format_version: Container version to write (1 or 2). Version 1 is
+            only kept for compatibility testing and benchmarks.
 
     Raises:
         SerializationError: If serialization fails
     """
+    if format_version not in (1, 2):
+        raise SerializationError(f"Cannot write format version {format_version}")
+
     try:
-        # 1. Convert Python data to dict
-        metadata = universe.to_dict()
+        # 1. Convert Python data to dict (v2 stores arrays as sections and
+        #    leaves derived indexes to be rebuilt lazily on load)
+        metadata = universe.to_dict(include_derived=format_version < 2)
+        if format_version >= 2:
+            for name in ARRAY_SECTIONS:
+                del metadata[name]
 
         # 2. Pack metadata with msgpack
         metadata_bytes = msgpack.packb(metadata, use_bin_type=True)
 
-        # 3. Serialize igraph to picklez (gzipped binary)
-        graph_buffer = io.BytesIO()
-        universe.graph.write_picklez(graph_buffer)
-        graph_bytes = graph_buffer.getvalue()
-
-        # 4. Build container
+        # 3. Build container
         with open(path, "wb") as f:
             # Magic bytes
             f.write(MAGIC)
 
             # Version (big-endian uint16)
-            f.write(struct.pack(">H", FORMAT_VERSION))
+            f.write(struct.pack(">H", format_version))
 
             # Metadata length + data
             f.write(struct.pack(">I", len(metadata_bytes)))
             f.write(metadata_bytes)
 
-            # Graph length + data
-            f.write(struct.pack(">I", len(graph_bytes)))
-            f.write(graph_bytes)
+            if format_version >= 2:
+                # Raw array and edge list sections
+                for name, (tag, dtype) in ARRAY_SECTIONS.items():
+                    array = np.ascontiguousarray(getattr(universe, name), dtype=dtype)
+                    _write_section(f, tag, array)
+                edges = np.array(universe.graph.get_edgelist(), dtype="<i4").reshape(-1, 2)
+                _write_section(f, SECTION_EDGES, edges)
+            else:
+                # Graph length + igraph picklez (gzipped binary)
+                graph_buffer = io.BytesIO()
+                universe.graph.write_picklez(graph_buffer)
+                graph_bytes = graph_buffer.getvalue()
+                f.write(struct.pack(">I", len(graph_bytes)))
+                f.write(graph_bytes)
+
+            # Optional sidecar sections
+            if universe.jump_matrix is not None:
+                jump_matrix = np.ascontiguousarray(universe.jump_matrix, dtype=np.uint8)
+                _write_section(f, SECTION_JUMP_MATRIX, jump_matrix)
+            if universe.border_index is not None:
+                border_index = universe.border_index
+                rows = np.ascontiguousarray(border_index.rows, dtype="<i4")
+                _write_section(f, SECTION_BORDER_ROWS, rows)
+                systems = np.ascontiguousarray(border_index.systems, dtype="<i4")
+                _write_section(f, SECTION_BORDER_SYSTEMS, systems)
+                jumps = np.ascontiguousarray(border_index.jumps, dtype=np.uint8)
+                _write_section(f, SECTION_BORDER_JUMPS, jumps)
 
         logger.debug(
-            "Saved universe graph: metadata=%d bytes, graph=%d bytes",
+            "Saved universe graph: version=%d, metadata=%d bytes, jump_matrix=%s, border_index=%s",
+            format_version,
             len(metadata_bytes),
-            len(graph_bytes),
+            universe.jump_matrix is not None,
+            universe.border_index is not None,
         )
 
     except Exception as e:
         raise SerializationError(f"Failed to save universe graph: {e}") from e
 
 
+def _write_section(f: io.BufferedWriter, tag: bytes, payload: np.ndarray) -> None:
+    """
+    Write an aligned sidecar section.
+
+    Args:
+        f: File opened for binary writing, positioned at the section start
+        tag: 4-byte section tag
+        payload: Contiguous array written as raw bytes
+    """
+    f.write(tag)
+    f.write(struct.pack(">Q", payload.nbytes))
+    f.write(b"\x00" * _section_padding(f.tell()))
+    f.write(payload.tobytes())
+
+
+def _section_padding(offset: int) -> int:
+    """Bytes of padding needed to align a payload starting at offset."""
+    return -offset % SECTION_ALIGNMENT
+
+
+def _read_sections(f: io.BufferedReader, path: Path) -> dict[bytes, tuple[int, int]]:
+    """
+    Scan sidecar sections following the graph blob.
+
+    Args:
+        f: File positioned at the end of the graph blob
+        path: Path of the open file (for size checks)
+
+    Returns:
+        Mapping of section tag to (payload offset, payload length)
+
+    Raises:
+        SerializationError: If a section header is truncated
+    """
+    sections: dict[bytes, tuple[int, int]] = {}
+    file_size = os.fstat(f.fileno()).st_size
+
+    while f.tell() < file_size:
+        header = f.read(SECTION_HEADER_SIZE)
+        if len(header) != SECTION_HEADER_SIZE:
+            raise SerializationError(f"Truncated section header in {path}")
+        tag = header[:4]
+        length = struct.unpack(">Q", header[4:])[0]
+        offset = f.tell() + _section_padding(f.tell())
+        if offset + length > file_size:
+            raise SerializationError(f"Truncated section {tag!r} in {path}")
+        sections[tag] = (offset, length)
+        f.seek(offset + length)
+
+    return sections
+
+
+def _map_jump_matrix(path: Path, offset: int, length: int, n: int) -> np.ndarray:
+    """
+    Memory-map the all-pairs jump matrix section read-only.
+
+    Args:
+        path: Path to .universe file
+        offset: Payload byte offset
+        length: Payload length in bytes
+        n: Number of systems
+
+    Returns:
+        (n, n) uint8 memmap
+
+    Raises:
+        SerializationError: If the payload size does not match n*n
+    """
+    if length != n * n:
+        raise SerializationError(
+            f"Jump matrix size mismatch: {length} bytes for {n} systems (expected {n * n})"
+        )
+    return np.memmap(path, dtype=np.uint8, mode="r", offset=offset, shape=(n, n))
+
+
+def _map_border_index(path: Path, sections: dict[bytes, tuple[int, int]], n: int) -> BorderIndex:
+    """
+    Memory-map the nearest-border index sections read-only.
+
+    Args:
+        path: Path to .universe file
+        sections: Section table from _read_sections
+        n: Number of systems
+
+    Returns:
+        BorderIndex backed by read-only memmaps
+
+    Raises:
+        SerializationError: If a section is missing or the sizes disagree
+    """
+    from aria_esi.universe.border_index import BorderIndex
+
+    for tag in (SECTION_BORDER_ROWS, SECTION_BORDER_SYSTEMS, SECTION_BORDER_JUMPS):
+        if tag not in sections:
+            raise SerializationError(f"Border index is missing section {tag!r}")
+    rows_offset, rows_length = sections[SECTION_BORDER_ROWS]
+    systems_offset, systems_length = sections[SECTION_BORDER_SYSTEMS]
+    jumps_offset, jumps_length = sections[SECTION_BORDER_JUMPS]
+    if rows_length != n * 4:
+        raise SerializationError(
+            f"Border index size mismatch: {rows_length} row bytes for {n} systems"
+        )
+
+    rows = np.memmap(path, dtype="<i4", mode="r", offset=rows_offset, shape=(n,))
+    r = int(rows.max()) + 1 if n else 0
+    k = jumps_length // r if r else 0
+    if (r and k == 0) or jumps_length != r * k or systems_length != r * k * 4:
+        raise SerializationError(
+            f"Border index size mismatch: {systems_length}/{jumps_length} bytes for {r} rows"
+        )
+    return BorderIndex(
+        rows=rows,
+        systems=np.memmap(path, dtype="<i4", mode="r", offset=systems_offset, shape=(r, k)),
+        jumps=np.memmap(path, dtype=np.uint8, mode="r", offset=jumps_offset, shape=(r, k)),
+    )
+
+
+def _view_section(
+    buffer: np.ndarray,
+    sections: dict[bytes, tuple[int, int]],
+    tag: bytes,
+    dtype: str,
+    count: int,
+) -> np.ndarray:
+    """
+    View a required array section of a mapped file without copying.
+
+    Args:
+        buffer: Whole file mapped as uint8
+        sections: Section table from _read_sections
+        tag: Section tag
+        dtype: Little-endian element dtype
+        count: Expected number of elements
+
+    Returns:
+        Read-only 1-D array backed by the mapping
+
+    Raises:
+        SerializationError: If the section is missing or the wrong size
+    """
+    if tag not in sections:
+        raise SerializationError(f"Missing required section {tag!r}")
+    offset, length = sections[tag]
+    expected = count * np.dtype(dtype).itemsize
+    if length != expected:
+        raise SerializationError(
+            f"Section {tag!r} size mismatch: {length} bytes (expected {expected})"
+        )
+    return np.frombuffer(buffer, dtype=dtype, count=count, offset=offset)
+
+
 def load_universe_graph(path: Path) -> UniverseGraph:
     """
     Deserialize UniverseGraph from container format.
 
+    Version 2 array and edge sections are viewed from a single read-only
+    memory map, and the jump matrix section (either version) is mapped
+    rather than read, so neither costs load time until touched. The
+    optional border index sections are mapped the same way.
+
     Args:
         path: Path to .universe file
 
@@ -140,17 +378,40 @@ def load_universe_graph(path: Path) -> UniverseGraph:
             metadata_bytes = f.read(metadata_len)
             metadata = msgpack.unpackb(metadata_bytes, raw=False)
 
-            # 4. Read graph
-            graph_len_bytes = f.read(4)
-            graph_len = struct.unpack(">I", graph_len_bytes)[0]
-            graph_bytes = f.read(graph_len)
-
-            # 5. Reconstruct igraph from picklez
-            graph_buffer = io.BytesIO(graph_bytes)
-            graph = ig.Graph.Read_Picklez(graph_buffer)
-
-            # 6. Reconstruct UniverseGraph
-            return UniverseGraph.from_dict(metadata, graph)
+            # 4. Read v1 graph blob and reconstruct igraph from picklez
+            graph = None
+            if version < 2:
+                graph_len_bytes = f.read(4)
+                graph_len = struct.unpack(">I", graph_len_bytes)[0]
+                graph_bytes = f.read(graph_len)
+                graph = ig.Graph.Read_Picklez(io.BytesIO(graph_bytes))
+
+            # 5. Scan sections
+            sections = _read_sections(f, path)
+
+        # 6. v2: view arrays and edge list from one mapping of the file
+        if graph is None:
+            n = metadata["system_count"]
+            buffer = np.memmap(path, dtype=np.uint8, mode="r")
+            for name, (tag, dtype) in ARRAY_SECTIONS.items():
+                metadata[name] = _view_section(buffer, sections, tag, dtype, n)
+            if SECTION_EDGES not in sections:
+                raise SerializationError(f"Missing required section {SECTION_EDGES!r}")
+            edge_count = sections[SECTION_EDGES][1] // 8
+            edges = _view_section(buffer, sections, SECTION_EDGES, "<i4", edge_count * 2)
+            graph = ig.Graph(n=n, edges=edges.reshape(-1, 2), directed=False)
+
+        # 7. Reconstruct UniverseGraph
+        universe = UniverseGraph.from_dict(metadata, graph)
+
+        # 8. Attach optional sidecar sections
+        if SECTION_JUMP_MATRIX in sections:
+            offset, length = sections[SECTION_JUMP_MATRIX]
+            universe.jump_matrix = _map_jump_matrix(path, offset, length, universe.system_count)
+        if SECTION_BORDER_ROWS in sections:
+            universe.border_index = _map_border_index(path, sections, universe.system_count)
+
+        return universe
 
     except SerializationError:
         raise
@@ -158,6 +419,26 @@ def load_universe_graph(path: Path) -> UniverseGraph:
         raise SerializationError(f"Failed to load universe graph: {e}") from e
 
 
+def read_format_version(path: Path) -> int:
+    """
+    Read the container version of a .universe file without loading it.
+
+    Args:
+        path: Path to .universe file
+
+    Returns:
+        Container format version
+
+    Raises:
+        SerializationError: If the file is not a .universe container
+    """
+    with open(path, "rb") as f:
+        header = f.read(6)
+    if len(header) != 6 or header[:4] != MAGIC:
+        raise SerializationError(f"Not a .universe container: {path}")
+    return struct.unpack(">H", header[4:])[0]
+
+
 def detect_format(path: Path) -> str:
     """
     Detect file format by magic bytes.
@@ -14,6 +14,20 @@ STP-012: Testing & Deployment
 import pytest
 
 
+@pytest.fixture(scope="module")
+def graph_files(benchmark_universe, tmp_path_factory):
+    """Real universe saved in each container format version."""
+    from aria_esi.universe.serialization import save_universe_graph
+
+    out = tmp_path_factory.mktemp("graph_formats")
+    paths = {}
+    for version in (1, 2):
+        path = out / f"universe_v{version}.universe"
+        save_universe_graph(benchmark_universe, path, format_version=version)
+        paths[version] = path
+    return paths
+
+
 @pytest.mark.benchmark
 class TestGraphLoadBenchmarks:
     """Graph loading and basic query benchmarks."""
@@ -36,6 +50,21 @@ class TestGraphLoadBenchmarks:
         assert result.system_count > 5000
         assert result.stargate_count > 5000
 
+    @pytest.mark.parametrize("format_version", [1, 2])
+    def test_graph_load_by_format(self, graph_files, format_version, benchmark):
+        """
+        Benchmark deserialization of each container version.
+
+        v1: msgpack array lists + gzipped igraph picklez
+        v2: mmap'd raw array sections + int32 edge list
+        """
+        from aria_esi.universe.serialization import load_universe_graph
+
+        result = benchmark(load_universe_graph, graph_files[format_version])
+
+        assert result.system_count > 5000
+        assert result.graph.ecount() == result.stargate_count
+
     def test_name_resolution(self, benchmark_universe, benchmark):
         """
         Benchmark case-insensitive name resolution.
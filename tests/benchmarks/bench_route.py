@@ -127,6 +127,93 @@ class TestRouteBenchmarks:
         # May return empty path if disconnected
 
 
+@pytest.mark.benchmark
+class TestNavigationServiceBenchmarks:
+    """
+    NavigationService route benchmarks, including avoid-lists.
+
+    Weight vectors are cached per (mode, avoid set), so steady-state calls
+    only pay for Dijkstra itself.
+    """
+
+    def test_service_safe_route(self, benchmark_universe, benchmark):
+        """Benchmark NavigationService safe route Jita -> Dodixie."""
+        from aria_esi.services.navigation import NavigationService
+
+        jita = benchmark_universe.resolve_name("Jita")
+        dodixie = benchmark_universe.resolve_name("Dodixie")
+
+        if jita is None or dodixie is None:
+            pytest.skip("Jita or Dodixie not found in graph")
+
+        service = NavigationService(benchmark_universe)
+
+        def run():
+            return service.calculate_route(jita, dodixie, "safe")
+
+        result = benchmark(run)
+        assert len(result) > 5
+
+    def test_service_safe_route_with_avoid(self, benchmark_universe, benchmark):
+        """
+        Benchmark safe route Jita -> Amarr avoiding Uedama and Niarja.
+
+        Repeated calls with the same avoid set hit the weight LRU.
+        """
+        from aria_esi.services.navigation import NavigationService
+
+        jita = benchmark_universe.resolve_name("Jita")
+        amarr = benchmark_universe.resolve_name("Amarr")
+        avoid = {
+            idx
+            for idx in (
+                benchmark_universe.resolve_name("Uedama"),
+                benchmark_universe.resolve_name("Niarja"),
+            )
+            if idx is not None
+        }
+
+        if jita is None or amarr is None or not avoid:
+            pytest.skip("Jita, Amarr or avoided systems not found in graph")
+
+        service = NavigationService(benchmark_universe)
+
+        def run():
+            return service.calculate_route(jita, amarr, "safe", avoid)
+
+        result = benchmark(run)
+        assert len(result) > 10
+        assert not avoid & set(result)
+
+    def test_service_safe_route_with_varying_avoid(self, benchmark_universe, benchmark):
+        """
+        Benchmark safe routes where every call uses a new avoid set.
+
+        Measures the masked-copy path (cache miss) rather than LRU hits.
+        """
+        from aria_esi.services.navigation import NavigationService
+        from aria_esi.services.navigation.weights import get_weight_cache
+
+        jita = benchmark_universe.resolve_name("Jita")
+        dodixie = benchmark_universe.resolve_name("Dodixie")
+
+        if jita is None or dodixie is None:
+            pytest.skip("Jita or Dodixie not found in graph")
+
+        service = NavigationService(benchmark_universe)
+        lowsec = sorted(benchmark_universe.lowsec_systems)
+        counter = iter(range(10**9))
+
+        def run():
+            i = next(counter)
+            avoid = {lowsec[i % len(lowsec)], lowsec[(i * 7 + 3) % len(lowsec)]}
+            return service.calculate_route(jita, dodixie, "safe", avoid)
+
+        get_weight_cache(benchmark_universe).clear()
+        result = benchmark(run)
+        assert len(result) > 5
+
+
 @pytest.mark.benchmark
 class TestRouteMultipleBenchmarks:
     """Benchmarks for multiple route calculations."""
@@ -155,3 +242,28 @@ class TestRouteMultipleBenchmarks:
 
         result = benchmark(run)
         assert len(result) == len(valid) - 1
+
+    def test_route_table_all_hubs(self, benchmark_universe, benchmark):
+        """
+        Benchmark safe routes between every pair of trade hubs.
+
+        One weight lookup and one distances() call for the whole table, then
+        one multi-target path search per origin.
+        """
+        from aria_esi.services.navigation import NavigationService
+
+        systems = ["Jita", "Amarr", "Dodixie", "Rens", "Hek"]
+        indices = [benchmark_universe.resolve_name(s) for s in systems]
+        valid = [i for i in indices if i is not None]
+
+        if len(valid) < 2:
+            pytest.skip("Not enough trade hubs found in graph")
+
+        service = NavigationService(benchmark_universe)
+
+        def run():
+            table = service.calculate_routes(valid, valid, "safe")
+            return [table.path(o, d) for o in valid for d in valid]
+
+        result = benchmark(run)
+        assert len(result) == len(valid) ** 2
@@ -215,3 +215,64 @@ class TestAnalysisBenchmarks:
 
         result = benchmark(find_chokepoints, path)
         # May be empty if route stays in one security class
+
+
+@pytest.mark.benchmark
+class TestNeighborhoodBenchmarks:
+    """Vectorized radius search benchmarks (universe_search / universe_nearest)."""
+
+    @pytest.mark.parametrize("max_jumps", [10, 20])
+    def test_within_jumps(self, benchmark_universe, benchmark, max_jumps):
+        """Benchmark a whole-radius BFS from Jita."""
+        from aria_esi.universe.neighborhood import within_jumps
+
+        jita = benchmark_universe.resolve_name("Jita")
+        if jita is None:
+            pytest.skip("Jita not found in graph")
+
+        vertices, _ = benchmark(within_jumps, benchmark_universe, jita, max_jumps)
+        assert len(vertices) > 0
+
+    @pytest.mark.parametrize("max_jumps", [10, 20])
+    def test_search_lowsec_in_radius(self, benchmark_universe, benchmark, max_jumps):
+        """Benchmark universe_search: low-sec systems within radius of Dodixie."""
+        from aria_esi.mcp.tools_search import _search_systems
+
+        dodixie = benchmark_universe.resolve_name("Dodixie")
+        if dodixie is None:
+            pytest.skip("Dodixie not found in graph")
+
+        result = benchmark(
+            _search_systems,
+            universe=benchmark_universe,
+            origin_idx=dodixie,
+            max_jumps=max_jumps,
+            security_min=0.1,
+            security_max=0.4,
+            region_id=None,
+            is_border=None,
+            limit=100,
+        )
+        assert len(result) > 0
+
+    @pytest.mark.parametrize("max_jumps", [10, 20])
+    def test_nearest_border(self, benchmark_universe, benchmark, max_jumps):
+        """Benchmark universe_nearest: border systems with 2+ low-sec gates."""
+        from aria_esi.mcp.tools_nearest import _build_predicate, _find_nearest
+
+        jita = benchmark_universe.resolve_name("Jita")
+        if jita is None:
+            pytest.skip("Jita not found in graph")
+
+        def nearest():
+            predicate = _build_predicate(
+                universe=benchmark_universe,
+                is_border=True,
+                min_adjacent_lowsec=2,
+                security_min=None,
+                security_max=None,
+                region_id=None,
+            )
+            return _find_nearest(benchmark_universe, jita, predicate, limit=10, max_jumps=max_jumps)
+
+        benchmark(nearest)
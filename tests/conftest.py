@@ -14,6 +14,9 @@ STP-012: Testing & Deployment
 import os
 os.environ.setdefault("ARIA_NO_KEYRING", "1")
 
+# Keep the ESI response cache in memory so tests never write cache/esi.db.
+os.environ.setdefault("ARIA_ESI_CACHE_PERSIST", "0")
+
 import json
 import random
 import sys
@@ -775,6 +778,7 @@ def reset_all_singletons():
     - Keyring credential store
     - Context budget
     - Async ESI client
+    - ESI response cache
 
     RedisQ services:
     - Name resolver
@@ -938,6 +942,20 @@ def reset_all_singletons():
         except ImportError:
             pass
 
+        # ESI response cache
+        try:
+            from aria_esi.core.response_cache import reset_esi_response_cache
+            reset_esi_response_cache()
+        except ImportError:
+            pass
+
+        # ESI rate limiter
+        try:
+            from aria_esi.core.rate_limit import reset_esi_rate_limiter
+            reset_esi_rate_limiter()
+        except ImportError:
+            pass
+
         # RedisQ - Name resolver
         try:
             from aria_esi.services.redisq.name_resolver import reset_name_resolver
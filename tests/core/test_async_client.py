@@ -4,6 +4,9 @@ Tests for async ESI client.
 
 from __future__ import annotations
 
+import time
+from email.utils import formatdate
+
 import pytest
 
 from aria_esi.core.async_client import (
@@ -12,6 +15,8 @@ from aria_esi.core.async_client import (
     AsyncESIResponse,
     create_async_client,
 )
+from aria_esi.core.rate_limit import TokenBucket, get_esi_rate_limiter
+from aria_esi.core.response_cache import ESIResponseCache
 
 
 class TestAsyncESIResponse:
@@ -341,3 +346,180 @@ class TestAsyncESIClientIntegration:
             await client.get("/universe/systems/30000142/")
 
             assert client._error_limit_remain == 50
+
+    async def test_requests_draw_from_rate_limiter(self, httpx_mock):
+        """Test every request takes a token from the configured limiter."""
+        for _ in range(2):
+            httpx_mock.add_response(
+                url="https://esi.evetech.net/latest/universe/systems/30000142/?datasource=tranquility",
+                json={"name": "Jita"},
+            )
+        limiter = TokenBucket(rate=0.001, capacity=5)
+
+        async with AsyncESIClient(rate_limiter=limiter) as client:
+            await client.get("/universe/systems/30000142/")
+            await client.get_with_headers("/universe/systems/30000142/")
+
+        assert limiter.available == pytest.approx(3, abs=0.01)
+
+    async def test_defaults_to_shared_rate_limiter(self):
+        """Test clients draw from the process-wide limiter by default."""
+        async with AsyncESIClient() as client:
+            assert client._rate_limiter is get_esi_rate_limiter()
+
+    async def test_get_all_pages_follows_x_pages(self, httpx_mock):
+        """Test get_all_pages fetches every page announced by X-Pages."""
+        base = "https://esi.evetech.net/latest/markets/10000002/orders/?datasource=tranquility&type_id=34"
+        httpx_mock.add_response(url=base, json=[{"order_id": 1}], headers={"X-Pages": "3"})
+        httpx_mock.add_response(url=f"{base}&page=2", json=[{"order_id": 2}])
+        httpx_mock.add_response(url=f"{base}&page=3", json=[{"order_id": 3}, {"order_id": 4}])
+
+        async with AsyncESIClient(enable_retry=False) as client:
+            pages = [
+                page
+                async for page in client.get_all_pages(
+                    "/markets/10000002/orders/", params={"type_id": 34}
+                )
+            ]
+
+        assert pages[0] == [{"order_id": 1}]
+        order_ids = sorted(order["order_id"] for page in pages for order in page)
+        assert order_ids == [1, 2, 3, 4]
+
+    async def test_get_all_pages_single_page(self, httpx_mock):
+        """Test get_all_pages stops after page 1 without X-Pages."""
+        httpx_mock.add_response(
+            url="https://esi.evetech.net/latest/markets/10000002/orders/?datasource=tranquility",
+            json=[{"order_id": 1}],
+        )
+
+        async with AsyncESIClient(enable_retry=False) as client:
+            pages = [page async for page in client.get_all_pages("/markets/10000002/orders/")]
+
+        assert pages == [[{"order_id": 1}]]
+
+    async def test_get_all_pages_respects_max_pages(self, httpx_mock):
+        """Test max_pages caps the pages requested."""
+        base = "https://esi.evetech.net/latest/markets/10000002/orders/?datasource=tranquility"
+        httpx_mock.add_response(url=base, json=[{"order_id": 1}], headers={"X-Pages": "50"})
+        httpx_mock.add_response(url=f"{base}&page=2", json=[{"order_id": 2}])
+
+        async with AsyncESIClient(enable_retry=False) as client:
+            pages = [
+                page
+                async for page in client.get_all_pages("/markets/10000002/orders/", max_pages=2)
+            ]
+
+        assert len(pages) == 2
+
+    async def test_get_all_pages_raises_on_failed_page(self, httpx_mock):
+        """Test a failing page surfaces as AsyncESIError."""
+        base = "https://esi.evetech.net/latest/markets/10000002/orders/?datasource=tranquility"
+        httpx_mock.add_response(url=base, json=[{"order_id": 1}], headers={"X-Pages": "2"})
+        httpx_mock.add_response(url=f"{base}&page=2", status_code=404, json={"error": "gone"})
+
+        async with AsyncESIClient(enable_retry=False) as client:
+            with pytest.raises(AsyncESIError):
+                async for _ in client.get_all_pages("/markets/10000002/orders/"):
+                    pass
+
+
+@pytest.mark.asyncio
+@pytest.mark.httpx
+@pytest.mark.skipif(not HTTPX_AVAILABLE, reason="pytest-httpx not installed")
+class TestAsyncESIClientResponseCache:
+    """Tests for ETag / Expires response caching."""
+
+    URL = "https://esi.evetech.net/latest/universe/system_kills/?datasource=tranquility"
+
+    async def test_fresh_response_served_without_request(self, httpx_mock):
+        """Test a response inside its Expires window is not re-fetched."""
+        httpx_mock.add_response(
+            url=self.URL,
+            json=[{"system_id": 30000142}],
+            headers={"ETag": '"v1"', "Expires": formatdate(time.time() + 60, usegmt=True)},
+        )
+        cache = ESIResponseCache()
+
+        async with AsyncESIClient(response_cache=cache) as client:
+            first = await client.get("/universe/system_kills/")
+            second = await client.get("/universe/system_kills/")
+
+        assert first == second == [{"system_id": 30000142}]
+        assert len(httpx_mock.get_requests()) == 1
+        assert cache.get_stats()["hits"] == 1
+
+    async def test_expired_response_revalidated_with_etag(self, httpx_mock):
+        """Test an expired response is revalidated and a 304 serves the cache."""
+        httpx_mock.add_response(
+            url=self.URL,
+            json=[{"system_id": 30000142}],
+            headers={"ETag": '"v1"', "Expires": formatdate(time.time() - 60, usegmt=True)},
+        )
+        httpx_mock.add_response(
+            url=self.URL,
+            status_code=304,
+            match_headers={"If-None-Match": '"v1"'},
+            headers={"Expires": formatdate(time.time() + 60, usegmt=True)},
+        )
+        cache = ESIResponseCache()
+
+        async with AsyncESIClient(response_cache=cache) as client:
+            await client.get("/universe/system_kills/")
+            result = await client.get("/universe/system_kills/")
+            again = await client.get("/universe/system_kills/")
+
+        assert result == again == [{"system_id": 30000142}]
+        assert len(httpx_mock.get_requests()) == 2
+        assert cache.get_stats()["revalidated"] == 1
+
+    async def test_authenticated_response_scoped_to_token(self, httpx_mock):
+        """Test an authenticated body is not served to other credentials."""
+        url = "https://esi.evetech.net/latest/characters/12345/location/?datasource=tranquility"
+        for system_id in (1, 2, 3):
+            httpx_mock.add_response(
+                url=url,
+                json={"solar_system_id": system_id},
+                headers={"Expires": formatdate(time.time() + 60, usegmt=True)},
+            )
+        cache = ESIResponseCache()
+
+        async with AsyncESIClient(token="pilot-a", response_cache=cache) as client:
+            first = await client.get("/characters/12345/location/", auth=True)
+            again = await client.get("/characters/12345/location/", auth=True)
+            public = await client.get("/characters/12345/location/")
+        async with AsyncESIClient(token="pilot-b", response_cache=cache) as client:
+            other = await client.get("/characters/12345/location/", auth=True)
+
+        assert first == again == {"solar_system_id": 1}
+        assert public == {"solar_system_id": 2}
+        assert other == {"solar_system_id": 3}
+        assert len(httpx_mock.get_requests()) == 3
+
+    async def test_cache_can_be_disabled(self, httpx_mock):
+        """Test cache_responses=False always goes to ESI."""
+        for _ in range(2):
+            httpx_mock.add_response(
+                url=self.URL,
+                json=[],
+                headers={"Expires": formatdate(time.time() + 60, usegmt=True)},
+            )
+
+        async with AsyncESIClient(cache_responses=False) as client:
+            await client.get("/universe/system_kills/")
+            await client.get("/universe/system_kills/")
+
+        assert len(httpx_mock.get_requests()) == 2
+
+    async def test_get_with_headers_if_none_match(self, httpx_mock):
+        """Test get_with_headers sends If-None-Match and reports 304."""
+        httpx_mock.add_response(
+            url=self.URL, status_code=304, match_headers={"If-None-Match": '"v1"'}
+        )
+
+        async with AsyncESIClient() as client:
+            response = await client.get_with_headers(
+                "/universe/system_kills/", if_none_match='"v1"'
+            )
+
+        assert response.is_not_modified
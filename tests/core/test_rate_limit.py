@@ -0,0 +1,77 @@
+"""
+Tests for the ESI token-bucket rate limiter.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from aria_esi.core.rate_limit import (
+    TokenBucket,
+    get_esi_rate_limiter,
+    reset_esi_rate_limiter,
+)
+
+
+class TestTokenBucket:
+    """Test TokenBucket."""
+
+    def test_starts_full(self):
+        bucket = TokenBucket(rate=5)
+        assert bucket.capacity == 5
+        assert all(bucket.try_acquire() for _ in range(5))
+        assert bucket.try_acquire() is False
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_refill(self):
+        bucket = TokenBucket(rate=50, capacity=1)
+        await bucket.acquire()
+
+        start = time.monotonic()
+        waited = await bucket.acquire()
+
+        assert waited > 0
+        assert time.monotonic() - start >= 0.015
+
+    @pytest.mark.asyncio
+    async def test_concurrent_acquires_are_spread(self):
+        bucket = TokenBucket(rate=100, capacity=2)
+
+        start = time.monotonic()
+        await asyncio.gather(*(bucket.acquire() for _ in range(6)))
+
+        # Two from the initial burst, four at 10ms each
+        assert time.monotonic() - start >= 0.035
+
+    @pytest.mark.asyncio
+    async def test_acquire_more_than_capacity(self):
+        with pytest.raises(ValueError):
+            await TokenBucket(rate=1).acquire(2)
+
+    def test_acquire_across_event_loops(self):
+        bucket = TokenBucket(rate=100, capacity=1)
+
+        async def contend():
+            await asyncio.gather(*(bucket.acquire() for _ in range(3)))
+
+        # A lock bound to the first loop would fail on the second
+        asyncio.run(contend())
+        asyncio.run(contend())
+
+
+class TestSharedLimiter:
+    """Test the process-wide ESI limiter."""
+
+    def test_singleton(self):
+        reset_esi_rate_limiter()
+        try:
+            assert get_esi_rate_limiter() is get_esi_rate_limiter()
+        finally:
+            reset_esi_rate_limiter()
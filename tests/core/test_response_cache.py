@@ -0,0 +1,124 @@
+"""
+Tests for the ESI response cache.
+"""
+
+from __future__ import annotations
+
+import time
+from email.utils import formatdate
+
+from aria_esi.core.response_cache import (
+    CachedResponse,
+    ESIResponseCache,
+    parse_expires,
+    response_cache_key,
+)
+
+URL = "https://esi.evetech.net/latest/sovereignty/map/?datasource=tranquility"
+
+
+def _expires_in(seconds: float) -> str:
+    return formatdate(time.time() + seconds, usegmt=True)
+
+
+class TestCachedResponse:
+    """Tests for CachedResponse and header parsing."""
+
+    def test_fresh_until_expires(self):
+        entry = CachedResponse(body=b"[]", expires=time.time() + 60)
+        assert entry.is_fresh()
+        assert not entry.is_fresh(now=time.time() + 120)
+
+    def test_json_returns_independent_copies(self):
+        entry = CachedResponse(body=b'[{"system_id": 1}]')
+        first = entry.json()
+        first.append({"system_id": 2})
+        assert entry.json() == [{"system_id": 1}]
+
+    def test_parse_expires(self):
+        assert parse_expires({"Expires": "Thu, 01 Jan 2026 00:00:00 GMT"}) > 0
+        assert parse_expires({"expires": "not a date"}) == 0.0
+        assert parse_expires({}) == 0.0
+
+
+class TestESIResponseCache:
+    """Tests for the in-memory LRU and SQLite write-through."""
+
+    def test_store_requires_validator(self):
+        cache = ESIResponseCache()
+        assert cache.store(URL, {"Content-Type": "application/json"}, b"[]") is None
+        assert cache.get(URL) is None
+
+    def test_store_and_get(self):
+        cache = ESIResponseCache()
+        entry = cache.store(URL, {"ETag": '"abc"', "Expires": _expires_in(60)}, b"[1]")
+
+        assert entry is not None
+        assert entry.etag == '"abc"'
+        assert cache.get(URL) is entry
+        assert entry.is_fresh()
+
+    def test_revalidate_refreshes_expiry(self):
+        cache = ESIResponseCache()
+        stale = cache.store(URL, {"ETag": '"abc"', "Expires": _expires_in(-60)}, b"[1]")
+        assert stale is not None and not stale.is_fresh()
+
+        refreshed = cache.revalidate(URL, stale, {"Expires": _expires_in(60)})
+
+        assert refreshed.is_fresh()
+        assert refreshed.etag == '"abc"'
+        assert refreshed.json() == [1]
+        assert cache.get_stats()["revalidated"] == 1
+
+    def test_evicts_by_count_and_bytes(self):
+        cache = ESIResponseCache(maxsize=2, max_bytes=10)
+        for i in range(3):
+            cache.store(f"{URL}&i={i}", {"ETag": str(i)}, b"123")
+        assert len(cache) == 2
+        assert cache.peek(f"{URL}&i=0") is None
+
+        cache.store(f"{URL}&big=1", {"ETag": "big"}, b"12345678")
+        assert len(cache) == 1
+        assert cache.get_stats()["bytes"] == 8
+
+    def test_persists_across_instances(self, tmp_path):
+        db_path = tmp_path / "esi.db"
+        cache = ESIResponseCache(db_path=db_path)
+        cache.store(URL, {"ETag": '"abc"', "Expires": _expires_in(60)}, b"[1]")
+        cache.close()
+
+        reopened = ESIResponseCache(db_path=db_path)
+        entry = reopened.get(URL)
+
+        assert entry is not None
+        assert entry.etag == '"abc"'
+        assert entry.json() == [1]
+        assert reopened.get_stats()["loaded_from_disk"] == 1
+        reopened.close()
+
+    def test_authenticated_responses_stay_in_memory(self, tmp_path):
+        db_path = tmp_path / "esi.db"
+        cache = ESIResponseCache(db_path=db_path)
+        cache.store(URL, {"ETag": '"abc"'}, b"[1]", persist=False)
+        assert cache.get(URL) is not None
+        cache.close()
+
+        reopened = ESIResponseCache(db_path=db_path)
+        assert reopened.get(URL) is None
+        reopened.close()
+
+    def test_key_scoped_to_credential(self):
+        assert response_cache_key(URL) == URL
+        assert response_cache_key(URL, None) == URL
+        assert response_cache_key(URL, "Bearer a") != URL
+        assert response_cache_key(URL, "Bearer a") == response_cache_key(URL, "Bearer a")
+        assert response_cache_key(URL, "Bearer a") != response_cache_key(URL, "Bearer b")
+
+    def test_clear(self, tmp_path):
+        cache = ESIResponseCache(db_path=tmp_path / "esi.db")
+        cache.store(URL, {"ETag": '"abc"'}, b"[1]")
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.get(URL) is None
+        cache.close()
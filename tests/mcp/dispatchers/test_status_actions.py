@@ -78,3 +78,48 @@ class TestStatusErrorHandling:
                 # Some implementations may propagate exceptions
                 # which is also acceptable behavior
                 pass
+
+
+class TestStatusRouteCache:
+    """Tests for route cache counters in status output."""
+
+    def test_status_reports_route_cache(self, status_tool, standard_universe):
+        """Route cache hit/miss counters are exposed under navigation."""
+        from aria_esi.mcp.tools import reset_universe
+        from aria_esi.services.navigation import NavigationService
+
+        NavigationService(standard_universe).calculate_route(0, 3, "safe")
+        NavigationService(standard_universe).calculate_route(0, 3, "safe")
+
+        with patch("aria_esi.mcp.tools._universe", standard_universe):
+            result = asyncio.run(status_tool())
+        reset_universe()
+
+        route_cache = result["navigation"]["route_cache"]
+        assert route_cache["hits"] == 1
+        assert route_cache["misses"] == 1
+        assert route_cache["entries"] == 1
+
+    def test_status_without_universe(self, status_tool):
+        """Status still returns when no universe is loaded."""
+        from aria_esi.mcp.tools import reset_universe
+
+        reset_universe()
+        result = asyncio.run(status_tool())
+
+        assert result["navigation"]["route_cache"] is None
+
+
+class TestStatusResponseCache:
+    """Tests for ESI response cache counters in status output."""
+
+    def test_status_reports_response_cache(self, status_tool):
+        """Response cache counters are exposed under esi."""
+        from aria_esi.core.response_cache import get_esi_response_cache
+
+        get_esi_response_cache().record_hit()
+        result = asyncio.run(status_tool())
+
+        response_cache = result["esi"]["response_cache"]
+        assert response_cache["hits"] == 1
+        assert response_cache["persistent"] is False
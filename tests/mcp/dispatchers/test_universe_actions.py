@@ -155,6 +155,57 @@ class TestRouteAction:
         assert "security_summary" in result
 
 
+    def test_route_multiple_destinations(self, universe_dispatcher):
+        """List of destinations returns one route per destination."""
+        result = asyncio.run(
+            universe_dispatcher(
+                action="route", origin="Jita", destination=["Sivala", "Perimeter", "Urlen"]
+            )
+        )
+
+        assert result["origin"] == "Jita"
+        assert [r["destination"] for r in result["routes"]] == ["Perimeter", "Sivala", "Urlen"]
+        assert [r["jumps"] for r in result["routes"]] == [1, 2, 2]
+        assert result["routes"][0]["systems"] == ["Jita", "Perimeter"]
+        assert "security_summary" in result["routes"][0]
+        assert result["_meta"]["count"] == 3
+
+    def test_route_multiple_destinations_with_avoid(self, universe_dispatcher):
+        """avoid_systems applies to every destination."""
+        result = asyncio.run(
+            universe_dispatcher(
+                action="route",
+                origin="Jita",
+                destination=["Urlen", "Maurasi"],
+                avoid_systems=["Perimeter", "Nowhere"],
+            )
+        )
+
+        for route in result["routes"]:
+            assert "Perimeter" not in route["systems"]
+        assert any("Nowhere" in w for w in result["warnings"])
+
+    def test_route_multiple_destinations_too_many(self, universe_dispatcher):
+        """Destination lists above the limit are rejected."""
+        with pytest.raises(InvalidParameterError) as exc:
+            asyncio.run(
+                universe_dispatcher(action="route", origin="Jita", destination=["Urlen"] * 51)
+            )
+
+        assert "destination" in str(exc.value).lower()
+
+    def test_destination_list_rejected_for_other_actions(self, universe_dispatcher):
+        """Only the route action accepts a list of destinations."""
+        with pytest.raises(InvalidParameterError) as exc:
+            asyncio.run(
+                universe_dispatcher(
+                    action="gatecamp_risk", origin="Jita", destination=["Sivala", "Urlen"]
+                )
+            )
+
+        assert "destination" in str(exc.value).lower()
+
+
 # =============================================================================
 # Systems Action Tests
 # =============================================================================
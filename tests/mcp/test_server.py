@@ -507,6 +507,14 @@ class TestLevenshteinDistance:
         # "Kisago" -> "Kisogo" = 1 substitution (a->o)
         assert _levenshtein_distance("kisago", "kisogo") == 1
 
+    def test_max_distance_cutoff(self):
+        """Distances past max_distance stop early at max_distance + 1."""
+        from aria_esi.mcp.tools import _levenshtein_distance
+
+        assert _levenshtein_distance("a", "abcdef", max_distance=2) == 3
+        assert _levenshtein_distance("kitten", "sitting", max_distance=1) == 2
+        assert _levenshtein_distance("kitten", "sitting", max_distance=3) == 3
+
 
 # =============================================================================
 # Module Exports Tests
@@ -312,6 +312,30 @@ class TestFindNearest:
         distances = [r.jumps_from_origin for r in results]
         assert distances == sorted(distances)
 
+    def test_jump_matrix_matches_bfs(self, mock_universe: UniverseGraph):
+        """Precomputed jump matrix finds the same systems at the same distances."""
+        from aria_esi.universe.builder import compute_jump_matrix
+
+        predicate = _build_predicate(
+            universe=mock_universe,
+            is_border=None,
+            min_adjacent_lowsec=None,
+            security_min=None,
+            security_max=None,
+            region_id=None,
+        )
+        expected = _find_nearest(mock_universe, 0, predicate, limit=50, max_jumps=3)
+        mock_universe.jump_matrix = compute_jump_matrix(mock_universe.graph)
+        results = _find_nearest(mock_universe, 0, predicate, limit=50, max_jumps=3)
+
+        def key(r):
+            return (r.jumps_from_origin, r.name)
+
+        assert sorted(results, key=key) == sorted(expected, key=key)
+        assert [r.jumps_from_origin for r in results] == sorted(
+            r.jumps_from_origin for r in results
+        )
+
 
 # =============================================================================
 # Result Building Tests
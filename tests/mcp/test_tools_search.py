@@ -217,6 +217,15 @@ class TestBfsWithinRange:
         # Urlen (2 jumps) should not be included
         assert 3 not in candidates
 
+    def test_jump_matrix_matches_bfs(self, mock_universe: UniverseGraph):
+        """Precomputed jump matrix gives the same result as BFS."""
+        from aria_esi.universe.builder import compute_jump_matrix
+
+        expected = [_bfs_within_range(mock_universe, 0, k) for k in range(4)]
+        mock_universe.jump_matrix = compute_jump_matrix(mock_universe.graph)
+
+        assert [_bfs_within_range(mock_universe, 0, k) for k in range(4)] == expected
+
 
 # =============================================================================
 # Search Systems Tests
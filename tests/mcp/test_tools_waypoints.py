@@ -276,6 +276,21 @@ class TestOptimizeWaypoints:
         route_names = {s["name"] for s in result["route_systems"]}
         assert "Sivala" not in route_names
 
+    def test_solver_reported(self, waypoint_universe: UniverseGraph):
+        """Optimized solver never does worse than greedy and reports its gain."""
+        kwargs = {
+            "waypoint_indices": [1, 2, 5, 7, 8],
+            "origin_idx": 0,
+            "origin_name": "Jita",
+            "return_to_origin": True,
+        }
+        greedy = _optimize_waypoints(waypoint_universe, solver="greedy", **kwargs)
+        optimized = _optimize_waypoints(waypoint_universe, **kwargs)
+
+        assert greedy["tour_method"] == "greedy"
+        assert greedy["jumps_saved"] == 0
+        assert optimized["total_jumps"] == greedy["total_jumps"] - optimized["jumps_saved"]
+
 
 # =============================================================================
 # Integration Tests: universe_optimize_waypoints tool
@@ -421,6 +436,18 @@ class TestWaypointErrors:
 
         assert "security_filter" in str(exc.value)
 
+    def test_invalid_solver(self, registered_waypoint_universe: UniverseGraph):
+        """Raises error for invalid solver."""
+        tool = _capture_tool(registered_waypoint_universe)
+
+        with pytest.raises(InvalidParameterError) as exc:
+            asyncio.run(tool(
+                waypoints=["Jita", "Perimeter"],
+                solver="invalid"
+            ))
+
+        assert "solver" in str(exc.value)
+
     def test_unknown_origin(self, registered_waypoint_universe: UniverseGraph):
         """Raises error for unknown origin system."""
         tool = _capture_tool(registered_waypoint_universe)
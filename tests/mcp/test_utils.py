@@ -6,6 +6,7 @@ Covers DistanceMatrix, weight computation, and shared utility functions.
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
 from aria_esi.mcp.errors import InvalidParameterError
@@ -213,6 +214,55 @@ class TestDistanceMatrix:
         # Or through other paths if available
         assert dist >= 2
 
+    def test_jump_matrix_any_filter(self, disconnected_universe: UniverseGraph):
+        """Unweighted matrices read hop counts from the jump matrix."""
+        from aria_esi.universe.builder import compute_jump_matrix
+
+        disconnected_universe.jump_matrix = compute_jump_matrix(disconnected_universe.graph)
+        matrix = DistanceMatrix.compute(
+            disconnected_universe, [0, 1, 2], security_filter="any"
+        )
+
+        assert matrix.distance(0, 1) == 1
+        assert matrix.distance(0, 2) == float("inf")
+        assert matrix.path(0, 1) == [0, 1]
+        assert matrix.path(0, 2) == []
+
+    def test_distances_stored_as_float32(self, route_universe: UniverseGraph):
+        """Distances are a float32 array with one predecessor row per source."""
+        matrix = DistanceMatrix.compute(route_universe, [0, 3, 5])
+
+        assert matrix._distances.dtype == np.float32
+        assert matrix._predecessors.shape == (3, route_universe.system_count)
+
+    @pytest.mark.parametrize("security_filter", ["highsec", "lowsec", "any"])
+    def test_paths_match_distances(self, route_universe: UniverseGraph, security_filter: str):
+        """Rebuilt paths are connected and as long as the reported distance."""
+        waypoints = list(range(route_universe.system_count))
+        matrix = DistanceMatrix.compute(route_universe, waypoints, security_filter=security_filter)
+
+        for src in waypoints:
+            for dst in waypoints:
+                path = matrix.path(src, dst)
+                assert path[0] == src and path[-1] == dst
+                assert len(path) - 1 == matrix.distance(src, dst)
+                for a, b in zip(path, path[1:]):
+                    assert b in route_universe.graph.neighbors(a)
+
+    def test_jump_matrix_trees_match_search(self, route_universe: UniverseGraph):
+        """Trees derived from the jump matrix give the same distances and path lengths."""
+        from aria_esi.universe.builder import compute_jump_matrix
+
+        waypoints = list(range(route_universe.system_count))
+        searched = DistanceMatrix.compute(route_universe, waypoints, security_filter="any")
+        route_universe.jump_matrix = compute_jump_matrix(route_universe.graph)
+        derived = DistanceMatrix.compute(route_universe, waypoints, security_filter="any")
+
+        np.testing.assert_array_equal(derived._distances, searched._distances)
+        for src in waypoints:
+            for dst in waypoints:
+                assert len(derived.path(src, dst)) == len(searched.path(src, dst))
+
     def test_len_returns_waypoint_count(self, route_universe: UniverseGraph):
         """__len__ returns number of waypoints."""
         waypoints = [0, 1, 2]
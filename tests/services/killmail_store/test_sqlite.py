@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timedelta
+import sqlite3
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
+import pytest_asyncio
 
 pytestmark = pytest.mark.asyncio
 
@@ -307,6 +310,19 @@ class TestSQLiteKillmailStore:
         await store.mark_kill_processed(worker_name, sample_kill.kill_id)
         assert await store.is_kill_processed(worker_name, sample_kill.kill_id)
 
+    async def test_processed_kills_batch(self, store: SQLiteKillmailStore) -> None:
+        """Test set-based duplicate detection and batch marking."""
+        await store.mark_kill_processed("test-worker", 1)
+
+        assert await store.filter_unprocessed("test-worker", [1, 2, 3]) == {2, 3}
+        assert await store.filter_unprocessed("other-worker", [1, 2]) == {1, 2}
+        assert await store.filter_unprocessed("test-worker", []) == set()
+
+        await store.mark_processed_batch("test-worker", [2, 3])
+        await store.mark_processed_batch("test-worker", [])
+        assert await store.filter_unprocessed("test-worker", [1, 2, 3, 4]) == {4}
+        assert await store.is_kill_processed("test-worker", 3)
+
     async def test_delivery_attempts_tracking(
         self, store: SQLiteKillmailStore, sample_kill: KillmailRecord
     ) -> None:
@@ -456,3 +472,183 @@ class TestSQLiteKillmailStore:
         assert stats.oldest_killmail_time is not None
         assert stats.newest_killmail_time is not None
         assert stats.database_size_bytes > 0
+
+
+# UTC midnight, so day partitions are predictable
+DAY0 = int(datetime(2026, 1, 20, tzinfo=timezone.utc).timestamp())
+
+
+def make_day_kill(kill_id: int, day: int, seconds: int = 3600) -> KillmailRecord:
+    """Create a kill at an offset into a UTC day after DAY0."""
+    return KillmailRecord(
+        kill_id=kill_id,
+        kill_time=DAY0 + day * 86400 + seconds,
+        solar_system_id=30000142 if kill_id % 2 else 30000144,
+        zkb_hash=f"hash{kill_id}",
+        zkb_total_value=100_000_000.0,
+        zkb_points=10,
+        zkb_is_npc=False,
+        zkb_is_solo=False,
+        zkb_is_awox=False,
+        ingested_at=DAY0 + day * 86400 + seconds,
+        victim_ship_type_id=670,
+        victim_corporation_id=98000001,
+        victim_alliance_id=None,
+    )
+
+
+@pytest_asyncio.fixture
+async def partitioned_store(temp_db_path: Path):
+    """Create and initialize a day-partitioned store."""
+    store = SQLiteKillmailStore(db_path=temp_db_path, partition_by_day=True)
+    await store.initialize()
+    yield store
+    await store.close()
+
+
+async def table_names(store: SQLiteKillmailStore, pattern: str) -> list[str]:
+    """Names of tables matching a GLOB pattern."""
+    cursor = await store.db.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name GLOB ? ORDER BY name",
+        (pattern,),
+    )
+    return [row[0] for row in await cursor.fetchall()]
+
+
+class TestPartitionedStore:
+    """Tests for the day-partitioned layout."""
+
+    async def test_kills_written_to_day_tables(
+        self, partitioned_store: SQLiteKillmailStore
+    ) -> None:
+        kills = [make_day_kill(i, day=i % 3) for i in range(1, 10)]
+        assert await partitioned_store.insert_kills_batch(kills) == 9
+        assert await partitioned_store.insert_kills_batch(kills) == 0
+
+        assert await table_names(partitioned_store, "killmails_*") == [
+            "killmails_20260120",
+            "killmails_20260121",
+            "killmails_20260122",
+        ]
+        cursor = await partitioned_store.db.execute("SELECT COUNT(*) FROM killmails")
+        assert (await cursor.fetchone())[0] == 0
+        assert (await partitioned_store.get_kill(5)).kill_time == make_day_kill(5, 2).kill_time
+
+    async def test_query_spans_partitions(self, partitioned_store: SQLiteKillmailStore) -> None:
+        kills = [make_day_kill(i, day=i % 4, seconds=i * 60) for i in range(1, 21)]
+        await partitioned_store.insert_kills_batch(kills)
+        expected = sorted(kills, key=lambda k: (k.kill_time, k.kill_id), reverse=True)
+
+        everything = await partitioned_store.query_kills(limit=100)
+        assert [k.kill_id for k in everything] == [k.kill_id for k in expected]
+
+        # Paging with a cursor crosses partition boundaries
+        paged: list[int] = []
+        cursor = None
+        while page := await partitioned_store.query_kills(limit=3, cursor=cursor):
+            paged.extend(k.kill_id for k in page)
+            cursor = (page[-1].kill_time, page[-1].kill_id)
+        assert paged == [k.kill_id for k in expected]
+
+        window = await partitioned_store.query_kills(
+            systems=[30000142],
+            since=datetime.fromtimestamp(DAY0 + 86400, tz=timezone.utc),
+            until=datetime.fromtimestamp(DAY0 + 2 * 86400 + 3600, tz=timezone.utc),
+        )
+        assert [k.kill_id for k in window] == [
+            k.kill_id
+            for k in expected
+            if k.solar_system_id == 30000142
+            and DAY0 + 86400 <= k.kill_time <= DAY0 + 2 * 86400 + 3600
+        ]
+
+    async def test_expunge_drops_whole_days(
+        self, partitioned_store: SQLiteKillmailStore, sample_esi_details: ESIKillmail
+    ) -> None:
+        kills = [make_day_kill(i, day=i % 3, seconds=i * 600) for i in range(1, 13)]
+        await partitioned_store.insert_kills_batch(kills)
+        await partitioned_store.insert_esi_details(3, replace(sample_esi_details, kill_id=3))
+
+        cutoff_ts = DAY0 + 86400 + 3600
+        cutoff = datetime.fromtimestamp(cutoff_ts, tz=timezone.utc)
+        deleted = await partitioned_store.expunge_before(cutoff)
+
+        assert deleted == sum(1 for k in kills if k.kill_time < cutoff_ts)
+        assert await table_names(partitioned_store, "*_20260120") == []
+        remaining = await partitioned_store.query_kills(limit=100)
+        assert sorted(k.kill_id for k in remaining) == sorted(
+            k.kill_id for k in kills if k.kill_time >= cutoff_ts
+        )
+        assert await partitioned_store.get_esi_details(3) is None
+
+    async def test_esi_details_follow_their_kill(
+        self, partitioned_store: SQLiteKillmailStore, sample_esi_details: ESIKillmail
+    ) -> None:
+        await partitioned_store.insert_kills_batch([make_day_kill(1, 0), make_day_kill(2, 1)])
+        await partitioned_store.insert_esi_details(2, replace(sample_esi_details, kill_id=2))
+        await partitioned_store.insert_esi_unfetchable(1)
+
+        details = await partitioned_store.get_esi_details(2)
+        assert details is not None
+        assert details.attacker_count == sample_esi_details.attacker_count
+        assert (await partitioned_store.get_esi_details(1)).fetch_status == "unfetchable"
+
+        with pytest.raises(sqlite3.IntegrityError):
+            await partitioned_store.insert_esi_details(99, sample_esi_details)
+
+        stats = await partitioned_store.get_stats()
+        assert stats.total_killmails == 2
+        assert stats.total_esi_details == 1
+        assert stats.total_esi_unfetchable == 1
+        assert stats.oldest_killmail_time == make_day_kill(1, 0).kill_time
+
+    async def test_legacy_rows_stay_visible(self, temp_db_path: Path) -> None:
+        legacy = SQLiteKillmailStore(db_path=temp_db_path)
+        await legacy.initialize()
+        await legacy.insert_kills_batch([make_day_kill(1, 0), make_day_kill(3, 2)])
+        await legacy.close()
+
+        store = SQLiteKillmailStore(db_path=temp_db_path, partition_by_day=True)
+        await store.initialize()
+        await store.insert_kill(make_day_kill(2, 1))
+
+        assert [k.kill_id for k in await store.query_kills(limit=2)] == [3, 2]
+        assert (await store.get_stats()).total_killmails == 3
+
+        deleted = await store.expunge_before(
+            datetime.fromtimestamp(DAY0 + 2 * 86400, tz=timezone.utc)
+        )
+        assert deleted == 2
+        assert [k.kill_id for k in await store.query_kills()] == [3]
+        await store.close()
+
+    async def test_reader_detects_partitions(
+        self, partitioned_store: SQLiteKillmailStore, temp_db_path: Path
+    ) -> None:
+        await partitioned_store.insert_kill(make_day_kill(1, 0))
+        reader = SQLiteKillmailStore(db_path=temp_db_path, read_only=True)
+        await reader.initialize()
+
+        assert reader.partitioned
+        assert [k.kill_id for k in await reader.query_kills()] == [1]
+
+        # Partitions created after the reader opened are picked up
+        await partitioned_store.insert_kill(make_day_kill(2, 5))
+        assert [k.kill_id for k in await reader.query_kills()] == [2, 1]
+        await reader.close()
+
+    async def test_reader_opened_before_first_partition(
+        self, partitioned_store: SQLiteKillmailStore, temp_db_path: Path
+    ) -> None:
+        reader = SQLiteKillmailStore(db_path=temp_db_path, read_only=True)
+        await reader.initialize()
+        try:
+            assert not reader.partitioned
+
+            await partitioned_store.insert_kill(make_day_kill(1, 0))
+
+            assert [k.kill_id for k in await reader.query_kills()] == [1]
+            assert (await reader.get_kill(1)).kill_id == 1
+            assert reader.partitioned
+        finally:
+            await reader.close()
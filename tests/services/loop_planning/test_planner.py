@@ -147,6 +147,16 @@ class TestLoopPlanningService:
         assert summary.full_route[0] == 0
         assert summary.full_route[-1] == 0
 
+    def test_plan_loop_solver(self, mock_universe: UniverseGraph):
+        """Optimized ordering is never longer than greedy and reports the gain."""
+        service = LoopPlanningService(mock_universe)
+        greedy = service.plan_loop(origin_idx=0, target_jumps=20, min_borders=2, solver="greedy")
+        optimized = service.plan_loop(origin_idx=0, target_jumps=20, min_borders=2)
+
+        assert greedy.tour_method == "greedy"
+        assert greedy.jumps_saved == 0
+        assert optimized.total_jumps == greedy.total_jumps - optimized.jumps_saved
+
     def test_plan_loop_density_mode(self, mock_universe: UniverseGraph):
         """Density mode works correctly."""
         service = LoopPlanningService(mock_universe)
@@ -0,0 +1,136 @@
+"""
+Tests for Tour Optimization.
+
+Unit tests for the Held-Karp and 2-opt/Or-opt visit-order solvers.
+"""
+
+from __future__ import annotations
+
+import itertools
+
+import numpy as np
+import pytest
+
+from aria_esi.mcp.utils import DistanceMatrix
+from aria_esi.services.loop_planning.tsp import (
+    EXACT_MAX_WAYPOINTS,
+    solve_tour,
+)
+
+
+def make_matrix(distances: np.ndarray) -> DistanceMatrix:
+    """Build a DistanceMatrix over vertices 0..n-1 from raw distances."""
+    n = len(distances)
+    return DistanceMatrix(
+        waypoints=list(range(n)),
+        _distances=distances.astype(np.float32),
+        _predecessors=np.full((n, n), -1, dtype=np.int32),
+        _idx_map={v: v for v in range(n)},
+    )
+
+
+def line_matrix(positions: list[int]) -> DistanceMatrix:
+    """Distances between points on a line (vertex i at positions[i])."""
+    p = np.array(positions, dtype=np.float64)
+    return make_matrix(np.abs(p[:, None] - p[None, :]))
+
+
+def grid_matrix(count: int, seed: int) -> DistanceMatrix:
+    """Manhattan distances between random integer points."""
+    rng = np.random.default_rng(seed)
+    points = rng.integers(0, 20, size=(count, 2))
+    return make_matrix(np.abs(points[:, None, :] - points[None, :, :]).sum(axis=2).astype(float))
+
+
+def tour_cost(matrix: DistanceMatrix, tour: list[int], closed: bool) -> float:
+    stops = tour + [tour[0]] if closed else tour
+    return sum(matrix.distance(a, b) for a, b in itertools.pairwise(stops))
+
+
+def brute_force(matrix: DistanceMatrix, stops: list[int], closed: bool) -> float:
+    return min(tour_cost(matrix, [0, *order], closed) for order in itertools.permutations(stops))
+
+
+class TestSolveTour:
+    """Test solve_tour function."""
+
+    def test_greedy_solver_matches_nearest_neighbor(self):
+        """Greedy solver returns the nearest-neighbor tour unchanged."""
+        matrix = line_matrix([0, 1, -2, 4])
+        solution = solve_tour(0, [1, 2, 3], matrix, closed=False, solver="greedy")
+
+        assert solution.tour == [0, 1, 2, 3]
+        assert solution.method == "greedy"
+        assert solution.cost == solution.greedy_cost == 10
+        assert solution.jumps_saved == 0
+
+    def test_improves_on_greedy(self):
+        """Optimized tour avoids the zig-zag nearest-neighbor produces."""
+        matrix = line_matrix([0, 1, -2, 4])
+        solution = solve_tour(0, [1, 2, 3], matrix, closed=False)
+
+        assert solution.method == "held_karp"
+        assert solution.tour == [0, 2, 1, 3]
+        assert solution.cost == 8
+        assert solution.jumps_saved == 2
+        assert solution.improvement == pytest.approx(0.2)
+
+    @pytest.mark.parametrize("closed", [True, False])
+    @pytest.mark.parametrize("seed", range(5))
+    def test_held_karp_is_optimal(self, closed: bool, seed: int):
+        """Exact solver matches brute force on small instances."""
+        matrix = grid_matrix(8, seed)
+        stops = list(range(1, 8))
+        solution = solve_tour(0, stops, matrix, closed=closed)
+
+        assert sorted(solution.tour) == list(range(8))
+        assert solution.tour[0] == 0
+        assert solution.cost == brute_force(matrix, stops, closed)
+        assert solution.cost == tour_cost(matrix, solution.tour, closed)
+
+    @pytest.mark.parametrize("closed", [True, False])
+    def test_local_search_beyond_exact_limit(self, closed: bool):
+        """Large instances use local search and never do worse than greedy."""
+        count = EXACT_MAX_WAYPOINTS + 20
+        matrix = grid_matrix(count, seed=42)
+        stops = list(range(1, count))
+        solution = solve_tour(0, stops, matrix, closed=closed, time_budget=1.0)
+
+        assert sorted(solution.tour) == list(range(count))
+        assert solution.tour[0] == 0
+        assert solution.cost == tour_cost(matrix, solution.tour, closed)
+        assert solution.cost <= solution.greedy_cost
+        assert solution.method in ("local_search", "greedy")
+
+    def test_zero_budget_falls_back_to_greedy(self):
+        """With no time to improve, the greedy tour is returned."""
+        count = EXACT_MAX_WAYPOINTS + 5
+        matrix = grid_matrix(count, seed=7)
+        solution = solve_tour(0, list(range(1, count)), matrix, time_budget=0.0)
+
+        assert solution.method == "greedy"
+        assert solution.cost == solution.greedy_cost
+
+    def test_unreachable_waypoint_keeps_greedy(self):
+        """Tours with unreachable legs report the greedy order."""
+        distances = np.array(
+            [
+                [0, 1, 2, np.inf],
+                [1, 0, 1, np.inf],
+                [2, 1, 0, np.inf],
+                [np.inf, np.inf, np.inf, 0],
+            ]
+        )
+        solution = solve_tour(0, [1, 2, 3], make_matrix(distances))
+
+        assert solution.method == "greedy"
+        assert solution.jumps_saved == 0
+        assert solution.improvement == 0.0
+
+    def test_fewer_than_three_stops_is_greedy(self):
+        """Trivial tours skip optimization."""
+        matrix = line_matrix([0, 5, -1])
+        solution = solve_tour(0, [1, 2], matrix)
+
+        assert solution.method == "greedy"
+        assert solution.tour == [0, 2, 1]
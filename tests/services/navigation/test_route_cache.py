@@ -0,0 +1,315 @@
+"""
+Tests for Navigation Route Cache.
+
+Tests the RouteCache LRU, its SQLite persistence and its integration with
+NavigationService.
+"""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from tests.mcp.conftest import STANDARD_EDGES, STANDARD_SYSTEMS, create_mock_universe
+
+
+@pytest.fixture
+def standard_universe():
+    """Standard 6-system universe (see tests/mcp/conftest.py)."""
+    return create_mock_universe(STANDARD_SYSTEMS, STANDARD_EDGES)
+
+
+# =============================================================================
+# Key Helper Tests
+# =============================================================================
+
+
+class TestAvoidSetHash:
+    """Test avoid_set_hash."""
+
+    def test_empty_is_blank(self):
+        from aria_esi.services.navigation.route_cache import avoid_set_hash
+
+        assert avoid_set_hash(None) == ""
+        assert avoid_set_hash(set()) == ""
+
+    def test_order_independent(self):
+        from aria_esi.services.navigation.route_cache import avoid_set_hash
+
+        assert avoid_set_hash([3, 1, 2]) == avoid_set_hash({2, 3, 1})
+        assert avoid_set_hash([1, 2]) != avoid_set_hash([1, 3])
+
+    def test_graph_key_includes_checksum(self, standard_universe):
+        from aria_esi.services.navigation.route_cache import graph_cache_key
+
+        before = graph_cache_key(standard_universe)
+        standard_universe.source_checksum = "abc123"
+        after = graph_cache_key(standard_universe)
+
+        assert before != after
+        assert after == f"{standard_universe.version}:abc123"
+
+
+# =============================================================================
+# In-Memory Cache Tests
+# =============================================================================
+
+
+class TestRouteCache:
+    """Test in-memory RouteCache behaviour."""
+
+    def test_miss_then_hit(self):
+        from aria_esi.services.navigation.route_cache import RouteCache
+
+        cache = RouteCache("v1:x")
+        assert cache.get(0, 3, "safe", None) is None
+
+        cache.put(0, 3, "safe", None, [0, 1, 3])
+        assert cache.get(0, 3, "safe", None) == [0, 1, 3]
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["persistent"] is False
+
+    def test_key_includes_mode_and_avoid(self):
+        from aria_esi.services.navigation.route_cache import RouteCache
+
+        cache = RouteCache("v1:x")
+        cache.put(0, 3, "safe", {2}, [0, 1, 3])
+
+        assert cache.get(0, 3, "shortest", {2}) is None
+        assert cache.get(0, 3, "safe", None) is None
+        assert cache.get(0, 3, "safe", [2]) == [0, 1, 3]
+
+    def test_returns_copy(self):
+        from aria_esi.services.navigation.route_cache import RouteCache
+
+        cache = RouteCache("v1:x")
+        cache.put(0, 1, "shortest", None, [0, 1])
+        cache.get(0, 1, "shortest", None).append(99)
+
+        assert cache.get(0, 1, "shortest", None) == [0, 1]
+
+    def test_lru_eviction(self):
+        from aria_esi.services.navigation.route_cache import RouteCache
+
+        cache = RouteCache("v1:x", maxsize=2)
+        cache.put(0, 1, "shortest", None, [0, 1])
+        cache.put(0, 2, "shortest", None, [0, 2])
+        cache.get(0, 1, "shortest", None)  # Refresh 0 -> 1
+        cache.put(0, 3, "shortest", None, [0, 3])
+
+        assert len(cache) == 2
+        assert cache.get(0, 2, "shortest", None) is None
+        assert cache.get(0, 1, "shortest", None) == [0, 1]
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_concurrent_access(self):
+        from aria_esi.services.navigation.route_cache import RouteCache
+
+        cache = RouteCache("v1:x", maxsize=64)
+
+        def worker(offset: int) -> None:
+            for i in range(200):
+                key = (offset + i) % 100
+                if cache.get(0, key, "safe", None) is None:
+                    cache.put(0, key, "safe", None, [0, key])
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stats = cache.get_stats()
+        assert stats["hits"] + stats["misses"] == 8 * 200
+        assert len(cache) <= 64
+
+
+# =============================================================================
+# Persistence Tests
+# =============================================================================
+
+
+class TestRouteCachePersistence:
+    """Test SQLite persistence and graph-key invalidation."""
+
+    def test_warm_start(self, tmp_path):
+        from aria_esi.services.navigation.route_cache import RouteCache
+
+        db = tmp_path / "routes.db"
+        cache = RouteCache("v1:abc", db_path=db)
+        cache.put(0, 3, "safe", {4}, [0, 2, 3])
+        cache.put(0, 5, "shortest", None, [0, 2, 4, 5])
+        cache.close()
+
+        reopened = RouteCache("v1:abc", db_path=db)
+        assert reopened.get_stats()["loaded_from_disk"] == 2
+        assert reopened.get(0, 3, "safe", {4}) == [0, 2, 3]
+        assert reopened.get(0, 5, "shortest", None) == [0, 2, 4, 5]
+        reopened.close()
+
+    def test_checksum_change_invalidates(self, tmp_path):
+        from aria_esi.services.navigation.route_cache import RouteCache
+
+        db = tmp_path / "routes.db"
+        cache = RouteCache("v1:abc", db_path=db)
+        cache.put(0, 3, "safe", None, [0, 2, 3])
+        cache.close()
+
+        rebuilt = RouteCache("v1:def", db_path=db)
+        assert len(rebuilt) == 0
+        assert rebuilt.get(0, 3, "safe", None) is None
+        rebuilt.close()
+
+    def test_graphs_share_file(self, tmp_path):
+        from aria_esi.services.navigation.route_cache import RouteCache
+
+        db = tmp_path / "routes.db"
+        first = RouteCache("v1:abc", db_path=db)
+        second = RouteCache("v1:def", db_path=db)
+        first.put(0, 3, "safe", None, [0, 2, 3])
+        second.put(0, 5, "safe", None, [0, 5])
+        first.close()
+        second.close()
+
+        # Opening one graph leaves the other graph's rows in place
+        reopened = RouteCache("v1:def", db_path=db)
+        reopened.close()
+        original = RouteCache("v1:abc", db_path=db)
+        assert original.get(0, 3, "safe", None) == [0, 2, 3]
+        assert original.get(0, 5, "safe", None) is None
+        original.close()
+
+    def test_writes_are_batched(self, tmp_path):
+        import sqlite3
+
+        from aria_esi.services.navigation.route_cache import (
+            ROUTE_CACHE_FLUSH_BATCH,
+            RouteCache,
+        )
+
+        db = tmp_path / "routes.db"
+        cache = RouteCache("v1:abc", db_path=db)
+
+        def persisted() -> int:
+            with sqlite3.connect(db) as conn:
+                return conn.execute("SELECT COUNT(*) FROM routes").fetchone()[0]
+
+        for dest in range(ROUTE_CACHE_FLUSH_BATCH - 1):
+            cache.put(0, dest, "safe", None, [0, dest])
+        assert persisted() == 0
+        assert cache.get_stats()["pending_writes"] == ROUTE_CACHE_FLUSH_BATCH - 1
+
+        cache.put(0, 999, "safe", None, [0, 999])
+        assert persisted() == ROUTE_CACHE_FLUSH_BATCH
+        assert cache.get_stats()["pending_writes"] == 0
+        cache.close()
+
+    def test_expired_rows_pruned(self, tmp_path):
+        import sqlite3
+
+        from aria_esi.services.navigation.route_cache import RouteCache
+
+        db = tmp_path / "routes.db"
+        cache = RouteCache("v1:abc", db_path=db)
+        cache.put(0, 3, "safe", None, [0, 2, 3])
+        cache.close()
+        with sqlite3.connect(db) as conn:
+            conn.execute("UPDATE routes SET created_at = 0")
+
+        reopened = RouteCache("v1:abc", db_path=db)
+        assert len(reopened) == 0
+        reopened.close()
+
+    def test_trim_is_per_graph(self, tmp_path):
+        from aria_esi.services.navigation.route_cache import RouteCache
+
+        db = tmp_path / "routes.db"
+        other = RouteCache("v1:def", db_path=db)
+        other.put(0, 5, "safe", None, [0, 5])
+        other.close()
+
+        cache = RouteCache("v1:abc", maxsize=2, db_path=db)
+        for dest in range(4):
+            cache.put(0, dest, "safe", None, [0, dest])
+        cache.close()
+
+        reopened = RouteCache("v1:abc", maxsize=8, db_path=db)
+        assert len(reopened) == 2
+        reopened.close()
+        other = RouteCache("v1:def", db_path=db)
+        assert len(other) == 1
+        other.close()
+
+    def test_unreachable_route_persisted(self, tmp_path):
+        from aria_esi.services.navigation.route_cache import RouteCache
+
+        db = tmp_path / "routes.db"
+        cache = RouteCache("v1:abc", db_path=db)
+        cache.put(0, 9, "safe", None, [])
+        cache.close()
+
+        reopened = RouteCache("v1:abc", db_path=db)
+        assert reopened.get(0, 9, "safe", None) == []
+        reopened.close()
+
+    def test_unusable_db_path_falls_back_to_memory(self, tmp_path):
+        from aria_esi.services.navigation.route_cache import RouteCache
+
+        not_a_db = tmp_path / "routes.db"
+        not_a_db.write_bytes(b"not a sqlite file" * 100)
+
+        cache = RouteCache("v1:abc", db_path=not_a_db)
+        cache.put(0, 1, "shortest", None, [0, 1])
+
+        assert cache.get_stats()["persistent"] is False
+        assert cache.get(0, 1, "shortest", None) == [0, 1]
+
+    def test_unverified_graph_not_persisted(self, standard_universe, tmp_path):
+        from aria_esi.services.navigation.route_cache import get_route_cache
+
+        cache = get_route_cache(standard_universe, db_path=tmp_path / "routes.db")
+
+        assert cache.get_stats()["persistent"] is False
+        assert not (tmp_path / "routes.db").exists()
+
+
+# =============================================================================
+# NavigationService Integration
+# =============================================================================
+
+
+class TestNavigationServiceCaching:
+    """Test that NavigationService consults the route cache."""
+
+    def test_repeat_route_hits_cache(self, standard_universe):
+        from aria_esi.services.navigation import NavigationService, get_route_cache
+
+        service = NavigationService(standard_universe)
+        first = service.calculate_route(0, 5, "safe")
+        second = service.calculate_route(0, 5, "safe")
+
+        assert first == second
+        stats = get_route_cache(standard_universe).get_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+
+    def test_cache_is_per_universe(self, standard_universe):
+        from aria_esi.services.navigation import NavigationService, get_route_cache
+
+        other = create_mock_universe(STANDARD_SYSTEMS, STANDARD_EDGES)
+        NavigationService(standard_universe).calculate_route(0, 3, "shortest")
+
+        assert len(get_route_cache(other)) == 0
+
+    def test_avoid_set_is_part_of_key(self, standard_universe):
+        from aria_esi.services.navigation import NavigationService
+
+        service = NavigationService(standard_universe)
+        assert service.calculate_route(0, 3, "shortest", avoid_systems={1}) == [0, 2, 3]
+        assert service.calculate_route(0, 3, "shortest", avoid_systems={2}) == [0, 1, 3]
+        assert service.calculate_route(0, 3, "shortest", avoid_systems={1}) == [0, 2, 3]
@@ -122,6 +122,83 @@ class TestNavigationService:
         assert path[-1] == 5
 
 
+class TestCalculateRoutes:
+    """Test batched NavigationService.calculate_routes."""
+
+    @pytest.mark.parametrize("mode", ["shortest", "safe", "unsafe"])
+    def test_matches_single_route(self, standard_universe, mode):
+        """Every pair in the table matches calculate_route."""
+        from aria_esi.services.navigation.router import NavigationService
+
+        service = NavigationService(standard_universe)
+        origins = [0, 3]
+        destinations = [0, 1, 3, 5]
+        table = service.calculate_routes(origins, destinations, mode=mode)
+
+        for o in origins:
+            for d in destinations:
+                expected = service.calculate_route(o, d, mode=mode)
+                assert table.path(o, d) == expected
+                assert table.jumps(o, d) == len(expected) - 1
+
+    def test_cost_is_jumps_in_shortest_mode(self, standard_universe):
+        """Unweighted costs are hop counts."""
+        from aria_esi.services.navigation.router import NavigationService
+
+        service = NavigationService(standard_universe)
+        table = service.calculate_routes([0], [1, 3, 5])
+
+        assert table.cost(0, 1) == 1
+        assert table.cost(0, 3) == 2
+        assert table.cost(0, 5) == 3
+
+    def test_avoidance_applies_to_all_pairs(self, standard_universe):
+        """Avoided systems are kept out of every route."""
+        from aria_esi.services.navigation.router import NavigationService
+
+        service = NavigationService(standard_universe)
+        table = service.calculate_routes([0], [3, 1], avoid_systems={1})
+
+        assert 1 not in table.path(0, 3)
+        assert table.path(0, 3) == [0, 2, 3]
+
+    def test_paths_materialized_lazily(self, standard_universe):
+        """Paths are only computed for origins that are queried."""
+        from aria_esi.services.navigation.router import NavigationService
+
+        service = NavigationService(standard_universe)
+        table = service.calculate_routes([0, 5], [3])
+
+        assert table._paths == {}
+        table.path(0, 3)
+        assert list(table._paths) == [0]
+
+    def test_unreachable_pair(self):
+        """Disconnected destinations report no route."""
+        from aria_esi.services.navigation.router import NavigationService
+
+        systems = [
+            {"name": "A", "id": 1, "sec": 0.9, "const": 1, "region": 1},
+            {"name": "B", "id": 2, "sec": 0.9, "const": 1, "region": 1},
+            {"name": "C", "id": 3, "sec": 0.9, "const": 1, "region": 1},
+        ]
+        universe = create_mock_universe(systems, [(0, 1)])
+        table = NavigationService(universe).calculate_routes([0], [1, 2])
+
+        assert table.reachable(0) == [1]
+        assert not table.is_reachable(0, 2)
+        assert table.path(0, 2) == []
+        assert table.jumps(0, 2) is None
+
+    def test_invalid_mode_raises(self, standard_universe):
+        """Invalid mode raises ValueError."""
+        from aria_esi.services.navigation.router import NavigationService
+
+        service = NavigationService(standard_universe)
+        with pytest.raises(ValueError):
+            service.calculate_routes([0], [1], mode="invalid")  # type: ignore[arg-type]
+
+
 class TestResolveAvoidSystems:
     """Test resolve_avoid_systems method."""
 
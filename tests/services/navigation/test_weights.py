@@ -255,3 +255,92 @@ class TestComputeUnsafeWeights:
         for i, edge in enumerate(g.es):
             if edge.target == 4:
                 assert weights[i] == WEIGHT_AVOID
+
+
+# =============================================================================
+# Edge Weight Cache Tests
+# =============================================================================
+
+
+class TestEdgeWeightCache:
+    """Test cached, vectorized weight vectors."""
+
+    def test_edge_arrays_match_graph(self, standard_universe):
+        """Edge endpoint arrays match igraph's edge orientation."""
+        g = standard_universe.graph
+
+        assert list(standard_universe.edge_sources) == [e.source for e in g.es]
+        assert list(standard_universe.edge_targets) == [e.target for e in g.es]
+        assert not standard_universe.edge_targets.flags.writeable
+
+    def test_route_weights_none_for_plain_shortest(self, standard_universe):
+        """Shortest mode without avoidance uses unweighted BFS."""
+        from aria_esi.services.navigation.weights import get_route_weights
+
+        assert get_route_weights(standard_universe, "shortest") is None
+
+    def test_route_weights_cached_per_avoid_set(self, standard_universe):
+        """Same (mode, avoid set) returns the cached vector."""
+        from aria_esi.services.navigation.weights import get_route_weights
+
+        first = get_route_weights(standard_universe, "safe", {1, 2})
+        second = get_route_weights(standard_universe, "safe", [2, 1])
+        other = get_route_weights(standard_universe, "safe", {1})
+
+        assert first is second
+        assert first is not other
+
+    def test_avoid_mask_does_not_mutate_base(self, standard_universe):
+        """Applying an avoid list leaves the base vector untouched."""
+        from aria_esi.services.navigation.weights import (
+            WEIGHT_AVOID,
+            compute_safe_weights,
+            get_route_weights,
+        )
+
+        avoided = get_route_weights(standard_universe, "safe", {1})
+        plain = compute_safe_weights(standard_universe)
+
+        assert WEIGHT_AVOID in avoided
+        assert WEIGHT_AVOID not in plain
+
+    def test_lru_bounded(self, standard_universe):
+        """Cache evicts least recently used avoid sets."""
+        from aria_esi.services.navigation.weights import (
+            EdgeWeightCache,
+            _safe_base_weights,
+        )
+
+        cache = EdgeWeightCache(standard_universe, maxsize=2)
+        first = cache.weights("safe", _safe_base_weights, {1})
+        cache.weights("safe", _safe_base_weights, {2})
+        cache.weights("safe", _safe_base_weights, {3})
+
+        assert cache.weights("safe", _safe_base_weights, {1}) is not first
+
+    def test_matches_edge_loop(self, standard_universe):
+        """Vectorized safe weights match a per-edge reference computation."""
+        from aria_esi.services.navigation.weights import (
+            HIGHSEC_THRESHOLD,
+            LOWSEC_THRESHOLD,
+            WEIGHT_LOWSEC_ENTRY,
+            WEIGHT_LOWSEC_STAY,
+            WEIGHT_NORMAL,
+            WEIGHT_NULLSEC,
+            compute_safe_weights,
+        )
+
+        security = standard_universe.security
+        expected = []
+        for edge in standard_universe.graph.es:
+            src_sec, dst_sec = security[edge.source], security[edge.target]
+            if dst_sec >= HIGHSEC_THRESHOLD:
+                expected.append(WEIGHT_NORMAL)
+            elif dst_sec > LOWSEC_THRESHOLD:
+                expected.append(
+                    WEIGHT_LOWSEC_ENTRY if src_sec >= HIGHSEC_THRESHOLD else WEIGHT_LOWSEC_STAY
+                )
+            else:
+                expected.append(WEIGHT_NULLSEC)
+
+        assert compute_safe_weights(standard_universe) == expected
@@ -4,6 +4,9 @@ Tests for Geographic Interest Layer.
 
 from __future__ import annotations
 
+import random
+from collections import deque
+
 import pytest
 
 from aria_esi.services.redisq.interest.layers import (
@@ -339,6 +342,129 @@ class TestLegacyCompatibility:
         assert layer.score_system(30002537).score == DEFAULT_HOME_WEIGHTS[0]
 
 
+# =============================================================================
+# Multi-Source Expansion Tests
+# =============================================================================
+
+
+def reference_interest(config: GeographicConfig, graph) -> dict[int, tuple[float, str]]:
+    """Per-source BFS: highest weight over sources, first source wins ties."""
+    result: dict[int, tuple[float, str]] = {}
+    for geo_sys in config.systems:
+        start = graph.resolve_name(geo_sys.name)
+        if start is None:
+            continue
+        weights = config.get_weights(geo_sys.classification)
+        max_hops = config.get_max_hops(geo_sys.classification)
+        hops = {start: 0}
+        queue = deque([start])
+        while queue:
+            idx = queue.popleft()
+            if hops[idx] not in weights:
+                continue
+            system_id = graph.get_system_id(idx)
+            interest = weights[hops[idx]]
+            if system_id not in result or result[system_id][0] < interest:
+                result[system_id] = (interest, geo_sys.classification.value)
+            if hops[idx] < max_hops:
+                for neighbor in graph.graph.neighbors(idx):
+                    if neighbor not in hops:
+                        hops[neighbor] = hops[idx] + 1
+                        queue.append(neighbor)
+    return result
+
+
+def random_universe(seed: int, size: int = 80):
+    """Create a sparse random universe."""
+    rng = random.Random(seed)
+    systems = [
+        {"name": f"Sys{i}", "id": 30000000 + i, "sec": 0.5, "const": 20000001, "region": 10000001}
+        for i in range(size)
+    ]
+    edges = {(i, rng.randrange(i)) for i in range(1, size)}
+    edges |= {tuple(sorted(rng.sample(range(size), 2))) for _ in range(size // 2)}
+    return create_mock_universe(systems, sorted(edges)), rng
+
+
+class TestMultiSourceExpansion:
+    """Tests for the single-pass multi-source BFS."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_per_source_bfs(self, seed: int) -> None:
+        """Interest and classification match expanding each source separately."""
+        graph, rng = random_universe(seed)
+        config = GeographicConfig(
+            systems=[
+                GeographicSystem(
+                    name=f"Sys{rng.randrange(80)}",
+                    classification=rng.choice(list(SystemClassification)),
+                )
+                for _ in range(6)
+            ],
+            # Gap at hop 2: expansion stops after hop 1
+            transit_weights={0: 0.7, 1: 0.9, 3: 1.0},
+        )
+        layer = GeographicLayer.from_config(config, graph)
+
+        expected = reference_interest(config, graph)
+        actual = {sid: (i, c) for sid, (i, c, _) in layer._interest_map.items()}
+        assert actual == expected
+
+    def test_from_system_is_neighbor_one_hop_closer(self, test_universe) -> None:
+        """Expanded systems record a neighbor on the path to their source."""
+        config = GeographicConfig(systems=[GeographicSystem(name="Tama")])
+        layer = GeographicLayer.from_config(config, test_universe)
+
+        assert layer.get_system_info(30002537)["from_system"] is None
+        assert layer.get_system_info(30002538)["from_system"] == "Tama"
+        # Enaluri (3 hops) is reached via Hikkoken or Sujarento
+        assert layer.get_system_info(30002542)["from_system"] in ("Hikkoken", "Sujarento")
+
+    def test_from_system_prefers_lowest_index_predecessor(self) -> None:
+        """Of several predecessors at the same distance, the lowest index wins."""
+        systems = [
+            {"name": f"Sys{i}", "id": 30000000 + i, "sec": 0.5, "const": 20000001, "region": 10000001}
+            for i in range(6)
+        ]
+        # Sys5 is three hops out via Sys4 (found first in queue order) or Sys3
+        edges = [(0, 1), (0, 2), (1, 4), (2, 3), (3, 5), (4, 5)]
+        graph = create_mock_universe(systems, edges)
+        config = GeographicConfig(systems=[GeographicSystem(name="Sys0")])
+        layer = GeographicLayer.from_config(config, graph)
+
+        assert layer.get_system_info(30000005)["from_system"] == "Sys3"
+
+    def test_vertex_interest_matches_map(self, test_universe) -> None:
+        """The dense vertex array agrees with the interest map."""
+        config = GeographicConfig(
+            systems=[GeographicSystem(name="Okkamon", classification=SystemClassification.HUNTING)]
+        )
+        layer = GeographicLayer.from_config(config, test_universe)
+
+        vertex_interest = layer.vertex_interest
+        assert vertex_interest.shape == (test_universe.system_count,)
+        assert not vertex_interest.flags.writeable
+        for system_id, idx in test_universe.id_to_idx.items():
+            assert vertex_interest[idx] == layer.score_system(system_id).score
+
+    def test_no_resolved_systems(self, test_universe) -> None:
+        """Unknown systems only yield an empty layer."""
+        config = GeographicConfig(systems=[GeographicSystem(name="Nowhere")])
+        layer = GeographicLayer.from_config(config, test_universe)
+
+        assert layer.total_systems == 0
+        assert layer.system_ids == []
+        assert not layer.vertex_interest.any()
+
+    def test_system_ids_cached(self, test_universe) -> None:
+        """System IDs are sorted and built once."""
+        config = GeographicConfig(systems=[GeographicSystem(name="Enaluri")])
+        layer = GeographicLayer.from_config(config, test_universe)
+
+        assert layer.system_ids == sorted(layer._interest_map)
+        assert layer.system_ids is layer.system_ids
+
+
 # =============================================================================
 # Serialization Tests
 # =============================================================================
@@ -13,6 +13,7 @@ from aria_esi.services.redisq.interest_v2.aggregation import (
     aggregate_rms,
     aggregate_scores,
     calculate_prefetch_bounds,
+    calculate_score_upper_bound,
     compare_aggregation_modes,
 )
 from aria_esi.services.redisq.interest_v2.models import (
@@ -335,6 +336,45 @@ class TestCalculatePrefetchBounds:
         assert upper == 0.8
 
 
+class TestCalculateScoreUpperBound:
+    """Tests for the partial-scoring upper bound."""
+
+    def _scored(self, score: float, weight: float = 1.0) -> dict[str, CategoryScore]:
+        cat = CategoryScore(category="location", score=score, weight=weight)
+        cat.signals = {"geographic": SignalScore(signal="geographic", score=score)}
+        return {"location": cat}
+
+    def test_linear_matches_prefetch_upper_bound(self):
+        """Linear bound assumes pending categories score 1.0."""
+        assert calculate_score_upper_bound(
+            self._scored(0.2), 1.0, AggregationMode.LINEAR
+        ) == pytest.approx(0.6)
+
+    def test_rms_bound(self):
+        """RMS bound is above the linear bound for the same scores."""
+        bound = calculate_score_upper_bound(self._scored(0.2), 1.0, AggregationMode.WEIGHTED)
+        assert bound == pytest.approx(math.sqrt((0.04 + 1.0) / 2))
+        assert bound > 0.6
+
+    def test_max_bound(self):
+        """Max bound is 1.0 while anything is pending."""
+        assert calculate_score_upper_bound(self._scored(0.2), 1.0, AggregationMode.MAX) == 1.0
+        assert calculate_score_upper_bound(self._scored(0.2), 0.0, AggregationMode.MAX) == 0.2
+
+    def test_nothing_pending_is_exact(self):
+        """With nothing pending the bound equals the aggregate."""
+        scores = self._scored(0.3)
+        for mode in AggregationMode:
+            assert calculate_score_upper_bound(scores, 0.0, mode) == pytest.approx(
+                aggregate_scores(scores, mode)
+            )
+
+    def test_unconfigured_categories_ignored(self):
+        """Scored categories without signals do not count toward the bound."""
+        empty = {"activity": CategoryScore(category="activity", score=0.0, weight=1.0)}
+        assert calculate_score_upper_bound(empty, 1.0, AggregationMode.LINEAR) == 1.0
+
+
 class TestCompareAggregationModes:
     """Tests for mode comparison utility."""
 
@@ -18,10 +18,41 @@ from aria_esi.services.redisq.interest_v2.engine import (
     create_engine,
 )
 from aria_esi.services.redisq.interest_v2.models import (
+    CANONICAL_CATEGORIES,
     AggregationMode,
     ConfigTier,
     NotificationTier,
+    SignalScore,
 )
+from aria_esi.services.redisq.interest_v2.providers.base import BaseSignalProvider
+from aria_esi.services.redisq.interest_v2.providers.registry import get_provider_registry
+
+
+class FixedSignal(BaseSignalProvider):
+    """Signal returning a fixed score and recording the configs it sees."""
+
+    def __init__(self, name: str, category: str, value: float, prefetch_capable: bool = True):
+        self._name = name
+        self._category = category
+        self._prefetch_capable = prefetch_capable
+        self.value = value
+        self.configs: list[dict] = []
+
+    def score(self, kill, system_id, config):
+        self.configs.append(config)
+        return SignalScore(
+            signal=self._name, score=self.value, prefetch_capable=self._prefetch_capable
+        )
+
+
+def register_fixed(category: str, name: str, value: float, prefetch_capable: bool = True):
+    """Replace a category's signals with a single fixed-score signal."""
+    registry = get_provider_registry()
+    signal = FixedSignal(name, category, value, prefetch_capable)
+    registry._signals[category] = {}
+    registry._signal_instances[category] = {}
+    registry.register_signal(category, name, lambda: signal)
+    return signal
 
 
 class TestEngineCreation:
@@ -478,3 +509,99 @@ class TestConfigTierIntegration:
         engine = InterestEngineV2(config)
 
         assert engine._config.tier == ConfigTier.ADVANCED
+
+
+class TestCompiledPlan:
+    """Tests for the scoring plan compiled at engine construction."""
+
+    def test_zero_weight_categories_dropped(self, reset_registry):
+        config = InterestConfigV2(engine="v2", weights={"location": 1.0, "value": 0.0})
+        engine = InterestEngineV2(config)
+
+        assert [c.category for c in engine.plan] == ["location"]
+
+    def test_configs_merged_once(self, mock_kill, reset_registry):
+        signal = register_fixed("value", "value", 0.5)
+        config = InterestConfigV2(
+            engine="v2",
+            weights={"value": 1.0},
+            signals={"value": {"value": {"min": 100}}},
+        )
+        engine = InterestEngineV2(config, {"corp_id": 98000001})
+
+        engine.calculate_interest(mock_kill, mock_kill.solar_system_id)
+        engine.calculate_interest(mock_kill, mock_kill.solar_system_id)
+
+        assert signal.configs[0] == {"corp_id": 98000001, "min": 100}
+        assert signal.configs[0] is signal.configs[1]
+
+    def test_prefetch_capable_categories_first(self, reset_registry):
+        register_fixed("location", "geographic", 0.5, prefetch_capable=False)
+        register_fixed("value", "value", 0.5)
+        config = InterestConfigV2(engine="v2", weights={"location": 1.0, "value": 1.0})
+        engine = InterestEngineV2(config)
+
+        assert [c.category for c in engine.plan] == ["value", "location"]
+
+    def test_results_keep_canonical_order(self, mock_kill, reset_registry):
+        register_fixed("location", "geographic", 0.5, prefetch_capable=False)
+        register_fixed("value", "value", 0.5)
+        config = InterestConfigV2(engine="v2", weights={"location": 1.0, "value": 1.0})
+        engine = InterestEngineV2(config)
+
+        result = engine.calculate_interest(mock_kill, mock_kill.solar_system_id)
+
+        assert list(result.category_scores) == list(CANONICAL_CATEGORIES)
+
+
+class TestNotifyOnlyShortCircuit:
+    """Tests for stopping once the notify threshold is out of reach."""
+
+    def _engine(self, value_score: float, mode=AggregationMode.WEIGHTED):
+        register_fixed("value", "value", value_score)
+        expensive = register_fixed("activity", "activity", 1.0, prefetch_capable=False)
+        config = InterestConfigV2(
+            engine="v2",
+            mode=mode,
+            weights={"value": 3.0, "activity": 1.0},
+            thresholds=ThresholdsConfig(digest=0.3, notify=0.6, priority=0.9),
+        )
+        return InterestEngineV2(config), expensive
+
+    def test_stops_when_notify_unreachable(self, mock_kill, reset_registry):
+        engine, expensive = self._engine(0.0)
+
+        result = engine.calculate_interest(mock_kill, mock_kill.solar_system_id, notify_only=True)
+
+        assert not result.should_notify
+        assert result.tier == NotificationTier.LOG_ONLY
+        assert result.score_upper_bound == pytest.approx(0.5)
+        assert expensive.configs == []
+
+    def test_full_scoring_when_notify_reachable(self, mock_kill, reset_registry):
+        engine, expensive = self._engine(0.5)
+
+        fast = engine.calculate_interest(mock_kill, mock_kill.solar_system_id, notify_only=True)
+        full = engine.calculate_interest(mock_kill, mock_kill.solar_system_id)
+
+        assert fast.score_upper_bound is None
+        assert fast.to_dict() == full.to_dict()
+        assert len(expensive.configs) == 2
+
+    def test_never_changes_notify_decision(self, mock_kill, reset_registry):
+        for mode in AggregationMode:
+            for value_score in (0.0, 0.2, 0.35, 0.45, 0.5, 0.8):
+                engine, _ = self._engine(value_score, mode)
+                fast = engine.calculate_interest(
+                    mock_kill, mock_kill.solar_system_id, notify_only=True
+                )
+                full = engine.calculate_interest(mock_kill, mock_kill.solar_system_id)
+                assert fast.should_notify == full.should_notify
+
+    def test_default_scores_everything(self, mock_kill, reset_registry):
+        engine, expensive = self._engine(0.0)
+
+        result = engine.calculate_interest(mock_kill, mock_kill.solar_system_id)
+
+        assert result.score_upper_bound is None
+        assert len(expensive.configs) == 1
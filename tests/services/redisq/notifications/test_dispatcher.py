@@ -0,0 +1,198 @@
+"""Tests for KillDispatcher."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+
+from aria_esi.services.killmail_store import KillmailRecord, SQLiteKillmailStore
+from aria_esi.services.redisq.notifications.dispatcher import KillDispatcher
+from aria_esi.services.redisq.notifications.profiles import NotificationProfile, PollingConfig
+
+pytestmark = pytest.mark.asyncio
+
+BASE_TIME = int(datetime(2026, 1, 26, 12, 0, 0).timestamp())
+
+
+def make_kill(kill_id: int, system_id: int, offset: int = 0) -> KillmailRecord:
+    """Create a test killmail record."""
+    return KillmailRecord(
+        kill_id=kill_id,
+        kill_time=BASE_TIME + offset,
+        solar_system_id=system_id,
+        zkb_hash=f"hash{kill_id}",
+        zkb_total_value=100_000_000.0,
+        zkb_points=10,
+        zkb_is_npc=False,
+        zkb_is_solo=False,
+        zkb_is_awox=False,
+        ingested_at=BASE_TIME + offset,
+        victim_ship_type_id=670,
+        victim_corporation_id=98000001,
+        victim_alliance_id=None,
+    )
+
+
+def drain(queue) -> list[list[int]]:
+    """Kill IDs of every batch waiting on a queue."""
+    batches = []
+    while not queue.empty():
+        batches.append(sorted(k.kill_id for k in queue.get_nowait()))
+    return batches
+
+
+@pytest_asyncio.fixture
+async def store(tmp_path: Path):
+    """Create and initialize a test store."""
+    store = SQLiteKillmailStore(db_path=tmp_path / "test.db")
+    await store.initialize()
+    yield store
+    await store.close()
+
+
+class TestRouting:
+    """Tests for the inverted system index."""
+
+    async def test_routes_by_system(self, store: SQLiteKillmailStore) -> None:
+        dispatcher = KillDispatcher(store=store)
+        dispatcher.subscribe("jita", [1])
+        dispatcher.subscribe("hubs", [1, 2])
+        dispatcher.subscribe("everything", None)
+
+        kills = [make_kill(10, 1), make_kill(11, 2), make_kill(12, 3)]
+        routed = dispatcher.route(kills)
+
+        assert [k.kill_id for k in routed["jita"]] == [10]
+        assert [k.kill_id for k in routed["hubs"]] == [10, 11]
+        assert [k.kill_id for k in routed["everything"]] == [10, 11, 12]
+
+    async def test_profiles_without_kills_omitted(self, store: SQLiteKillmailStore) -> None:
+        dispatcher = KillDispatcher(store=store)
+        dispatcher.subscribe("jita", [1])
+        dispatcher.subscribe("amarr", [2])
+
+        assert set(dispatcher.route([make_kill(10, 1)])) == {"jita"}
+
+    async def test_resubscribe_keeps_queue(self, store: SQLiteKillmailStore) -> None:
+        dispatcher = KillDispatcher(store=store)
+        queue = dispatcher.subscribe("jita", [1])
+
+        assert dispatcher.subscribe("jita", [2]) is queue
+        assert set(dispatcher.route([make_kill(10, 1), make_kill(11, 2)])) == {"jita"}
+        assert dispatcher.route([make_kill(10, 1)]) == {}
+
+    async def test_unsubscribe(self, store: SQLiteKillmailStore) -> None:
+        dispatcher = KillDispatcher(store=store)
+        dispatcher.subscribe("jita", [1])
+        dispatcher.unsubscribe("jita")
+
+        assert dispatcher.route([make_kill(10, 1)]) == {}
+        assert await dispatcher.dispatch_once() == 0
+
+
+class TestDispatchOnce:
+    """Tests for the shared store poll."""
+
+    async def test_one_query_for_all_profiles(self, store: SQLiteKillmailStore) -> None:
+        await store.insert_kills_batch([make_kill(100 + i, i % 4) for i in range(8)])
+        dispatcher = KillDispatcher(store=store)
+        queues = {f"p{i}": dispatcher.subscribe(f"p{i}", [i % 4]) for i in range(20)}
+        store.query_kills = AsyncMock(wraps=store.query_kills)
+
+        delivered = await dispatcher.dispatch_once()
+
+        assert store.query_kills.await_count == 1
+        assert delivered == 20 * 2
+        assert drain(queues["p1"]) == [[101, 105]]
+        assert drain(queues["p5"]) == [[101, 105]]
+
+    async def test_queries_union_of_systems(self, store: SQLiteKillmailStore) -> None:
+        await store.insert_kills_batch([make_kill(100, 1), make_kill(101, 9)])
+        dispatcher = KillDispatcher(store=store)
+        dispatcher.subscribe("a", [1])
+        dispatcher.subscribe("b", [2])
+        store.query_kills = AsyncMock(wraps=store.query_kills)
+
+        await dispatcher.dispatch_once()
+
+        assert store.query_kills.await_args.kwargs["systems"] == [1, 2]
+        assert dispatcher.metrics.kills_read == 1
+
+    async def test_overlap_not_redispatched(self, store: SQLiteKillmailStore) -> None:
+        await store.insert_kill(make_kill(100, 1))
+        dispatcher = KillDispatcher(store=store, overlap_window_seconds=60)
+        queue = dispatcher.subscribe("a", None)
+
+        await dispatcher.dispatch_once()
+        await store.insert_kill(make_kill(101, 1, offset=10))
+        await dispatcher.dispatch_once()
+
+        assert drain(queue) == [[100], [101]]
+
+    async def test_pages_through_backlog(self, store: SQLiteKillmailStore) -> None:
+        await store.insert_kill(make_kill(1, 1))
+        dispatcher = KillDispatcher(store=store, batch_size=5, overlap_window_seconds=0)
+        queue = dispatcher.subscribe("a", None)
+        await dispatcher.dispatch_once()
+        drain(queue)
+
+        await store.insert_kills_batch([make_kill(100 + i, 1, offset=1 + i) for i in range(12)])
+        await dispatcher.dispatch_once()
+
+        assert drain(queue) == [list(range(100, 112))]
+
+    async def test_full_queue_drops_oldest_batch(self, store: SQLiteKillmailStore) -> None:
+        dispatcher = KillDispatcher(store=store, overlap_window_seconds=0, max_queued_batches=2)
+        queue = dispatcher.subscribe("a", None)
+
+        for i in range(3):
+            await store.insert_kill(make_kill(100 + i, 1, offset=i + 1))
+            await dispatcher.dispatch_once()
+
+        assert drain(queue) == [[101], [102]]
+        assert queue.overflowed
+        status = dispatcher.get_status()
+        assert status["dropped_batches"] == {"a": 1}
+        assert status["metrics"]["batches_dropped"] == 1
+
+    async def test_start_resumes_from_oldest_checkpoint(self, store: SQLiteKillmailStore) -> None:
+        await store.update_worker_state("a", last_processed_time=BASE_TIME + 100)
+        await store.update_worker_state("b", last_processed_time=BASE_TIME + 50)
+        dispatcher = KillDispatcher(store=store, interval_seconds=60)
+        dispatcher.subscribe("a", None)
+        dispatcher.subscribe("b", None)
+
+        await dispatcher.start()
+        await asyncio.sleep(0.05)
+        await dispatcher.stop()
+
+        assert dispatcher.get_status()["high_water"] == BASE_TIME + 50
+        assert dispatcher.metrics.polls == 1
+
+
+class TestForProfiles:
+    """Tests for polling settings derived from profiles."""
+
+    async def test_uses_most_demanding_settings(self, store: SQLiteKillmailStore) -> None:
+        profiles = [
+            NotificationProfile(
+                name="a",
+                webhook_url="https://discord.com/api/webhooks/1/a",
+                polling=PollingConfig(interval_seconds=5, batch_size=20, overlap_window_seconds=30),
+            ),
+            NotificationProfile(
+                name="b",
+                webhook_url="https://discord.com/api/webhooks/1/b",
+                polling=PollingConfig(interval_seconds=2, batch_size=50, overlap_window_seconds=90),
+            ),
+        ]
+        dispatcher = KillDispatcher.for_profiles(store, profiles)
+
+        assert dispatcher.interval_seconds == 2
+        assert dispatcher.batch_size == 50
+        assert dispatcher.overlap_window_seconds == 90
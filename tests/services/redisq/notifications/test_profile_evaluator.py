@@ -6,6 +6,8 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
+from aria_esi.services.redisq.interest import InterestCalculator
+from aria_esi.services.redisq.interest.layers import EntityLayer, GeographicLayer
 from aria_esi.services.redisq.notifications.config import QuietHoursConfig, TriggerConfig
 from aria_esi.services.redisq.notifications.profile_evaluator import (
     MAX_PROFILES_HARD,
@@ -488,6 +490,104 @@ class TestProfileEvaluatorTopology:
         assert result.has_matches is True
 
 
+class FakeGraph:
+    """Minimal universe graph: vertex per system ID."""
+
+    def __init__(self, system_ids: list[int]):
+        self.id_to_idx = {system_id: idx for idx, system_id in enumerate(system_ids)}
+        self.system_count = len(system_ids)
+
+
+def make_geo_calculator(
+    interest_map: dict[int, float], fetch_threshold: float = 0.0, extra_layers=()
+) -> InterestCalculator:
+    """Create a real InterestCalculator with a geographic layer."""
+    geo = GeographicLayer(
+        _interest_map={sid: (score, "home", None) for sid, score in interest_map.items()}
+    )
+    return InterestCalculator(layers=[geo, *extra_layers], fetch_threshold=fetch_threshold)
+
+
+class TestProfileEvaluatorTopologyMatrix:
+    """Tests for the vectorized geographic topology check."""
+
+    SYSTEMS = [30000142, 30000144, 30002187, 30002659]
+
+    def build(self, calculators: dict[str, InterestCalculator]) -> ProfileEvaluator:
+        profiles = []
+        for name in calculators:
+            profile = make_profile(name, watchlist_activity=False, gatecamp_detected=False)
+            profile.triggers.high_value_threshold = 100
+            profile.topology = {"geographic": {"systems": [{"name": "Jita"}]}}
+            profiles.append(profile)
+
+        with patch.object(ProfileEvaluator, "_build_calculator") as mock_build:
+            mock_build.side_effect = list(calculators.values())
+            evaluator = ProfileEvaluator(profiles)
+
+        evaluator._graph = FakeGraph(self.SYSTEMS)
+        evaluator._build_topology_matrix()
+        return evaluator
+
+    def test_matrix_matches_should_fetch(self):
+        """Gathered scores give the same decision as each calculator."""
+        calculators = {
+            "jita": make_geo_calculator({30000142: 1.0, 30000144: 0.7}),
+            "amarr": make_geo_calculator({30002187: 1.0, 30000144: 0.3}, fetch_threshold=0.5),
+            "entity": make_geo_calculator(
+                {30002659: 0.4}, fetch_threshold=0.5, extra_layers=[EntityLayer()]
+            ),
+        }
+        evaluator = self.build(calculators)
+
+        assert evaluator._topology_matrix.shape == (3, len(self.SYSTEMS))
+        assert evaluator._topology_rows["entity"] == (2, False)
+
+        for system_id in [*self.SYSTEMS, 30045354]:
+            result = evaluator.evaluate(make_kill(solar_system_id=system_id, total_value=1000))
+            matched = {m.profile.name for m in result.matches}
+            expected = {n for n, c in calculators.items() if c.should_fetch(system_id)}
+            assert matched == expected, system_id
+            assert set(result.filtered_by_topology) == set(calculators) - expected
+
+    def test_geographic_only_skips_calculator(self):
+        """Geographic-only profiles are decided from the gathered column."""
+        calculator = make_geo_calculator({30000142: 1.0})
+        evaluator = self.build({"jita": calculator})
+
+        with patch.object(InterestCalculator, "should_fetch") as should_fetch:
+            assert evaluator.evaluate(make_kill(solar_system_id=30000142)).has_matches
+            assert not evaluator.evaluate(make_kill(solar_system_id=30000144)).has_matches
+
+        should_fetch.assert_not_called()
+
+    def test_other_layers_fall_back_on_geographic_miss(self):
+        """A geographic miss still consults calculators with other layers."""
+        calculator = make_geo_calculator({30000142: 1.0}, extra_layers=[EntityLayer()])
+        evaluator = self.build({"mixed": calculator})
+
+        with patch.object(InterestCalculator, "should_fetch", return_value=True) as should_fetch:
+            assert evaluator.evaluate(make_kill(solar_system_id=30000142)).has_matches
+            should_fetch.assert_not_called()
+            assert evaluator.evaluate(make_kill(solar_system_id=30000144)).has_matches
+
+        should_fetch.assert_called_once_with(30000144)
+
+    def test_mocked_filters_not_vectorized(self):
+        """Profiles without a real calculator keep the should_fetch path."""
+        with patch.object(ProfileEvaluator, "_build_calculator") as mock_build:
+            mock_build.return_value = MagicMock()
+            profile = make_profile("mocked")
+            profile.topology = {"geographic": {"systems": [{"name": "Jita"}]}}
+            evaluator = ProfileEvaluator([profile])
+
+        evaluator._graph = FakeGraph(self.SYSTEMS)
+        evaluator._build_topology_matrix()
+
+        assert evaluator._topology_matrix is None
+        assert evaluator._topology_rows == {}
+
+
 class TestProfileEvaluatorWarContext:
     """Tests for war context handling."""
 
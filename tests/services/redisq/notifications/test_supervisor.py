@@ -138,6 +138,22 @@ class TestWorkerSupervisor:
 
         await supervisor.stop()
 
+    async def test_workers_fed_by_shared_dispatcher(
+        self, store: SQLiteKillmailStore
+    ) -> None:
+        """Workers receive kills through one shared dispatcher."""
+        profiles = [make_profile(f"profile-{i}") for i in range(5)]
+        supervisor = WorkerSupervisor(store=store, profiles=profiles)
+
+        await supervisor.start()
+        assert supervisor.dispatcher is not None
+        assert supervisor.dispatcher.is_running
+        assert all(w.inbox is not None for w in supervisor._workers.values())
+
+        await supervisor.stop()
+        assert not supervisor.dispatcher.is_running
+        assert supervisor.get_status()["dispatcher"]["subscriptions"] == 5
+
     async def test_empty_profiles_works(
         self, store: SQLiteKillmailStore
     ) -> None:
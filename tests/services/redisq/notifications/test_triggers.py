@@ -20,6 +20,7 @@ from aria_esi.services.redisq.notifications.triggers import (
     _evaluate_political_entity_kill,
     _resolve_entity_name,
     evaluate_triggers,
+    map_npc_corps,
 )
 
 from .conftest import (
@@ -400,6 +401,47 @@ class TestEvaluateTriggers:
         assert result.npc_faction is not None
         assert result.npc_faction.matched is True
 
+    def test_npc_faction_kill_uses_precomputed_corp_factions(self):
+        """A shared corp -> faction map replaces per-profile mapper lookups."""
+        kill = make_processed_kill(
+            total_value=100,
+            attacker_corps=[98000001, 1000125],
+            victim_corporation_id=1000135,
+        )
+        mapper = MagicMock()
+        mapper.get_faction_for_corp.side_effect = {
+            1000125: "serpentis",
+            1000135: "guristas",
+        }.get
+        mapper.get_corp_name.return_value = "Serpentis Corporation"
+
+        corp_factions = map_npc_corps(kill, mapper)
+        assert corp_factions == {1000125: "serpentis", 1000135: "guristas"}
+
+        mapper.get_faction_for_corp.reset_mock()
+        results = {}
+        for faction in ("Serpentis", "guristas", "angel_cartel"):
+            triggers = TriggerConfig(
+                npc_faction_kill=NPCFactionKillConfig(
+                    enabled=True, factions=[faction], as_attacker=True, as_victim=True
+                ),
+                high_value_threshold=10_000_000_000,
+            )
+            results[faction] = evaluate_triggers(
+                kill=kill,
+                entity_match=None,
+                gatecamp_status=None,
+                triggers=triggers,
+                npc_faction_mapper=mapper,
+                npc_corp_factions=corp_factions,
+            ).npc_faction
+
+        mapper.get_faction_for_corp.assert_not_called()
+        assert results["Serpentis"].role == "attacker"
+        assert results["Serpentis"].corporation_id == 1000125
+        assert results["guristas"].role == "victim"
+        assert results["angel_cartel"] is None
+
     def test_political_entity_trigger_corp_victim(self):
         """Political entity trigger matches victim corporation."""
         kill = make_processed_kill(
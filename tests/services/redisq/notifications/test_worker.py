@@ -14,6 +14,7 @@ from aria_esi.services.killmail_store import (
     KillmailRecord,
     SQLiteKillmailStore,
 )
+from aria_esi.services.redisq.notifications.dispatcher import KillInbox
 from aria_esi.services.redisq.notifications.esi_coordinator import ESICoordinator
 from aria_esi.services.redisq.notifications.profiles import (
     NotificationProfile,
@@ -121,6 +122,61 @@ class TestNotificationWorker:
 
         await worker.stop()
 
+    async def test_poll_batches_store_calls(
+        self, worker: NotificationWorker, store: SQLiteKillmailStore
+    ) -> None:
+        """A poll window dedups and marks kills with one store call each."""
+        for i in range(10):
+            await store.insert_kill(make_kill(700 + i))
+        await store.mark_kill_processed("test-profile", 700)
+
+        sent: list[int] = []
+
+        async def send(payload, url):
+            sent.append(payload["kill_id"])
+            return MagicMock(success=True, is_rate_limited=False)
+
+        worker._send_notification = send
+        worker._format_kill = lambda kill, *args: {"kill_id": kill.kill_id}
+        worker._evaluate_triggers = lambda kill: (
+            None if kill.kill_id % 2 else MagicMock(requires_esi=False)
+        )
+        store.filter_unprocessed = AsyncMock(wraps=store.filter_unprocessed)
+        store.mark_processed_batch = AsyncMock(wraps=store.mark_processed_batch)
+
+        await worker._poll_once()
+
+        assert store.filter_unprocessed.await_count == 1
+        assert store.mark_processed_batch.await_count == 1
+        assert sorted(sent) == list(range(702, 710, 2))
+        assert worker.metrics.kills_skipped_duplicate == 1
+        assert worker.metrics.kills_skipped_filter == 5
+        assert worker.metrics.kills_processed == 4
+        assert await store.filter_unprocessed("test-profile", list(range(700, 710))) == set()
+
+    async def test_rate_limit_marks_kills_sent_before(
+        self, worker: NotificationWorker, store: SQLiteKillmailStore
+    ) -> None:
+        """Kills delivered before a rate limit are still marked processed."""
+        for i in range(3):
+            await store.insert_kill(make_kill(800 + i))
+
+        results = iter(
+            [
+                MagicMock(success=True, is_rate_limited=False),
+                MagicMock(success=False, is_rate_limited=True, retry_after=30),
+            ]
+        )
+        worker._send_notification = AsyncMock(side_effect=lambda *args: next(results))
+        worker._format_kill = lambda *args: {"content": "test"}
+        worker._evaluate_triggers = lambda *args: MagicMock(requires_esi=False)
+
+        await worker._poll_once()
+
+        # Newest first: 802 delivered, 801 rate limited, 800 untouched
+        assert await store.filter_unprocessed("test-profile", [800, 801, 802]) == {800, 801}
+        assert [k.kill_id for k in worker._pending_kills] == [801]
+
     async def test_get_status_returns_dict(self, worker: NotificationWorker) -> None:
         """Test that get_status returns a status dict."""
         status = worker.get_status()
@@ -521,6 +577,74 @@ class TestNotificationWorkerRateLimit:
         assert len(worker._pending_kills) >= 0  # May be empty if not processed
 
 
+class TestNotificationWorkerInbox:
+    """Tests for dispatcher-fed delivery."""
+
+    async def test_delivers_routed_batches(
+        self, worker: NotificationWorker, store: SQLiteKillmailStore
+    ) -> None:
+        """Kills put on the inbox are delivered without polling the store."""
+        worker.inbox = KillInbox()
+        worker._send_notification = AsyncMock(
+            return_value=MagicMock(success=True, is_rate_limited=False)
+        )
+        worker._format_kill = lambda *args: {"content": "test"}
+        store.query_kills = AsyncMock(wraps=store.query_kills)
+
+        worker.inbox.put_nowait([make_kill(900), make_kill(901)])
+        await worker._receive_once()
+
+        assert worker._send_notification.await_count == 2
+        assert store.query_kills.await_count == 0
+        assert await store.filter_unprocessed("test-profile", [900, 901]) == set()
+
+    async def test_rate_limited_kills_retried(
+        self, worker: NotificationWorker, store: SQLiteKillmailStore
+    ) -> None:
+        """Kills cut off by a rate limit are retried on the next receive."""
+        worker.inbox = KillInbox()
+        results = iter(
+            [
+                MagicMock(success=False, is_rate_limited=True, retry_after=30),
+                MagicMock(success=True, is_rate_limited=False),
+                MagicMock(success=True, is_rate_limited=False),
+            ]
+        )
+        worker._send_notification = AsyncMock(side_effect=lambda *args: next(results))
+        worker._format_kill = lambda *args: {"content": "test"}
+
+        worker.inbox.put_nowait([make_kill(910), make_kill(911)])
+        await worker._receive_once()
+        assert [k.kill_id for k in worker._backlog] == [910, 911]
+
+        await worker._receive_once()
+        assert worker._backlog == []
+        assert await store.filter_unprocessed("test-profile", [910, 911]) == set()
+
+    async def test_overflow_catches_up_from_store(
+        self, worker: NotificationWorker, store: SQLiteKillmailStore
+    ) -> None:
+        """Kills in batches dropped from a full inbox are read back from the store."""
+        worker.inbox = KillInbox(maxsize=1)
+        worker._send_notification = AsyncMock(
+            return_value=MagicMock(success=True, is_rate_limited=False)
+        )
+        worker._format_kill = lambda *args: {"content": "test"}
+        await store.insert_kills_batch([make_kill(920), make_kill(921)])
+
+        worker.inbox.put_dropping_oldest([make_kill(920)])
+        worker.inbox.put_dropping_oldest([make_kill(921)])
+        await worker._receive_once()
+
+        assert not worker.inbox.overflowed
+        assert worker.metrics.inbox_catch_ups == 1
+        assert await store.filter_unprocessed("test-profile", [920, 921]) == set()
+
+        # The surviving batch is now a duplicate
+        await worker._receive_once()
+        assert worker._send_notification.await_count == 2
+
+
 class TestNotificationWorkerHTTPClient:
     """Tests for HTTP client management."""
 
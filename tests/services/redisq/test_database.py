@@ -6,13 +6,17 @@ from __future__ import annotations
 
 import sqlite3
 import time
+from dataclasses import replace
 from datetime import datetime, timedelta
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
 from aria_esi.services.redisq.database import (
     RealtimeKillsDatabase,
+    RealtimeKillWriter,
+    RecentKillIds,
 )
 from aria_esi.services.redisq.models import ProcessedKill
 
@@ -142,6 +146,25 @@ class TestKillOperations:
         assert count == 5
         assert db.get_kill_count() == 5
 
+    def test_save_kills_batch_with_entity_matches(self, db: RealtimeKillsDatabase, sample_kill):
+        """Test batch saving records watched entity matches."""
+        match = MagicMock(has_match=True, all_matched_ids=[98000001])
+
+        db.save_kills_batch([sample_kill], [match])
+
+        assert [k.kill_id for k in db.get_watched_entity_kills()] == [sample_kill.kill_id]
+
+    def test_get_recent_kill_ids(self, db: RealtimeKillsDatabase, sample_kill):
+        """Test recent kill IDs come back newest first."""
+        now_ts = time.time()
+        for i in range(3):
+            sample_kill.kill_id = i + 1
+            sample_kill.kill_time = datetime.fromtimestamp(now_ts - (3 - i) * 60)
+            db.save_kill(sample_kill)
+
+        assert db.get_recent_kill_ids() == [3, 2, 1]
+        assert db.get_recent_kill_ids(limit=2) == [3, 2]
+
     def test_get_recent_kills(self, db: RealtimeKillsDatabase):
         """Test getting recent kills."""
         # Use explicit timestamps for reliable testing
@@ -297,3 +320,67 @@ class TestStatistics:
         assert stats["kills_last_hour"] == 1
         assert stats["latest_kill_time"] is not None
         assert stats["queue_id"] == "test-queue"
+
+
+class TestRecentKillIds:
+    """Tests for the bounded recent kill ID set."""
+
+    def test_membership(self):
+        ids = RecentKillIds(capacity=10)
+        ids.update([1, 2])
+
+        assert 1 in ids
+        assert 3 not in ids
+        assert len(ids) == 2
+
+    def test_evicts_oldest(self):
+        ids = RecentKillIds(capacity=3)
+        ids.update([1, 2, 3])
+        ids.add(1)  # Refresh 1 so 2 is now oldest
+        ids.add(4)
+
+        assert 2 not in ids
+        assert all(kill_id in ids for kill_id in (1, 3, 4))
+
+
+class TestRealtimeKillWriter:
+    """Tests for the background realtime kill writer."""
+
+    def test_flush_commits_submitted_kills(self, db: RealtimeKillsDatabase, sample_kill):
+        writer = RealtimeKillWriter(db.db_path, flush_interval_ms=10_000)
+        writer.start()
+        try:
+            for i in range(5):
+                writer.submit(replace(sample_kill, kill_id=i + 1))
+            assert writer.flush() is True
+        finally:
+            writer.stop()
+
+        assert db.get_kill_count() == 5
+        assert writer.kills_written == 5
+        assert writer.batches_written == 1
+
+    def test_commits_after_interval(self, db: RealtimeKillsDatabase, sample_kill):
+        writer = RealtimeKillWriter(db.db_path, flush_interval_ms=10)
+        writer.start()
+        try:
+            writer.submit(sample_kill)
+            deadline = time.monotonic() + 2
+            while writer.kills_written == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            writer.stop()
+
+        assert db.kill_exists(sample_kill.kill_id)
+
+    def test_stop_writes_pending_kills(self, db: RealtimeKillsDatabase, sample_kill):
+        writer = RealtimeKillWriter(db.db_path, flush_interval_ms=10_000)
+        writer.start()
+        writer.submit(sample_kill, MagicMock(has_match=True, all_matched_ids=[1]))
+        writer.stop()
+
+        assert writer.is_running is False
+        assert db.get_watched_entity_kill_count() == 1
+
+    def test_flush_when_not_running(self, db: RealtimeKillsDatabase):
+        assert RealtimeKillWriter(db.db_path).flush() is False
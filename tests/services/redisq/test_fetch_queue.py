@@ -0,0 +1,141 @@
+"""
+Tests for the killmail fetch queue.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from aria_esi.core.rate_limit import TokenBucket
+from aria_esi.services.redisq.fetch_queue import (
+    FETCH_PRIORITY_HIGH,
+    FetchResult,
+    KillFetchQueue,
+    StageLatency,
+)
+from aria_esi.services.redisq.models import QueuedKill
+
+pytestmark = pytest.mark.asyncio
+
+
+def make_kill(kill_id: int) -> QueuedKill:
+    """Create a queued kill."""
+    return QueuedKill(kill_id=kill_id, hash=f"hash{kill_id}", zkb_data={}, queued_at=0.0)
+
+
+class FakeESI:
+    """Stand-in for fetch_killmail with per-kill delays."""
+
+    def __init__(self, esi_killmail: dict[str, Any], delays: dict[int, float] | None = None):
+        self.esi_killmail = esi_killmail
+        self.delays = delays or {}
+        self.started: list[int] = []
+
+    async def __call__(self, client, kill_id: int, kill_hash: str) -> FetchResult:
+        self.started.append(kill_id)
+        await asyncio.sleep(self.delays.get(kill_id, 0))
+        if kill_id < 0:
+            return FetchResult(kill_id=kill_id, success=False, error="ESI error: 500")
+        return FetchResult(
+            kill_id=kill_id, success=True, esi_data={**self.esi_killmail, "killmail_id": kill_id}
+        )
+
+
+async def run_queue(queue: KillFetchQueue, fake: FakeESI, kills, priorities=None) -> list[int]:
+    """Enqueue kills, process them all, and return kill IDs in callback order."""
+    processed: list[int] = []
+    for i, kill in enumerate(kills):
+        await queue.enqueue(kill, *(priorities[i : i + 1] if priorities else ()))
+
+    with patch("aria_esi.services.redisq.fetch_queue.fetch_killmail", fake):
+        await queue.start_processing(on_kill_processed=lambda k: processed.append(k.kill_id))
+        try:
+            await asyncio.wait_for(queue.join(), timeout=5)
+        finally:
+            await queue.stop_processing()
+    return processed
+
+
+@pytest.fixture
+def queue() -> KillFetchQueue:
+    """Fetch queue with its own generous rate limiter."""
+    return KillFetchQueue(_rate_limiter=TokenBucket(rate=1000))
+
+
+class TestKillFetchQueue:
+    """Tests for streaming fetch workers."""
+
+    async def test_processes_all_kills(self, queue: KillFetchQueue, sample_esi_killmail):
+        processed = await run_queue(
+            queue, FakeESI(sample_esi_killmail), [make_kill(i) for i in range(1, 13)]
+        )
+
+        assert sorted(processed) == list(range(1, 13))
+        assert queue.fetched_count == 12
+        assert queue.backlog_size == 0
+
+    async def test_slow_fetch_does_not_block_others(
+        self, queue: KillFetchQueue, sample_esi_killmail
+    ):
+        fake = FakeESI(sample_esi_killmail, delays={1: 0.3})
+
+        processed = await run_queue(queue, fake, [make_kill(i) for i in range(1, 11)])
+
+        # Every other kill completes while kill 1 is still in flight
+        assert processed[-1] == 1
+
+    async def test_high_priority_served_first(self, sample_esi_killmail):
+        queue = KillFetchQueue(MAX_CONCURRENT_FETCHES=1, _rate_limiter=TokenBucket(rate=1000))
+        kills = [make_kill(i) for i in range(1, 5)]
+
+        processed = await run_queue(
+            queue, FakeESI(sample_esi_killmail), kills, priorities=[1, 1, FETCH_PRIORITY_HIGH, 1]
+        )
+
+        assert processed == [3, 1, 2, 4]
+        assert queue.get_stats()["high_priority_count"] == 1
+
+    async def test_errors_counted(self, queue: KillFetchQueue, sample_esi_killmail):
+        processed = await run_queue(
+            queue, FakeESI(sample_esi_killmail), [make_kill(1), make_kill(-2)]
+        )
+
+        assert processed == [1]
+        assert queue.error_count == 1
+
+    async def test_rejects_when_full(self):
+        queue = KillFetchQueue(MAX_QUEUE_SIZE=2)
+
+        assert await queue.enqueue(make_kill(1)) is True
+        assert await queue.enqueue(make_kill(2)) is True
+        assert await queue.enqueue(make_kill(3)) is False
+        assert queue.backlog_size == 2
+
+    async def test_stats_report_stage_latency(self, queue: KillFetchQueue, sample_esi_killmail):
+        await run_queue(queue, FakeESI(sample_esi_killmail), [make_kill(1), make_kill(2)])
+
+        latency = queue.get_stats()["latency"]
+
+        assert set(latency) == {"queue_wait", "rate_limit", "fetch", "process"}
+        assert latency["fetch"]["count"] == 2
+        assert latency["fetch"]["p50_ms"] is not None
+
+
+class TestStageLatency:
+    """Tests for latency percentiles."""
+
+    async def test_percentiles(self):
+        latency = StageLatency()
+        for ms in range(1, 101):
+            latency.record(ms / 1000)
+
+        result = latency.percentiles()
+
+        assert result == {"count": 100, "p50_ms": 51.0, "p95_ms": 96.0, "p99_ms": 100.0}
+
+    async def test_empty(self):
+        assert StageLatency().percentiles()["p95_ms"] is None
@@ -0,0 +1,116 @@
+"""
+Tests for the in-memory recent kill index.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from aria_esi.services.redisq.kill_index import RecentKillIndex
+from aria_esi.services.redisq.models import ProcessedKill
+
+NOW = 1_800_000_000.0
+
+
+def make_kill(kill_id: int, age_seconds: float, system_id: int = 1, is_pod: bool = False):
+    """Create a kill age_seconds before NOW."""
+    return ProcessedKill(
+        kill_id=kill_id,
+        kill_time=datetime.fromtimestamp(NOW - age_seconds),
+        solar_system_id=system_id,
+        victim_ship_type_id=670 if is_pod else 587,
+        victim_corporation_id=1,
+        victim_alliance_id=None,
+        attacker_count=5,
+        attacker_corps=[100],
+        attacker_alliances=[],
+        attacker_ship_types=[587],
+        final_blow_ship_type_id=587,
+        total_value=1_000_000.0,
+        is_pod_kill=is_pod,
+    )
+
+
+@pytest.fixture
+def index() -> RecentKillIndex:
+    """Index with kills at various ages across two systems."""
+    index = RecentKillIndex()
+    ages = [30, 120, 500, 700, 1800, 3500, 7200, 40000, 86000]
+    for i, age in enumerate(ages):
+        index.add(make_kill(i + 1, age, is_pod=i % 2 == 1), now=NOW)
+    index.add(make_kill(100, 60, system_id=2), watched=True, now=NOW)
+    return index
+
+
+class TestCounts:
+    """Tests for windowed counts."""
+
+    def test_window_counts(self, index: RecentKillIndex):
+        assert index.count(1, 600, now=NOW) == 3
+        assert index.count(1, 3600, now=NOW) == 6
+        assert index.count(1, 86400, now=NOW) == 9
+        assert index.count(2, 600, now=NOW) == 1
+        assert index.count(3, 600, now=NOW) == 0
+
+    def test_pod_counts(self, index: RecentKillIndex):
+        assert index.pod_count(1, 600, now=NOW) == 1
+        assert index.pod_count(1, 3600, now=NOW) == 3
+        assert index.pod_count(1, 86400, now=NOW) == 4
+
+    def test_window_is_exclusive_at_cutoff(self):
+        index = RecentKillIndex()
+        index.add(make_kill(1, 600), now=NOW)
+        assert index.count(1, 600, now=NOW) == 0
+        assert index.count(1, 601, now=NOW) == 1
+
+
+class TestAdd:
+    """Tests for indexing kills."""
+
+    def test_duplicates_ignored(self, index: RecentKillIndex):
+        assert index.add(make_kill(1, 30), now=NOW) is False
+        assert index.count(1, 600, now=NOW) == 3
+
+    def test_outside_horizon_ignored(self):
+        index = RecentKillIndex()
+        assert index.add(make_kill(1, 90000), now=NOW) is False
+        assert index.kill_count == 0
+
+    def test_out_of_order_kills(self):
+        index = RecentKillIndex()
+        for kill_id, age in [(1, 100), (2, 300), (3, 50), (4, 200)]:
+            index.add(make_kill(kill_id, age), now=NOW)
+
+        assert [k.kill_id for k in index.recent_kills(1, 600, now=NOW)] == [3, 1, 4, 2]
+
+    def test_prunes_as_time_advances(self, index: RecentKillIndex):
+        later = NOW + 86400
+        index.add(make_kill(200, -86400 + 10, system_id=3), now=later)
+
+        assert index.system_count == 1
+        assert index.kill_count == 1
+        assert index.recent_kills(1, 3600, now=later) == []
+
+
+class TestRecentKills:
+    """Tests for kill detail lookups."""
+
+    def test_newest_first_with_limit(self, index: RecentKillIndex):
+        kills = index.recent_kills(1, 3600, limit=4, now=NOW)
+        assert [k.kill_id for k in kills] == [1, 2, 3, 4]
+
+    def test_watched_only(self, index: RecentKillIndex):
+        assert index.recent_kills(1, 3600, watched_only=True, now=NOW) == []
+        assert [k.kill_id for k in index.recent_kills(2, 3600, watched_only=True, now=NOW)] == [100]
+
+    def test_beyond_detail_window_rejected(self, index: RecentKillIndex):
+        with pytest.raises(ValueError):
+            index.recent_kills(1, 7200, now=NOW)
+
+    def test_covers_requires_bootstrap(self, index: RecentKillIndex):
+        assert index.covers(600) is False
+        index._bootstrapped = True
+        assert index.covers(86400) is True
+        assert index.covers(86401) is False
@@ -15,7 +15,8 @@ from unittest.mock import AsyncMock, MagicMock, patch, PropertyMock
 import httpx
 import pytest
 
-from aria_esi.services.redisq.database import RealtimeKillsDatabase
+from aria_esi.services.redisq.database import RealtimeKillsDatabase, RealtimeKillWriter
+from aria_esi.services.redisq.kill_index import RecentKillIndex
 from aria_esi.services.redisq.models import (
     IngestMetrics,
     PollerStatus,
@@ -645,14 +646,7 @@ class TestPollOnce:
     async def test_poll_once_skips_existing_kill(
         self, db: RealtimeKillsDatabase, config: RedisQConfig, mock_fetch_queue, mock_ingest_queue
     ):
-        """Test poll_once skips kills already in database."""
-        # Pre-populate database with a kill - use the public connection getter
-        conn = db._get_connection()
-        conn.execute(
-            "INSERT INTO realtime_kills (kill_id, kill_time, solar_system_id) VALUES (?, ?, ?)",
-            (12345, int(time.time()), 30000142),
-        )
-        conn.commit()
+        """Test poll_once skips saved kills but retries ones whose fetch failed."""
 
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -676,9 +670,17 @@ class TestPollOnce:
             patch("aria_esi.services.redisq.poller.get_fetch_queue", return_value=mock_fetch_queue),
         ):
             await poller._poll_once()
-            # Should store in ingest queue but not fetch via ESI
-            mock_ingest_queue.put.assert_called_once()
-            mock_fetch_queue.enqueue.assert_not_called()
+            mock_fetch_queue.enqueue.assert_called_once()
+
+            # The ESI fetch failed, so the kill was never saved: fetch it again
+            await poller._poll_once()
+            assert mock_fetch_queue.enqueue.call_count == 2
+
+            # Once saved, RedisQ duplicates are stored but not fetched via ESI
+            poller._recent_kill_ids.add(12345)
+            await poller._poll_once()
+            assert mock_ingest_queue.put.call_count == 3
+            assert mock_fetch_queue.enqueue.call_count == 2
 
     @pytest.mark.asyncio
     async def test_poll_once_queues_new_kill(
@@ -743,7 +745,7 @@ class TestPollOnce:
 
         mock_topology = MagicMock()
         mock_topology.is_active = True
-        mock_topology.should_fetch.return_value = False  # Filter it out
+        mock_topology.fetch_priority.return_value = None  # Filter it out
 
         poller = RedisQPoller(config=config)
         poller._client = mock_client
@@ -946,6 +948,102 @@ class TestOnKillProcessed:
 
             assert poller._watched_entity_kills == 1
 
+    def test_on_kill_processed_uses_background_writer(
+        self, db: RealtimeKillsDatabase, config: RedisQConfig
+    ):
+        """Test _on_kill_processed hands saves to the writer thread when running."""
+        kill = ProcessedKill(
+            kill_id=12345,
+            kill_time=datetime.utcnow(),
+            solar_system_id=30000142,
+            victim_ship_type_id=587,
+            victim_corporation_id=123,
+            victim_alliance_id=None,
+            attacker_count=1,
+            attacker_corps=[456],
+            attacker_alliances=[],
+            attacker_ship_types=[587],
+            final_blow_ship_type_id=587,
+            total_value=1000000.0,
+            is_pod_kill=False,
+        )
+
+        mock_db = MagicMock()
+        with patch("aria_esi.services.redisq.poller.get_realtime_database", return_value=mock_db):
+            poller = RedisQPoller(config=config)
+            poller._kill_writer = RealtimeKillWriter(db.db_path)
+            poller._kill_writer.start()
+            try:
+                poller._on_kill_processed(kill)
+                assert poller._kill_writer.flush()
+            finally:
+                poller._kill_writer.stop()
+
+        mock_db.save_kill.assert_not_called()
+        assert db.kill_exists(12345)
+        assert 12345 in poller._recent_kill_ids
+
+    def test_on_kill_processed_feeds_kill_index(
+        self, db: RealtimeKillsDatabase, config: RedisQConfig
+    ):
+        """Test accepted kills are added to the in-memory kill index."""
+        kill = ProcessedKill(
+            kill_id=12345,
+            kill_time=datetime.now(),
+            solar_system_id=30000142,
+            victim_ship_type_id=587,
+            victim_corporation_id=123,
+            victim_alliance_id=None,
+            attacker_count=1,
+            attacker_corps=[456],
+            attacker_alliances=[],
+            attacker_ship_types=[587],
+            final_blow_ship_type_id=587,
+            total_value=1000000.0,
+            is_pod_kill=False,
+        )
+
+        with patch("aria_esi.services.redisq.poller.get_realtime_database", return_value=db):
+            poller = RedisQPoller(config=config)
+            poller._kill_index = RecentKillIndex()
+            poller._on_kill_processed(kill)
+
+        assert poller._kill_index.count(30000142, 600) == 1
+
+    def test_on_kill_processed_feeds_gatecamp_tracker(
+        self, db: RealtimeKillsDatabase, config: RedisQConfig
+    ):
+        """Test accepted kills are classified once and added to the gatecamp tracker."""
+        from aria_esi.services.redisq.threat_cache import GatecampTracker
+        from aria_esi.services.redisq.war_context import KillWarContext
+
+        kill = ProcessedKill(
+            kill_id=12345,
+            kill_time=datetime.now(),
+            solar_system_id=30000142,
+            victim_ship_type_id=587,
+            victim_corporation_id=123,
+            victim_alliance_id=None,
+            attacker_count=1,
+            attacker_corps=[456],
+            attacker_alliances=[],
+            attacker_ship_types=[587],
+            final_blow_ship_type_id=587,
+            total_value=1000000.0,
+            is_pod_kill=False,
+        )
+        war_provider = MagicMock()
+        war_provider.check_kill.return_value = KillWarContext(is_war_engagement=True)
+
+        with patch("aria_esi.services.redisq.poller.get_realtime_database", return_value=db):
+            poller = RedisQPoller(config=config)
+            poller._war_context_provider = war_provider
+            poller._gatecamp_tracker = GatecampTracker(war_context=war_provider)
+            poller._on_kill_processed(kill)
+
+        war_provider.check_kill.assert_called_once_with(kill)
+        assert poller._gatecamp_tracker.get_stats()["kills"] == 1
+
 
 class TestBackgroundLoops:
     """Tests for background maintenance loops."""
@@ -452,6 +452,34 @@ class TestTopologyFilter:
         assert metrics["filtered"] == 1
         assert metrics["total"] == 2
 
+    def test_fetch_priority_lanes(self):
+        """High-interest systems get the high-priority fetch lane."""
+        interest_map = InterestMap(
+            systems={
+                30000142: SystemInterest(30000142, "Jita", 1.0, 0),
+                30000144: SystemInterest(30000144, "Perimeter", 0.7, 2),
+            }
+        )
+        filter = TopologyFilter(interest_map=interest_map)
+
+        assert filter.fetch_priority(QueuedKill(1, "a", {}, 0.0, solar_system_id=30000142)) == 0
+        assert filter.fetch_priority(QueuedKill(2, "b", {}, 0.0, solar_system_id=30000144)) == 1
+        assert filter.fetch_priority(QueuedKill(3, "c", {}, 0.0, solar_system_id=99999)) is None
+
+    def test_fetch_priority_uses_calculator_thresholds(self):
+        """Context-aware mode uses the calculator's fetch and priority thresholds."""
+        calculator = MagicMock(fetch_threshold=0.2, priority_threshold=0.8)
+        filter = TopologyFilter(calculator=calculator)
+        kill = QueuedKill(1, "a", {}, 0.0, solar_system_id=30000142)
+
+        lanes = []
+        for interest in (0.9, 0.5, 0.1):
+            calculator.calculate_system_interest.return_value = MagicMock(interest=interest)
+            lanes.append(filter.fetch_priority(kill))
+
+        assert lanes == [0, 1, None]
+        assert calculator.calculate_system_interest.call_count == 3
+
     def test_reset_metrics(self):
         """Should reset metrics to zero."""
         interest_map = InterestMap(
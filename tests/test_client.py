@@ -419,6 +419,109 @@ class TestESIClientGetWithHeaders:
             assert response.status_code == 304
 
 
+@pytest.mark.httpx
+@pytest.mark.skipif(not HTTPX_AVAILABLE, reason="pytest-httpx not installed")
+class TestESIClientResponseCache:
+    """Tests for ETag / Expires response caching."""
+
+    URL = "https://esi.evetech.net/latest/sovereignty/map/?datasource=tranquility"
+
+    def test_fresh_response_served_without_request(self, httpx_mock):
+        import time
+        from email.utils import formatdate
+
+        from aria_esi.core import ESIClient
+        from aria_esi.core.response_cache import ESIResponseCache
+
+        httpx_mock.add_response(
+            url=self.URL,
+            json=[{"system_id": 30000142}],
+            headers={"ETag": '"v1"', "Expires": formatdate(time.time() + 60, usegmt=True)},
+        )
+
+        with ESIClient(enable_retry=False, response_cache=ESIResponseCache()) as client:
+            assert client.get("/sovereignty/map/") == [{"system_id": 30000142}]
+            assert client.get("/sovereignty/map/") == [{"system_id": 30000142}]
+
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_expired_response_revalidated_with_etag(self, httpx_mock):
+        import time
+        from email.utils import formatdate
+
+        from aria_esi.core import ESIClient
+        from aria_esi.core.response_cache import ESIResponseCache
+
+        httpx_mock.add_response(
+            url=self.URL,
+            json=[{"system_id": 30000142}],
+            headers={"ETag": '"v1"', "Expires": formatdate(time.time() - 60, usegmt=True)},
+        )
+        httpx_mock.add_response(
+            url=self.URL,
+            status_code=304,
+            match_headers={"If-None-Match": '"v1"'},
+        )
+        cache = ESIResponseCache()
+
+        with ESIClient(enable_retry=False, response_cache=cache) as client:
+            client.get("/sovereignty/map/")
+            assert client.get("/sovereignty/map/") == [{"system_id": 30000142}]
+
+        assert cache.get_stats()["revalidated"] == 1
+
+    def test_shares_cache_with_async_client(self, httpx_mock):
+        import asyncio
+        import time
+        from email.utils import formatdate
+
+        from aria_esi.core import ESIClient
+        from aria_esi.core.async_client import AsyncESIClient
+        from aria_esi.core.response_cache import ESIResponseCache
+
+        httpx_mock.add_response(
+            url=self.URL,
+            json=[{"system_id": 30000142}],
+            headers={"Expires": formatdate(time.time() + 60, usegmt=True)},
+        )
+        cache = ESIResponseCache()
+
+        with ESIClient(enable_retry=False, response_cache=cache) as client:
+            client.get("/sovereignty/map/")
+
+        async def fetch_async():
+            async with AsyncESIClient(response_cache=cache) as async_client:
+                return await async_client.get("/sovereignty/map/")
+
+        assert asyncio.run(fetch_async()) == [{"system_id": 30000142}]
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_authenticated_response_scoped_to_token(self, httpx_mock):
+        import time
+        from email.utils import formatdate
+
+        from aria_esi.core import ESIClient
+        from aria_esi.core.response_cache import ESIResponseCache
+
+        url = "https://esi.evetech.net/latest/characters/12345/location/?datasource=tranquility"
+        for body in ({"solar_system_id": 1}, {"solar_system_id": 2}, {"solar_system_id": 3}):
+            httpx_mock.add_response(
+                url=url,
+                json=body,
+                headers={"Expires": formatdate(time.time() + 60, usegmt=True)},
+            )
+        cache = ESIResponseCache()
+
+        with ESIClient(token="pilot-a", enable_retry=False, response_cache=cache) as client:
+            assert client.get("/characters/12345/location/", auth=True) == {"solar_system_id": 1}
+            assert client.get("/characters/12345/location/", auth=True) == {"solar_system_id": 1}
+            assert client.get("/characters/12345/location/") == {"solar_system_id": 2}
+        with ESIClient(token="pilot-b", enable_retry=False, response_cache=cache) as client:
+            assert client.get("/characters/12345/location/", auth=True) == {"solar_system_id": 3}
+
+        assert len(httpx_mock.get_requests()) == 3
+
+
 @pytest.mark.httpx
 @pytest.mark.skipif(not HTTPX_AVAILABLE, reason="pytest-httpx not installed")
 class TestESIClientRateLimits:
@@ -303,3 +303,155 @@ class TestAggregateToItemPrice:
         assert result.buy.min_price is None
         # Spread can't be calculated without buy max
         assert result.spread is None
+
+
+class TestRegionalOrders:
+    """Tests for single-flight raw order fetching."""
+
+    @staticmethod
+    def _gated_fetch(cache, release):
+        """Patch _fetch_raw_orders to block on release, recording concurrency."""
+        calls = []
+        active = []
+        peak = [0]
+
+        async def fetch(region_id, type_id, order_type):
+            calls.append((region_id, type_id, order_type))
+            active.append(1)
+            peak[0] = max(peak[0], len(active))
+            await release.wait()
+            active.pop()
+            return [{"region_id": region_id, "type_id": type_id}]
+
+        cache._fetch_raw_orders = fetch
+        return calls, peak
+
+    @pytest.mark.asyncio
+    async def test_same_key_shares_one_fetch(self):
+        import asyncio
+
+        from aria_esi.mcp.market.cache import MarketCache
+
+        cache = MarketCache()
+        release = asyncio.Event()
+        calls, _ = self._gated_fetch(cache, release)
+
+        waiters = [asyncio.ensure_future(cache.get_regional_orders(1, 34)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiters)
+
+        assert calls == [(1, 34, "sell")]
+        assert all(r == results[0] for r in results)
+        assert cache.get_cache_status()["raw_orders"]["coalesced"] == 4
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_in_parallel(self):
+        import asyncio
+
+        from aria_esi.mcp.market.cache import MarketCache
+
+        cache = MarketCache()
+        release = asyncio.Event()
+        calls, peak = self._gated_fetch(cache, release)
+
+        waiters = [
+            asyncio.ensure_future(cache.get_regional_orders(region_id, 34))
+            for region_id in range(8)
+        ]
+        await asyncio.sleep(0.01)
+        release.set()
+        await asyncio.gather(*waiters)
+
+        assert len(calls) == 8
+        assert peak[0] == 8
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_abort_fetch(self):
+        import asyncio
+
+        from aria_esi.mcp.market.cache import MarketCache
+
+        cache = MarketCache()
+        release = asyncio.Event()
+        calls, _ = self._gated_fetch(cache, release)
+
+        first = asyncio.ensure_future(cache.get_regional_orders(1, 34))
+        second = asyncio.ensure_future(cache.get_regional_orders(1, 34))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == [{"region_id": 1, "type_id": 34}]
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_within_ttl(self):
+        import asyncio
+
+        from aria_esi.mcp.market.cache import MarketCache
+
+        cache = MarketCache()
+        release = asyncio.Event()
+        release.set()
+        calls, _ = self._gated_fetch(cache, release)
+
+        await cache.get_regional_orders(1, 34)
+        await cache.get_regional_orders(1, 34)
+
+        assert len(calls) == 1
+        stats = cache.get_cache_status()["raw_orders"]
+        assert stats["hits"] == 1
+        assert stats["in_flight"] == 0
+
+
+class TestRawOrdersCache:
+    """Tests for the bounded raw orders LRU."""
+
+    @staticmethod
+    def _entry(type_id, timestamp=None):
+        from aria_esi.mcp.market.cache import CachedOrders
+
+        return CachedOrders(
+            orders=[],
+            timestamp=time.time() if timestamp is None else timestamp,
+            region_id=1,
+            type_id=type_id,
+            order_type="sell",
+        )
+
+    def test_evicts_least_recently_used(self):
+        from aria_esi.mcp.market.cache import RawOrdersCache
+
+        cache = RawOrdersCache(maxsize=2)
+        cache.put((1, 1, "sell"), self._entry(1))
+        cache.put((1, 2, "sell"), self._entry(2))
+        cache.get((1, 1, "sell"))
+        cache.put((1, 3, "sell"), self._entry(3))
+
+        assert cache.get((1, 2, "sell")) is None
+        assert cache.get((1, 1, "sell")) is not None
+        assert cache.evictions == 1
+
+    def test_purges_expired_before_evicting(self):
+        from aria_esi.mcp.market.cache import RawOrdersCache
+
+        cache = RawOrdersCache(maxsize=2, ttl_seconds=300)
+        cache.put((1, 1, "sell"), self._entry(1))
+        cache.put((1, 2, "sell"), self._entry(2, timestamp=time.time() - 400))
+        cache.put((1, 3, "sell"), self._entry(3))
+
+        assert len(cache) == 2
+        assert cache.evictions == 0
+        assert cache.expirations == 1
+        assert cache.get((1, 1, "sell")) is not None
+
+    def test_expired_entry_is_a_miss(self):
+        from aria_esi.mcp.market.cache import RawOrdersCache
+
+        cache = RawOrdersCache(ttl_seconds=300)
+        cache.put((1, 1, "sell"), self._entry(1, timestamp=time.time() - 400))
+
+        assert cache.get((1, 1, "sell")) is None
+        assert cache.get_stats()["misses"] == 1
+        assert len(cache) == 0
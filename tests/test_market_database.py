@@ -520,6 +520,107 @@ class TestImportTypes:
         assert result.type_id == 34
 
 
+class TestTypeNameIndex:
+    """Tests for the trigram and prefix type name indexes."""
+
+    NAMES = [
+        (34, "Tritanium"),
+        (2454, "Hobgoblin I"),
+        (2456, "Hobgoblin II"),
+        (2488, "Warrior II"),
+        (11578, "Heavy Assault Missile Launcher II"),
+        (25715, "Heavy Assault Missile Launcher I"),
+    ]
+
+    @pytest.fixture
+    def indexed_db(self, market_db):
+        market_db.import_types_from_esi(
+            [{"type_id": type_id, "name": name} for type_id, name in self.NAMES]
+        )
+        return market_db
+
+    def test_import_builds_fts(self, indexed_db):
+        assert indexed_db.has_type_name_fts()
+
+    def test_contains_match_uses_lowest_type_id(self, indexed_db):
+        result = indexed_db.resolve_type_name("Assault Missile")
+
+        assert result is not None
+        assert result.type_id == 11578
+
+    def test_prefix_match_takes_first_name(self, indexed_db):
+        result = indexed_db.resolve_type_name("hobgob")
+
+        assert result is not None
+        assert result.type_name == "Hobgoblin I"
+
+    def test_suggestions_ranked_by_edit_distance(self, indexed_db):
+        suggestions = indexed_db.find_type_suggestions("Hobgoblen II")
+
+        assert suggestions[:2] == ["Hobgoblin II", "Hobgoblin I"]
+
+    def test_suggestions_prefix_before_contains(self, indexed_db):
+        suggestions = indexed_db.find_type_suggestions("heavy assault missile launcher")
+
+        assert suggestions[:2] == [
+            "Heavy Assault Missile Launcher I",
+            "Heavy Assault Missile Launcher II",
+        ]
+
+    def test_batch_resolve_in_few_statements(self, indexed_db):
+        names = [name for _, name in self.NAMES] * 30 + ["Warr", "obgoblin I", "Missing"]
+        names += [f"Unknown Item {i}" for i in range(100)]
+        statements = []
+        conn = indexed_db._get_connection()
+        conn.set_trace_callback(statements.append)
+
+        result = indexed_db.batch_resolve_names(names)
+
+        conn.set_trace_callback(None)
+        # Ignore FTS5's internal statements, traced with a leading comment
+        statements = [sql for sql in statements if not sql.lstrip().startswith("--")]
+        assert result["Warr"].type_id == 2488
+        assert result["obgoblin I"].type_id == 2454
+        assert result["Missing"] is None
+        assert result["Tritanium"].type_id == 34
+        assert len(statements) < 10
+
+    def test_renames_reload_prefix_index(self, indexed_db):
+        assert indexed_db.resolve_type_name("warr").type_id == 2488
+
+        indexed_db.update_type_names({2488: "Valkyrie II"})
+
+        assert indexed_db.resolve_type_name("warr") is None
+        assert indexed_db.resolve_type_name("valk").type_id == 2488
+
+    def test_fallback_without_fts(self, market_db):
+        conn = market_db._get_connection()
+        conn.execute(
+            "INSERT INTO types (type_id, type_name, type_name_lower) "
+            "VALUES (11578, 'Heavy Assault Missile Launcher II', 'heavy assault missile launcher ii')"
+        )
+        conn.commit()
+
+        assert not market_db.has_type_name_fts()
+        assert market_db.batch_resolve_names(["launcher"])["launcher"].type_id == 11578
+        assert market_db.find_type_suggestions("missile") == ["Heavy Assault Missile Launcher II"]
+
+    def test_prefix_index(self):
+        from aria_esi.mcp.market.name_index import TypeNameIndex
+
+        index = TypeNameIndex(
+            [
+                ("warrior ii", 2488, "Warrior II"),
+                ("warrior i", 2486, "Warrior I"),
+                ("wasp i", 1, "Wasp I"),
+            ]
+        )
+
+        assert index.first_with_prefix("warrior") == 2486
+        assert index.first_with_prefix("zz") is None
+        assert index.names_with_prefix("wa", 2) == ["Wasp I", "Warrior I"]
+
+
 class TestSafeHelpers:
     """Tests for safe conversion helpers."""
 
@@ -299,6 +299,7 @@ def mock_universe_graph():
                 4: 30000005,
                 5: 30000006,
             }
+            self.jump_matrix = None
 
         def get_system_id(self, idx: int) -> int:
             return self._system_ids.get(idx, 0)
@@ -12,9 +12,11 @@ from datetime import datetime, timedelta
 from aria_esi.services.redisq.models import ProcessedKill
 from aria_esi.services.redisq.threat_cache import (
     FORCE_ASYMMETRY_THRESHOLD,
+    GatecampTracker,
     detect_gatecamp,
     detect_smartbomb_camp,
 )
+from aria_esi.services.redisq.war_context import KillWarContext, WarRelationship
 
 
 def make_kill(
@@ -540,3 +542,203 @@ class TestWarContextIntegration:
         assert "war_attacker_alliance" not in result_dict
         assert "war_defender_alliance" not in result_dict
         assert "war_kills_filtered" not in result_dict
+
+
+class FakeWarContext:
+    """War context provider treating a fixed set of kill IDs as war kills."""
+
+    def __init__(self, war_kill_ids: set[int]):
+        self.war_kill_ids = war_kill_ids
+        self.relationship = WarRelationship(aggressor_id=5000, defender_id=6000)
+
+    def check_kill(self, kill: ProcessedKill) -> KillWarContext:
+        if kill.kill_id in self.war_kill_ids:
+            return KillWarContext(is_war_engagement=True, relationship=self.relationship)
+        return KillWarContext()
+
+    def is_war_kill(self, kill: ProcessedKill) -> bool:
+        return kill.kill_id in self.war_kill_ids
+
+    def filter_war_kills(self, kills):
+        war = [k for k in kills if self.is_war_kill(k)]
+        return war, [k for k in kills if not self.is_war_kill(k)]
+
+
+def comparable(status):
+    """GatecampStatus as a dict with order-independent lists."""
+    if status is None:
+        return None
+    result = status.to_dict()
+    for key in ("attacker_corps", "attacker_alliances", "attacker_ships"):
+        result[key] = sorted(result[key])
+    return result
+
+
+class TestGatecampTracker:
+    """Tests for incremental gatecamp detection."""
+
+    BASE = datetime(2026, 1, 26, 12, 0, 0)
+
+    def at(self, seconds: int) -> datetime:
+        return self.BASE + timedelta(seconds=seconds)
+
+    def now(self, seconds: int) -> float:
+        return self.at(seconds).timestamp()
+
+    def mixed_kills(self) -> list[ProcessedKill]:
+        """Kills spread over 20 minutes with varied attackers and victims."""
+        kills = []
+        for i in range(24):
+            kills.append(
+                make_kill(
+                    kill_id=i + 1,
+                    kill_time=self.at(i * 50),
+                    victim_corp=1 + i % 3,
+                    attacker_count=2 + i % 7,
+                    attacker_corps=[100 + i % 2, 200] if i % 4 else [100 + i % 2],
+                    attacker_alliances=[900] if i % 5 else [],
+                    attacker_ship_types=[24690] if i % 6 == 0 else [587, 11993],
+                    is_pod=i % 3 == 0,
+                )
+            )
+        return kills
+
+    def test_matches_detect_gatecamp_as_window_slides(self):
+        """Status after every kill equals a full recompute over the window."""
+        tracker = GatecampTracker()
+        kills = self.mixed_kills()
+
+        for i, kill in enumerate(kills):
+            now = self.now(i * 50)
+            tracker.add(kill, now=now)
+            window = [k for k in kills[: i + 1] if k.kill_time.timestamp() > now - 600]
+            expected = detect_gatecamp(kill.solar_system_id, list(reversed(window)), "Test")
+
+            actual = tracker.status(kill.solar_system_id, "Test", now=now)
+
+            assert comparable(actual) == comparable(expected)
+
+    def test_matches_detect_gatecamp_excluding_war_kills(self):
+        """War filtering matches detect_gatecamp with the same provider."""
+        war_context = FakeWarContext({3, 4, 9, 10, 11})
+        tracker = GatecampTracker(war_context=war_context)
+        kills = self.mixed_kills()[:12]
+
+        for i, kill in enumerate(kills):
+            now = self.now(i * 50)
+            tracker.add(kill, war=war_context.check_kill(kill), now=now)
+            window = [k for k in kills[: i + 1] if k.kill_time.timestamp() > now - 600]
+            expected = detect_gatecamp(
+                kill.solar_system_id, list(reversed(window)), war_context=war_context
+            )
+
+            actual = tracker.status(kill.solar_system_id, exclude_war=True, now=now)
+
+            assert comparable(actual) == comparable(expected)
+
+    def test_all_war_kills_not_a_camp(self):
+        """A window of only war kills is not a gatecamp when excluding war."""
+        war_context = FakeWarContext({1, 2, 3})
+        tracker = GatecampTracker(war_context=war_context)
+        for i in range(3):
+            kill = make_kill(kill_id=i + 1, kill_time=self.at(i), victim_corp=i + 1)
+            tracker.add(kill, war=war_context.check_kill(kill), now=self.now(5))
+
+        assert tracker.status(30000142, exclude_war=True, now=self.now(5)) is None
+        assert tracker.status(30000142, now=self.now(5)) is not None
+
+    def test_kills_expire_from_window(self):
+        """Kills older than the window stop counting."""
+        tracker = GatecampTracker()
+        for i in range(3):
+            tracker.add(
+                make_kill(kill_id=i + 1, kill_time=self.at(i * 60), victim_corp=i + 1),
+                now=self.now(i * 60),
+            )
+
+        assert tracker.status(30000142, now=self.now(120)).kill_count == 3
+        assert tracker.status(30000142, now=self.now(630)) is None
+        assert tracker.get_stats()["kills"] == 2
+        assert tracker.status(30000142, now=self.now(800)) is None
+        assert tracker.system_count == 0
+
+    def test_duplicates_and_stale_kills_ignored(self):
+        """Re-added and already expired kills are rejected."""
+        tracker = GatecampTracker()
+        kill = make_kill(kill_id=1, kill_time=self.at(0))
+
+        assert tracker.add(kill, now=self.now(0)) is True
+        assert tracker.add(kill, now=self.now(1)) is False
+        assert tracker.add(make_kill(kill_id=2, kill_time=self.at(0)), now=self.now(600)) is False
+
+    def test_attacker_consistency_tracked_under_expiry(self):
+        """Most common attacker corp is recomputed as kills leave the window."""
+        tracker = GatecampTracker()
+        # Corp 100 on the first three kills only, corp 200 on the last four
+        for i in range(7):
+            tracker.add(
+                make_kill(
+                    kill_id=i + 1,
+                    kill_time=self.at(i * 100),
+                    victim_corp=i + 1,
+                    attacker_corps=[100] if i < 3 else [200],
+                ),
+                now=self.now(i * 100),
+            )
+
+        for now in (600, 650, 750, 850):
+            kills_in_window = [
+                make_kill(
+                    kill_id=i + 1,
+                    kill_time=self.at(i * 100),
+                    victim_corp=i + 1,
+                    attacker_corps=[100] if i < 3 else [200],
+                )
+                for i in range(7)
+                if i * 100 > now - 600
+            ]
+            expected = detect_gatecamp(30000142, kills_in_window)
+            actual = tracker.status(30000142, now=self.now(now))
+            assert comparable(actual) == comparable(expected)
+
+    def test_smartbomb_camp_detected(self):
+        """Tight kill chains with smartbomb ships flag a smartbomb camp."""
+        tracker = GatecampTracker()
+        for i in range(3):
+            tracker.add(
+                make_kill(
+                    kill_id=i + 1,
+                    kill_time=self.at(i * 20),
+                    victim_corp=i + 1,
+                    attacker_ship_types=[24690],
+                ),
+                now=self.now(40),
+            )
+
+        assert tracker.status(30000142, now=self.now(40)).is_smartbomb_camp is True
+
+    def test_status_uses_requested_system_name(self):
+        """Cached status carries the caller's system name."""
+        tracker = GatecampTracker()
+        for i in range(3):
+            tracker.add(
+                make_kill(kill_id=i + 1, kill_time=self.at(i), victim_corp=i + 1),
+                now=self.now(5),
+            )
+
+        assert tracker.status(30000142, "Jita", now=self.now(5)).system_name == "Jita"
+        assert tracker.status(30000142, "Perimeter", now=self.now(5)).system_name == "Perimeter"
+
+    def test_bootstrap_classifies_war_kills(self):
+        """Bootstrapped kills are classified with the tracker's provider."""
+        war_context = FakeWarContext({2})
+        tracker = GatecampTracker(war_context=war_context)
+        kills = [
+            make_kill(kill_id=i + 1, kill_time=self.at(i), victim_corp=i + 1) for i in range(4)
+        ]
+
+        assert tracker.bootstrap(kills, now=self.now(10)) == 4
+        status = tracker.status(30000142, exclude_war=True, now=self.now(10))
+        assert status.kill_count == 3
+        assert status.war_kills_filtered == 1
+        assert status.war_attacker_alliance == 5000
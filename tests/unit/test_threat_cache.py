@@ -10,13 +10,16 @@ from __future__ import annotations
 import tempfile
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
 from aria_esi.services.redisq.database import RealtimeKillsDatabase
+from aria_esi.services.redisq.kill_index import RecentKillIndex
 from aria_esi.services.redisq.models import ProcessedKill
 from aria_esi.services.redisq.threat_cache import (
     GatecampStatus,
+    GatecampTracker,
     RealtimeActivitySummary,
     ThreatCache,
 )
@@ -355,6 +358,125 @@ class TestActivitySummary:
         assert summary.pod_kills_1h == 2
 
 
+class TestKillIndexBackedQueries:
+    """Queries answered from an attached RecentKillIndex match the database."""
+
+    @pytest.fixture
+    def populated_db(self, temp_db):
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        watched = MagicMock(has_match=True, all_matched_ids=[98000001])
+        minutes = [1, 2, 3, 4, 8, 20, 45, 90, 300, 600, 1000]
+        for i, age in enumerate(minutes):
+            temp_db.save_kill(
+                make_kill(
+                    kill_id=i + 1,
+                    kill_time=now - timedelta(minutes=age),
+                    victim_corp=i,
+                    is_pod=i % 3 == 0,
+                ),
+                watched if i == 5 else None,
+            )
+        temp_db.save_kill(make_kill(kill_id=50, system_id=30002187))
+        return temp_db
+
+    def _caches(self, db):
+        plain = ThreatCache()
+        plain._db = db
+
+        index = RecentKillIndex()
+        index.bootstrap(db)
+        indexed = ThreatCache()
+        indexed._db = MagicMock(wraps=db)
+        indexed.attach_index(index)
+        return plain, indexed
+
+    def test_activity_summary_matches_database(self, populated_db, monkeypatch):
+        from aria_esi.services.redisq import threat_cache as tc
+
+        monkeypatch.setattr(tc, "_threat_cache", None)
+        plain, indexed = self._caches(populated_db)
+
+        expected = plain.get_activity_for_systems([30000142, 30002187, 30000144])
+        actual = indexed.get_activity_for_systems([30000142, 30002187, 30000144])
+
+        assert {k: v.to_dict() for k, v in actual.items()} == {
+            k: v.to_dict() for k, v in expected.items()
+        }
+        assert actual[30000142].gatecamp is not None
+        assert actual[30000142].watched_entity_kills_1h == 1
+        indexed._db.get_recent_kills.assert_not_called()
+        indexed._db.get_watched_entity_kills.assert_not_called()
+
+    def test_activity_spike_matches_database(self, populated_db):
+        plain, indexed = self._caches(populated_db)
+
+        assert indexed.detect_activity_spike(30000142) == plain.detect_activity_spike(30000142)
+        indexed._db.get_recent_kills.assert_not_called()
+
+    def test_gatecamp_status_uses_index(self, populated_db):
+        plain, indexed = self._caches(populated_db)
+
+        assert indexed.get_gatecamp_status(30000142).to_dict() == (
+            plain.get_gatecamp_status(30000142).to_dict()
+        )
+        indexed._db.get_recent_kills.assert_not_called()
+
+    def test_detached_index_falls_back(self, populated_db):
+        _, indexed = self._caches(populated_db)
+        indexed.attach_index(None)
+
+        indexed.get_recent_kills(system_id=30000142, since_minutes=10)
+
+        indexed._db.get_recent_kills.assert_called_once()
+
+
+class TestGatecampTrackerBackedQueries:
+    """Gatecamp status from an attached GatecampTracker matches the database."""
+
+    @pytest.fixture
+    def tracked(self, temp_db, monkeypatch):
+        from aria_esi.services.redisq import threat_cache as tc
+
+        monkeypatch.setattr(tc, "_threat_cache", None)
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        for i in range(1, 5):
+            temp_db.save_kill(
+                make_kill(kill_id=i, kill_time=now - timedelta(minutes=i), victim_corp=i)
+            )
+
+        plain = ThreatCache()
+        plain._db = temp_db
+
+        tracker = GatecampTracker()
+        tracker.bootstrap(kill for kill, _ in temp_db.get_kills_since(since_minutes=10))
+        cache = ThreatCache()
+        cache._db = MagicMock(wraps=temp_db)
+        cache.attach_gatecamp_tracker(tracker)
+        return plain, cache
+
+    def test_gatecamp_status_uses_tracker(self, tracked):
+        plain, cache = tracked
+
+        actual = cache.get_gatecamp_status(30000142, "Jita")
+
+        assert actual.to_dict() == plain.get_gatecamp_status(30000142, "Jita").to_dict()
+        cache._db.get_recent_kills.assert_not_called()
+        saved = (
+            plain._db._get_connection()
+            .execute("SELECT COUNT(*) FROM gatecamp_detections")
+            .fetchone()
+        )
+        assert saved[0] == 1
+
+    def test_other_war_provider_falls_back(self, tracked):
+        _, cache = tracked
+        war_context = MagicMock()
+        war_context.filter_war_kills.side_effect = lambda kills: ([], kills)
+
+        assert cache.get_gatecamp_status(30000142, war_context=war_context) is not None
+        cache._db.get_recent_kills.assert_called_once()
+
+
 class TestDetectionDeduplication:
     """Tests for detection deduplication."""
 
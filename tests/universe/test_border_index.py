@@ -0,0 +1,116 @@
+"""
+Tests for the precomputed nearest-border index.
+"""
+
+import numpy as np
+import pytest
+
+from aria_esi.services.loop_planning.border_search import (
+    _bfs_borders,
+    find_borders_with_distance,
+)
+from aria_esi.universe import UniverseGraph
+from aria_esi.universe.border_index import (
+    BorderIndex,
+    compute_border_index,
+    get_border_index,
+)
+from aria_esi.universe.graph import JUMPS_UNREACHABLE
+from tests.mcp.conftest import create_mock_universe
+
+
+@pytest.fixture
+def universe() -> UniverseGraph:
+    """
+    Random 80-system universe, mostly high-sec with scattered low-sec.
+
+    Enough border systems that small index sizes truncate rows.
+    """
+    rng = np.random.default_rng(11)
+    n = 80
+    security = np.where(rng.random(n) < 0.2, 0.3, 0.8)
+    systems = [
+        {"name": f"S{i}", "id": 30000000 + i, "sec": float(security[i]), "const": 1, "region": 1}
+        for i in range(n)
+    ]
+    edges = {(i, i + 1) for i in range(n - 1)}
+    for a, b in rng.integers(0, n, size=(60, 2)):
+        if a != b:
+            edges.add((int(min(a, b)), int(max(a, b))))
+    return create_mock_universe(systems, sorted(edges))
+
+
+class TestComputeBorderIndex:
+    """Test index construction."""
+
+    def test_rows_match_bfs(self, universe: UniverseGraph):
+        index = compute_border_index(universe, size=8)
+        for origin in universe.highsec_systems:
+            expected = _bfs_borders(universe, origin, 8, 100, "highsec", None)
+            assert index.nearest(origin, 8, 100) == expected
+
+    def test_rows_cover_highsec_only(self, universe: UniverseGraph):
+        index = compute_border_index(universe)
+        highsec = sorted(universe.highsec_systems)
+
+        assert index.rows[highsec].tolist() == list(range(len(highsec)))
+        assert (index.rows[sorted(universe.lowsec_systems)] == -1).all()
+        assert index.systems.shape == index.jumps.shape == (len(highsec), index.size)
+        assert index.nearest(min(universe.lowsec_systems), 10, 10) is None
+
+    def test_padding(self, universe: UniverseGraph):
+        index = compute_border_index(universe, size=universe.system_count)
+        padding = index.jumps == JUMPS_UNREACHABLE
+
+        assert index.systems.dtype == np.int32
+        assert index.jumps.dtype == np.uint8
+        assert padding.any()
+        assert (index.systems[padding] == -1).all()
+        assert (index.systems[~padding] >= 0).all()
+
+    def test_get_border_index_caches(self, universe: UniverseGraph):
+        assert universe.border_index is None
+        index = get_border_index(universe)
+        assert universe.border_index is index
+        assert get_border_index(universe) is index
+
+
+class TestNearest:
+    """Test index lookups."""
+
+    def test_respects_max_jumps(self, universe: UniverseGraph):
+        index = compute_border_index(universe)
+        origin = min(universe.highsec_systems)
+        for max_jumps in range(4):
+            assert all(d <= max_jumps for _, d in index.nearest(origin, 50, max_jumps))
+
+    def test_truncated_row_returns_none(self):
+        systems = np.array([[3, 7]], dtype=np.int32)
+        jumps = np.array([[1, 2]], dtype=np.uint8)
+        index = BorderIndex(rows=np.array([0], dtype=np.int32), systems=systems, jumps=jumps)
+
+        assert index.nearest(0, 2, 5) == [(3, 1), (7, 2)]
+        assert index.nearest(0, 1, 5) == [(3, 1)]
+        assert index.nearest(0, 5, 1) == [(3, 1)]
+        # Full row and a caller wanting more: borders beyond the row may exist
+        assert index.nearest(0, 5, 5) is None
+
+
+class TestFindBordersFastPath:
+    """Test find_borders_with_distance agrees with BFS."""
+
+    @pytest.mark.parametrize(("limit", "max_jumps"), [(3, 2), (10, 5), (45, 10)])
+    def test_matches_bfs(self, universe: UniverseGraph, limit: int, max_jumps: int):
+        # A small index forces some lookups back onto BFS
+        universe.border_index = compute_border_index(universe, size=6)
+        for origin in range(universe.system_count):
+            expected = _bfs_borders(universe, origin, limit, max_jumps, "highsec", None)
+            assert find_borders_with_distance(universe, origin, limit, max_jumps) == expected
+
+    def test_avoid_systems_uses_bfs(self, universe: UniverseGraph):
+        origin = min(universe.highsec_systems - universe.border_systems)
+        nearest = find_borders_with_distance(universe, origin, 1, 100)
+        avoid = {nearest[0][0]}
+        borders = find_borders_with_distance(universe, origin, 50, 100, avoid_systems=avoid)
+
+        assert nearest[0][0] not in {idx for idx, _ in borders}
@@ -315,6 +315,42 @@ class TestUniverseRoundtrip:
         assert loaded.resolve_name("jita") == loaded.resolve_name("JITA")
 
 
+# =============================================================================
+# Jump Matrix Tests
+# =============================================================================
+
+
+class TestJumpMatrix:
+    """Test optional all-pairs jump matrix generation."""
+
+    def test_not_built_by_default(self, sample_universe):
+        """Jump matrix is opt-in."""
+        assert sample_universe.jump_matrix is None
+
+    def test_matches_bfs_distances(self, sample_cache: Path):
+        """Matrix entries equal igraph hop distances."""
+        import numpy as np
+
+        from aria_esi.universe.graph import JUMPS_UNREACHABLE
+
+        universe = build_universe_graph(sample_cache, include_jump_matrix=True)
+        expected = np.asarray(universe.graph.distances(), dtype=np.float64)
+        expected[~np.isfinite(expected)] = JUMPS_UNREACHABLE
+
+        assert universe.jump_matrix.shape == (universe.system_count, universe.system_count)
+        assert np.array_equal(universe.jump_matrix, expected.astype(np.uint8))
+
+    def test_roundtrip_preserves_matrix(self, sample_cache: Path, tmp_path: Path):
+        """Matrix is written to and mapped back from the .universe file."""
+        import numpy as np
+
+        output = tmp_path / "universe.universe"
+        original = build_universe_graph(sample_cache, output, include_jump_matrix=True)
+        loaded = load_universe_graph(output, skip_integrity_check=True)
+
+        assert np.array_equal(loaded.jump_matrix, original.jump_matrix)
+
+
 # =============================================================================
 # Name Resolution Tests
 # =============================================================================
@@ -323,6 +323,70 @@ class TestSecuritySets:
             assert count == 1, f"System {i} appears in {count} security sets"
 
 
+class TestJumps:
+    """Test jumps() / jumps_from() with and without the jump matrix."""
+
+    def test_jumps_without_matrix(self, mock_universe: UniverseGraph):
+        """Falls back to BFS when no matrix is loaded."""
+        assert mock_universe.jump_matrix is None
+        assert mock_universe.jumps(0, 5) == 3  # Jita -> Maurasi -> Sivala -> Ala
+        assert mock_universe.jumps(3, 3) == 0
+
+    def test_jumps_from_without_matrix(self, mock_universe: UniverseGraph):
+        """BFS fallback returns a uint8 row."""
+        row = mock_universe.jumps_from(0)
+        assert row.dtype == np.uint8
+        assert row.tolist() == [0, 1, 1, 2, 2, 3]
+
+    def test_jumps_with_matrix(self, mock_universe: UniverseGraph):
+        """Matrix lookups agree with BFS."""
+        from aria_esi.universe.builder import compute_jump_matrix
+
+        expected = [mock_universe.jumps_from(v).tolist() for v in range(6)]
+        mock_universe.jump_matrix = compute_jump_matrix(mock_universe.graph)
+
+        assert [mock_universe.jumps_from(v).tolist() for v in range(6)] == expected
+        assert mock_universe.jumps(5, 1) == 4
+
+    def test_unreachable(self):
+        """Unreachable pairs return None / JUMPS_UNREACHABLE."""
+        from aria_esi.universe.builder import compute_jump_matrix
+        from aria_esi.universe.graph import JUMPS_UNREACHABLE
+        from tests.mcp.conftest import create_mock_universe
+
+        systems = [
+            {"name": "A", "id": 1, "sec": 0.9, "const": 1, "region": 1},
+            {"name": "B", "id": 2, "sec": 0.9, "const": 1, "region": 1},
+            {"name": "J100000", "id": 3, "sec": -1.0, "const": 2, "region": 2},
+        ]
+        universe = create_mock_universe(systems, [(0, 1)])
+
+        assert universe.jumps(0, 2) is None
+        assert universe.jumps_from(0)[2] == JUMPS_UNREACHABLE
+
+        universe.jump_matrix = compute_jump_matrix(universe.graph)
+        assert universe.jumps(0, 2) is None
+        assert universe.jumps_from(2).tolist() == [JUMPS_UNREACHABLE, JUMPS_UNREACHABLE, 0]
+
+
+class TestNeighborTable:
+    """Test the padded neighbor table used by vectorized BFS."""
+
+    def test_matches_graph_neighbors(self, mock_universe: UniverseGraph):
+        """Each row lists the vertex's neighbors, padded with system_count."""
+        table = mock_universe.neighbor_table
+        n = mock_universe.system_count
+        for idx in range(n):
+            row = [v for v in table[idx].tolist() if v != n]
+            assert row == sorted(mock_universe.graph.neighbors(idx))
+
+    def test_read_only_and_cached(self, mock_universe: UniverseGraph):
+        """Table is built once and cannot be mutated."""
+        table = mock_universe.neighbor_table
+        assert table is mock_universe.neighbor_table
+        assert not table.flags.writeable
+
+
 class TestMetadata:
     """Test metadata attributes."""
 
@@ -399,6 +463,61 @@ class TestToDictRoundtrip:
         assert restored.resolve_name("PERIMETER") == mock_universe.resolve_name("PERIMETER")
 
 
+class TestDerivedIndexes:
+    """Test lazily built derived indexes."""
+
+    @pytest.fixture
+    def lazy_universe(self, mock_universe: UniverseGraph) -> UniverseGraph:
+        """Same universe, built without any derived indexes."""
+        data = mock_universe.to_dict(include_derived=False)
+        return UniverseGraph.from_dict(data, mock_universe.graph)
+
+    def test_to_dict_without_derived(self, mock_universe: UniverseGraph):
+        """include_derived=False omits every derived field."""
+        from aria_esi.universe.graph import DERIVED_FIELDS
+
+        data = mock_universe.to_dict(include_derived=False)
+
+        assert not set(DERIVED_FIELDS) & set(data)
+
+    def test_built_on_first_access(self, lazy_universe: UniverseGraph):
+        """Derived slots stay unset until first accessed, then are cached."""
+        from aria_esi.universe.graph import DERIVED_FIELDS
+
+        for name in DERIVED_FIELDS:
+            with pytest.raises(AttributeError):
+                object.__getattribute__(lazy_universe, name)
+
+        first = lazy_universe.idx_to_name
+        assert lazy_universe.idx_to_name is first
+        assert object.__getattribute__(lazy_universe, "idx_to_name") is first
+
+    def test_derived_match_supplied(
+        self, mock_universe: UniverseGraph, lazy_universe: UniverseGraph
+    ):
+        """Derived values equal the eagerly supplied ones."""
+        from aria_esi.universe.graph import DERIVED_FIELDS
+
+        for name in DERIVED_FIELDS:
+            assert getattr(lazy_universe, name) == getattr(mock_universe, name), name
+
+    def test_region_systems_order(self, lazy_universe: UniverseGraph):
+        """Regions appear in order of first vertex, members ascending."""
+        assert lazy_universe.region_systems == {10000002: [0, 1, 2, 3, 4], 10000003: [5]}
+        assert list(lazy_universe.region_systems) == [10000002, 10000003]
+
+    def test_queries_work_without_derived(self, lazy_universe: UniverseGraph):
+        """Public query methods work on a lazily built graph."""
+        assert lazy_universe.resolve_name("jita") == 0
+        assert lazy_universe.is_border_system(2)
+        assert lazy_universe.get_adjacent_lowsec(2) == ["Sivala"]
+
+    def test_unknown_attribute_still_raises(self, lazy_universe: UniverseGraph):
+        """__getattr__ only serves derived fields."""
+        with pytest.raises(AttributeError, match="no_such_field"):
+            lazy_universe.no_such_field  # noqa: B018
+
+
 class TestNumpyDtypePreserved:
     """Test NumPy array dtype preservation."""
 
@@ -0,0 +1,122 @@
+"""
+Tests for vectorized neighborhood queries.
+"""
+
+import numpy as np
+import pytest
+
+from aria_esi.universe import UniverseGraph
+from aria_esi.universe.builder import compute_jump_matrix
+from aria_esi.universe.neighborhood import (
+    adjacent_lowsec_counts,
+    nearest_matching,
+    system_mask,
+    within_jumps,
+)
+from tests.mcp.conftest import create_mock_universe
+
+
+@pytest.fixture
+def universe() -> UniverseGraph:
+    """
+    Small universe with a disconnected system.
+
+    Graph structure:
+        Jita (0.95) -- Perimeter (0.90) -- Urlen (0.85)
+          |                                  |
+        Maurasi (0.65) ---------------------+
+          |
+        Sivala (0.35) -- Ala (-0.2)
+
+        Thera (-1.0, no gates)
+    """
+    systems = [
+        {"name": "Jita", "id": 30000142, "sec": 0.95, "const": 1, "region": 10000002},
+        {"name": "Perimeter", "id": 30000144, "sec": 0.90, "const": 1, "region": 10000002},
+        {"name": "Maurasi", "id": 30000140, "sec": 0.65, "const": 1, "region": 10000002},
+        {"name": "Urlen", "id": 30000138, "sec": 0.85, "const": 1, "region": 10000002},
+        {"name": "Sivala", "id": 30000160, "sec": 0.35, "const": 2, "region": 10000002},
+        {"name": "Ala", "id": 30000161, "sec": -0.2, "const": 3, "region": 10000003},
+        {"name": "Thera", "id": 31000005, "sec": -1.0, "const": 4, "region": 11000031},
+    ]
+    edges = [(0, 1), (0, 2), (1, 3), (2, 3), (2, 4), (4, 5)]
+    return create_mock_universe(systems, edges)
+
+
+class TestWithinJumps:
+    """Test radius queries."""
+
+    def test_distance_then_index_order(self, universe: UniverseGraph):
+        vertices, distances = within_jumps(universe, 0, 10)
+        assert vertices.tolist() == [0, 1, 2, 3, 4, 5]
+        assert distances.tolist() == [0, 1, 1, 2, 2, 3]
+
+    def test_respects_radius(self, universe: UniverseGraph):
+        vertices, distances = within_jumps(universe, 0, 1)
+        assert vertices.tolist() == [0, 1, 2]
+        assert distances.tolist() == [0, 1, 1]
+
+    def test_zero_radius_is_origin(self, universe: UniverseGraph):
+        vertices, distances = within_jumps(universe, 4, 0)
+        assert vertices.tolist() == [4]
+        assert distances.tolist() == [0]
+
+    def test_unreachable_excluded(self, universe: UniverseGraph):
+        vertices, _ = within_jumps(universe, 0, 50)
+        assert 6 not in vertices.tolist()
+
+    def test_jump_matrix_matches_bfs(self, universe: UniverseGraph):
+        expected = [
+            tuple(a.tolist() for a in within_jumps(universe, v, k))
+            for v in range(7)
+            for k in range(5)
+        ]
+        universe.jump_matrix = compute_jump_matrix(universe.graph)
+        results = [
+            tuple(a.tolist() for a in within_jumps(universe, v, k))
+            for v in range(7)
+            for k in range(5)
+        ]
+        assert results == expected
+
+
+class TestSystemMask:
+    """Test vectorized system filters."""
+
+    def test_no_filters_selects_all(self, universe: UniverseGraph):
+        assert system_mask(universe).all()
+
+    def test_security_range(self, universe: UniverseGraph):
+        mask = system_mask(universe, security_min=0.5, security_max=0.9)
+        assert np.flatnonzero(mask).tolist() == [1, 2, 3]
+
+    def test_region(self, universe: UniverseGraph):
+        mask = system_mask(universe, region_id=10000003)
+        assert np.flatnonzero(mask).tolist() == [5]
+
+    def test_border(self, universe: UniverseGraph):
+        assert np.flatnonzero(system_mask(universe, is_border=True)).tolist() == [2]
+        assert 2 not in np.flatnonzero(system_mask(universe, is_border=False)).tolist()
+
+    def test_adjacent_lowsec(self, universe: UniverseGraph):
+        assert adjacent_lowsec_counts(universe).tolist() == [0, 0, 1, 0, 1, 1, 0]
+        mask = system_mask(universe, min_adjacent_lowsec=1)
+        assert np.flatnonzero(mask).tolist() == [2, 4, 5]
+
+
+class TestNearestMatching:
+    """Test nearest-match queries."""
+
+    def test_excludes_origin_and_respects_limit(self, universe: UniverseGraph):
+        mask = system_mask(universe, security_min=0.5)
+        vertices, distances = nearest_matching(universe, 0, mask, limit=2, max_jumps=10)
+        assert vertices.tolist() == [1, 2]
+        assert distances.tolist() == [1, 1]
+
+    def test_respects_radius(self, universe: UniverseGraph):
+        mask = system_mask(universe, security_max=0.0)
+        vertices, _ = nearest_matching(universe, 0, mask, limit=5, max_jumps=2)
+        assert vertices.tolist() == []
+        vertices, distances = nearest_matching(universe, 0, mask, limit=5, max_jumps=3)
+        assert vertices.tolist() == [5]
+        assert distances.tolist() == [3]
@@ -1,7 +1,8 @@
 """
 Tests for Universe Graph Serialization.
 
-Tests safe serialization using msgpack + igraph picklez format.
+Tests safe serialization using msgpack metadata with raw array sections
+(format v2) and the legacy igraph picklez layout (format v1).
 """
 
 from __future__ import annotations
@@ -75,7 +76,7 @@ class TestConstants:
         """FORMAT_VERSION is correctly defined."""
         from aria_esi.universe.serialization import FORMAT_VERSION
 
-        assert FORMAT_VERSION == 1
+        assert FORMAT_VERSION == 2
 
     def test_header_size(self):
         """HEADER_SIZE is correctly defined."""
@@ -172,6 +173,225 @@ class TestSaveLoadRoundtrip:
         assert temp_file.stat().st_size > 0
 
 
+# =============================================================================
+# Jump Matrix Section Tests
+# =============================================================================
+
+
+class TestJumpMatrixSection:
+    """Test the optional memory-mapped jump matrix section."""
+
+    def test_no_section_by_default(self, standard_universe, temp_file):
+        """Graphs without a jump matrix load with jump_matrix=None."""
+        from aria_esi.universe.serialization import (
+            load_universe_graph,
+            save_universe_graph,
+        )
+
+        save_universe_graph(standard_universe, temp_file)
+        loaded = load_universe_graph(temp_file)
+
+        assert loaded.jump_matrix is None
+
+    def test_roundtrip_memory_maps_matrix(self, standard_universe, temp_file):
+        """Jump matrix survives save/load as a read-only memmap."""
+        import numpy as np
+
+        from aria_esi.universe.builder import compute_jump_matrix
+        from aria_esi.universe.serialization import (
+            load_universe_graph,
+            save_universe_graph,
+        )
+
+        standard_universe.jump_matrix = compute_jump_matrix(standard_universe.graph)
+        save_universe_graph(standard_universe, temp_file)
+        loaded = load_universe_graph(temp_file)
+
+        assert isinstance(loaded.jump_matrix, np.memmap)
+        assert not loaded.jump_matrix.flags.writeable
+        assert np.array_equal(loaded.jump_matrix, standard_universe.jump_matrix)
+
+    def test_payload_aligned(self, standard_universe, temp_file):
+        """Section payload starts on a SECTION_ALIGNMENT boundary."""
+        from aria_esi.universe.builder import compute_jump_matrix
+        from aria_esi.universe.serialization import (
+            SECTION_ALIGNMENT,
+            SECTION_JUMP_MATRIX,
+            load_universe_graph,
+            save_universe_graph,
+        )
+
+        standard_universe.jump_matrix = compute_jump_matrix(standard_universe.graph)
+        save_universe_graph(standard_universe, temp_file)
+        loaded = load_universe_graph(temp_file)
+
+        assert loaded.jump_matrix.offset % SECTION_ALIGNMENT == 0
+        assert SECTION_JUMP_MATRIX in temp_file.read_bytes()
+
+    def test_truncated_section_raises(self, standard_universe, temp_file):
+        """A truncated section payload raises SerializationError."""
+        from aria_esi.universe.builder import compute_jump_matrix
+        from aria_esi.universe.serialization import (
+            SerializationError,
+            load_universe_graph,
+            save_universe_graph,
+        )
+
+        standard_universe.jump_matrix = compute_jump_matrix(standard_universe.graph)
+        save_universe_graph(standard_universe, temp_file)
+        temp_file.write_bytes(temp_file.read_bytes()[:-5])
+
+        with pytest.raises(SerializationError, match="Truncated"):
+            load_universe_graph(temp_file)
+
+
+# =============================================================================
+# Border Index Section Tests
+# =============================================================================
+
+
+class TestBorderIndexSection:
+    """Test the optional memory-mapped nearest-border index sections."""
+
+    @pytest.mark.parametrize("format_version", [1, 2])
+    def test_roundtrip_memory_maps_index(self, standard_universe, temp_file, format_version):
+        """Border index survives save/load as read-only memmaps."""
+        import numpy as np
+
+        from aria_esi.universe.border_index import compute_border_index
+        from aria_esi.universe.serialization import (
+            load_universe_graph,
+            save_universe_graph,
+        )
+
+        index = compute_border_index(standard_universe)
+        standard_universe.border_index = index
+        save_universe_graph(standard_universe, temp_file, format_version=format_version)
+        loaded = load_universe_graph(temp_file).border_index
+
+        assert isinstance(loaded.systems, np.memmap)
+        assert not loaded.jumps.flags.writeable
+        assert np.array_equal(loaded.rows, index.rows)
+        assert np.array_equal(loaded.systems, index.systems)
+        assert np.array_equal(loaded.jumps, index.jumps)
+
+    def test_missing_section_raises(self, standard_universe, temp_file):
+        """An index with a section stripped out raises SerializationError."""
+        from aria_esi.universe.border_index import compute_border_index
+        from aria_esi.universe.serialization import (
+            SECTION_BORDER_JUMPS,
+            SerializationError,
+            load_universe_graph,
+            save_universe_graph,
+        )
+
+        standard_universe.border_index = compute_border_index(standard_universe)
+        save_universe_graph(standard_universe, temp_file)
+        data = temp_file.read_bytes()
+        temp_file.write_bytes(data.replace(SECTION_BORDER_JUMPS, b"XXXX"))
+
+        with pytest.raises(SerializationError, match="missing section"):
+            load_universe_graph(temp_file)
+
+
+# =============================================================================
+# Format Version Tests
+# =============================================================================
+
+
+class TestFormatVersions:
+    """Test the v2 raw-section layout and v1 backward compatibility."""
+
+    @pytest.mark.parametrize("format_version", [1, 2])
+    def test_roundtrip_each_version(self, standard_universe, temp_file, format_version):
+        """Both versions round-trip arrays, edges and metadata."""
+        import numpy as np
+
+        from aria_esi.universe.serialization import (
+            load_universe_graph,
+            read_format_version,
+            save_universe_graph,
+        )
+
+        save_universe_graph(standard_universe, temp_file, format_version=format_version)
+        loaded = load_universe_graph(temp_file)
+
+        assert read_format_version(temp_file) == format_version
+        assert loaded.graph.get_edgelist() == standard_universe.graph.get_edgelist()
+        assert np.array_equal(loaded.security, standard_universe.security)
+        assert np.array_equal(loaded.system_ids, standard_universe.system_ids)
+        assert np.array_equal(loaded.constellation_ids, standard_universe.constellation_ids)
+        assert np.array_equal(loaded.region_ids, standard_universe.region_ids)
+        assert loaded.security.dtype == np.float32
+        assert loaded.system_ids.dtype == np.int32
+        assert loaded.name_to_idx == standard_universe.name_to_idx
+        assert loaded.border_systems == standard_universe.border_systems
+
+    def test_v1_with_jump_matrix(self, standard_universe, temp_file):
+        """v1 files with a jump matrix section remain readable."""
+        import numpy as np
+
+        from aria_esi.universe.builder import compute_jump_matrix
+        from aria_esi.universe.serialization import load_universe_graph, save_universe_graph
+
+        standard_universe.jump_matrix = compute_jump_matrix(standard_universe.graph)
+        save_universe_graph(standard_universe, temp_file, format_version=1)
+        loaded = load_universe_graph(temp_file)
+
+        assert np.array_equal(loaded.jump_matrix, standard_universe.jump_matrix)
+
+    def test_v2_arrays_are_mapped_views(self, standard_universe, temp_file):
+        """v2 arrays are read-only views into the mapped file."""
+        from aria_esi.universe.serialization import load_universe_graph, save_universe_graph
+
+        save_universe_graph(standard_universe, temp_file)
+        loaded = load_universe_graph(temp_file)
+
+        for array in (loaded.security, loaded.system_ids, loaded.region_ids):
+            assert not array.flags.writeable
+            assert not array.flags.owndata
+
+    def test_v2_sections_aligned(self, standard_universe, temp_file):
+        """v2 array payloads start on SECTION_ALIGNMENT boundaries."""
+        from aria_esi.universe.serialization import (
+            SECTION_ALIGNMENT,
+            _read_sections,
+            save_universe_graph,
+        )
+
+        save_universe_graph(standard_universe, temp_file)
+        data = temp_file.read_bytes()
+        metadata_len = struct.unpack(">I", data[6:10])[0]
+
+        with open(temp_file, "rb") as f:
+            f.seek(10 + metadata_len)
+            sections = _read_sections(f, temp_file)
+
+        assert {b"SECU", b"SYSI", b"CONS", b"REGN", b"EDGE"} <= set(sections)
+        assert all(offset % SECTION_ALIGNMENT == 0 for offset, _ in sections.values())
+
+    def test_v2_missing_section_raises(self, standard_universe, temp_file):
+        """A v2 file without a required section is rejected."""
+        from aria_esi.universe.serialization import (
+            SerializationError,
+            load_universe_graph,
+            save_universe_graph,
+        )
+
+        save_universe_graph(standard_universe, temp_file)
+        temp_file.write_bytes(temp_file.read_bytes().replace(b"EDGE", b"XXXX"))
+
+        with pytest.raises(SerializationError, match="EDGE"):
+            load_universe_graph(temp_file)
+
+    def test_rejects_unknown_write_version(self, standard_universe, temp_file):
+        """Writing an unknown version raises SerializationError."""
+        from aria_esi.universe.serialization import SerializationError, save_universe_graph
+
+        with pytest.raises(SerializationError, match="format version"):
+            save_universe_graph(standard_universe, temp_file, format_version=3)
+
+
 # =============================================================================
 # File Format Tests
 # =============================================================================